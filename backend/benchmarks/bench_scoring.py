@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the snow quality scoring hot path.
+
+Times the functions the weather worker and timeline endpoint call thousands
+of times per hour, replaying Open-Meteo responses from benchmarks/fixtures/
+so every run scores exactly the same inputs. For each function it reports
+throughput (ops/sec, best of several timed repeats) and allocations (peak
+traced memory per call, via tracemalloc), then compares both against
+benchmarks/baseline.json and flags anything worse than the tolerance.
+
+Fixture timestamps are shifted on load so the fixture's "now" hour is the
+current UTC hour; code that locates "now" in the hourly arrays therefore does
+the same work regardless of when the suite runs.
+
+Usage (from backend/):
+    python benchmarks/bench_scoring.py                    # compare to baseline
+    python benchmarks/bench_scoring.py -k predict         # subset by name
+    python benchmarks/bench_scoring.py --tolerance 0.15
+    python benchmarks/bench_scoring.py --update-baseline  # after an intended change
+    python benchmarks/bench_scoring.py --record           # re-record fixtures (network)
+
+Exits non-zero when a regression is flagged. Throughput baselines are only
+meaningful on the machine that recorded them; the baseline stores the machine
+it came from and the report says when it differs.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+BENCH_DIR = Path(__file__).parent
+sys.path.insert(0, str(BENCH_DIR.parent / "src"))
+
+from models.weather import WeatherCondition  # noqa: E402
+from services import ml_scorer  # noqa: E402
+from services.multi_source_merger import MultiSourceMerger, SourceData  # noqa: E402
+from services.openmeteo_service import OpenMeteoService  # noqa: E402
+from services.quality_explanation_service import (  # noqa: E402
+    generate_quality_explanation,
+)
+from services.snow_quality_service import SnowQualityService  # noqa: E402
+
+FIXTURES_DIR = BENCH_DIR / "fixtures"
+BASELINE_FILE = BENCH_DIR / "baseline.json"
+DEFAULT_TOLERANCE = 0.25
+
+# Ignore allocation growth below this (interpreter noise on tiny functions)
+ALLOC_NOISE_KIB = 1.0
+
+# Same request the weather worker makes (OpenMeteoService.get_current_weather)
+RECORD_URL = "https://api.open-meteo.com/v1/forecast"
+RECORD_PARAMS = {
+    "current": "temperature_2m,relative_humidity_2m,wind_speed_10m,wind_gusts_10m,weather_code",
+    "hourly": "temperature_2m,snowfall,snow_depth,wind_speed_10m,wind_gusts_10m,weather_code,cloud_cover,visibility",
+    "daily": "temperature_2m_min,temperature_2m_max,snowfall_sum",
+    "past_days": 14,
+    "forecast_days": 3,
+    "timezone": "GMT",
+}
+
+
+@dataclass
+class FixtureContext:
+    """Pre-built inputs for one recorded resort/elevation."""
+
+    name: str
+    elevation_m: float
+    now_index: int
+    hourly: dict[str, list]
+    weather_data: dict[str, Any]
+    condition: WeatherCondition
+    raw_features: dict[str, float]
+    sources: list[SourceData]
+
+
+class _FixtureResponse:
+    def __init__(self, data: dict):
+        self._data = data
+
+    def json(self) -> dict:
+        return self._data
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def _shift_times(times: list[str], delta: timedelta) -> list[str]:
+    return [
+        (datetime.fromisoformat(t) + delta).strftime("%Y-%m-%dT%H:%M") for t in times
+    ]
+
+
+def load_fixture(path: Path) -> dict:
+    """Load a recorded response with its clock moved to the current UTC hour."""
+    with open(path) as f:
+        data = json.load(f)
+    meta = data["_fixture"]
+    hourly = data["hourly"]
+    recorded_now = datetime.fromisoformat(hourly["time"][meta["now_index"]])
+    now = datetime.now(UTC).replace(minute=0, second=0, microsecond=0, tzinfo=None)
+    delta = now - recorded_now
+    hourly["time"] = _shift_times(hourly["time"], delta)
+    data["daily"]["time"] = [
+        (datetime.fromisoformat(d) + delta).strftime("%Y-%m-%d")
+        for d in data["daily"]["time"]
+    ]
+    data["current"]["time"] = hourly["time"][meta["now_index"]]
+    return data
+
+
+def build_context(path: Path) -> FixtureContext:
+    """Run the real ingest path once on a fixture to get the hot-path inputs."""
+    data = load_fixture(path)
+    meta = data["_fixture"]
+    elevation_m = float(meta["elevation_meters"])
+
+    with (
+        patch(
+            "services.openmeteo_service._request_with_retry",
+            return_value=_FixtureResponse(data),
+        ),
+        patch.object(OpenMeteoService, "_get_era5_snow_depth", return_value=None),
+    ):
+        weather_data = OpenMeteoService().get_current_weather(
+            latitude=data["latitude"],
+            longitude=data["longitude"],
+            elevation_meters=int(elevation_m),
+        )
+
+    condition = WeatherCondition(
+        resort_id=meta["resort_id"],
+        elevation_level=meta["elevation_level"],
+        timestamp=datetime.now(UTC).isoformat(),
+        **weather_data,
+    )
+    quality, fresh_snow_cm, confidence, score = (
+        SnowQualityService().assess_snow_quality(condition, elevation_m=elevation_m)
+    )
+    condition.snow_quality = quality
+    condition.fresh_snow_cm = fresh_snow_cm
+    condition.confidence_level = confidence
+    condition.quality_score = score
+
+    hourly = data["hourly"]
+    raw_features = ml_scorer._extract_features_at_hour(
+        hourly["temperature_2m"],
+        hourly["snowfall"],
+        hourly["wind_speed_10m"],
+        meta["now_index"],
+        elevation_m,
+        hourly["snow_depth"],
+        hourly["weather_code"],
+        hourly["cloud_cover"],
+        hourly["visibility"],
+        hourly["wind_gusts_10m"],
+    )
+
+    # Resort-reported sources that disagree with the model, so merge() takes
+    # its consensus/override branches rather than the no-op fast path
+    snowfall_24h = weather_data["snowfall_24h_cm"]
+    sources = [
+        SourceData(
+            source_name="onthesnow",
+            snowfall_24h_cm=snowfall_24h + 8.0,
+            snowfall_48h_cm=weather_data["snowfall_48h_cm"] + 10.0,
+            snow_depth_cm=(weather_data["snow_depth_cm"] or 0.0) + 40.0,
+            surface_conditions="Packed Powder",
+        ),
+        SourceData(
+            source_name="snowforecast",
+            snowfall_24h_cm=snowfall_24h * 0.5,
+            snowfall_72h_cm=weather_data["snowfall_72h_cm"],
+            snow_depth_cm=weather_data["snow_depth_cm"],
+        ),
+        SourceData(
+            source_name="weatherkit",
+            snowfall_24h_cm=snowfall_24h,
+            temperature_c=weather_data["current_temp_celsius"] + 0.5,
+        ),
+    ]
+
+    return FixtureContext(
+        name=f"{meta['resort_id']}/{meta['elevation_level']}",
+        elevation_m=elevation_m,
+        now_index=meta["now_index"],
+        hourly=hourly,
+        weather_data=weather_data,
+        condition=condition,
+        raw_features=raw_features,
+        sources=sources,
+    )
+
+
+def load_contexts(fixtures_dir: Path = FIXTURES_DIR) -> list[FixtureContext]:
+    return [build_context(p) for p in sorted(fixtures_dir.glob("open_meteo_*.json"))]
+
+
+def build_cases(contexts: list[FixtureContext]) -> dict[str, Any]:
+    """Benchmark name -> zero-arg callable scoring every fixture once."""
+    service = SnowQualityService()
+
+    def engineer_features():
+        for ctx in contexts:
+            ml_scorer.engineer_features(ctx.raw_features)
+
+    def extract_features_at_hour():
+        for ctx in contexts:
+            h = ctx.hourly
+            ml_scorer._extract_features_at_hour(
+                h["temperature_2m"],
+                h["snowfall"],
+                h["wind_speed_10m"],
+                ctx.now_index,
+                ctx.elevation_m,
+                h["snow_depth"],
+                h["weather_code"],
+                h["cloud_cover"],
+                h["visibility"],
+                h["wind_gusts_10m"],
+            )
+
+    def predict_quality():
+        for ctx in contexts:
+            ml_scorer.predict_quality(ctx.condition, ctx.elevation_m)
+
+    def predict_quality_at_hour():
+        for ctx in contexts:
+            h = ctx.hourly
+            ml_scorer.predict_quality_at_hour(
+                h["time"],
+                h["temperature_2m"],
+                h["snowfall"],
+                h["wind_speed_10m"],
+                ctx.now_index,
+                ctx.elevation_m,
+                h["snow_depth"],
+                h["weather_code"],
+                h["cloud_cover"],
+                h["visibility"],
+                h["wind_gusts_10m"],
+            )
+
+    def merge():
+        for ctx in contexts:
+            MultiSourceMerger.merge(
+                ctx.weather_data, ctx.sources, elevation_level="mid"
+            )
+
+    def assess_snow_quality():
+        for ctx in contexts:
+            service.assess_snow_quality(ctx.condition, elevation_m=ctx.elevation_m)
+
+    def quality_explanation():
+        for ctx in contexts:
+            generate_quality_explanation(ctx.condition)
+
+    return {
+        "engineer_features": engineer_features,
+        "extract_features_at_hour": extract_features_at_hour,
+        "predict_quality": predict_quality,
+        "predict_quality_at_hour": predict_quality_at_hour,
+        "merge": merge,
+        "assess_snow_quality": assess_snow_quality,
+        "generate_quality_explanation": quality_explanation,
+    }
+
+
+def measure(fn, calls_per_run: int, repeat: int = 5) -> dict[str, float]:
+    """Throughput (best of `repeat`) and peak allocation for one call."""
+    fn()  # warm up (model load, lazy imports)
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number))
+    ops_per_sec = number * calls_per_run / best
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    alloc_kib = (peak - before) / calls_per_run / 1024
+
+    return {"ops_per_sec": round(ops_per_sec, 1), "alloc_kib": round(alloc_kib, 2)}
+
+
+def machine_info() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(terse=True),
+        "processor": platform.machine(),
+        "cpu_count": str(os.cpu_count()),
+    }
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[str]:
+    """Return a description of every result worse than baseline by > tolerance."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        min_ops = base["ops_per_sec"] * (1 - tolerance)
+        if result["ops_per_sec"] < min_ops:
+            regressions.append(
+                f"{name}: {result['ops_per_sec']:,.0f} ops/s "
+                f"< {base['ops_per_sec']:,.0f} baseline (-{tolerance:.0%} allowed)"
+            )
+        max_alloc = base["alloc_kib"] * (1 + tolerance)
+        if (
+            result["alloc_kib"] > max_alloc
+            and result["alloc_kib"] - base["alloc_kib"] > ALLOC_NOISE_KIB
+        ):
+            regressions.append(
+                f"{name}: {result['alloc_kib']:.1f} KiB/call "
+                f"> {base['alloc_kib']:.1f} baseline (+{tolerance:.0%} allowed)"
+            )
+    return regressions
+
+
+def _pct(new: float, old: float | None) -> str:
+    if not old:
+        return "n/a"
+    return f"{(new - old) / old:+.1%}"
+
+
+def print_report(results, baseline) -> None:
+    print(
+        f"{'benchmark':<30} {'ops/sec':>12} {'vs base':>9} "
+        f"{'KiB/call':>10} {'vs base':>9}"
+    )
+    for name, r in results.items():
+        base = baseline.get(name, {})
+        print(
+            f"{name:<30} {r['ops_per_sec']:>12,.0f} "
+            f"{_pct(r['ops_per_sec'], base.get('ops_per_sec')):>9} "
+            f"{r['alloc_kib']:>10.2f} {_pct(r['alloc_kib'], base.get('alloc_kib')):>9}"
+        )
+
+
+def record_fixtures(fixtures_dir: Path = FIXTURES_DIR) -> None:
+    """Re-record every fixture from the live Open-Meteo API."""
+    import requests
+
+    for path in sorted(fixtures_dir.glob("open_meteo_*.json")):
+        with open(path) as f:
+            old = json.load(f)
+        meta = old["_fixture"]
+        params = {
+            "latitude": old["latitude"],
+            "longitude": old["longitude"],
+            "elevation": meta["elevation_meters"],
+            **RECORD_PARAMS,
+        }
+        response = requests.get(RECORD_URL, params=params, timeout=30)
+        response.raise_for_status()
+        data = response.json()
+
+        now_str = datetime.now(UTC).strftime("%Y-%m-%dT%H:00")
+        times = data["hourly"]["time"]
+        now_index = next(
+            (i for i, t in enumerate(times) if t[:13] >= now_str[:13]), len(times) - 1
+        )
+        data["_fixture"] = {
+            **meta,
+            "source": "api.open-meteo.com",
+            "recorded_at": datetime.now(UTC).isoformat(),
+            "now_index": now_index,
+            "params": {k: v for k, v in RECORD_PARAMS.items() if "_days" in k},
+        }
+        data = {"_fixture": data.pop("_fixture"), **data}
+        with open(path, "w") as f:
+            json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+            f.write("\n")
+        print(f"Recorded {path.name} ({len(times)} hours)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Scoring hot-path benchmarks")
+    parser.add_argument("-k", dest="pattern", help="Only run benchmarks matching")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--record", action="store_true")
+    args = parser.parse_args()
+
+    if args.record:
+        record_fixtures()
+        return 0
+
+    contexts = load_contexts()
+    cases = build_cases(contexts)
+    if args.pattern:
+        cases = {k: v for k, v in cases.items() if args.pattern in k}
+
+    print(f"{len(contexts)} fixtures: {', '.join(c.name for c in contexts)}")
+    results = {
+        name: measure(fn, len(contexts), repeat=args.repeat)
+        for name, fn in cases.items()
+    }
+
+    stored = {}
+    if BASELINE_FILE.exists():
+        with open(BASELINE_FILE) as f:
+            stored = json.load(f)
+    baseline = stored.get("results", {})
+
+    print_report(results, baseline)
+
+    if args.update_baseline:
+        stored = {
+            "machine": machine_info(),
+            "updated_at": datetime.now(UTC).isoformat(),
+            "results": {**baseline, **results},
+        }
+        with open(BASELINE_FILE, "w") as f:
+            json.dump(stored, f, indent=2)
+            f.write("\n")
+        print(f"Baseline updated: {BASELINE_FILE}")
+        return 0
+
+    if not baseline:
+        print("No baseline yet; run with --update-baseline to record one.")
+        return 0
+    if stored.get("machine") != machine_info():
+        print(
+            f"Note: baseline was recorded on {stored.get('machine')}; "
+            "throughput may not compare across machines."
+        )
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\nREGRESSIONS:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print(f"\nNo regressions beyond {args.tolerance:.0%}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
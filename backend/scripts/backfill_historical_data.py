@@ -16,7 +16,6 @@ import sys
 from datetime import UTC, datetime, timedelta
 
 import boto3
-import requests
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -26,6 +25,11 @@ from services.resort_service import ResortService
 from services.snow_quality_service import SnowQualityService
 from utils.dynamodb_utils import prepare_for_dynamodb
 
+# Add ml/ to path for the shared Open-Meteo response cache
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ml"))
+
+from weather_cache import WeatherCache, cached_get_json  # noqa: E402
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s",
@@ -44,12 +48,18 @@ ICE_THRESHOLDS = [
 
 
 def fetch_extended_historical_data(
-    latitude: float, longitude: float, elevation_meters: int, past_days: int = 14
+    latitude: float,
+    longitude: float,
+    elevation_meters: int,
+    past_days: int = 14,
+    cache: WeatherCache | None = None,
 ) -> dict:
     """
     Fetch extended historical weather data from Open-Meteo.
 
     Returns hourly temperature and snowfall data for the specified period.
+    Responses go through the on-disk cache shared with the ML collectors, so
+    re-running the backfill on the same day doesn't re-download anything.
     """
     url = "https://api.open-meteo.com/v1/forecast"
     params = {
@@ -63,9 +73,7 @@ def fetch_extended_historical_data(
         "timezone": "auto",
     }
 
-    response = requests.get(url, params=params, timeout=30)
-    response.raise_for_status()
-    return response.json()
+    return cached_get_json(url, params, cache=cache, timeout=30)
 
 
 def find_last_freeze_thaw_event(hourly_temps: list, hourly_times: list) -> tuple:
@@ -137,7 +145,11 @@ def calculate_snowfall_since_event(
 
 
 def process_resort(
-    resort, weather_conditions_table, snow_quality_service, dry_run: bool = False
+    resort,
+    weather_conditions_table,
+    snow_quality_service,
+    dry_run: bool = False,
+    cache: WeatherCache | None = None,
 ):
     """Process a single resort and store historical conditions."""
     logger.info(f"Processing {resort.name} ({resort.resort_id})...")
@@ -150,6 +162,7 @@ def process_resort(
                 longitude=elevation_point.longitude,
                 elevation_meters=elevation_point.elevation_meters,
                 past_days=MAX_HISTORICAL_DAYS,
+                cache=cache,
             )
 
             hourly = data.get("hourly", {})
@@ -318,6 +331,11 @@ def main():
         "--dry-run", action="store_true", help="Don't write to DynamoDB"
     )
     parser.add_argument("--resort", type=str, help="Process only this resort ID")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached Open-Meteo responses and re-download",
+    )
     args = parser.parse_args()
 
     # Get environment
@@ -340,6 +358,7 @@ def main():
     resort_service = ResortService(dynamodb.Table(resorts_table))
     weather_conditions_table = dynamodb.Table(conditions_table)
     snow_quality_service = SnowQualityService()
+    cache = WeatherCache(refresh=args.refresh)
 
     # Get resorts
     resorts = resort_service.get_all_resorts()
@@ -355,11 +374,16 @@ def main():
     for resort in resorts:
         try:
             process_resort(
-                resort, weather_conditions_table, snow_quality_service, args.dry_run
+                resort,
+                weather_conditions_table,
+                snow_quality_service,
+                args.dry_run,
+                cache,
             )
         except Exception as e:
             logger.error(f"Failed to process {resort.resort_id}: {e}")
 
+    logger.info(f"Open-Meteo cache: {cache.hits} hits, {cache.misses} misses")
     logger.info("Backfill complete!")
 
 
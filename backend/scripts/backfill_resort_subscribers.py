@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Backfill the resort subscribers index from existing user preferences.
+
+UserService keeps the index in sync on every preferences write; this one-off
+pass indexes users who have not saved their preferences since it was added.
+Re-running it is safe (writes are idempotent).
+
+Usage:
+    python scripts/backfill_resort_subscribers.py [--env ENV] [--dry-run]
+
+Options:
+    --env ENV    Environment (dev, staging, prod). Default: dev
+    --dry-run    Show what would be written without actually writing
+"""
+
+import argparse
+import logging
+
+import boto3
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+def backfill(env: str, dry_run: bool) -> None:
+    """Write one (resort_id, user_id) entry per user favorite."""
+    dynamodb = boto3.resource("dynamodb")
+    prefs_table = dynamodb.Table(f"snow-tracker-user-preferences-{env}")
+    index_table = dynamodb.Table(f"snow-tracker-resort-subscribers-{env}")
+
+    scan_kwargs = {"ProjectionExpression": "user_id, favorite_resorts"}
+    users = 0
+    entries = 0
+
+    with index_table.batch_writer() as batch:
+        while True:
+            response = prefs_table.scan(**scan_kwargs)
+            for item in response.get("Items", []):
+                users += 1
+                for resort_id in set(item.get("favorite_resorts") or []):
+                    entries += 1
+                    if dry_run:
+                        logger.info("  [DRY RUN] %s -> %s", resort_id, item["user_id"])
+                        continue
+                    batch.put_item(
+                        Item={"resort_id": resort_id, "user_id": item["user_id"]}
+                    )
+            if "LastEvaluatedKey" not in response:
+                break
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    logger.info(
+        "Done. %d entries for %d users%s.",
+        entries,
+        users,
+        " (dry run)" if dry_run else "",
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill resort subscribers index")
+    parser.add_argument(
+        "--env",
+        default="dev",
+        choices=["dev", "staging", "prod"],
+        help="Environment (default: dev)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be written without actually writing",
+    )
+    args = parser.parse_args()
+    backfill(args.env, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Build the resort data snapshot used by ResortLoader.
+
+The snapshot holds the parsed resorts.json and the validated Resort objects,
+so loading it skips the JSON parse and pydantic validation. It is tied to
+the exact resorts.json it was built from; rerun this after editing that file.
+
+Usage:
+    PYTHONPATH=src python scripts/build_resort_snapshot.py [--output PATH]
+"""
+
+import argparse
+import logging
+import os
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils.resort_loader import DATA_FILE, SNAPSHOT_FILE, ResortLoader
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the resort data snapshot")
+    parser.add_argument(
+        "--data-file", type=Path, default=DATA_FILE, help="Resort data JSON"
+    )
+    parser.add_argument(
+        "--output", type=Path, default=SNAPSHOT_FILE, help="Snapshot file to write"
+    )
+    args = parser.parse_args()
+
+    path = ResortLoader(data_file=args.data_file).write_snapshot(args.output)
+    logger.info(f"Snapshot written to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Add the GSIs the API queries to the existing trips table.
+
+The trips table was created by hand before the Pulumi stack referenced it
+and has only its key schema. TripService and account deletion query two
+GSIs on it:
+
+- UserIdIndex (hash: user_id) - a user's trips
+- StatusStartDateIndex (hash: status, range: start_date) - upcoming trips
+
+DynamoDB builds one new GSI per UpdateTable call, so each missing index is
+created in turn and the script waits for it to become ACTIVE (backfilling
+existing trips) before starting the next. Re-running it is safe; indexes
+that already exist are skipped.
+
+Run it before deploying a backend that queries these indexes.
+
+Usage:
+    python scripts/migrate_trips_table.py [--table NAME] [--dry-run]
+
+Options:
+    --table NAME  Trips table. Default: snow-tracker-trips-dev (the table
+                  every environment uses today)
+    --dry-run     Show which indexes would be created without creating them
+"""
+
+import argparse
+import logging
+import time
+
+import boto3
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# (index name, [(attribute, key type)])
+INDEXES = [
+    ("UserIdIndex", [("user_id", "HASH")]),
+    ("StatusStartDateIndex", [("status", "HASH"), ("start_date", "RANGE")]),
+]
+POLL_SECONDS = 15
+
+
+def _index_status(client, table: str) -> dict[str, str]:
+    """Status of each existing GSI on the table."""
+    description = client.describe_table(TableName=table)["Table"]
+    return {
+        index["IndexName"]: index["IndexStatus"]
+        for index in description.get("GlobalSecondaryIndexes", [])
+    }
+
+
+def _wait_until_active(client, table: str, index_name: str) -> None:
+    while True:
+        status = _index_status(client, table).get(index_name)
+        if status == "ACTIVE":
+            return
+        logger.info("  %s is %s, waiting...", index_name, status)
+        time.sleep(POLL_SECONDS)
+
+
+def migrate(table: str, dry_run: bool) -> None:
+    """Create any missing trip GSIs, one at a time."""
+    client = boto3.client("dynamodb")
+    existing = _index_status(client, table)
+
+    for index_name, key_schema in INDEXES:
+        if index_name in existing:
+            logger.info("%s already exists (%s)", index_name, existing[index_name])
+            if not dry_run:
+                _wait_until_active(client, table, index_name)
+            continue
+        if dry_run:
+            logger.info("[DRY RUN] would create %s on %s", index_name, table)
+            continue
+
+        logger.info("Creating %s on %s", index_name, table)
+        client.update_table(
+            TableName=table,
+            AttributeDefinitions=[
+                {"AttributeName": name, "AttributeType": "S"} for name, _ in key_schema
+            ],
+            GlobalSecondaryIndexUpdates=[
+                {
+                    "Create": {
+                        "IndexName": index_name,
+                        "KeySchema": [
+                            {"AttributeName": name, "KeyType": key_type}
+                            for name, key_type in key_schema
+                        ],
+                        "Projection": {"ProjectionType": "ALL"},
+                    }
+                }
+            ],
+        )
+        _wait_until_active(client, table, index_name)
+
+    logger.info("Done%s.", " (dry run)" if dry_run else "")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Add GSIs to the trips table")
+    parser.add_argument(
+        "--table",
+        default="snow-tracker-trips-dev",
+        help="Trips table (default: snow-tracker-trips-dev)",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show which indexes would be created without creating them",
+    )
+    args = parser.parse_args()
+    migrate(args.table, args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
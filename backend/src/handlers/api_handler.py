@@ -51,6 +51,11 @@ from services.quality_explanation_service import (
 from services.recommendation_service import RecommendationService
 from services.resort_service import ResortService
 from services.snow_quality_service import SnowQualityService
+from services.static_shards import (
+    MANIFEST_KEY,
+    apply_resorts_delta,
+    apply_snow_quality_delta,
+)
 from services.trip_service import TripService
 from services.user_service import UserService
 from services.weather_service import WeatherService
@@ -199,12 +204,62 @@ def get_s3_client():
     return _s3_client
 
 
-# Cached static JSON data with TTL
-_static_resorts_cache = {"data": None, "expires": 0}
-_static_snow_quality_cache = {"data": None, "expires": 0}
+# Cached static JSON data with TTL and the manifest version it matches
+_static_resorts_cache = {"data": None, "expires": 0, "version": None}
+_static_snow_quality_cache = {"data": None, "expires": 0, "version": None}
 STATIC_CACHE_TTL_SECONDS = 300  # 5 minute cache for static JSON
 
 
+def _get_static_json(bucket: str, key: str) -> dict:
+    response = get_s3_client().get_object(Bucket=bucket, Key=key)
+    return json.loads(response["Body"].read().decode("utf-8"))
+
+
+def _get_static_manifest(bucket: str) -> dict | None:
+    """Fetch the static JSON manifest, or None if it isn't published."""
+    try:
+        manifest = _get_static_json(bucket, MANIFEST_KEY)
+        return manifest if isinstance(manifest, dict) else None
+    except Exception as e:
+        logger.debug("Static JSON manifest unavailable: %s", e)
+        return None
+
+
+def _refresh_static_cache(
+    cache: dict, manifest: dict | None, bucket: str, apply_delta, now: float
+) -> bool:
+    """Bring an expired static cache up to the manifest version cheaply.
+
+    Keeps the cached data when the version hasn't changed, and applies the
+    published delta when it starts from the cached version.
+
+    Returns:
+        True if the cache is current, False if a full download is needed.
+    """
+    if not manifest or not cache["data"] or not cache.get("version"):
+        return False
+
+    version = manifest.get("version")
+    if version == cache["version"]:
+        cache["expires"] = now + STATIC_CACHE_TTL_SECONDS
+        return True
+
+    delta = manifest.get("delta") or {}
+    if delta.get("from_version") != cache["version"] or not delta.get("key"):
+        return False
+    try:
+        delta_data = _get_static_json(bucket, delta["key"])
+    except Exception as e:
+        logger.warning("Error fetching static JSON delta %s: %s", delta["key"], e)
+        return False
+
+    cache["data"] = apply_delta(cache["data"], delta_data)
+    cache["version"] = version
+    cache["expires"] = now + STATIC_CACHE_TTL_SECONDS
+    logger.info("Applied static JSON delta %s", delta["key"])
+    return True
+
+
 def _get_static_resorts_from_s3() -> list[dict] | None:
     """Fetch resorts from static S3 JSON file with caching.
 
@@ -220,15 +275,22 @@ def _get_static_resorts_from_s3() -> list[dict] | None:
     if not website_bucket:
         return None
 
+    # Unchanged or a small delta away: skip the full download
+    manifest = _get_static_manifest(website_bucket)
+    if _refresh_static_cache(
+        _static_resorts_cache, manifest, website_bucket, apply_resorts_delta, now
+    ):
+        return _static_resorts_cache["data"]
+
     try:
-        response = get_s3_client().get_object(
-            Bucket=website_bucket, Key="data/resorts.json"
-        )
-        data = json.loads(response["Body"].read().decode("utf-8"))
+        data = _get_static_json(website_bucket, "data/resorts.json")
 
         # Cache the result
         _static_resorts_cache["data"] = data.get("resorts", [])
         _static_resorts_cache["expires"] = now + STATIC_CACHE_TTL_SECONDS
+        # The manifest is published after the file, so the file is at least
+        # this version; a later delta from it re-applies idempotently
+        _static_resorts_cache["version"] = (manifest or {}).get("version")
 
         logger.info(
             "Loaded %d resorts from S3 static JSON", len(_static_resorts_cache["data"])
@@ -263,15 +325,24 @@ def _get_static_snow_quality_from_s3() -> dict | None:
     if not website_bucket:
         return None
 
+    # Unchanged or a small delta away: skip the full download
+    manifest = _get_static_manifest(website_bucket)
+    if _refresh_static_cache(
+        _static_snow_quality_cache,
+        manifest,
+        website_bucket,
+        apply_snow_quality_delta,
+        now,
+    ):
+        return _static_snow_quality_cache["data"]
+
     try:
-        response = get_s3_client().get_object(
-            Bucket=website_bucket, Key="data/snow-quality.json"
-        )
-        data = json.loads(response["Body"].read().decode("utf-8"))
+        data = _get_static_json(website_bucket, "data/snow-quality.json")
 
         # Cache the result
         _static_snow_quality_cache["data"] = data.get("results", {})
         _static_snow_quality_cache["expires"] = now + STATIC_CACHE_TTL_SECONDS
+        _static_snow_quality_cache["version"] = (manifest or {}).get("version")
 
         logger.info(
             "Loaded snow quality for %d resorts from S3",
@@ -328,12 +399,18 @@ def get_user_service():
     """Get or create UserService (lazy init for SnapStart)."""
     global _user_service
     if _user_service is None:
+        dynamodb = get_dynamodb()
         _user_service = UserService(
-            get_dynamodb().Table(
+            dynamodb.Table(
                 os.environ.get(
                     "USER_PREFERENCES_TABLE", "snow-tracker-user-preferences-dev"
                 )
-            )
+            ),
+            resort_subscribers_table=dynamodb.Table(
+                os.environ.get(
+                    "RESORT_SUBSCRIBERS_TABLE", "snow-tracker-resort-subscribers-dev"
+                )
+            ),
         )
     return _user_service
 
@@ -517,58 +594,60 @@ def _get_client_ip(request: Request) -> str:
     return request.client.host if request.client else "unknown"
 
 
-def _check_anonymous_chat_limit(ip_address: str) -> bool:
-    """Check if anonymous IP is within chat rate limit. Returns True if allowed."""
-    table_name = os.environ.get("CHAT_RATE_LIMIT_TABLE_NAME")
-    if not table_name:
-        logger.warning("CHAT_RATE_LIMIT_TABLE_NAME not configured, allowing request")
-        return True
+def _consume_chat_quota(key: str, limit: int, window_seconds: int) -> int | None:
+    """Count one message against key's current rate limit window.
 
+    A single conditional ADD on a per-window counter item, so concurrent
+    requests can't both take the last slot. Windows are fixed (aligned to
+    the epoch) and their items expire with the window.
+
+    Returns messages remaining after this one, or None if the window is full.
+    """
+    table = get_dynamodb().Table(os.environ["CHAT_RATE_LIMIT_TABLE_NAME"])
+    window = int(time.time()) // window_seconds
     try:
-        table = get_dynamodb().Table(table_name)
+        response = table.update_item(
+            Key={"ip_address": f"{key}#{window}"},
+            UpdateExpression=(
+                "ADD message_count :one SET expires_at = if_not_exists(expires_at, :exp)"
+            ),
+            ConditionExpression=(
+                "attribute_not_exists(message_count) OR message_count < :limit"
+            ),
+            ExpressionAttributeValues={
+                ":one": 1,
+                ":limit": limit,
+                ":exp": (window + 1) * window_seconds,
+            },
+            ReturnValues="UPDATED_NEW",
+        )
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+            return None
+        raise
+    return max(0, limit - int(response["Attributes"]["message_count"]))
 
-        now = int(time.time())
-        window_start = now - (ANON_CHAT_WINDOW_HOURS * 3600)
-        expires_at = now + (ANON_CHAT_WINDOW_HOURS * 3600)
 
-        # Get current record
-        response = table.get_item(Key={"ip_address": ip_address})
-        item = response.get("Item")
+def _check_anonymous_chat_limit(ip_address: str) -> tuple[bool, int]:
+    """Check if anonymous IP is within chat rate limit.
 
-        if item:
-            # Filter to only timestamps within the window
-            timestamps = item.get("timestamps", [])
-            recent = [t for t in timestamps if t > window_start]
-
-            if len(recent) >= ANON_CHAT_LIMIT:
-                return False
-
-            # Add new timestamp
-            recent.append(now)
-            table.put_item(
-                Item={
-                    "ip_address": ip_address,
-                    "timestamps": recent,
-                    "message_count": len(recent),
-                    "expires_at": expires_at,
-                }
-            )
-        else:
-            # First message from this IP
-            table.put_item(
-                Item={
-                    "ip_address": ip_address,
-                    "timestamps": [now],
-                    "message_count": 1,
-                    "expires_at": expires_at,
-                }
-            )
+    Returns (allowed, remaining_messages).
+    """
+    if not os.environ.get("CHAT_RATE_LIMIT_TABLE_NAME"):
+        logger.warning("CHAT_RATE_LIMIT_TABLE_NAME not configured, allowing request")
+        return True, ANON_CHAT_LIMIT
 
-        return True
+    try:
+        remaining = _consume_chat_quota(
+            ip_address, ANON_CHAT_LIMIT, ANON_CHAT_WINDOW_HOURS * 3600
+        )
     except Exception as e:
         logger.error("Rate limit check failed for IP %s: %s", ip_address, e)
         # Fail open - allow the request if rate limit check fails
-        return True
+        return True, ANON_CHAT_LIMIT
+    if remaining is None:
+        return False, 0
+    return True, remaining
 
 
 def _check_authenticated_chat_limit(user_id: str) -> tuple[bool, int]:
@@ -576,76 +655,19 @@ def _check_authenticated_chat_limit(user_id: str) -> tuple[bool, int]:
 
     Returns (allowed, remaining_messages).
     """
-    table_name = os.environ.get("CHAT_RATE_LIMIT_TABLE_NAME")
-    if not table_name:
+    if not os.environ.get("CHAT_RATE_LIMIT_TABLE_NAME"):
         return True, AUTH_CHAT_DAILY_LIMIT
 
     try:
-        table = get_dynamodb().Table(table_name)
-
-        now = int(time.time())
-        # 24-hour sliding window
-        window_start = now - (24 * 3600)
-        expires_at = now + (24 * 3600)
-
-        key = f"user_{user_id}"
-        response = table.get_item(Key={"ip_address": key})
-        item = response.get("Item")
-
-        if item:
-            timestamps = item.get("timestamps", [])
-            recent = [t for t in timestamps if t > window_start]
-
-            if len(recent) >= AUTH_CHAT_DAILY_LIMIT:
-                return False, 0
-
-            recent.append(now)
-            table.put_item(
-                Item={
-                    "ip_address": key,
-                    "timestamps": recent,
-                    "message_count": len(recent),
-                    "expires_at": expires_at,
-                }
-            )
-            return True, max(0, AUTH_CHAT_DAILY_LIMIT - len(recent))
-        else:
-            table.put_item(
-                Item={
-                    "ip_address": key,
-                    "timestamps": [now],
-                    "message_count": 1,
-                    "expires_at": expires_at,
-                }
-            )
-            return True, AUTH_CHAT_DAILY_LIMIT - 1
+        remaining = _consume_chat_quota(
+            f"user_{user_id}", AUTH_CHAT_DAILY_LIMIT, 24 * 3600
+        )
     except Exception as e:
         logger.error("Auth rate limit check failed for %s: %s", user_id, e)
         return True, AUTH_CHAT_DAILY_LIMIT
-
-
-def _get_remaining_anonymous_messages(ip_address: str) -> int:
-    """Get remaining anonymous messages for an IP address."""
-    table_name = os.environ.get("CHAT_RATE_LIMIT_TABLE_NAME")
-    if not table_name:
-        return ANON_CHAT_LIMIT
-
-    try:
-        table = get_dynamodb().Table(table_name)
-
-        now = int(time.time())
-        window_start = now - (ANON_CHAT_WINDOW_HOURS * 3600)
-
-        response = table.get_item(Key={"ip_address": ip_address})
-        item = response.get("Item")
-
-        if item:
-            timestamps = item.get("timestamps", [])
-            recent = [t for t in timestamps if t > window_start]
-            return max(0, ANON_CHAT_LIMIT - len(recent))
-        return ANON_CHAT_LIMIT
-    except Exception:
-        return ANON_CHAT_LIMIT
+    if remaining is None:
+        return False, 0
+    return True, remaining
 
 
 # MARK: - Input Validation Helpers
@@ -1754,6 +1776,7 @@ def _get_snow_quality_for_resort(resort_id: str) -> dict | None:
             "snowfall_fresh_cm": None,
             "snowfall_24h_cm": None,
             "snow_depth_cm": None,
+            "wind_speed_kmh": None,
             "predicted_snow_48h_cm": None,
         }
 
@@ -1803,6 +1826,7 @@ def _get_snow_quality_for_resort(resort_id: str) -> dict | None:
         "snowfall_fresh_cm": representative.fresh_snow_cm if representative else None,
         "snowfall_24h_cm": representative.snowfall_24h_cm if representative else None,
         "snow_depth_cm": representative.snow_depth_cm if representative else None,
+        "wind_speed_kmh": representative.wind_speed_kmh if representative else None,
         "predicted_snow_48h_cm": representative.predicted_snow_48h_cm
         if representative
         else None,
@@ -4348,13 +4372,14 @@ async def send_chat_message(
         if not user_id:
             # Anonymous: IP-based rate limit
             client_ip = _get_client_ip(fastapi_request)
-            if not _check_anonymous_chat_limit(client_ip):
+            allowed, remaining = _check_anonymous_chat_limit(client_ip)
+            if not allowed:
                 raise HTTPException(
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                     detail="Chat limit reached. Sign in for unlimited access, or try again later.",
                 )
             user_id = f"anon_{client_ip}"
-            remaining_messages = _get_remaining_anonymous_messages(client_ip)
+            remaining_messages = remaining
         else:
             # Authenticated: per-user daily limit
             allowed, remaining = _check_authenticated_chat_limit(user_id)
@@ -28,8 +28,18 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from ulid import ULID
 
-from services.chat_service import RESORT_ALIASES, SYSTEM_PROMPT, TOOL_DEFINITIONS
+from services.chat_context import build_messages, dedupe_tool_results, system_blocks
+from services.chat_service import (
+    RESORT_ALIASES,
+    SYSTEM_PROMPT,
+    TOOL_CONFIG,
+    WriteBehind,
+    run_tool_calls,
+)
+from services.resort_catalog import get_resort_catalog
+from services.tool_result_cache import tool_result_cache
 from utils.geo_utils import haversine_distance
+from utils.resort_mentions import ResortMentionDetector
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -41,6 +51,9 @@ MAX_TOOL_ITERATIONS = 5
 # Sentinel to signal end of stream
 _STREAM_END = object()
 
+# Mention detector, rebuilt whenever the resort catalog is refreshed
+_mention_detector = {"catalog": None, "detector": ResortMentionDetector(RESORT_ALIASES)}
+
 app = FastAPI()
 
 app.add_middleware(
@@ -175,7 +188,7 @@ def _handle_chat_stream(
         conversation_id = f"conv_{uuid.uuid4().hex[:12]}"
 
     history = _load_history(chat_table, conversation_id, user_id)
-    messages = _build_messages(history, user_message)
+    messages = build_messages(history, user_message)
 
     from datetime import UTC, datetime, timedelta
 
@@ -183,96 +196,111 @@ def _handle_chat_stream(
     now = datetime.now(UTC).isoformat()
     is_first = len(history) == 0
     title = user_message[:50] if is_first else None
-    _save_message(
-        chat_table,
-        conversation_id,
-        user_message_id,
-        user_id,
-        "user",
-        user_message,
-        now,
-        title,
-    )
-
-    q.put(_sse({"type": "status", "message": "Analyzing your question..."}))
-    context_data = _auto_detect_resorts_fast(user_message, dynamodb)
-
-    system_text = SYSTEM_PROMPT
-    # Inject user location if available
-    if user_lat is not None and user_lon is not None:
-        system_text += (
-            f"\n\n--- USER LOCATION ---\n"
-            f"The user's current coordinates: latitude {user_lat:.4f}, longitude {user_lon:.4f}.\n"
-            f"Use the get_nearby_resorts tool with these coordinates when the user asks about "
-            f"nearby resorts, recommendations near them, or 'where should I ski'. "
-            f"Do not mention exact coordinates to the user."
-        )
-    if context_data:
-        system_text += (
-            "\n\n--- PRE-FETCHED DATA ---\n"
-            "The following resort data was auto-detected from the user's message. "
-            "Use this data directly instead of calling tools for these resorts. "
-            "You may still use tools for additional resorts or data not covered here.\n\n"
-            + context_data
+    # Message writes don't affect the reply: they run in the background and
+    # are flushed after the done event (or the error)
+    writes = WriteBehind()
+    # Flushed on every exit path, before the stream ends (and the Lambda can
+    # freeze), so the user message is saved even if the model call fails
+    try:
+        writes.submit(
+            _save_message,
+            chat_table,
+            conversation_id,
+            user_message_id,
+            user_id,
+            "user",
+            user_message,
+            now,
+            title,
         )
-        q.put(_sse({"type": "status", "message": "Checking conditions..."}))
 
-        text = _call_bedrock_stream_no_tools(bedrock, system_text, messages, q)
-        if text:
-            assistant_id = str(ULID())
-            _save_message(
-                chat_table,
-                conversation_id,
-                assistant_id,
-                user_id,
-                "assistant",
-                text,
-                datetime.now(UTC).isoformat(),
+        q.put(_sse({"type": "status", "message": "Analyzing your question..."}))
+        context_data = _auto_detect_resorts_fast(user_message, dynamodb)
+
+        # Per-request context goes after the cacheable static prompt
+        extra_text = ""
+        # Inject user location if available
+        if user_lat is not None and user_lon is not None:
+            extra_text += (
+                f"--- USER LOCATION ---\n"
+                f"The user's current coordinates: latitude {user_lat:.4f}, longitude {user_lon:.4f}.\n"
+                f"Use the get_nearby_resorts tool with these coordinates when the user asks about "
+                f"nearby resorts, recommendations near them, or 'where should I ski'. "
+                f"Do not mention exact coordinates to the user."
             )
-            q.put(
-                _sse(
-                    {
-                        "type": "done",
-                        "conversation_id": conversation_id,
-                        "message_id": assistant_id,
-                    }
-                )
+        if context_data:
+            extra_text += (
+                "\n\n--- PRE-FETCHED DATA ---\n"
+                "The following resort data was auto-detected from the user's message. "
+                "Use this data directly instead of calling tools for these resorts. "
+                "You may still use tools for additional resorts or data not covered here.\n\n"
+                + context_data
             )
-            return
+        system = system_blocks(SYSTEM_PROMPT, extra_text.strip())
+
+        if context_data:
+            q.put(_sse({"type": "status", "message": "Checking conditions..."}))
+
+            text = _call_bedrock_stream_no_tools(bedrock, system, messages, q)
+            if text:
+                assistant_id = str(ULID())
+                writes.submit(
+                    _save_message,
+                    chat_table,
+                    conversation_id,
+                    assistant_id,
+                    user_id,
+                    "assistant",
+                    text,
+                    datetime.now(UTC).isoformat(),
+                )
+                q.put(
+                    _sse(
+                        {
+                            "type": "done",
+                            "conversation_id": conversation_id,
+                            "message_id": assistant_id,
+                        }
+                    )
+                )
+                return
 
-    q.put(_sse({"type": "status", "message": "Looking up data..."}))
-    text, tool_calls = _call_bedrock_with_tools_stream(
-        bedrock, system_text, messages, q, dynamodb
-    )
+        q.put(_sse({"type": "status", "message": "Looking up data..."}))
+        text, tool_calls = _call_bedrock_with_tools_stream(
+            bedrock, system, messages, q, dynamodb, context_data=context_data
+        )
 
-    assistant_id = str(ULID())
-    _save_message(
-        chat_table,
-        conversation_id,
-        assistant_id,
-        user_id,
-        "assistant",
-        text,
-        datetime.now(UTC).isoformat(),
-        tool_calls=tool_calls,
-    )
+        assistant_id = str(ULID())
+        writes.submit(
+            _save_message,
+            chat_table,
+            conversation_id,
+            assistant_id,
+            user_id,
+            "assistant",
+            text,
+            datetime.now(UTC).isoformat(),
+            tool_calls=tool_calls,
+        )
 
-    q.put(
-        _sse(
-            {
-                "type": "done",
-                "conversation_id": conversation_id,
-                "message_id": assistant_id,
-            }
+        q.put(
+            _sse(
+                {
+                    "type": "done",
+                    "conversation_id": conversation_id,
+                    "message_id": assistant_id,
+                }
+            )
         )
-    )
+    finally:
+        writes.flush()
 
 
-def _call_bedrock_stream_no_tools(bedrock, system_text, messages, q) -> str | None:
+def _call_bedrock_stream_no_tools(bedrock, system, messages, q) -> str | None:
     try:
         response = bedrock.converse_stream(
             modelId="us.anthropic.claude-sonnet-4-6",
-            system=[{"text": system_text}],
+            system=system,
             messages=messages,
             inferenceConfig={"maxTokens": 2048, "temperature": 0.5},
         )
@@ -297,7 +325,9 @@ def _call_bedrock_stream_no_tools(bedrock, system_text, messages, q) -> str | No
         return None
 
 
-def _call_bedrock_with_tools_stream(bedrock, system_text, messages, q, dynamodb):
+def _call_bedrock_with_tools_stream(
+    bedrock, system, messages, q, dynamodb, context_data=None
+):
     all_tool_calls = []
 
     for iteration in range(MAX_TOOL_ITERATIONS):
@@ -305,9 +335,9 @@ def _call_bedrock_with_tools_stream(bedrock, system_text, messages, q, dynamodb)
         try:
             response = bedrock.converse(
                 modelId="us.anthropic.claude-sonnet-4-6",
-                system=[{"text": system_text}],
+                system=system,
                 messages=messages,
-                toolConfig={"tools": TOOL_DEFINITIONS},
+                toolConfig=TOOL_CONFIG,
                 inferenceConfig={"maxTokens": 2048, "temperature": 0.5},
             )
         except ClientError as e:
@@ -342,87 +372,48 @@ def _call_bedrock_with_tools_stream(bedrock, system_text, messages, q, dynamodb)
             tool_use_blocks = [b for b in content_blocks if "toolUse" in b]
             messages.append({"role": "assistant", "content": content_blocks})
 
-            tool_results = []
-            for tool_block in tool_use_blocks:
-                tool_use = tool_block["toolUse"]
-                tool_name = tool_use["name"]
-                tool_input = tool_use.get("input", {})
-                tool_use_id = tool_use["toolUseId"]
-
-                friendly = _tool_friendly_name(tool_name, tool_input)
+            def _on_start(tool_name, tool_input):
                 q.put(
                     _sse(
                         {
                             "type": "tool_start",
                             "tool": tool_name,
                             "input": tool_input,
-                            "message": friendly,
+                            "message": _tool_friendly_name(tool_name, tool_input),
                         }
                     )
                 )
 
-                t_tool = time.monotonic()
-                try:
-                    result = _execute_tool(tool_name, tool_input, dynamodb)
-                    tool_ms = int((time.monotonic() - t_tool) * 1000)
-                    logger.info("Tool %s took %dms", tool_name, tool_ms)
-
+            def _on_done(call):
+                if call["success"]:
                     q.put(
                         _sse(
                             {
                                 "type": "tool_done",
-                                "tool": tool_name,
-                                "duration_ms": tool_ms,
+                                "tool": call["tool"],
+                                "duration_ms": call["duration_ms"],
                             }
                         )
                     )
 
-                    all_tool_calls.append(
-                        {
-                            "tool": tool_name,
-                            "input": tool_input,
-                            "success": True,
-                            "duration_ms": tool_ms,
-                        }
-                    )
-                    tool_results.append(
-                        {
-                            "toolResult": {
-                                "toolUseId": tool_use_id,
-                                "content": [{"json": result}],
-                            }
-                        }
-                    )
-                except Exception as e:
-                    tool_ms = int((time.monotonic() - t_tool) * 1000)
-                    logger.error("Tool %s failed after %dms: %s", tool_name, tool_ms, e)
-                    all_tool_calls.append(
-                        {
-                            "tool": tool_name,
-                            "input": tool_input,
-                            "success": False,
-                            "duration_ms": tool_ms,
-                        }
-                    )
-                    tool_results.append(
-                        {
-                            "toolResult": {
-                                "toolUseId": tool_use_id,
-                                "content": [{"text": f"Error: {e}"}],
-                                "status": "error",
-                            }
-                        }
-                    )
+            tool_results, tool_calls = run_tool_calls(
+                tool_use_blocks,
+                lambda name, tool_input: _execute_tool(name, tool_input, dynamodb),
+                on_start=_on_start,
+                on_done=_on_done,
+            )
+            all_tool_calls.extend(tool_calls)
 
+            tool_results = dedupe_tool_results(tool_results, messages, context_data)
             messages.append({"role": "user", "content": tool_results})
 
             if iteration < MAX_TOOL_ITERATIONS - 1:
                 try:
                     stream_resp = bedrock.converse_stream(
                         modelId="us.anthropic.claude-sonnet-4-6",
-                        system=[{"text": system_text}],
+                        system=system,
                         messages=messages,
-                        toolConfig={"tools": TOOL_DEFINITIONS},
+                        toolConfig=TOOL_CONFIG,
                         inferenceConfig={"maxTokens": 2048, "temperature": 0.5},
                     )
                     stream = stream_resp.get("stream")
@@ -492,21 +483,24 @@ def _tool_friendly_name(tool_name: str, tool_input: dict) -> str:
     return names.get(tool_name, f"Running {tool_name}...")
 
 
-def _auto_detect_resorts_fast(user_message: str, dynamodb) -> str | None:
-    import re
-
-    message_lower = user_message.lower()
-    detected_ids: set[str] = set()
+def _get_mention_detector(catalog) -> ResortMentionDetector:
+    """Aliases plus every catalog resort name (aliases only without a catalog)."""
+    if catalog is not None and _mention_detector["catalog"] is not catalog:
+        _mention_detector["detector"] = ResortMentionDetector(
+            RESORT_ALIASES,
+            ((r["resort_id"], r.get("name") or "") for r in catalog.resorts),
+        )
+        _mention_detector["catalog"] = catalog
+    return _mention_detector["detector"]
 
-    for alias, resort_id in RESORT_ALIASES.items():
-        pattern = r"\b" + re.escape(alias) + r"\b"
-        if re.search(pattern, message_lower):
-            detected_ids.add(resort_id)
 
+def _auto_detect_resorts_fast(user_message: str, dynamodb) -> str | None:
+    catalog = get_resort_catalog()
+    detected_ids = _get_mention_detector(catalog).find(user_message)
     if not detected_ids:
         return None
 
-    resort_ids = list(detected_ids)[:3]
+    resort_ids = detected_ids[:3]
     env = os.environ.get("ENVIRONMENT", "prod")
     conditions_table = dynamodb.Table(f"snow-tracker-weather-conditions-{env}")
     resorts_table = dynamodb.Table(f"snow-tracker-resorts-{env}")
@@ -514,8 +508,7 @@ def _auto_detect_resorts_fast(user_message: str, dynamodb) -> str | None:
     context_parts = []
     for resort_id in resort_ids:
         try:
-            resort_resp = resorts_table.get_item(Key={"resort_id": resort_id})
-            resort = resort_resp.get("Item", {})
+            resort = _get_resort(resort_id, catalog, resorts_table) or {}
             resort_name = resort.get("name", resort_id)
 
             cond_resp = conditions_table.query(
@@ -558,7 +551,43 @@ def _to_float(val) -> float | None:
         return None
 
 
+def _get_resort(resort_id: str, catalog, resorts_table) -> dict | None:
+    """Resort metadata from the catalog, or DynamoDB when it is not loaded."""
+    if catalog is not None:
+        return catalog.get(resort_id)
+    return resorts_table.get_item(Key={"resort_id": resort_id}).get("Item")
+
+
+def _scan_all(table) -> list[dict]:
+    """Every item in a table, following pagination."""
+    resp = table.scan()
+    items = resp.get("Items", [])
+    while "LastEvaluatedKey" in resp:
+        resp = table.scan(ExclusiveStartKey=resp["LastEvaluatedKey"])
+        items.extend(resp.get("Items", []))
+    return items
+
+
+def _add_snapshot_conditions(entry: dict, summary: dict | None) -> None:
+    """Copy a catalog snow quality summary onto a tool result entry."""
+    if not summary:
+        return
+    entry["snow_quality"] = summary.get("overall_quality", "unknown")
+    entry["snow_score"] = _to_float(summary.get("snow_score"))
+    entry["fresh_snow_cm"] = _to_float(summary.get("snowfall_fresh_cm"))
+    entry["temperature_c"] = _to_float(summary.get("temperature_c"))
+    entry["snow_depth_cm"] = _to_float(summary.get("snow_depth_cm"))
+    entry["wind_speed_kmh"] = _to_float(summary.get("wind_speed_kmh"))
+    entry["snowfall_24h_cm"] = _to_float(summary.get("snowfall_24h_cm"))
+
+
 def _execute_tool(tool_name: str, tool_input: dict, dynamodb) -> dict:
+    return tool_result_cache.get_or_run(
+        tool_name, tool_input, lambda: _run_tool(tool_name, tool_input, dynamodb)
+    )
+
+
+def _run_tool(tool_name: str, tool_input: dict, dynamodb) -> dict:
     env = os.environ.get("ENVIRONMENT", "prod")
 
     if tool_name == "get_resort_conditions":
@@ -592,23 +621,28 @@ def _execute_tool(tool_name: str, tool_input: dict, dynamodb) -> dict:
         query_str = tool_input.get("query", "").lower()
         if not query_str:
             return {"error": "Missing query"}
-        table = dynamodb.Table(f"snow-tracker-resorts-{env}")
-        resp = table.scan()
-        results = []
-        for r in resp.get("Items", []):
-            name = r.get("name", "").lower()
-            region = r.get("region", "").lower()
-            country = r.get("country", "").lower()
-            if query_str in name or query_str in region or query_str in country:
-                results.append(
-                    {
-                        "resort_id": r["resort_id"],
-                        "name": r.get("name"),
-                        "country": r.get("country"),
-                        "region": r.get("region"),
-                    }
-                )
-        return {"results": results[:20], "count": len(results)}
+        catalog = get_resort_catalog()
+        if catalog is not None:
+            matches = catalog.search(query_str)
+        else:
+            table = dynamodb.Table(f"snow-tracker-resorts-{env}")
+            matches = [
+                r
+                for r in _scan_all(table)
+                if query_str in r.get("name", "").lower()
+                or query_str in r.get("region", "").lower()
+                or query_str in r.get("country", "").lower()
+            ]
+        results = [
+            {
+                "resort_id": r["resort_id"],
+                "name": r.get("name"),
+                "country": r.get("country"),
+                "region": r.get("region"),
+            }
+            for r in matches[:20]
+        ]
+        return {"results": results, "count": len(matches)}
 
     elif tool_name == "get_best_conditions":
         try:
@@ -630,8 +664,7 @@ def _execute_tool(tool_name: str, tool_input: dict, dynamodb) -> dict:
         if not resort_id:
             return {"error": "Missing resort_id"}
         table = dynamodb.Table(f"snow-tracker-resorts-{env}")
-        resp = table.get_item(Key={"resort_id": resort_id})
-        item = resp.get("Item")
+        item = _get_resort(resort_id, get_resort_catalog(), table)
         if not item:
             return {"error": f"Resort '{resort_id}' not found"}
         return {
@@ -648,8 +681,7 @@ def _execute_tool(tool_name: str, tool_input: dict, dynamodb) -> dict:
             return {"error": "Missing resort_id"}
         # Look up resort to get coordinates
         resorts_table = dynamodb.Table(f"snow-tracker-resorts-{env}")
-        resp = resorts_table.get_item(Key={"resort_id": resort_id})
-        resort = resp.get("Item")
+        resort = _get_resort(resort_id, get_resort_catalog(), resorts_table)
         if not resort:
             return {"error": f"Resort '{resort_id}' not found"}
         # Get elevation point (prefer mid > top > base)
@@ -776,53 +808,63 @@ def _execute_tool(tool_name: str, tool_input: dict, dynamodb) -> dict:
         lon = tool_input.get("longitude")
         if lat is None or lon is None:
             return {"error": "Missing coordinates"}
-        import math
+        radius = tool_input.get("radius_km", 200)
+
+        catalog = get_resort_catalog()
+        if catalog is not None:
+            in_range = catalog.nearby(lat, lon, radius)
+        else:
+            table = dynamodb.Table(f"snow-tracker-resorts-{env}")
+            in_range = []
+            for r in _scan_all(table):
+                eps = r.get("elevation_points", [])
+                if not eps:
+                    continue
+                ep = eps[0]
+                rlat = float(ep.get("latitude", 0))
+                rlon = float(ep.get("longitude", 0))
+                dist = haversine_distance(lat, lon, rlat, rlon)
+                if dist <= radius:
+                    in_range.append((dist, r))
+            in_range.sort(key=lambda x: x[0])
 
-        table = dynamodb.Table(f"snow-tracker-resorts-{env}")
-        conditions_table = dynamodb.Table(f"snow-tracker-weather-conditions-{env}")
-        resp = table.scan()
-        items = resp.get("Items", [])
         nearby = []
-        for r in items:
-            eps = r.get("elevation_points", [])
-            if not eps:
-                continue
-            ep = eps[0]
-            rlat = float(ep.get("latitude", 0))
-            rlon = float(ep.get("longitude", 0))
-            dist = haversine_distance(lat, lon, rlat, rlon)
-            radius = tool_input.get("radius_km", 200)
-            if dist <= radius:
-                entry = {
-                    "resort_id": r["resort_id"],
-                    "name": r.get("name"),
-                    "country": r.get("country"),
-                    "region": r.get("region"),
-                    "distance_km": round(dist, 1),
-                }
-                # Include pricing and pass info
-                if r.get("day_ticket_price_min_usd"):
-                    entry["day_ticket_price_usd"] = int(
-                        float(r["day_ticket_price_min_usd"])
-                    )
-                if r.get("day_ticket_price_max_usd"):
-                    entry["day_ticket_price_max_usd"] = int(
-                        float(r["day_ticket_price_max_usd"])
-                    )
-                passes = []
-                if r.get("epic_pass"):
-                    passes.append(f"Epic ({r['epic_pass']})")
-                if r.get("ikon_pass"):
-                    passes.append(f"Ikon ({r['ikon_pass']})")
-                if r.get("indy_pass"):
-                    passes.append(f"Indy ({r['indy_pass']})")
-                if passes:
-                    entry["pass_affiliations"] = passes
-                nearby.append(entry)
-        nearby.sort(key=lambda x: x["distance_km"])
+        for dist, r in in_range:
+            entry = {
+                "resort_id": r["resort_id"],
+                "name": r.get("name"),
+                "country": r.get("country"),
+                "region": r.get("region"),
+                "distance_km": round(dist, 1),
+            }
+            # Include pricing and pass info
+            if r.get("day_ticket_price_min_usd"):
+                entry["day_ticket_price_usd"] = int(
+                    float(r["day_ticket_price_min_usd"])
+                )
+            if r.get("day_ticket_price_max_usd"):
+                entry["day_ticket_price_max_usd"] = int(
+                    float(r["day_ticket_price_max_usd"])
+                )
+            passes = []
+            if r.get("epic_pass"):
+                passes.append(f"Epic ({r['epic_pass']})")
+            if r.get("ikon_pass"):
+                passes.append(f"Ikon ({r['ikon_pass']})")
+            if r.get("indy_pass"):
+                passes.append(f"Indy ({r['indy_pass']})")
+            if passes:
+                entry["pass_affiliations"] = passes
+            nearby.append(entry)
 
         # Enrich top results with conditions
         top_nearby = nearby[:20]
+        if catalog is not None:
+            for entry in top_nearby:
+                _add_snapshot_conditions(entry, catalog.conditions(entry["resort_id"]))
+            return {"results": top_nearby, "count": len(nearby)}
+
+        conditions_table = dynamodb.Table(f"snow-tracker-weather-conditions-{env}")
         for entry in top_nearby:
             try:
                 c_resp = conditions_table.query(
@@ -859,13 +901,13 @@ def _execute_tool(tool_name: str, tool_input: dict, dynamodb) -> dict:
         resort_ids = resort_ids[:10]
         resorts_table = dynamodb.Table(f"snow-tracker-resorts-{env}")
         conditions_table = dynamodb.Table(f"snow-tracker-weather-conditions-{env}")
+        catalog = get_resort_catalog()
         results = []
         for rid in resort_ids:
             entry = {"resort_id": rid}
             try:
                 # Resort info
-                r_resp = resorts_table.get_item(Key={"resort_id": rid})
-                resort = r_resp.get("Item", {})
+                resort = _get_resort(rid, catalog, resorts_table) or {}
                 entry["name"] = resort.get("name", rid)
                 entry["country"] = resort.get("country")
                 entry["region"] = resort.get("region")
@@ -882,31 +924,36 @@ def _execute_tool(tool_name: str, tool_input: dict, dynamodb) -> dict:
                     entry["pass_affiliations"] = passes
 
                 # Conditions
-                c_resp = conditions_table.query(
-                    KeyConditionExpression=Key("resort_id").eq(rid),
-                    ScanIndexForward=False,
-                    Limit=3,
-                )
-                conditions = c_resp.get("Items", [])
-                if conditions:
-                    # Representative condition (mid > top > base)
-                    rep = None
-                    for pref in ["mid", "top", "base"]:
-                        for c in conditions:
-                            if c.get("elevation_level") == pref:
-                                rep = c
+                if catalog is not None:
+                    _add_snapshot_conditions(entry, catalog.conditions(rid))
+                else:
+                    c_resp = conditions_table.query(
+                        KeyConditionExpression=Key("resort_id").eq(rid),
+                        ScanIndexForward=False,
+                        Limit=3,
+                    )
+                    conditions = c_resp.get("Items", [])
+                    if conditions:
+                        # Representative condition (mid > top > base)
+                        rep = None
+                        for pref in ["mid", "top", "base"]:
+                            for c in conditions:
+                                if c.get("elevation_level") == pref:
+                                    rep = c
+                                    break
+                            if rep:
                                 break
-                        if rep:
-                            break
-                    if not rep:
-                        rep = conditions[0]
-                    entry["snow_quality"] = rep.get("snow_quality", "unknown")
-                    entry["snow_score"] = _to_float(rep.get("quality_score"))
-                    entry["fresh_snow_cm"] = _to_float(rep.get("fresh_snow_cm"))
-                    entry["temperature_c"] = _to_float(rep.get("current_temp_celsius"))
-                    entry["snow_depth_cm"] = _to_float(rep.get("snow_depth_cm"))
-                    entry["wind_speed_kmh"] = _to_float(rep.get("wind_speed_kmh"))
-                    entry["snowfall_24h_cm"] = _to_float(rep.get("snowfall_24h_cm"))
+                        if not rep:
+                            rep = conditions[0]
+                        entry["snow_quality"] = rep.get("snow_quality", "unknown")
+                        entry["snow_score"] = _to_float(rep.get("quality_score"))
+                        entry["fresh_snow_cm"] = _to_float(rep.get("fresh_snow_cm"))
+                        entry["temperature_c"] = _to_float(
+                            rep.get("current_temp_celsius")
+                        )
+                        entry["snow_depth_cm"] = _to_float(rep.get("snow_depth_cm"))
+                        entry["wind_speed_kmh"] = _to_float(rep.get("wind_speed_kmh"))
+                        entry["snowfall_24h_cm"] = _to_float(rep.get("snowfall_24h_cm"))
             except Exception as e:
                 logger.warning("Batch detail error for %s: %s", rid, e)
                 entry["error"] = str(e)
@@ -932,17 +979,6 @@ def _load_history(chat_table, conversation_id, user_id):
         return []
 
 
-def _build_messages(history, user_message):
-    messages = []
-    for item in history:
-        role = item.get("role", "user")
-        content = item.get("content", "")
-        if role in ("user", "assistant") and content:
-            messages.append({"role": role, "content": [{"text": content}]})
-    messages.append({"role": "user", "content": [{"text": user_message}]})
-    return messages
-
-
 def _convert_floats(obj):
     """Recursively convert float values to Decimal for DynamoDB compatibility."""
     from decimal import Decimal
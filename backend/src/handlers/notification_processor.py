@@ -7,16 +7,34 @@ This Lambda runs hourly to check for conditions that warrant notifications:
 It also handles weekly digest processing when triggered by the weekly schedule.
 
 It respects a 24-hour grace period per resort to avoid notification spam.
+
+With NOTIFICATION_SEGMENTS > 1 the scheduled invocation acts as a
+coordinator: it splits the user preferences table into DynamoDB parallel-scan
+segments, dispatches each segment to a worker (a synchronous invocation of
+this Lambda, or a local thread pool with NOTIFICATION_FANOUT=local) and
+aggregates the per-segment summaries into one.
+
+The weather worker also invokes it with {"resort_changed": {...}} as soon as a
+resort's snowfall rises; those events only evaluate that resort for its
+subscribers (looked up in the resort subscribers index), so alerts go out
+minutes before the next hourly scan.
+
+The hourly run also refreshes the condition snapshots and alerts of upcoming
+trips, once per run (not per segment), with one conditions lookup per resort.
 """
 
+import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 
 import boto3
 
 from services.notification_history_service import NotificationHistoryService
 from services.notification_service import NotificationService
+from services.trip_service import TripService
+from services.weather_service import WeatherService
 
 # Configure logging
 logger = logging.getLogger()
@@ -40,30 +58,90 @@ RESORTS_TABLE = os.environ.get("RESORTS_TABLE", f"snow-tracker-resorts-{ENVIRONM
 NOTIFICATIONS_TABLE = os.environ.get(
     "NOTIFICATIONS_TABLE", f"snow-tracker-notifications-{ENVIRONMENT}"
 )
+RESORT_SUBSCRIBERS_TABLE = os.environ.get(
+    "RESORT_SUBSCRIBERS_TABLE", f"snow-tracker-resort-subscribers-{ENVIRONMENT}"
+)
+TRIPS_TABLE = os.environ.get("TRIPS_TABLE", "snow-tracker-trips-dev")
 APNS_PLATFORM_ARN = os.environ.get("APNS_PLATFORM_APP_ARN")
 
-# Lazy-initialized service
+# Trips starting within this many days get their conditions refreshed hourly
+TRIP_ALERT_DAYS_AHEAD = int(os.environ.get("TRIP_ALERT_DAYS_AHEAD", "7"))
+
+# Parallel fan-out: number of user-table scan segments (1 = process inline),
+# and whether segments run as Lambda invocations ("lambda") or threads ("local")
+NOTIFICATION_SEGMENTS = int(os.environ.get("NOTIFICATION_SEGMENTS", "1"))
+NOTIFICATION_FANOUT = os.environ.get("NOTIFICATION_FANOUT", "lambda")
+NOTIFICATION_WORKER_LAMBDA = os.environ.get(
+    "NOTIFICATION_WORKER_LAMBDA", f"snow-tracker-notification-processor-{ENVIRONMENT}"
+)
+
+# Lazy-initialized services and Lambda client
 _notification_service = None
+_trip_service = None
+_lambda_client = None
+
+
+def _build_notification_service() -> NotificationService:
+    """Create a NotificationService with its own DynamoDB resource."""
+    dynamodb = boto3.resource("dynamodb")
+    notification_history_service = NotificationHistoryService(
+        table=dynamodb.Table(NOTIFICATIONS_TABLE)
+    )
+    return NotificationService(
+        device_tokens_table=dynamodb.Table(DEVICE_TOKENS_TABLE),
+        user_preferences_table=dynamodb.Table(USER_PREFERENCES_TABLE),
+        resort_events_table=dynamodb.Table(RESORT_EVENTS_TABLE),
+        weather_conditions_table=dynamodb.Table(WEATHER_CONDITIONS_TABLE),
+        resorts_table=dynamodb.Table(RESORTS_TABLE),
+        apns_platform_arn=APNS_PLATFORM_ARN,
+        notification_history_service=notification_history_service,
+        resort_subscribers_table=dynamodb.Table(RESORT_SUBSCRIBERS_TABLE),
+    )
 
 
 def get_notification_service() -> NotificationService:
     """Get or create NotificationService (lazy init for Lambda reuse)."""
     global _notification_service
     if _notification_service is None:
+        _notification_service = _build_notification_service()
+    return _notification_service
+
+
+def get_trip_service() -> TripService:
+    """Get or create TripService (lazy init for Lambda reuse)."""
+    global _trip_service
+    if _trip_service is None:
         dynamodb = boto3.resource("dynamodb")
-        notification_history_service = NotificationHistoryService(
-            table=dynamodb.Table(NOTIFICATIONS_TABLE)
+        _trip_service = TripService(
+            table=dynamodb.Table(TRIPS_TABLE),
+            weather_service=WeatherService(
+                api_key=os.environ.get("WEATHER_API_KEY"),
+                conditions_table=dynamodb.Table(WEATHER_CONDITIONS_TABLE),
+            ),
         )
-        _notification_service = NotificationService(
-            device_tokens_table=dynamodb.Table(DEVICE_TOKENS_TABLE),
-            user_preferences_table=dynamodb.Table(USER_PREFERENCES_TABLE),
-            resort_events_table=dynamodb.Table(RESORT_EVENTS_TABLE),
-            weather_conditions_table=dynamodb.Table(WEATHER_CONDITIONS_TABLE),
-            resorts_table=dynamodb.Table(RESORTS_TABLE),
-            apns_platform_arn=APNS_PLATFORM_ARN,
-            notification_history_service=notification_history_service,
+    return _trip_service
+
+
+def refresh_trip_conditions() -> dict:
+    """Refresh upcoming trips' conditions and alerts.
+
+    A failure here is logged and reported in the summary; it never fails the
+    notification run.
+    """
+    try:
+        return get_trip_service().refresh_upcoming_trip_conditions(
+            TRIP_ALERT_DAYS_AHEAD
         )
-    return _notification_service
+    except Exception as e:
+        logger.error(f"Error refreshing trip conditions: {e}", exc_info=True)
+        return {"error": str(e)}
+
+
+def _get_lambda_client():
+    global _lambda_client
+    if _lambda_client is None:
+        _lambda_client = boto3.client("lambda")
+    return _lambda_client
 
 
 def _is_weekly_digest_event(event: dict) -> bool:
@@ -81,6 +159,101 @@ def _is_weekly_digest_event(event: dict) -> bool:
     return event.get("weekly_digest") is True
 
 
+def _is_resort_change_event(event: dict) -> bool:
+    """Check if the event is a weather worker "resort changed" notification."""
+    return isinstance(event.get("resort_changed"), dict)
+
+
+def _run_segment(service: NotificationService, event: dict) -> dict:
+    """Process one scan segment (or the whole table if the event has none)."""
+    segment = event.get("segment")
+    total_segments = event.get("total_segments")
+    if _is_weekly_digest_event(event):
+        return service.process_weekly_digest(segment, total_segments)
+    return service.process_all_notifications(segment, total_segments)
+
+
+def _invoke_segment_lambda(event: dict) -> dict:
+    """Run a segment in a worker invocation of this Lambda and return its summary."""
+    response = _get_lambda_client().invoke(
+        FunctionName=NOTIFICATION_WORKER_LAMBDA,
+        InvocationType="RequestResponse",
+        Payload=json.dumps(event),
+    )
+    result = json.loads(response["Payload"].read())
+    if response.get("FunctionError") or result.get("statusCode") != 200:
+        raise RuntimeError(f"Segment {event['segment']} failed: {result}")
+    return result["body"]["summary"]
+
+
+def _run_segment_locally(event: dict) -> dict:
+    """Run a segment in this process with its own service (boto3 resources
+    are not thread-safe)."""
+    return _run_segment(_build_notification_service(), event)
+
+
+def fan_out_segments(event: dict, total_segments: int, mode: str) -> dict:
+    """Dispatch every scan segment concurrently and aggregate the summaries.
+
+    Local mode uses threads rather than processes: the work is I/O bound and
+    Lambda has no /dev/shm for multiprocessing primitives.
+
+    Args:
+        event: Triggering event (weekly_digest flag is forwarded)
+        total_segments: Number of DynamoDB parallel-scan segments
+        mode: "lambda" for worker invocations, "local" for a thread pool
+
+    Returns:
+        Summed summary plus segment and failed_segments counts
+    """
+    run = _invoke_segment_lambda if mode == "lambda" else _run_segment_locally
+    summaries = []
+    failed = 0
+
+    with ThreadPoolExecutor(max_workers=total_segments) as executor:
+        futures = {
+            executor.submit(
+                run, {**event, "segment": i, "total_segments": total_segments}
+            ): i
+            for i in range(total_segments)
+        }
+        for future in as_completed(futures):
+            try:
+                summaries.append(future.result())
+            except Exception as e:
+                logger.error(f"Segment {futures[future]} failed: {e}")
+                failed += 1
+
+    summary = NotificationService.merge_summaries(summaries)
+    summary["errors"] = summary.get("errors", 0) + failed
+    summary["segments"] = total_segments
+    summary["failed_segments"] = failed
+    return summary
+
+
+def _process(event: dict) -> dict:
+    """Fan out across scan segments when configured, otherwise run inline.
+
+    Worker events already carry a segment and are never fanned out again.
+    Resort change events are handled on their own, without a table scan.
+    """
+    if _is_resort_change_event(event):
+        change = event["resort_changed"]
+        return get_notification_service().process_resort_change(change["resort_id"])
+    if "segment" not in event and NOTIFICATION_SEGMENTS > 1:
+        logger.info(
+            f"Fanning out {NOTIFICATION_SEGMENTS} segments ({NOTIFICATION_FANOUT})"
+        )
+        summary = fan_out_segments(event, NOTIFICATION_SEGMENTS, NOTIFICATION_FANOUT)
+    else:
+        summary = _run_segment(get_notification_service(), event)
+
+    # Once per hourly run: the coordinator (or inline run), not its workers
+    if "segment" not in event and not _is_weekly_digest_event(event):
+        summary["trips"] = refresh_trip_conditions()
+    return summary
+
+
 def notification_handler(event, context):
     """Lambda handler for notification processing.
 
@@ -90,8 +263,14 @@ def notification_handler(event, context):
     If the event contains {"weekly_digest": true}, it runs the weekly
     digest processing instead of the regular hourly notifications.
 
+    Events with a "segment" key are fan-out workers and only process that
+    scan segment; otherwise the run fans out when NOTIFICATION_SEGMENTS > 1.
+
+    Events with a "resort_changed" payload come from the weather worker and
+    only evaluate that resort's subscribers.
+
     Args:
-        event: CloudWatch Events scheduled event
+        event: CloudWatch Events scheduled event (or worker change event)
         context: Lambda context
 
     Returns:
@@ -102,16 +281,16 @@ def notification_handler(event, context):
     logger.info(f"Event: {event}")
 
     try:
-        service = get_notification_service()
-
         if _is_weekly_digest_event(event):
             logger.info("Processing weekly digest")
-            summary = service.process_weekly_digest()
             message = "Weekly digest processing complete"
+        elif _is_resort_change_event(event):
+            message = "Resort change processing complete"
         else:
-            summary = service.process_all_notifications()
             message = "Notification processing complete"
 
+        summary = _process(event)
+
         logger.info(f"{message}: {summary}")
 
         return {
@@ -151,8 +330,7 @@ def weekly_digest_handler(event, context):
     logger.info(f"Environment: {ENVIRONMENT}")
 
     try:
-        service = get_notification_service()
-        summary = service.process_weekly_digest()
+        summary = _process({**(event or {}), "weekly_digest": True})
 
         logger.info(f"Weekly digest processing complete: {summary}")
 
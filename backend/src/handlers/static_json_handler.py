@@ -2,8 +2,10 @@
 
 This handler can be triggered:
 1. Directly by the weather processor after sequential processing
-2. By a scheduled CloudWatch event (for parallel processing mode)
-3. Manually via the Lambda console or CLI
+2. By the last weather worker of a parallel run, with {"run_id", "chunk_count"}:
+   files are built from the workers' chunk summaries, with no DynamoDB pass
+3. By a scheduled CloudWatch event (backstop for parallel processing mode)
+4. Manually via the Lambda console or CLI
 
 The static JSON files are uploaded to S3 and served via CloudFront for
 fast edge-cached responses, reducing DynamoDB costs and improving app performance.
@@ -14,7 +16,10 @@ import logging
 from datetime import UTC, datetime
 from typing import Any
 
-from services.static_json_generator import generate_static_json_api
+from services.static_json_generator import (
+    generate_static_json_api,
+    generate_static_json_from_chunks,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -28,6 +33,7 @@ def static_json_handler(event: dict[str, Any], context) -> dict[str, Any]:
     This generates:
     - /data/resorts.json - All resort metadata
     - /data/snow-quality.json - All resort snow quality summaries
+    - /data/manifest.json plus changed region/resort shards and a delta
 
     Args:
         event: Lambda event (can be CloudWatch scheduled event or direct invocation)
@@ -40,7 +46,12 @@ def static_json_handler(event: dict[str, Any], context) -> dict[str, Any]:
     logger.info(f"Event: {json.dumps(event)}")
 
     try:
-        result = generate_static_json_api()
+        if event.get("run_id"):
+            result = generate_static_json_from_chunks(
+                event["run_id"], event.get("chunk_count")
+            )
+        else:
+            result = generate_static_json_api()
 
         if result.get("success"):
             logger.info(f"Static JSON generation successful: {result}")
@@ -253,21 +253,26 @@ def process_elevation_point(
 
         # Get existing snow summary for this resort/elevation
         last_known_freeze_date = None
+        freeze_state = None
         existing_summary = None
         if snow_summary_service:
             existing_summary = snow_summary_service.get_or_create_summary(
                 resort_id, level
             )
             last_known_freeze_date = existing_summary.get("last_freeze_date")
+            freeze_state = existing_summary.get("freeze_state")
 
         # Fetch current weather data from Open-Meteo
-        # Pass the last known freeze date for better accumulation tracking
+        # Pass the last known freeze date for better accumulation tracking,
+        # and the freeze-thaw state so only newly arrived hours are scanned
         weather_data = weather_service.get_current_weather(
             latitude=elevation_point.latitude,
             longitude=elevation_point.longitude,
             elevation_meters=elevation_point.elevation_meters,
             last_known_freeze_date=last_known_freeze_date,
+            freeze_state=freeze_state,
         )
+        freeze_state = weather_data.pop("freeze_state", None)
 
         # Merge with all available supplementary sources
         supplementary_sources = _build_supplementary_sources_processor(
@@ -323,6 +328,7 @@ def process_elevation_point(
                     ),
                     last_updated=datetime.now(UTC).isoformat(),
                     season_start_date=existing_summary.get("season_start_date"),
+                    freeze_state=freeze_state,
                 )
             else:
                 # No new freeze - accumulate snowfall
@@ -357,6 +363,7 @@ def process_elevation_point(
                             ),
                             last_updated=datetime.now(UTC).isoformat(),
                             season_start_date=existing_summary.get("season_start_date"),
+                            freeze_state=freeze_state,
                         )
                 else:
                     # Open-Meteo can see the freeze - use its accumulation value
@@ -371,6 +378,7 @@ def process_elevation_point(
                         ),
                         last_updated=datetime.now(UTC).isoformat(),
                         season_start_date=existing_summary.get("season_start_date"),
+                        freeze_state=freeze_state,
                     )
 
                 # Use the higher accumulation value for weather condition
@@ -500,6 +508,10 @@ def orchestrate_parallel_processing(context) -> dict[str, Any]:
 
     logger.info(f"Total workers to invoke: {len(chunked_regions)}")
 
+    # Workers upload per-chunk summaries for this run; the last one to finish
+    # triggers static JSON generation from them
+    run_id = start_time.strftime("%Y%m%dT%H%M%SZ")
+
     # Invoke worker Lambda for each region/chunk (asynchronously)
     invocations = []
     for region, resort_ids in chunked_regions.items():
@@ -508,6 +520,9 @@ def orchestrate_parallel_processing(context) -> dict[str, Any]:
                 "resort_ids": resort_ids,
                 "region": region,
             }
+            if ENABLE_STATIC_JSON:
+                payload["run_id"] = run_id
+                payload["chunk_count"] = len(chunked_regions)
 
             logger.info(
                 f"Invoking worker for region {region} with {len(resort_ids)} resorts"
@@ -2,6 +2,11 @@
 
 This worker Lambda is invoked by the orchestrator (weather_processor) to process
 a batch of resorts in parallel. Each worker handles one region's resorts.
+
+When the orchestrator passes a run_id, each worker also uploads a chunk
+summary (its resorts' metadata and snow quality) for the static JSON API,
+and the worker that completes the run's set of chunks invokes the static
+JSON generator on them.
 """
 
 import gzip
@@ -16,14 +21,21 @@ from typing import Any
 import boto3
 from botocore.exceptions import ClientError
 
+from models.resort import Resort
 from models.weather import WeatherCondition
+from services import ml_scorer
 from services.daily_history_service import DailyHistoryService
 from services.multi_source_merger import MultiSourceMerger, SourceData
 from services.onthesnow_scraper import OnTheSnowScraper
 from services.openmeteo_service import OpenMeteoService
 from services.snow_quality_service import SnowQualityService
 from services.snow_summary_service import SnowSummaryService
-from utils.dynamodb_utils import prepare_for_dynamodb
+from services.static_json_generator import (
+    CHUNK_PREFIX,
+    build_snow_quality_summary,
+    chunk_key,
+)
+from utils.dynamodb_utils import parse_from_dynamodb, prepare_for_dynamodb
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -32,6 +44,7 @@ logger.setLevel(logging.INFO)
 # Initialize AWS clients
 dynamodb = boto3.resource("dynamodb")
 s3_client = boto3.client("s3")
+_lambda_client = None
 # Environment variables
 RESORTS_TABLE = os.environ.get("RESORTS_TABLE", "snow-tracker-resorts-dev")
 WEATHER_CONDITIONS_TABLE = os.environ.get(
@@ -52,6 +65,13 @@ ENVIRONMENT = os.environ.get("ENVIRONMENT", "dev")
 ELEVATION_CONCURRENCY = int(os.environ.get("ELEVATION_CONCURRENCY", "3"))
 # Delay between resorts to avoid overwhelming external APIs (seconds)
 INTER_RESORT_DELAY = float(os.environ.get("INTER_RESORT_DELAY", "0.5"))
+# Notification processor to send a "resort changed" event to (empty = disabled)
+# once a resort's 24h snowfall rises by at least CHANGE_EVENT_MIN_SNOW_CM
+NOTIFICATION_PROCESSOR_LAMBDA = os.environ.get("NOTIFICATION_PROCESSOR_LAMBDA", "")
+CHANGE_EVENT_MIN_SNOW_CM = float(os.environ.get("CHANGE_EVENT_MIN_SNOW_CM", "1.0"))
+# Static JSON generator invoked once all of a run's chunks are uploaded
+# (empty = leave it to the scheduled run)
+STATIC_JSON_LAMBDA = os.environ.get("STATIC_JSON_LAMBDA", "")
 
 # TTL for weather conditions: 60 days (extended from 7 days)
 WEATHER_CONDITIONS_TTL_DAYS = 60
@@ -254,21 +274,26 @@ def process_elevation_point(
 
         # Get existing snow summary for this resort/elevation
         last_known_freeze_date = None
+        freeze_state = None
         existing_summary = None
         if snow_summary_service:
             existing_summary = snow_summary_service.get_or_create_summary(
                 resort_id, level
             )
             last_known_freeze_date = existing_summary.get("last_freeze_date")
+            freeze_state = existing_summary.get("freeze_state")
 
         # Fetch current weather data from Open-Meteo
-        # Pass the last known freeze date for better accumulation tracking
+        # Pass the last known freeze date for better accumulation tracking,
+        # and the freeze-thaw state so only newly arrived hours are scanned
         weather_data = weather_service.get_current_weather(
             latitude=lat,
             longitude=lon,
             elevation_meters=elev,
             last_known_freeze_date=last_known_freeze_date,
+            freeze_state=freeze_state,
         )
+        freeze_state = weather_data.pop("freeze_state", None)
 
         # Merge with all available supplementary sources
         supplementary_sources = _build_supplementary_sources(
@@ -355,6 +380,7 @@ def process_elevation_point(
                     last_updated=datetime.now(UTC).isoformat(),
                     season_start_date=existing_summary.get("season_start_date"),
                     last_snowfall_24h_cm=weather_data.get("snowfall_24h_cm", 0.0),
+                    freeze_state=freeze_state,
                 )
             else:
                 # No new freeze - accumulate snowfall
@@ -389,6 +415,7 @@ def process_elevation_point(
                         last_updated=datetime.now(UTC).isoformat(),
                         season_start_date=existing_summary.get("season_start_date"),
                         last_snowfall_24h_cm=current_24h,
+                        freeze_state=freeze_state,
                     )
                 else:
                     # Open-Meteo can see the freeze - use its accumulation value
@@ -404,6 +431,7 @@ def process_elevation_point(
                         last_updated=datetime.now(UTC).isoformat(),
                         season_start_date=existing_summary.get("season_start_date"),
                         last_snowfall_24h_cm=weather_data.get("snowfall_24h_cm", 0.0),
+                        freeze_state=freeze_state,
                     )
 
                 # Use the higher accumulation value for weather condition
@@ -467,8 +495,14 @@ def process_elevation_point(
                 )
 
         result["success"] = True
+        result["weather_condition"] = weather_condition
         result["raw_data"] = getattr(weather_condition, "raw_data", None)
         result["resort_id"] = resort_id
+        result["snowfall_24h_cm"] = weather_condition.snowfall_24h_cm
+        if existing_summary:
+            result["previous_snowfall_24h_cm"] = existing_summary.get(
+                "last_snowfall_24h_cm", 0.0
+            )
         logger.debug(
             f"Processed {resort_id} {level}: Quality="
             f"{snow_quality.value if hasattr(snow_quality, 'value') else snow_quality}"
@@ -483,6 +517,112 @@ def process_elevation_point(
     return result
 
 
+def _get_lambda_client():
+    global _lambda_client
+    if _lambda_client is None:
+        _lambda_client = boto3.client("lambda")
+    return _lambda_client
+
+
+def build_resort_change(resort_id: str, results: list[dict]) -> dict | None:
+    """Summarize a resort's new snowfall from its elevation results.
+
+    Compares each elevation's 24h snowfall with the value stored in its snow
+    summary on the previous run; elevations without a previous value are
+    treated as new data.
+
+    Returns:
+        Compact change event payload, or None if the rise is below
+        CHANGE_EVENT_MIN_SNOW_CM
+    """
+    current = 0.0
+    previous = 0.0
+    for result in results:
+        if not result.get("success") or result.get("snowfall_24h_cm") is None:
+            continue
+        current = max(current, float(result["snowfall_24h_cm"]))
+        previous = max(previous, float(result.get("previous_snowfall_24h_cm") or 0.0))
+
+    if current - previous < CHANGE_EVENT_MIN_SNOW_CM:
+        return None
+    return {
+        "resort_id": resort_id,
+        "snowfall_24h_cm": round(current, 1),
+        "previous_snowfall_24h_cm": round(previous, 1),
+    }
+
+
+def emit_resort_change(change: dict) -> bool:
+    """Send a "resort changed" event to the notification processor (async).
+
+    The processor evaluates alerts for that resort's subscribers only, so
+    fresh-snow alerts go out as soon as the data lands instead of on the next
+    hourly scan.
+    """
+    try:
+        response = _get_lambda_client().invoke(
+            FunctionName=NOTIFICATION_PROCESSOR_LAMBDA,
+            InvocationType="Event",  # Async invocation
+            Payload=json.dumps({"resort_changed": change}),
+        )
+        return response.get("StatusCode") == 202
+    except Exception as e:
+        logger.warning(f"Failed to emit change event for {change['resort_id']}: {e}")
+        return False
+
+
+def publish_static_chunk(
+    run_id: str,
+    chunk: str,
+    resort_ids: list[str],
+    resorts: list[dict],
+    snow_quality: dict[str, dict],
+    chunk_count: int | None,
+) -> bool:
+    """Upload this worker's static JSON chunk and trigger generation if last.
+
+    Returns:
+        True if this worker completed the run's chunks and invoked the
+        static JSON generator
+    """
+    body = {
+        "run_id": run_id,
+        "chunk": chunk,
+        "resort_ids": resort_ids,
+        "resorts": resorts,
+        "snow_quality": snow_quality,
+    }
+    s3_client.put_object(
+        Bucket=WEBSITE_BUCKET,
+        Key=chunk_key(run_id, chunk),
+        Body=json.dumps(body, default=str).encode("utf-8"),
+        ContentType="application/json",
+    )
+    if not STATIC_JSON_LAMBDA or not chunk_count:
+        return False
+
+    # S3 listings are strongly consistent, so the worker that sees every
+    # chunk is (one of) the last to finish; the generator skips duplicates
+    response = s3_client.list_objects_v2(
+        Bucket=WEBSITE_BUCKET, Prefix=f"{CHUNK_PREFIX}{run_id}/"
+    )
+    written = sum(
+        1 for obj in response.get("Contents", []) if obj["Key"].endswith(".json")
+    )
+    if written < chunk_count:
+        return False
+
+    _get_lambda_client().invoke(
+        FunctionName=STATIC_JSON_LAMBDA,
+        InvocationType="Event",  # Async invocation
+        Payload=json.dumps({"run_id": run_id, "chunk_count": chunk_count}),
+    )
+    logger.info(
+        f"All {chunk_count} chunks of run {run_id} written, static JSON triggered"
+    )
+    return True
+
+
 def weather_worker_handler(event: dict[str, Any], context) -> dict[str, Any]:
     """
     Worker Lambda handler for processing weather data for a batch of resorts.
@@ -493,6 +633,8 @@ def weather_worker_handler(event: dict[str, Any], context) -> dict[str, Any]:
         event: Contains:
             - resort_ids: List of resort IDs to process
             - region: The region name (for metrics)
+            - run_id, chunk_count: Optional; upload a static JSON chunk for
+              this run of chunk_count workers
         context: Lambda context object
 
     Returns:
@@ -500,6 +642,7 @@ def weather_worker_handler(event: dict[str, Any], context) -> dict[str, Any]:
     """
     resort_ids = event.get("resort_ids", [])
     region = event.get("region", "unknown")
+    run_id = event.get("run_id")
 
     if not resort_ids:
         return {
@@ -516,6 +659,7 @@ def weather_worker_handler(event: dict[str, Any], context) -> dict[str, Any]:
         "conditions_saved": 0,
         "scraper_hits": 0,
         "scraper_misses": 0,
+        "change_events": 0,
         "errors": 0,
         "start_time": datetime.now(UTC).isoformat(),
         "region": region,
@@ -580,6 +724,8 @@ def weather_worker_handler(event: dict[str, Any], context) -> dict[str, Any]:
 
         # Collect raw data for archival
         raw_data_items = []
+        # Snow quality summaries for the static JSON chunk
+        chunk_quality: dict[str, dict] = {}
 
         # Process each resort
         for resort_data in resorts:
@@ -633,8 +779,10 @@ def weather_worker_handler(event: dict[str, Any], context) -> dict[str, Any]:
                         for elevation_point in elevation_points
                     }
 
+                    results = []
                     for future in as_completed(futures):
                         result = future.result()
+                        results.append(result)
                         if result["success"]:
                             stats["elevation_points_processed"] += 1
                             stats["conditions_saved"] += 1
@@ -651,6 +799,24 @@ def weather_worker_handler(event: dict[str, Any], context) -> dict[str, Any]:
 
                 stats["resorts_processed"] += 1
 
+                if run_id:
+                    conditions = [
+                        r["weather_condition"]
+                        for r in results
+                        if r["success"] and r.get("weather_condition")
+                    ]
+                    if conditions:
+                        chunk_quality[resort_id] = build_snow_quality_summary(
+                            resort_id, conditions
+                        )
+
+                # Let the notification processor alert this resort's
+                # subscribers right away if fresh snow just landed
+                if NOTIFICATION_PROCESSOR_LAMBDA:
+                    change = build_resort_change(resort_id, results)
+                    if change and emit_resort_change(change):
+                        stats["change_events"] += 1
+
                 # Rate limit: small delay between resorts to avoid overwhelming APIs
                 if INTER_RESORT_DELAY > 0:
                     time.sleep(INTER_RESORT_DELAY)
@@ -666,6 +832,40 @@ def weather_worker_handler(event: dict[str, Any], context) -> dict[str, Any]:
             except Exception as e:
                 logger.error(f"Failed to archive raw data to S3: {e}")
 
+        # Static JSON chunk for this run. Resorts without a summary here
+        # (all elevations failed) get one from DynamoDB in the generator.
+        if run_id and WEBSITE_BUCKET:
+            try:
+                chunk_resorts = []
+                for resort_data in resorts:
+                    try:
+                        resort = Resort(**parse_from_dynamodb(resort_data))
+                        chunk_resorts.append(resort.model_dump())
+                    except Exception as e:
+                        logger.warning(
+                            f"Skipping {resort_data.get('resort_id')} in static "
+                            f"JSON chunk: {e}"
+                        )
+                stats["static_json_triggered"] = publish_static_chunk(
+                    run_id,
+                    region,
+                    resort_ids,
+                    chunk_resorts,
+                    chunk_quality,
+                    event.get("chunk_count"),
+                )
+            except Exception as e:
+                logger.error(f"Failed to publish static JSON chunk: {e}")
+
+        # Score this batch with the registry's shadow model (if any) and log
+        # how far it diverges from the primary
+        try:
+            shadow_stats = ml_scorer.flush_shadow_stats()
+            if shadow_stats:
+                stats["ml_shadow"] = shadow_stats
+        except Exception as e:
+            logger.warning(f"Shadow model scoring failed: {e}")
+
         stats["end_time"] = datetime.now(UTC).isoformat()
         stats["duration_seconds"] = (
             datetime.fromisoformat(stats["end_time"].replace("Z", "+00:00"))
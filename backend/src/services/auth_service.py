@@ -3,7 +3,9 @@
 import hashlib
 import logging
 import os
+import threading
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from enum import Enum
@@ -11,7 +13,8 @@ from typing import Any
 
 import requests
 from botocore.exceptions import ClientError
-from jose import JWTError, jwt
+from cachetools import LRUCache
+from jose import JWTError, jwk, jwt
 from jose.exceptions import ExpiredSignatureError, JWTClaimsError
 
 from models.user import User
@@ -81,6 +84,12 @@ class AuthService:
     _google_keys_cache_time: float = 0
     GOOGLE_KEYS_CACHE_DURATION = 3600  # 1 hour
 
+    # Public keys are refreshed in the background this long before they expire
+    KEYS_REFRESH_MARGIN = 300
+
+    # Recently verified access tokens, so repeat requests skip JWT decoding
+    VERIFIED_TOKEN_CACHE_SIZE = 4096
+
     def __init__(
         self,
         user_table,
@@ -111,6 +120,16 @@ class AuthService:
         )
         self.google_client_id = google_client_id or os.environ.get("GOOGLE_CLIENT_ID")
 
+        # sha256(token) -> (user_id, exp)
+        self._verified_tokens: LRUCache = LRUCache(
+            maxsize=self.VERIFIED_TOKEN_CACHE_SIZE
+        )
+        self._verified_tokens_lock = threading.Lock()
+        # provider -> (JWKS dict, {kid: key object}) for the current fetch
+        self._parsed_keys: dict[AuthProvider, tuple[dict, dict[str, Any]]] = {}
+        self._refreshing: set[AuthProvider] = set()
+        self._refresh_lock = threading.Lock()
+
     # ============================================
     # Apple Sign In
     # ============================================
@@ -217,20 +236,13 @@ class AuthService:
             raise AuthenticationError("Missing key ID in token header")
 
         # Find the matching public key
-        matching_key = None
-        for key in apple_keys.get("keys", []):
-            if key.get("kid") == kid:
-                matching_key = key
-                break
+        matching_key = self._public_key(AuthProvider.APPLE, apple_keys, kid)
 
         if not matching_key:
             # Refresh keys and try again
             self._apple_keys_cache = None
             apple_keys = self._get_apple_public_keys()
-            for key in apple_keys.get("keys", []):
-                if key.get("kid") == kid:
-                    matching_key = key
-                    break
+            matching_key = self._public_key(AuthProvider.APPLE, apple_keys, kid)
 
         if not matching_key:
             raise AuthenticationError("No matching public key found")
@@ -287,26 +299,33 @@ class AuthService:
     def _get_apple_public_keys(self) -> dict[str, Any]:
         """Get Apple's public keys for JWT verification."""
         # Check cache
-        if (
-            self._apple_keys_cache
-            and time.time() - self._apple_keys_cache_time
-            < self.APPLE_KEYS_CACHE_DURATION
-        ):
+        age = time.time() - self._apple_keys_cache_time
+        if self._apple_keys_cache and age < self.APPLE_KEYS_CACHE_DURATION:
+            if age > self.APPLE_KEYS_CACHE_DURATION - self.KEYS_REFRESH_MARGIN:
+                self._refresh_keys_in_background(
+                    AuthProvider.APPLE, self._fetch_apple_public_keys
+                )
             return self._apple_keys_cache
 
         # Fetch fresh keys
         try:
-            response = requests.get(self.APPLE_KEYS_URL, timeout=10)
-            response.raise_for_status()
-            self._apple_keys_cache = response.json()
-            self._apple_keys_cache_time = time.time()
-            return self._apple_keys_cache
+            return self._fetch_apple_public_keys()
         except requests.RequestException as e:
             if self._apple_keys_cache:
                 # Return stale cache if fetch fails
                 return self._apple_keys_cache
             raise AuthenticationError(f"Failed to fetch Apple public keys: {str(e)}")
 
+    def _fetch_apple_public_keys(self) -> dict[str, Any]:
+        """Fetch Apple's JWKS and parse it into key objects."""
+        response = requests.get(self.APPLE_KEYS_URL, timeout=10)
+        response.raise_for_status()
+        keys = response.json()
+        self._parse_public_keys(AuthProvider.APPLE, keys)
+        self._apple_keys_cache = keys
+        self._apple_keys_cache_time = time.time()
+        return keys
+
     # ============================================
     # Google Sign In
     # ============================================
@@ -417,20 +436,13 @@ class AuthService:
             raise AuthenticationError("Missing key ID in token header")
 
         # Find the matching public key
-        matching_key = None
-        for key in google_keys.get("keys", []):
-            if key.get("kid") == kid:
-                matching_key = key
-                break
+        matching_key = self._public_key(AuthProvider.GOOGLE, google_keys, kid)
 
         if not matching_key:
             # Refresh keys and try again
             self._google_keys_cache = None
             google_keys = self._get_google_public_keys()
-            for key in google_keys.get("keys", []):
-                if key.get("kid") == kid:
-                    matching_key = key
-                    break
+            matching_key = self._public_key(AuthProvider.GOOGLE, google_keys, kid)
 
         if not matching_key:
             raise AuthenticationError("No matching public key found")
@@ -484,24 +496,82 @@ class AuthService:
 
     def _get_google_public_keys(self) -> dict[str, Any]:
         """Get Google's public keys for JWT verification."""
-        if (
-            self._google_keys_cache
-            and time.time() - self._google_keys_cache_time
-            < self.GOOGLE_KEYS_CACHE_DURATION
-        ):
+        age = time.time() - self._google_keys_cache_time
+        if self._google_keys_cache and age < self.GOOGLE_KEYS_CACHE_DURATION:
+            if age > self.GOOGLE_KEYS_CACHE_DURATION - self.KEYS_REFRESH_MARGIN:
+                self._refresh_keys_in_background(
+                    AuthProvider.GOOGLE, self._fetch_google_public_keys
+                )
             return self._google_keys_cache
 
         try:
-            response = requests.get(self.GOOGLE_KEYS_URL, timeout=10)
-            response.raise_for_status()
-            self._google_keys_cache = response.json()
-            self._google_keys_cache_time = time.time()
-            return self._google_keys_cache
+            return self._fetch_google_public_keys()
         except requests.RequestException as e:
             if self._google_keys_cache:
                 return self._google_keys_cache
             raise AuthenticationError(f"Failed to fetch Google public keys: {str(e)}")
 
+    def _fetch_google_public_keys(self) -> dict[str, Any]:
+        """Fetch Google's JWKS and parse it into key objects."""
+        response = requests.get(self.GOOGLE_KEYS_URL, timeout=10)
+        response.raise_for_status()
+        keys = response.json()
+        self._parse_public_keys(AuthProvider.GOOGLE, keys)
+        self._google_keys_cache = keys
+        self._google_keys_cache_time = time.time()
+        return keys
+
+    # ============================================
+    # Public Key Helpers
+    # ============================================
+
+    def _parse_public_keys(
+        self, provider: AuthProvider, jwks: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Convert a JWKS response into key objects, indexed by key ID."""
+        parsed = {}
+        for key in jwks.get("keys", []):
+            kid = key.get("kid")
+            if not kid:
+                continue
+            try:
+                parsed[kid] = jwk.construct(key, algorithm=key.get("alg", "RS256"))
+            except Exception as e:
+                logger.warning(
+                    "Skipping unusable %s key %s: %s", provider.value, kid, e
+                )
+        self._parsed_keys[provider] = (jwks, parsed)
+        return parsed
+
+    def _public_key(self, provider: AuthProvider, jwks: dict[str, Any], kid: str):
+        """Key object for kid, parsed once per JWKS fetch."""
+        cached = self._parsed_keys.get(provider)
+        if cached is not None and cached[0] is jwks:
+            return cached[1].get(kid)
+        return self._parse_public_keys(provider, jwks).get(kid)
+
+    def _refresh_keys_in_background(
+        self, provider: AuthProvider, fetch: Callable[[], dict[str, Any]]
+    ) -> None:
+        """Re-fetch keys off the request path before the cached copy expires."""
+        with self._refresh_lock:
+            if provider in self._refreshing:
+                return
+            self._refreshing.add(provider)
+
+        def _refresh():
+            try:
+                fetch()
+            except Exception as e:
+                logger.warning(
+                    "Background %s key refresh failed: %s", provider.value, e
+                )
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(provider)
+
+        threading.Thread(target=_refresh, daemon=True).start()
+
     # ============================================
     # JWT Session Management
     # ============================================
@@ -558,6 +628,17 @@ class AuthService:
         Raises:
             AuthenticationError: If token is invalid
         """
+        # Tokens verified earlier skip decoding until they expire
+        token_hash = hashlib.sha256(token.encode()).hexdigest()
+        with self._verified_tokens_lock:
+            cached = self._verified_tokens.get(token_hash)
+        if cached is not None:
+            user_id, exp = cached
+            if time.time() < exp:
+                return user_id
+            with self._verified_tokens_lock:
+                self._verified_tokens.pop(token_hash, None)
+
         try:
             payload = jwt.decode(
                 token,
@@ -573,13 +654,17 @@ class AuthService:
             if not user_id:
                 raise AuthenticationError("Missing user ID in token")
 
-            return user_id
-
         except ExpiredSignatureError:
             raise AuthenticationError("Token has expired")
         except JWTError as e:
             raise AuthenticationError(f"Invalid token: {str(e)}")
 
+        exp = payload.get("exp")
+        if isinstance(exp, int | float):
+            with self._verified_tokens_lock:
+                self._verified_tokens[token_hash] = (user_id, exp)
+        return user_id
+
     def refresh_tokens(self, refresh_token: str) -> dict[str, str]:
         """Refresh access and refresh tokens.
 
@@ -0,0 +1,198 @@
+"""Token-budgeted context for Bedrock chat calls.
+
+Every turn resends the conversation history, and every tool-loop iteration
+resends the whole exchange so far, so input size (and Bedrock latency and
+cost) grows with conversation length. This module keeps it bounded:
+
+- Recent turns are sent verbatim up to HISTORY_TOKEN_BUDGET; older turns
+  collapse into a short extractive summary at the start of the context.
+- Tool results the model has already seen (in an earlier tool call or in
+  the pre-fetched resort data) are replaced with a pointer to that copy.
+- The static system prompt and tool definitions end with a cache point so
+  Bedrock can reuse them across turns.
+
+Token counts are estimates (about four characters per token); the budget
+only needs to be roughly right.
+"""
+
+import json
+
+CHARS_PER_TOKEN = 4
+HISTORY_TOKEN_BUDGET = 3000
+SUMMARY_TOKEN_BUDGET = 300
+SUMMARY_SNIPPET_CHARS = 160
+# Results shorter than this cost less than the pointer that would replace them
+MIN_DEDUPE_CHARS = 200
+
+CACHE_POINT = {"cachePoint": {"type": "default"}}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for English text."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def system_blocks(static_text: str, dynamic_text: str | None = None) -> list[dict]:
+    """System content with a cache point after the part that never changes.
+
+    Per-request context (user location, pre-fetched data) goes after the
+    cache point so it doesn't invalidate the cached prefix.
+    """
+    blocks = [{"text": static_text}, CACHE_POINT]
+    if dynamic_text:
+        blocks.append({"text": dynamic_text})
+    return blocks
+
+
+def cached_tool_config(tools: list[dict]) -> dict:
+    """Converse toolConfig with a cache point after the tool definitions."""
+    return {"tools": [*tools, CACHE_POINT]}
+
+
+def _snippet(text: str) -> str:
+    text = " ".join(text.split())
+    if len(text) <= SUMMARY_SNIPPET_CHARS:
+        return text
+    return text[: SUMMARY_SNIPPET_CHARS - 3].rstrip() + "..."
+
+
+def summarize_turns(
+    turns: list[tuple[str, str]], budget: int = SUMMARY_TOKEN_BUDGET
+) -> str | None:
+    """One-line-per-message summary of older turns, newest kept first.
+
+    Args:
+        turns: (role, content) pairs in chronological order
+        budget: Token budget for the summary lines
+    """
+    lines = []
+    remaining = budget * CHARS_PER_TOKEN
+    for role, content in reversed(turns):
+        speaker = "User" if role == "user" else "Assistant"
+        line = f"- {speaker}: {_snippet(content)}"
+        if len(line) > remaining:
+            break
+        remaining -= len(line)
+        lines.append(line)
+    if not lines:
+        return None
+
+    lines.reverse()
+    omitted = len(turns) - len(lines)
+    header = "[Summary of earlier messages in this conversation"
+    if omitted:
+        header += f"; {omitted} older message(s) omitted"
+    return header + "]\n" + "\n".join(lines)
+
+
+def build_messages(
+    history: list[dict],
+    user_message: str,
+    budget: int = HISTORY_TOKEN_BUDGET,
+) -> list[dict]:
+    """Build the Converse messages array within a token budget.
+
+    Args:
+        history: Stored messages in chronological order
+        user_message: The new user message (always sent verbatim)
+        budget: Token budget for verbatim history
+
+    Returns:
+        Messages that open with a user turn and alternate roles.
+    """
+    turns = [
+        (item.get("role", "user"), item.get("content", ""))
+        for item in history
+        if item.get("role", "user") in ("user", "assistant") and item.get("content")
+    ]
+
+    # Keep the newest turns verbatim while they fit
+    keep = len(turns)
+    remaining = budget
+    while keep > 0:
+        cost = estimate_tokens(turns[keep - 1][1])
+        if cost > remaining:
+            break
+        remaining -= cost
+        keep -= 1
+    older, recent = turns[:keep], turns[keep:]
+
+    # The conversation has to open with a user turn
+    while recent and recent[0][0] != "user":
+        older.append(recent.pop(0))
+
+    messages: list[dict] = []
+    for role, content in [*recent, ("user", user_message)]:
+        if messages and messages[-1]["role"] == role:
+            # Consecutive turns from one role (e.g. a reply that failed to
+            # save) are merged; Converse requires alternating roles
+            messages[-1]["content"].append({"text": content})
+        else:
+            messages.append({"role": role, "content": [{"text": content}]})
+
+    summary = summarize_turns(older)
+    if summary:
+        messages[0]["content"].insert(0, {"text": summary})
+    return messages
+
+
+def _result_key(value) -> str:
+    # Same serialization as the pre-fetched data blocks, so they can be matched
+    return json.dumps(value, default=str)
+
+
+def dedupe_tool_results(
+    tool_results: list[dict],
+    messages: list[dict],
+    context_data: str | None = None,
+) -> list[dict]:
+    """Replace tool results the model has already seen with a pointer.
+
+    A result is a repeat when an earlier toolResult in messages has the same
+    JSON, or when it appears verbatim in the pre-fetched context data.
+
+    Args:
+        tool_results: toolResult blocks about to be sent
+        messages: The conversation so far
+        context_data: Pre-fetched resort data in the system prompt
+    """
+    seen: dict[str, str] = {}
+    for message in messages:
+        for block in message.get("content", []):
+            result = block.get("toolResult") if isinstance(block, dict) else None
+            if result:
+                content = result.get("content") or []
+                if content and "json" in content[0]:
+                    seen.setdefault(
+                        _result_key(content[0]["json"]), result["toolUseId"]
+                    )
+
+    deduped = []
+    for block in tool_results:
+        result = block["toolResult"]
+        content = result.get("content") or []
+        if not content or "json" not in content[0]:
+            deduped.append(block)
+            continue
+        key = _result_key(content[0]["json"])
+        if len(key) < MIN_DEDUPE_CHARS:
+            deduped.append(block)
+            continue
+
+        if key in seen:
+            note = f"Same result as tool call {seen[key]} above."
+        elif context_data and key in context_data:
+            note = "Same data as the PRE-FETCHED DATA in the system prompt."
+        else:
+            seen[key] = result["toolUseId"]
+            deduped.append(block)
+            continue
+        deduped.append(
+            {
+                "toolResult": {
+                    "toolUseId": result["toolUseId"],
+                    "content": [{"text": note}],
+                }
+            }
+        )
+    return deduped
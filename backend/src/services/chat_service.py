@@ -2,10 +2,10 @@
 
 import json
 import logging
-import re
 import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from typing import Any
@@ -16,6 +16,14 @@ from botocore.exceptions import ClientError
 from ulid import ULID
 
 from models.chat import ChatMessage, ChatResponse, ConversationSummary
+from services.chat_context import (
+    build_messages,
+    cached_tool_config,
+    dedupe_tool_results,
+    system_blocks,
+)
+from services.tool_result_cache import tool_result_cache
+from utils.resort_mentions import ResortMentionDetector
 
 logger = logging.getLogger(__name__)
 
@@ -405,6 +413,9 @@ TOOL_DEFINITIONS = [
     },
 ]
 
+# Tool definitions never change, so Bedrock can cache them with the prompt
+TOOL_CONFIG = cached_tool_config(TOOL_DEFINITIONS)
+
 # Max tool use iterations to prevent infinite loops
 MAX_TOOL_ITERATIONS = 5
 
@@ -415,6 +426,140 @@ BEDROCK_BASE_DELAY = 1.0  # seconds
 # TTL for chat messages: 30 days
 MESSAGE_TTL_DAYS = 30
 
+# Tool calls from one model turn run concurrently, each with its own deadline
+MAX_PARALLEL_TOOLS = 4
+TOOL_TIMEOUT_SECONDS = 20.0
+
+
+def run_tool_calls(
+    tool_use_blocks: list[dict],
+    execute: Callable[[str, dict], dict],
+    on_start: Callable[[str, dict], None] | None = None,
+    on_done: Callable[[dict], None] | None = None,
+) -> tuple[list[dict], list[dict]]:
+    """Execute the toolUse blocks of one model turn concurrently.
+
+    Args:
+        tool_use_blocks: Content blocks with a "toolUse" key
+        execute: Runs one tool, (tool_name, tool_input) -> result
+        on_start: Called from the worker as each tool starts
+        on_done: Called with each tool's call record as it finishes
+
+    Returns:
+        Tuple of (toolResult blocks, tool call records), both in the order
+        the model requested the tools. A tool still running after
+        TOOL_TIMEOUT_SECONDS is reported as failed and left to finish in
+        the background.
+    """
+    tool_uses = [b["toolUse"] for b in tool_use_blocks]
+    started: dict[int, float] = {}
+
+    def _run(i: int, tool_name: str, tool_input: dict) -> dict:
+        started[i] = time.monotonic()
+        if on_start:
+            on_start(tool_name, tool_input)
+        return execute(tool_name, tool_input)
+
+    results: list[dict | None] = [None] * len(tool_uses)
+    calls: list[dict | None] = [None] * len(tool_uses)
+
+    def _finish(i: int, result: dict | None, error: str | None) -> None:
+        tool_use = tool_uses[i]
+        tool_name = tool_use["name"]
+        tool_ms = int((time.monotonic() - started.get(i, time.monotonic())) * 1000)
+        call = {
+            "tool": tool_name,
+            "input": tool_use.get("input", {}),
+            "success": error is None,
+            "duration_ms": tool_ms,
+        }
+        if error is None:
+            logger.info("Tool %s took %dms", tool_name, tool_ms)
+            results[i] = {
+                "toolResult": {
+                    "toolUseId": tool_use["toolUseId"],
+                    "content": [{"json": result}],
+                }
+            }
+        else:
+            logger.error("Tool %s failed after %dms: %s", tool_name, tool_ms, error)
+            call["error"] = error
+            results[i] = {
+                "toolResult": {
+                    "toolUseId": tool_use["toolUseId"],
+                    "content": [{"text": f"Error: {error}"}],
+                    "status": "error",
+                }
+            }
+        calls[i] = call
+        if on_done:
+            on_done(call)
+
+    workers = max(1, min(len(tool_uses), MAX_PARALLEL_TOOLS))
+    executor = ThreadPoolExecutor(max_workers=workers)
+    timed_out = []
+    try:
+        pending = {
+            executor.submit(_run, i, t["name"], t.get("input", {})): i
+            for i, t in enumerate(tool_uses)
+        }
+        while pending:
+            # Wake up for the next completion or the earliest running deadline
+            deadlines = [started[i] for i in pending.values() if i in started]
+            timeout = TOOL_TIMEOUT_SECONDS
+            if deadlines:
+                timeout = max(0.0, min(deadlines) + timeout - time.monotonic())
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = pending.pop(future)
+                try:
+                    _finish(i, future.result(), None)
+                except Exception as e:
+                    _finish(i, None, str(e))
+
+            now = time.monotonic()
+            for future, i in list(pending.items()):
+                if i in started and now - started[i] >= TOOL_TIMEOUT_SECONDS:
+                    del pending[future]
+                    timed_out.append(future)
+                    _finish(i, None, f"timed out after {TOOL_TIMEOUT_SECONDS:.0f}s")
+            # Tools still queued behind hung workers would never start
+            if sum(not f.done() for f in timed_out) >= workers:
+                for future, i in list(pending.items()):
+                    if future.cancel():
+                        del pending[future]
+                        _finish(i, None, "timed out waiting for a worker")
+    finally:
+        # Don't block the turn on a hung tool
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results, calls
+
+
+class WriteBehind:
+    """Runs writes that don't affect the reply off the critical path.
+
+    Each write starts as soon as it is submitted, so it overlaps with the
+    model call instead of delaying it. flush() waits for all of them once
+    the reply is ready; failures are logged, not raised.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures = []
+
+    def submit(self, fn: Callable, *args, **kwargs) -> None:
+        self._futures.append(self._executor.submit(fn, *args, **kwargs))
+
+    def flush(self) -> None:
+        for future in self._futures:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error("Background write failed: %s", e)
+        self._futures = []
+        self._executor.shutdown(wait=True)
+
 
 class ChatService:
     """Service for AI-powered ski conditions chat using AWS Bedrock."""
@@ -448,6 +593,7 @@ class ChatService:
         self.condition_report_service = condition_report_service
         self.daily_history_service = daily_history_service
         self.bedrock = boto3.client("bedrock-runtime", region_name="us-west-2")
+        self._mention_detector: ResortMentionDetector | None = None
 
     def chat(
         self,
@@ -472,76 +618,89 @@ class ChatService:
         if not conversation_id:
             conversation_id = f"conv_{uuid.uuid4().hex[:12]}"
 
-        # Load conversation history (last 20 messages)
-        history = self._load_history(conversation_id, user_id)
-
-        # Build messages for Bedrock
-        messages = self._build_messages(history, user_message)
-
-        # Save user message
-        user_message_id = str(ULID())
-        now = datetime.now(UTC).isoformat()
-        is_first_message = len(history) == 0
-        title = self._generate_title(user_message) if is_first_message else None
-
-        self._save_message(
-            conversation_id=conversation_id,
-            message_id=user_message_id,
-            user_id=user_id,
-            role="user",
-            content=user_message,
-            created_at=now,
-            title=title,
-        )
-
-        # Auto-detect resort mentions and pre-inject conditions data
-        # This reduces Bedrock round trips from 2-3 to 1 for simple queries
-        t0 = time.monotonic()
-        context_data = self._auto_detect_resorts(user_message)
-        t1 = time.monotonic()
-        logger.info(
-            "Chat auto-detect took %.1fs, found context: %s",
-            t1 - t0,
-            bool(context_data),
-        )
+        writes = WriteBehind()
+        # Flushed on every exit path so the user message is saved even if the
+        # model call fails
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Auto-detect resort mentions and pre-inject conditions data while
+                # history loads. This reduces Bedrock round trips from 2-3 to 1
+                # for simple queries
+                t0 = time.monotonic()
+                detect = executor.submit(self._auto_detect_resorts, user_message)
+
+                # Load conversation history (last 20 messages)
+                history = self._load_history(conversation_id, user_id)
+
+                # Build messages for Bedrock
+                messages = self._build_messages(history, user_message)
+
+                # Save user message in the background
+                user_message_id = str(ULID())
+                now = datetime.now(UTC).isoformat()
+                is_first_message = len(history) == 0
+                title = self._generate_title(user_message) if is_first_message else None
+
+                writes.submit(
+                    self._save_message,
+                    conversation_id=conversation_id,
+                    message_id=user_message_id,
+                    user_id=user_id,
+                    role="user",
+                    content=user_message,
+                    created_at=now,
+                    title=title,
+                )
 
-        # Build location context if available
-        location_context = None
-        if user_lat is not None and user_lon is not None:
-            location_context = (
-                f"\n\n--- USER LOCATION ---\n"
-                f"The user's current coordinates: latitude {user_lat:.4f}, longitude {user_lon:.4f}.\n"
-                f"Use the get_nearby_resorts tool with these coordinates when the user asks about "
-                f"nearby resorts, recommendations near them, or 'where should I ski'. "
-                f"Do not mention exact coordinates to the user."
+                context_data = detect.result()
+            t1 = time.monotonic()
+            logger.info(
+                "Chat auto-detect took %.1fs, found context: %s",
+                t1 - t0,
+                bool(context_data),
             )
 
-        # Call Bedrock with tool use loop
-        assistant_text, tool_calls = self._call_bedrock_with_tools(
-            messages, context_data=context_data, location_context=location_context
-        )
-        t2 = time.monotonic()
-        logger.info("Chat Bedrock call took %.1fs (total %.1fs)", t2 - t1, t2 - t0)
-
-        # Save assistant message
-        assistant_message_id = str(ULID())
-        assistant_now = datetime.now(UTC).isoformat()
-
-        self._save_message(
-            conversation_id=conversation_id,
-            message_id=assistant_message_id,
-            user_id=user_id,
-            role="assistant",
-            content=assistant_text,
-            created_at=assistant_now,
-            tool_calls=tool_calls if tool_calls else None,
-        )
+            # Build location context if available
+            location_context = None
+            if user_lat is not None and user_lon is not None:
+                location_context = (
+                    f"\n\n--- USER LOCATION ---\n"
+                    f"The user's current coordinates: latitude {user_lat:.4f}, longitude {user_lon:.4f}.\n"
+                    f"Use the get_nearby_resorts tool with these coordinates when the user asks about "
+                    f"nearby resorts, recommendations near them, or 'where should I ski'. "
+                    f"Do not mention exact coordinates to the user."
+                )
 
-        return ChatResponse(
-            conversation_id=conversation_id,
-            response=assistant_text,
-            message_id=assistant_message_id,
-        )
+            # Call Bedrock with tool use loop
+            assistant_text, tool_calls = self._call_bedrock_with_tools(
+                messages, context_data=context_data, location_context=location_context
+            )
+            t2 = time.monotonic()
+            logger.info("Chat Bedrock call took %.1fs (total %.1fs)", t2 - t1, t2 - t0)
+
+            # Save assistant message. Buffered responses can't be sent before we
+            # return, so wait for both writes (the user message is usually done)
+            assistant_message_id = str(ULID())
+            assistant_now = datetime.now(UTC).isoformat()
+
+            writes.submit(
+                self._save_message,
+                conversation_id=conversation_id,
+                message_id=assistant_message_id,
+                user_id=user_id,
+                role="assistant",
+                content=assistant_text,
+                created_at=assistant_now,
+                tool_calls=tool_calls if tool_calls else None,
+            )
+
+            return ChatResponse(
+                conversation_id=conversation_id,
+                response=assistant_text,
+                message_id=assistant_message_id,
+            )
+        finally:
+            writes.flush()
 
     def list_conversations(self, user_id: str) -> list[ConversationSummary]:
         """List all conversations for a user.
@@ -734,21 +893,13 @@ class ChatService:
     def _build_messages(
         self, history: list[dict[str, Any]], user_message: str
     ) -> list[dict]:
-        """Build the messages array for Bedrock converse API."""
-        messages = []
-
-        for item in history:
-            role = item.get("role", "user")
-            content = item.get("content", "")
-            if role in ("user", "assistant") and content:
-                messages.append({"role": role, "content": [{"text": content}]})
+        """Build the messages array for Bedrock converse API.
 
-        # Add the new user message
-        messages.append({"role": "user", "content": [{"text": user_message}]})
-
-        return messages
+        History beyond the token budget is summarized (see chat_context).
+        """
+        return build_messages(history, user_message)
 
-    def _invoke_bedrock(self, system_text: str, messages: list[dict]) -> dict | None:
+    def _invoke_bedrock(self, system: list[dict], messages: list[dict]) -> dict | None:
         """Invoke Bedrock converse API with retry on throttling.
 
         Returns the response dict, or None if all retries failed.
@@ -757,9 +908,9 @@ class ChatService:
             try:
                 return self.bedrock.converse(
                     modelId="us.anthropic.claude-sonnet-4-6",
-                    system=[{"text": system_text}],
+                    system=system,
                     messages=messages,
-                    toolConfig={"tools": TOOL_DEFINITIONS},
+                    toolConfig=TOOL_CONFIG,
                     inferenceConfig={"maxTokens": 2048, "temperature": 0.5},
                 )
             except ClientError as e:
@@ -795,7 +946,7 @@ class ChatService:
         return None
 
     def _invoke_bedrock_no_tools(
-        self, system_text: str, messages: list[dict]
+        self, system: list[dict], messages: list[dict]
     ) -> dict | None:
         """Invoke Bedrock converse API without tools (faster, single response).
 
@@ -805,7 +956,7 @@ class ChatService:
             try:
                 return self.bedrock.converse(
                     modelId="us.anthropic.claude-sonnet-4-6",
-                    system=[{"text": system_text}],
+                    system=system,
                     messages=messages,
                     inferenceConfig={"maxTokens": 2048, "temperature": 0.5},
                 )
@@ -850,20 +1001,23 @@ class ChatService:
         """
         all_tool_calls = []
 
-        # Build system prompt with optional pre-injected context
-        system_text = SYSTEM_PROMPT
+        # Build system prompt with optional pre-injected context. The static
+        # prompt stays a separate, cacheable block
+        extra_text = ""
         if location_context:
-            system_text += location_context
+            extra_text += location_context
         if context_data:
-            system_text += (
+            extra_text += (
                 "\n\n--- PRE-FETCHED DATA ---\n"
                 "The following resort data was auto-detected from the user's message. "
                 "Use this data directly instead of calling tools for these resorts. "
                 "You may still use tools for additional resorts or data not covered here.\n\n"
                 + context_data
             )
+        system = system_blocks(SYSTEM_PROMPT, extra_text.strip())
+        if context_data:
             # When we have pre-fetched data, try without tools first for speed
-            response = self._invoke_bedrock_no_tools(system_text, messages)
+            response = self._invoke_bedrock_no_tools(system, messages)
             if response is not None:
                 output = response.get("output", {})
                 message = output.get("message", {})
@@ -874,7 +1028,7 @@ class ChatService:
 
         for iteration in range(MAX_TOOL_ITERATIONS):
             t_bedrock = time.monotonic()
-            response = self._invoke_bedrock(system_text, messages)
+            response = self._invoke_bedrock(system, messages)
             bedrock_ms = int((time.monotonic() - t_bedrock) * 1000)
             logger.info("Bedrock call #%d took %dms", iteration + 1, bedrock_ms)
             if response is None:
@@ -897,65 +1051,15 @@ class ChatService:
                 # Add assistant message with tool use to conversation
                 messages.append({"role": "assistant", "content": content_blocks})
 
-                # Execute tools and build result message
-                tool_results = []
-                for tool_block in tool_use_blocks:
-                    tool_use = tool_block["toolUse"]
-                    tool_name = tool_use["name"]
-                    tool_input = tool_use.get("input", {})
-                    tool_use_id = tool_use["toolUseId"]
-
-                    t_tool = time.monotonic()
-                    try:
-                        result = self._execute_tool(tool_name, tool_input)
-                        tool_ms = int((time.monotonic() - t_tool) * 1000)
-                        logger.info(
-                            "Tool %s took %dms (input: %s)",
-                            tool_name,
-                            tool_ms,
-                            tool_input,
-                        )
-                        all_tool_calls.append(
-                            {
-                                "tool": tool_name,
-                                "input": tool_input,
-                                "success": True,
-                                "duration_ms": tool_ms,
-                            }
-                        )
-                        tool_results.append(
-                            {
-                                "toolResult": {
-                                    "toolUseId": tool_use_id,
-                                    "content": [{"json": result}],
-                                }
-                            }
-                        )
-                    except Exception as e:
-                        tool_ms = int((time.monotonic() - t_tool) * 1000)
-                        logger.error(
-                            "Tool %s failed after %dms: %s", tool_name, tool_ms, e
-                        )
-                        all_tool_calls.append(
-                            {
-                                "tool": tool_name,
-                                "input": tool_input,
-                                "success": False,
-                                "error": str(e),
-                                "duration_ms": tool_ms,
-                            }
-                        )
-                        tool_results.append(
-                            {
-                                "toolResult": {
-                                    "toolUseId": tool_use_id,
-                                    "content": [{"text": f"Error: {str(e)}"}],
-                                    "status": "error",
-                                }
-                            }
-                        )
+                # Execute tools concurrently and build result message
+                tool_results, tool_calls = run_tool_calls(
+                    tool_use_blocks, self._execute_tool
+                )
+                all_tool_calls.extend(tool_calls)
 
-                # Add tool results as user message
+                # Add tool results as user message, minus data the model has
+                # already seen this turn
+                tool_results = dedupe_tool_results(tool_results, messages, context_data)
                 messages.append({"role": "user", "content": tool_results})
                 continue
 
@@ -979,7 +1083,17 @@ class ChatService:
         )
 
     def _execute_tool(self, tool_name: str, tool_input: dict) -> dict:
-        """Execute a tool and return the result as a dictionary."""
+        """Execute a tool and return the result as a dictionary.
+
+        Results of data-only tools are shared across conversations until the
+        next weather run (see tool_result_cache).
+        """
+        return tool_result_cache.get_or_run(
+            tool_name, tool_input, lambda: self._run_tool(tool_name, tool_input)
+        )
+
+    def _run_tool(self, tool_name: str, tool_input: dict) -> dict:
+        """Dispatch a tool call to its implementation."""
         if tool_name == "get_resort_conditions":
             resort_id = tool_input.get("resort_id")
             if not resort_id:
@@ -1621,48 +1735,36 @@ class ChatService:
             logger.error("Error saving message %s: %s", message_id, e)
             raise
 
+    def _get_mention_detector(self) -> ResortMentionDetector:
+        """Detector over aliases and every resort name, built once per container."""
+        if self._mention_detector is None:
+            try:
+                self._mention_detector = ResortMentionDetector(
+                    RESORT_ALIASES,
+                    [
+                        (r.resort_id, r.name)
+                        for r in self.resort_service.get_all_resorts()
+                    ],
+                )
+            except Exception as e:
+                # Aliases only for now; retry the names on the next message
+                logger.warning("Error loading resorts for auto-detect: %s", e)
+                return ResortMentionDetector(RESORT_ALIASES)
+        return self._mention_detector
+
     def _auto_detect_resorts(self, user_message: str) -> str | None:
         """Detect resort mentions in user message and pre-fetch conditions.
 
         Matches against known aliases and all resort names from the database.
         Returns formatted context string or None if no resorts detected.
         """
-        message_lower = user_message.lower()
-        detected_ids: set[str] = set()
-
-        # Check against static aliases first (fast)
-        for alias, resort_id in RESORT_ALIASES.items():
-            # Word boundary matching to avoid false positives
-            pattern = r"\b" + re.escape(alias) + r"\b"
-            if re.search(pattern, message_lower):
-                detected_ids.add(resort_id)
-
-        # If no alias match, try matching against all resort names
-        if not detected_ids:
-            try:
-                all_resorts = self.resort_service.get_all_resorts()
-                for resort in all_resorts:
-                    # Match on name (at least 4 chars to avoid false positives)
-                    name_lower = resort.name.lower()
-                    if len(name_lower) >= 4:
-                        # Try full name first
-                        if name_lower in message_lower:
-                            detected_ids.add(resort.resort_id)
-                            continue
-                        # Try first word of multi-word names (e.g., "Revelstoke" from "Revelstoke Mountain Resort")
-                        first_word = name_lower.split()[0]
-                        if len(first_word) >= 5:
-                            pattern = r"\b" + re.escape(first_word) + r"\b"
-                            if re.search(pattern, message_lower):
-                                detected_ids.add(resort.resort_id)
-            except Exception as e:
-                logger.warning("Error in resort auto-detect: %s", e)
+        detected_ids = self._get_mention_detector().find(user_message)
 
         if not detected_ids:
             return None
 
         # Limit to 3 resorts to keep context manageable
-        resort_ids = list(detected_ids)[:3]
+        resort_ids = detected_ids[:3]
         context_parts = []
 
         def _fetch_resort_context(resort_id: str) -> str | None:
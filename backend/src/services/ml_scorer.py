@@ -7,10 +7,15 @@ and outputs a quality score from 1.0 (HORRIBLE) to 6.0 (EXCELLENT).
 See ml/ALGORITHM.md for full documentation.
 """
 
+import bisect
 import json
 import logging
 import math
-from datetime import UTC
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
@@ -23,6 +28,35 @@ logger = logging.getLogger(__name__)
 MODEL_PATH = Path(__file__).parent.parent / "ml_model" / "model_weights_v2.json"
 _model = None
 
+# Inference mode: "ensemble" averages every ensemble member (most accurate);
+# "student" runs the single distilled network from `ml/train_v2.py --distill`
+# when the weights file contains one (~10x fewer multiply-adds per prediction).
+SCORER_MODE = os.environ.get("ML_SCORER_MODE", "ensemble").lower()
+
+# Versioned model registry. When ML_MODEL_BUCKET is set, the primary (and an
+# optional shadow) model come from s3://<bucket>/<prefix>manifest.json instead
+# of the bundled weights:
+#   {"primary": {"version": "v2-20260301", "key": "ml-models/v2-20260301.json"},
+#    "shadow": {"version": "v3-rc1", "key": "ml-models/v3-rc1.json"}}
+# Models are cached per container; the manifest is re-read at most every
+# ML_MODEL_REFRESH_SECONDS and a model is only downloaded when its version
+# changes. Publish with `ml/publish_model.py`.
+MODEL_BUCKET = os.environ.get("ML_MODEL_BUCKET", "")
+MODEL_PREFIX = os.environ.get("ML_MODEL_PREFIX", "ml-models/")
+MODEL_REFRESH_SECONDS = float(os.environ.get("ML_MODEL_REFRESH_SECONDS", "300"))
+
+# Record features scored by predict_quality so the registry's shadow model can
+# score them after the batch (see flush_shadow_stats). Worker only.
+SHADOW_SCORING = os.environ.get("ML_SHADOW_SCORING", "false").lower() == "true"
+SHADOW_MAX_SAMPLES = 5000
+
+_shadow_model = None
+_shadow_samples: list[tuple[list[float], dict[str, float], float]] = []
+_registry_versions: dict[str, str | None] = {"primary": None, "shadow": None}
+_registry_checked_at: float | None = None
+_registry_lock = threading.Lock()
+_s3_client = None
+
 
 def _transpose_weights(weights: dict) -> dict:
     """Pre-transpose W1 for fast row-major dot products.
@@ -37,26 +71,109 @@ def _transpose_weights(weights: dict) -> dict:
     return {**weights, "W1_T": W1_T}
 
 
+def _prepare_model(model: dict) -> dict:
+    """Pre-transpose every network in a weights file for fast inference."""
+    ensemble = model.get("ensemble", [])
+    if ensemble:
+        model["ensemble"] = [_transpose_weights(m) for m in ensemble]
+    else:
+        model["weights"] = _transpose_weights(model["weights"])
+    if model.get("student"):
+        model["student"] = _transpose_weights(model["student"])
+    return model
+
+
+def _describe_model(model: dict) -> str:
+    hidden = model["architecture"]["hidden_size"]
+    ensemble = model.get("ensemble", [])
+    desc = (
+        f"ensemble ({len(ensemble)} models, primary: {hidden} hidden)"
+        if ensemble
+        else f"({hidden} hidden neurons)"
+    )
+    if model.get("student"):
+        desc += (
+            f", distilled student ({model['student']['n_hidden']} hidden, "
+            f"mode={SCORER_MODE})"
+        )
+    return desc
+
+
+def _fetch_registry_json(key: str) -> dict:
+    global _s3_client
+    if _s3_client is None:
+        import boto3
+
+        _s3_client = boto3.client("s3")
+    response = _s3_client.get_object(Bucket=MODEL_BUCKET, Key=key)
+    return json.loads(response["Body"].read())
+
+
+def _refresh_registry() -> None:
+    """Swap in new primary/shadow models when the registry manifest changes.
+
+    Never raises: on any S3 or parse error the current models stay in place
+    and the manifest is retried after the next refresh interval.
+    """
+    global _model, _shadow_model, _registry_checked_at
+    now = time.monotonic()
+    if (
+        _registry_checked_at is not None
+        and now - _registry_checked_at < MODEL_REFRESH_SECONDS
+    ):
+        return
+    # Only the first load waits; later refreshes keep serving the current model
+    if not _registry_lock.acquire(blocking=_model is None):
+        return
+    try:
+        if (
+            _registry_checked_at is not None
+            and now - _registry_checked_at < MODEL_REFRESH_SECONDS
+        ):
+            return
+        _registry_checked_at = now
+        manifest = _fetch_registry_json(f"{MODEL_PREFIX}manifest.json")
+        for role in ("primary", "shadow"):
+            entry = manifest.get(role)
+            version = entry["version"] if entry else None
+            # A manifest without a primary keeps serving the current model
+            if version == _registry_versions[role] or (role == "primary" and not entry):
+                continue
+            model = None
+            if entry:
+                model = _prepare_model(_fetch_registry_json(entry["key"]))
+                model["version"] = version
+                logger.info(
+                    f"Loaded {role} ML model {version}: {_describe_model(model)}"
+                )
+            else:
+                logger.info(f"Shadow ML model {_registry_versions[role]} retired")
+            if role == "primary":
+                _model = model
+            else:
+                _shadow_model = model
+                _shadow_samples.clear()
+            _registry_versions[role] = version
+    except Exception as e:
+        logger.warning(f"ML model registry refresh failed, keeping current models: {e}")
+    finally:
+        _registry_lock.release()
+
+
 def _load_model() -> dict:
-    """Load model weights from JSON file."""
+    """Load model weights from the registry (if configured) or the bundled file."""
     global _model
+    if MODEL_BUCKET:
+        _refresh_registry()
     if _model is not None:
         return _model
     try:
         with open(MODEL_PATH) as f:
-            _model = json.load(f)
-        # Pre-transpose weights for faster inference
-        ensemble = _model.get("ensemble", [])
-        if ensemble:
-            _model["ensemble"] = [_transpose_weights(m) for m in ensemble]
-            logger.info(
-                f"Loaded ML model v2 ensemble ({len(ensemble)} models, "
-                f"primary: {_model['architecture']['hidden_size']} hidden)"
-            )
-        else:
-            _model["weights"] = _transpose_weights(_model["weights"])
-            logger.info(
-                f"Loaded ML model v2 ({_model['architecture']['hidden_size']} hidden neurons)"
+            _model = _prepare_model(json.load(f))
+        logger.info(f"Loaded ML model v2 {_describe_model(_model)}")
+        if SCORER_MODE == "student" and not _model.get("student"):
+            logger.warning(
+                "ML_SCORER_MODE=student but no student model, using ensemble"
             )
         return _model
     except FileNotFoundError:
@@ -87,9 +204,11 @@ def get_quality_thresholds() -> dict[str, float]:
     }
 
 
-def raw_score_to_quality(score: float) -> SnowQuality:
+def raw_score_to_quality(
+    score: float, thresholds: dict[str, float] | None = None
+) -> SnowQuality:
     """Convert a raw ML score to a SnowQuality enum using model thresholds."""
-    t = get_quality_thresholds()
+    t = thresholds or get_quality_thresholds()
     if score >= t.get("champagne_powder", 5.5):
         return SnowQuality.CHAMPAGNE_POWDER
     elif score >= t.get("powder_day", 5.0):
@@ -152,6 +271,21 @@ def _forward_ensemble(normalized: list[float], ensemble: list[dict]) -> float:
     return total / len(ensemble)
 
 
+def _run_inference(normalized: list[float], model: dict) -> float:
+    """Score normalized features with the configured inference path.
+
+    Uses the distilled student in "student" mode (if present), otherwise the
+    ensemble, otherwise the single primary network.
+    """
+    student = model.get("student")
+    if student and SCORER_MODE == "student":
+        return _forward_single(normalized, student)
+    ensemble = model.get("ensemble", [])
+    if ensemble:
+        return _forward_ensemble(normalized, ensemble)
+    return _forward_single(normalized, model["weights"])
+
+
 def _compute_wind_chill(temp_c: float, wind_kmh: float) -> float:
     """Compute wind chill temperature using the North American formula.
 
@@ -661,17 +795,25 @@ def _extract_features_at_hour(
     }
 
 
-def extract_features_from_raw_data(
-    condition: Any,
-    elevation_m: float | None = None,
-) -> dict[str, float] | None:
-    """Extract ML features from raw hourly data stored in condition.raw_data.
+def _find_current_index(hourly_times: list[str]) -> int:
+    """Index of the first hourly slot at or after the current UTC hour.
 
-    This gives exact features (not approximations) when raw_data is available.
+    Open-Meteo times are sorted ISO strings, so this is a binary search on
+    the "YYYY-MM-DDTHH" prefix. Falls back to the last slot.
     """
+    now_hour = datetime.now(UTC).strftime("%Y-%m-%dT%H")
+    index = bisect.bisect_left(hourly_times, now_hour, key=lambda t: t[:13])
+    return min(index, len(hourly_times) - 1)
+
+
+def _extract_raw_data_features(
+    condition: Any,
+    elevation_m: float | None = None,
+) -> tuple[dict[str, float] | None, int | None]:
+    """Exact raw features from condition.raw_data plus the current hour index."""
     raw_data = getattr(condition, "raw_data", None)
     if not raw_data or not isinstance(raw_data, dict):
-        return None
+        return None, None
 
     api_response = raw_data.get("api_response", raw_data)
     hourly = api_response.get("hourly", {})
@@ -685,22 +827,13 @@ def extract_features_from_raw_data(
     wind_gust_arr = hourly.get("wind_gusts_10m", [])
 
     if not temps or len(temps) < 48:
-        return None
-
-    from datetime import datetime
+        return None, None
 
     hourly_times = hourly.get("time", [])
-
-    # Find current hour index
-    now_str = datetime.now(UTC).strftime("%Y-%m-%dT%H:00")
-    current_index = len(hourly_times) - 1
-    for i, time_str in enumerate(hourly_times):
-        if time_str[:13] >= now_str[:13]:
-            current_index = i
-            break
+    current_index = _find_current_index(hourly_times)
 
     elev = float(elevation_m or raw_data.get("elevation_meters", 1500.0))
-    return _extract_features_at_hour(
+    raw_features = _extract_features_at_hour(
         temps,
         snowfall,
         wind_speeds,
@@ -712,6 +845,78 @@ def extract_features_from_raw_data(
         visibility_arr or None,
         wind_gust_arr or None,
     )
+    return raw_features, current_index
+
+
+def extract_features_from_raw_data(
+    condition: Any,
+    elevation_m: float | None = None,
+) -> dict[str, float] | None:
+    """Extract ML features from raw hourly data stored in condition.raw_data.
+
+    This gives exact features (not approximations) when raw_data is available.
+    """
+    return _extract_raw_data_features(condition, elevation_m)[0]
+
+
+@dataclass
+class ScoringContext:
+    """Per-condition scoring inputs and results, derived once.
+
+    Built by build_scoring_context() and passed to predict_quality() so
+    SnowQualityService and the ML path share one walk of the hourly arrays.
+    Score fields are filled in by predict_quality().
+    """
+
+    raw_features: dict[str, float] | None
+    features: list[float] | None = None
+    current_index: int | None = None
+    exact: bool = False  # raw_features came from raw hourly data
+    model_score: float | None = None  # before physics constraints
+    score: float | None = None
+    quality: SnowQuality = SnowQuality.UNKNOWN
+    no_snowfall_capped: bool = False
+    fresh_snow_floored: bool = False
+
+
+def build_scoring_context(
+    condition: Any,
+    elevation_m: float | None = None,
+    exact_only: bool = False,
+) -> ScoringContext:
+    """Extract and engineer ML features for a condition in a single pass.
+
+    Prefers exact features from raw_data, falls back to approximation from
+    condition fields, then applies merged-source snowfall overrides.
+
+    Args:
+        condition: WeatherCondition object
+        elevation_m: Elevation in meters
+        exact_only: Skip the approximation when raw_data is missing and
+            return an empty, inexact context instead
+    """
+    raw_features, current_index = _extract_raw_data_features(condition, elevation_m)
+    exact = raw_features is not None
+    if raw_features is None:
+        if exact_only:
+            return ScoringContext(raw_features=None)
+        raw_features = extract_features_from_condition(condition, elevation_m)
+    if raw_features is None:
+        return ScoringContext(raw_features=None)
+
+    # Override snowfall features with merged values from the condition.
+    # raw_data features use Open-Meteo's hourly arrays, but the merger
+    # may have corrected snowfall totals using resort-reported data
+    # (OnTheSnow, Snow-Forecast). Without this, the ML model sees
+    # Open-Meteo's underreported snowfall instead of the merged values.
+    _override_snowfall_from_condition(raw_features, condition)
+
+    return ScoringContext(
+        raw_features=raw_features,
+        features=engineer_features(raw_features),
+        current_index=current_index,
+        exact=exact,
+    )
 
 
 def _override_snowfall_from_condition(
@@ -756,6 +961,7 @@ def _override_snowfall_from_condition(
 def predict_quality(
     condition: Any,
     elevation_m: float | None = None,
+    context: ScoringContext | None = None,
 ) -> tuple[SnowQuality, float]:
     """Predict snow quality using the ML model.
 
@@ -765,6 +971,8 @@ def predict_quality(
     Args:
         condition: WeatherCondition object
         elevation_m: Elevation in meters
+        context: Features already extracted by build_scoring_context();
+            built here if omitted. Score fields are written back to it.
 
     Returns:
         Tuple of (SnowQuality, raw_score)
@@ -773,45 +981,94 @@ def predict_quality(
     if model is None:
         return SnowQuality.UNKNOWN, 3.5
 
-    # Try exact features from raw data first
-    raw_features = extract_features_from_raw_data(condition, elevation_m)
-    if raw_features is None:
-        # Fall back to approximation
-        raw_features = extract_features_from_condition(condition, elevation_m)
-    if raw_features is None:
+    if context is None:
+        context = build_scoring_context(condition, elevation_m)
+    if context.raw_features is None:
         return SnowQuality.UNKNOWN, 3.5
 
-    # Override snowfall features with merged values from the condition.
-    # raw_data features use Open-Meteo's hourly arrays, but the merger
-    # may have corrected snowfall totals using resort-reported data
-    # (OnTheSnow, Snow-Forecast). Without this, the ML model sees
-    # Open-Meteo's underreported snowfall instead of the merged values.
-    _override_snowfall_from_condition(raw_features, condition)
+    score = _score_features(context.features, context.raw_features, model, context)
 
-    # Engineer features
-    features = engineer_features(raw_features)
+    # Queue for the shadow model; it is scored after the batch, off this path
+    if (
+        SHADOW_SCORING
+        and _shadow_model is not None
+        and len(_shadow_samples) < SHADOW_MAX_SAMPLES
+    ):
+        _shadow_samples.append((context.features, context.raw_features, score))
+
+    quality = raw_score_to_quality(score)
+    context.score = score
+    context.quality = quality
+
+    return quality, score
 
-    # Normalize
+
+def _score_features(
+    features: list[float],
+    raw_features: dict[str, float],
+    model: dict,
+    context: ScoringContext | None = None,
+) -> float:
+    """Normalize engineered features, run inference and apply physics caps."""
     norm = model["normalization"]
-    mean = norm["mean"]
-    std = norm["std"]
-    normalized = [(f - m) / s for f, m, s in zip(features, mean, std, strict=False)]
+    normalized = [
+        (f - m) / s
+        for f, m, s in zip(features, norm["mean"], norm["std"], strict=False)
+    ]
 
-    # Run inference — ensemble if available, single model otherwise
-    ensemble = model.get("ensemble", [])
-    if ensemble:
-        score = _forward_ensemble(normalized, ensemble)
-    else:
-        score = _forward_single(normalized, model["weights"])
-    score = max(1.0, min(6.0, score))
+    # Run inference — student, ensemble or single model (see SCORER_MODE)
+    model_score = max(1.0, min(6.0, _run_inference(normalized, model)))
 
     # Apply physics constraints
-    score = _apply_no_snowfall_cap(score, raw_features)
-    score = _apply_fresh_snow_floor(score, raw_features)
+    capped = _apply_no_snowfall_cap(model_score, raw_features)
+    score = _apply_fresh_snow_floor(capped, raw_features)
 
-    quality = raw_score_to_quality(score)
+    if context is not None:
+        context.model_score = model_score
+        context.no_snowfall_capped = capped < model_score
+        context.fresh_snow_floored = score > capped
+    return score
 
-    return quality, score
+
+def flush_shadow_stats() -> dict[str, Any] | None:
+    """Score queued predictions with the shadow model and log the divergence.
+
+    Called by the weather worker once per invocation. Returns the stats dict
+    (also logged as JSON), or None when there is no shadow model or no queued
+    predictions.
+    """
+    shadow = _shadow_model
+    samples = _shadow_samples[:]
+    _shadow_samples.clear()
+    if shadow is None or not samples:
+        return None
+
+    primary = _load_model()
+    shadow_thresholds = shadow.get("quality_thresholds")
+    diffs = []
+    agree = 0
+    for features, raw_features, primary_score in samples:
+        shadow_score = _score_features(features, raw_features, shadow)
+        diffs.append(shadow_score - primary_score)
+        if raw_score_to_quality(primary_score) == raw_score_to_quality(
+            shadow_score, shadow_thresholds
+        ):
+            agree += 1
+
+    abs_diffs = sorted(abs(d) for d in diffs)
+    n = len(diffs)
+    stats = {
+        "primary_version": (primary or {}).get("version"),
+        "shadow_version": shadow.get("version"),
+        "n": n,
+        "mean_diff": round(sum(diffs) / n, 4),
+        "mean_abs_diff": round(sum(abs_diffs) / n, 4),
+        "p95_abs_diff": round(abs_diffs[min(n - 1, int(n * 0.95))], 4),
+        "max_abs_diff": round(abs_diffs[-1], 4),
+        "quality_agreement": round(agree / n, 4),
+    }
+    logger.info(f"ML shadow divergence: {json.dumps(stats)}")
+    return stats
 
 
 def _apply_no_snowfall_cap(
@@ -998,23 +1255,7 @@ def predict_quality_at_hour(
         return SnowQuality.UNKNOWN, 3.5
 
     features = engineer_features(raw_features)
-
-    norm = model["normalization"]
-    normalized = [
-        (f - m) / s
-        for f, m, s in zip(features, norm["mean"], norm["std"], strict=False)
-    ]
-
-    ensemble = model.get("ensemble", [])
-    if ensemble:
-        score = _forward_ensemble(normalized, ensemble)
-    else:
-        score = _forward_single(normalized, model["weights"])
-    score = max(1.0, min(6.0, score))
-
-    # Apply physics constraints
-    score = _apply_no_snowfall_cap(score, raw_features)
-    score = _apply_fresh_snow_floor(score, raw_features)
+    score = _score_features(features, raw_features, model)
 
     quality = raw_score_to_quality(score)
 
@@ -4,11 +4,17 @@ import json
 import logging
 import os
 import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from typing import Optional
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from models.notification import (
@@ -33,8 +39,230 @@ def _to_float(val) -> float:
     return float(val)
 
 
+def _fresh_snow_from_items(items: list[dict]) -> float:
+    """Max snowfall_24h_cm across the latest per-elevation condition items."""
+    if not items:
+        return 0.0
+    return max(float(item.get("snowfall_24h_cm", 0.0)) for item in items)
+
+
+def _temperature_from_items(items: list[dict]) -> float | None:
+    """Current temperature from the most recent condition item."""
+    if not items:
+        return None
+    temp = items[0].get("current_temp_celsius")
+    return _to_float(temp) if temp is not None else None
+
+
+def _powder_conditions_from_items(items: list[dict]) -> dict:
+    """Powder day inputs from the most recent condition item."""
+    if not items:
+        return {}
+    item = items[0]
+    return {
+        "snowfall_24h_cm": _to_float(item.get("snowfall_24h_cm", 0.0)),
+        "current_temp_celsius": _to_float(item.get("current_temp_celsius"))
+        if item.get("current_temp_celsius") is not None
+        else None,
+        "wind_speed_kmh": _to_float(item.get("wind_speed_kmh"))
+        if item.get("wind_speed_kmh") is not None
+        else None,
+        "quality_score": _to_float(item.get("quality_score"))
+        if item.get("quality_score") is not None
+        else None,
+    }
+
+
+def _forecast_from_items(items: list[dict]) -> dict:
+    """Max predicted snowfall per forecast period across elevations."""
+    if not items:
+        return {}
+    return {
+        "predicted_snow_24h_cm": max(
+            float(item.get("predicted_snow_24h_cm", 0.0)) for item in items
+        ),
+        "predicted_snow_48h_cm": max(
+            float(item.get("predicted_snow_48h_cm", 0.0)) for item in items
+        ),
+        "predicted_snow_72h_cm": max(
+            float(item.get("predicted_snow_72h_cm", 0.0)) for item in items
+        ),
+    }
+
+
+def _event_alerts_enabled(
+    notification_settings: UserNotificationPreferences, resort_id: str
+) -> bool:
+    """Whether a user wants event alerts for a resort (per-resort override first)."""
+    resort_settings = notification_settings.resort_settings.get(resort_id)
+    if resort_settings:
+        return resort_settings.event_notifications_enabled
+    return notification_settings.event_alerts
+
+
 logger = logging.getLogger(__name__)
 
+# Push delivery: concurrent SNS publishers, paced below the account's SNS
+# mobile-push TPS quota, with backoff when SNS throttles anyway
+PUSH_CONCURRENCY = int(os.environ.get("PUSH_CONCURRENCY", "16"))
+PUSH_RATE_PER_SECOND = float(os.environ.get("PUSH_RATE_PER_SECOND", "100"))
+PUSH_MAX_RETRIES = 3
+THROTTLE_ERROR_CODES = {"Throttling", "ThrottlingException", "Throttled"}
+
+# Push outcomes that mean the device token will never deliver again
+DEAD_ENDPOINT_STATUSES = ("disabled", "invalid")
+
+# SNS reports a rejected token as "Invalid parameter: Token Reason: ...". Other
+# InvalidParameter errors (e.g. a wrong PlatformApplicationArn) say nothing
+# about the device and must not get its token pruned.
+INVALID_TOKEN_PATTERN = re.compile(r"parameter:\s*Token\b", re.IGNORECASE)
+
+# Alert bookkeeping maps inside notification_settings. Only changed entries
+# are written (narrow UpdateExpressions), so a run never rewrites favorites or
+# settings the user may be editing at the same time.
+NOTIFICATION_STATE_FIELDS = (
+    "last_notified",
+    "last_notified_amount",
+    "temperature_state",
+    "thaw_started_at",
+)
+
+
+def _notification_state(settings: UserNotificationPreferences) -> dict[str, dict]:
+    """Copy of the bookkeeping maps, to diff against after evaluation."""
+    return {
+        field: dict(getattr(settings, field)) for field in NOTIFICATION_STATE_FIELDS
+    }
+
+
+@dataclass
+class NotificationStateUpdate:
+    """Changed bookkeeping entries for one user, written at the end of a run.
+
+    settings is the evaluated in-memory state; stored is False for users
+    without a notification_settings map yet (legacy preferences), who get
+    the whole map created once.
+    """
+
+    user_id: str
+    changed: dict[str, dict]
+    removed: dict[str, list[str]]
+    settings: UserNotificationPreferences
+    stored: bool = True
+
+    @classmethod
+    def diff(
+        cls,
+        user_id: str,
+        before: dict[str, dict],
+        settings: UserNotificationPreferences,
+        stored: bool = True,
+    ) -> "NotificationStateUpdate | None":
+        """Entries of settings' bookkeeping that differ from before."""
+        changed: dict[str, dict] = {}
+        removed: dict[str, list[str]] = {}
+        for field in NOTIFICATION_STATE_FIELDS:
+            old, new = before[field], getattr(settings, field)
+            entries = {k: v for k, v in new.items() if old.get(k) != v}
+            gone = [k for k in old if k not in new]
+            if entries:
+                changed[field] = entries
+            if gone:
+                removed[field] = gone
+        if not changed and not removed:
+            return None
+        return cls(user_id, changed, removed, settings, stored)
+
+
+class _RateLimiter:
+    """Thread-safe pacing of calls to at most `rate` per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+@dataclass
+class ResortSnapshot:
+    """Latest data for one resort, fetched once per run and shared by every
+    subscriber's alert checks.
+
+    conditions holds the latest condition item per elevation, most recent
+    first. new_events is None when no subscriber wants event alerts.
+    """
+
+    resort_id: str
+    resort_name: str
+    conditions: list[dict]
+    new_events: list[ResortEvent] | None = None
+
+    @property
+    def fresh_snow_cm(self) -> float:
+        return _fresh_snow_from_items(self.conditions)
+
+    @property
+    def current_temperature(self) -> float | None:
+        return _temperature_from_items(self.conditions)
+
+    @property
+    def powder_conditions(self) -> dict:
+        return _powder_conditions_from_items(self.conditions)
+
+    @property
+    def forecast(self) -> dict:
+        return _forecast_from_items(self.conditions)
+
+
+@dataclass
+class ResortWeeklyRollup:
+    """Last 7 days of one resort, computed once per digest run and shared by
+    every user who follows it.
+
+    daily_snowfall_cm maps each date to its highest 24h snowfall reading;
+    powder days depend on each user's threshold, so they are derived per user
+    in summarize().
+    """
+
+    resort_id: str
+    resort_name: str
+    daily_snowfall_cm: dict[str, float]
+    upcoming_snow_cm: float
+
+    def summarize(self, powder_threshold: float) -> dict:
+        """Digest entry for this resort at a user's powder threshold."""
+        total_snowfall = 0.0
+        powder_days = 0
+        best_day_snow = 0.0
+        best_day_date = None
+        for date_str, snow in self.daily_snowfall_cm.items():
+            total_snowfall += snow
+            if snow >= powder_threshold:
+                powder_days += 1
+            if snow > best_day_snow:
+                best_day_snow = snow
+                best_day_date = date_str
+
+        return {
+            "resort_id": self.resort_id,
+            "resort_name": self.resort_name,
+            "total_snowfall_cm": round(total_snowfall, 1),
+            "powder_days": powder_days,
+            "best_day_snow_cm": round(best_day_snow, 1),
+            "best_day_date": best_day_date,
+            "upcoming_snow_cm": round(self.upcoming_snow_cm, 1),
+        }
+
 
 class NotificationService:
     """Service for managing push notifications."""
@@ -49,6 +277,7 @@ class NotificationService:
         sns_client=None,
         apns_platform_arn: str | None = None,
         notification_history_service=None,
+        resort_subscribers_table=None,
     ):
         """Initialize notification service.
 
@@ -61,17 +290,28 @@ class NotificationService:
             sns_client: Optional SNS client (for testing)
             apns_platform_arn: ARN of the APNs platform application
             notification_history_service: Optional service for storing notification history
+            resort_subscribers_table: Optional resort_id -> user_id index of
+                favorite resorts (maintained by UserService), used by
+                event-driven alerts
         """
         self.device_tokens_table = device_tokens_table
         self.user_preferences_table = user_preferences_table
         self.resort_events_table = resort_events_table
         self.weather_conditions_table = weather_conditions_table
         self.resorts_table = resorts_table
-        self.sns = sns_client or boto3.client("sns")
+        self.sns = sns_client or boto3.client(
+            "sns", config=Config(max_pool_connections=PUSH_CONCURRENCY)
+        )
         self.apns_platform_arn = apns_platform_arn or os.environ.get(
             "APNS_PLATFORM_APP_ARN"
         )
         self.notification_history_service = notification_history_service
+        self.resort_subscribers_table = resort_subscribers_table
+        self._rate_limiter = _RateLimiter(PUSH_RATE_PER_SECOND)
+        # Per-run caches (see _begin_run); None outside a batch run
+        self._device_token_cache: dict[str, list[DeviceToken]] | None = None
+        self._endpoint_cache: dict[str, str] | None = None
+        self._pending_state: list[NotificationStateUpdate] | None = None
 
     @staticmethod
     def _json_default(obj):
@@ -176,42 +416,93 @@ class NotificationService:
     # Push Notification Sending
     # =========================================================================
 
-    def send_push_notification(
-        self, device_token: str, payload: NotificationPayload
-    ) -> bool:
-        """Send a push notification to a device.
+    def _begin_run(self) -> None:
+        """Start run-scoped caching of device tokens and SNS endpoints, and
+        defer notification state writes to the end of the run."""
+        self._device_token_cache = {}
+        self._endpoint_cache = {}
+        self._pending_state = []
+
+    def _end_run(self) -> None:
+        pending, self._pending_state = self._pending_state, None
+        for update in pending or []:
+            self.save_notification_state(update)
+        self._device_token_cache = None
+        self._endpoint_cache = None
+
+    def _device_tokens_for(self, user_id: str) -> list[DeviceToken]:
+        """Device tokens for a user, cached for the rest of a batch run."""
+        if self._device_token_cache is None:
+            return self.get_user_device_tokens(user_id)
+        if user_id not in self._device_token_cache:
+            self._device_token_cache[user_id] = self.get_user_device_tokens(user_id)
+        return self._device_token_cache[user_id]
+
+    def _call_sns(self, method: str, **kwargs):
+        """Call an SNS API, backing off and retrying when throttled."""
+        for attempt in range(PUSH_MAX_RETRIES + 1):
+            try:
+                return getattr(self.sns, method)(**kwargs)
+            except ClientError as e:
+                code = e.response.get("Error", {}).get("Code", "")
+                if code not in THROTTLE_ERROR_CODES or attempt == PUSH_MAX_RETRIES:
+                    raise
+                time.sleep(0.2 * 2**attempt + random.uniform(0, 0.1))
 
-        Args:
-            device_token: APNs device token
-            payload: Notification payload
+    def _push_to_device(self, device_token: str, payload: NotificationPayload) -> str:
+        """Push a notification to one device.
 
         Returns:
-            True if sent successfully
+            "sent", "disabled" (stale endpoint), "invalid" (token rejected by
+            SNS), "failed" (transient or unknown error) or "skipped" (APNs not
+            configured)
         """
         if not self.apns_platform_arn:
             logger.warning("APNs platform ARN not configured, skipping notification")
-            return False
+            return "skipped"
+
+        endpoint_cache = self._endpoint_cache
+        endpoint_arn = endpoint_cache.get(device_token) if endpoint_cache else None
 
         try:
-            # Create a platform endpoint for this device token
-            endpoint_response = self.sns.create_platform_endpoint(
-                PlatformApplicationArn=self.apns_platform_arn,
-                Token=device_token,
-            )
-            endpoint_arn = endpoint_response["EndpointArn"]
+            if endpoint_arn is None:
+                # Create a platform endpoint for this device token
+                try:
+                    endpoint_response = self._call_sns(
+                        "create_platform_endpoint",
+                        PlatformApplicationArn=self.apns_platform_arn,
+                        Token=device_token,
+                    )
+                except ClientError as e:
+                    error = e.response.get("Error", {})
+                    message = error.get("Message", "")
+                    if (
+                        error.get("Code") == "InvalidParameter"
+                        and INVALID_TOKEN_PATTERN.search(message)
+                        and "already exists" not in message
+                    ):
+                        logger.warning("Invalid device token: %s...", device_token[:20])
+                        return "invalid"
+                    raise
+                endpoint_arn = endpoint_response["EndpointArn"]
 
-            # Check if endpoint is enabled; skip if disabled (stale token)
-            try:
-                attrs = self.sns.get_endpoint_attributes(EndpointArn=endpoint_arn)
-                enabled = attrs.get("Attributes", {}).get("Enabled", "true")
-                if enabled.lower() != "true":
-                    logger.warning(
-                        "Endpoint disabled (stale token), skipping: %s...",
-                        device_token[:20],
+                # Check if endpoint is enabled; skip if disabled (stale token)
+                try:
+                    attrs = self._call_sns(
+                        "get_endpoint_attributes", EndpointArn=endpoint_arn
                     )
-                    return False
-            except ClientError as e:
-                logger.warning("Failed to check endpoint attributes: %s", e)
+                    enabled = attrs.get("Attributes", {}).get("Enabled", "true")
+                    if enabled.lower() != "true":
+                        logger.warning(
+                            "Endpoint disabled (stale token), skipping: %s...",
+                            device_token[:20],
+                        )
+                        return "disabled"
+                except ClientError as e:
+                    logger.warning("Failed to check endpoint attributes: %s", e)
+
+                if endpoint_cache is not None:
+                    endpoint_cache[device_token] = endpoint_arn
 
             # Send the notification
             apns_payload = payload.to_apns_payload()
@@ -225,14 +516,16 @@ class NotificationService:
                 {apns_key: json.dumps(apns_payload, default=self._json_default)}
             )
 
-            self.sns.publish(
+            self._rate_limiter.wait()
+            self._call_sns(
+                "publish",
                 TargetArn=endpoint_arn,
                 Message=message,
                 MessageStructure="json",
             )
 
             logger.info(f"Sent push notification: {payload.title}")
-            return True
+            return "sent"
 
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "")
@@ -241,9 +534,114 @@ class NotificationService:
                     "Endpoint still disabled after re-enable attempt: %s...",
                     device_token[:20],
                 )
-            else:
-                logger.error(f"Error sending push notification: {e}")
-            return False
+                return "disabled"
+            logger.error(f"Error sending push notification: {e}")
+            return "failed"
+
+    def send_push_notification(
+        self, device_token: str, payload: NotificationPayload
+    ) -> bool:
+        """Send a push notification to a device.
+
+        Args:
+            device_token: APNs device token
+            payload: Notification payload
+
+        Returns:
+            True if sent successfully
+        """
+        return self._push_to_device(device_token, payload) == "sent"
+
+    def deliver_notifications(
+        self, deliveries: list[tuple[str, NotificationPayload]]
+    ) -> dict:
+        """Push many notifications to all of their users' devices concurrently.
+
+        Device pushes run on a bounded thread pool (PUSH_CONCURRENCY) paced to
+        PUSH_RATE_PER_SECOND publishes. Devices whose endpoint is disabled or
+        whose token SNS rejects are removed from the device tokens table.
+        Notifications that reached at least one device are stored in the
+        notification history.
+
+        Args:
+            deliveries: (user_id, payload) pairs
+
+        Returns:
+            Dict with sent (device pushes), per_delivery (devices notified for
+            each delivery, in order), failed and pruned_devices counts
+        """
+        per_delivery = [0] * len(deliveries)
+        dead_devices: dict[tuple[str, str], DeviceToken] = {}
+        failed = 0
+
+        jobs = []
+        for index, (user_id, payload) in enumerate(deliveries):
+            try:
+                devices = self._device_tokens_for(user_id)
+            except Exception as e:
+                logger.error(f"Error getting device tokens for user {user_id}: {e}")
+                failed += 1
+                continue
+            jobs.extend((index, user_id, device, payload) for device in devices)
+
+        if jobs:
+            with ThreadPoolExecutor(
+                max_workers=min(PUSH_CONCURRENCY, len(jobs))
+            ) as executor:
+                statuses = list(
+                    executor.map(
+                        lambda job: self._push_to_device(job[2].token, job[3]), jobs
+                    )
+                )
+            for (index, user_id, device, _), status in zip(jobs, statuses, strict=True):
+                if status == "sent":
+                    per_delivery[index] += 1
+                elif status in DEAD_ENDPOINT_STATUSES:
+                    dead_devices[(user_id, device.device_id)] = device
+                elif status == "failed":
+                    failed += 1
+
+        for user_id, device_id in dead_devices:
+            self._prune_device(user_id, device_id)
+        if dead_devices:
+            logger.info(f"Pruned {len(dead_devices)} dead device tokens")
+
+        # Store in notification history for in-app bell icon
+        if self.notification_history_service:
+            for (user_id, payload), sent_count in zip(
+                deliveries, per_delivery, strict=True
+            ):
+                if sent_count > 0:
+                    try:
+                        self.notification_history_service.store_notification(
+                            user_id, payload
+                        )
+                    except Exception:
+                        logger.warning(
+                            "Failed to store notification history for user %s",
+                            user_id,
+                        )
+
+        return {
+            "sent": sum(per_delivery),
+            "per_delivery": per_delivery,
+            "failed": failed,
+            "pruned_devices": len(dead_devices),
+        }
+
+    def _prune_device(self, user_id: str, device_id: str) -> None:
+        """Remove a device whose push endpoint is disabled or invalid."""
+        try:
+            self.device_tokens_table.delete_item(
+                Key={"user_id": user_id, "device_id": device_id}
+            )
+        except ClientError as e:
+            logger.error(f"Error pruning device {device_id} of user {user_id}: {e}")
+            return
+        if self._device_token_cache and user_id in self._device_token_cache:
+            self._device_token_cache[user_id] = [
+                d for d in self._device_token_cache[user_id] if d.device_id != device_id
+            ]
 
     def send_notification_to_user(
         self, user_id: str, payload: NotificationPayload
@@ -257,23 +655,7 @@ class NotificationService:
         Returns:
             Number of devices notified
         """
-        device_tokens = self.get_user_device_tokens(user_id)
-        sent_count = 0
-
-        for device in device_tokens:
-            if self.send_push_notification(device.token, payload):
-                sent_count += 1
-
-        # Store in notification history for in-app bell icon
-        if sent_count > 0 and self.notification_history_service:
-            try:
-                self.notification_history_service.store_notification(user_id, payload)
-            except Exception:
-                logger.warning(
-                    "Failed to store notification history for user %s", user_id
-                )
-
-        return sent_count
+        return self.deliver_notifications([(user_id, payload)])["sent"]
 
     # =========================================================================
     # Resort Events
@@ -372,12 +754,8 @@ class NotificationService:
                 Limit=3,
             )
 
-            items = response.get("Items", [])
-            if not items:
-                return 0.0
-
             # Use snowfall_24h_cm and take max across elevations
-            return max(float(item.get("snowfall_24h_cm", 0.0)) for item in items)
+            return _fresh_snow_from_items(response.get("Items", []))
 
         except Exception as e:
             logger.error(f"Error getting fresh snow for {resort_id}: {e}")
@@ -400,12 +778,7 @@ class NotificationService:
                 Limit=1,
             )
 
-            items = response.get("Items", [])
-            if not items:
-                return None
-
-            temp = items[0].get("current_temp_celsius")
-            return _to_float(temp) if temp is not None else None
+            return _temperature_from_items(response.get("Items", []))
 
         except Exception as e:
             logger.error(f"Error getting temperature for {resort_id}: {e}")
@@ -428,23 +801,7 @@ class NotificationService:
                 Limit=1,
             )
 
-            items = response.get("Items", [])
-            if not items:
-                return {}
-
-            item = items[0]
-            return {
-                "snowfall_24h_cm": _to_float(item.get("snowfall_24h_cm", 0.0)),
-                "current_temp_celsius": _to_float(item.get("current_temp_celsius"))
-                if item.get("current_temp_celsius") is not None
-                else None,
-                "wind_speed_kmh": _to_float(item.get("wind_speed_kmh"))
-                if item.get("wind_speed_kmh") is not None
-                else None,
-                "quality_score": _to_float(item.get("quality_score"))
-                if item.get("quality_score") is not None
-                else None,
-            }
+            return _powder_conditions_from_items(response.get("Items", []))
 
         except Exception as e:
             logger.error(f"Error getting powder conditions for {resort_id}: {e}")
@@ -665,8 +1022,226 @@ class NotificationService:
             logger.error(f"Error getting resort name for {resort_id}: {e}")
             return resort_id
 
+    def get_latest_conditions(self, resort_id: str) -> list[dict]:
+        """Get the latest condition item per elevation for a resort.
+
+        One query serves every hourly alert check (fresh snow, temperature,
+        powder day and forecast).
+
+        Args:
+            resort_id: Resort ID
+
+        Returns:
+            Up to 3 condition items, most recent first (empty on error)
+        """
+        try:
+            response = self.weather_conditions_table.query(
+                KeyConditionExpression="resort_id = :rid",
+                ExpressionAttributeValues={":rid": resort_id},
+                ScanIndexForward=False,
+                Limit=3,  # Get all 3 elevation levels
+            )
+            return list(response.get("Items", []))
+        except Exception as e:
+            logger.error(f"Error getting latest conditions for {resort_id}: {e}")
+            return []
+
+    def load_resort_snapshot(
+        self, resort_id: str, include_events: bool = True
+    ) -> ResortSnapshot:
+        """Fetch the name, latest conditions and new events for a resort.
+
+        Args:
+            resort_id: Resort ID
+            include_events: Also fetch events created in the last hour
+
+        Returns:
+            ResortSnapshot for alert evaluation
+        """
+        new_events = None
+        if include_events:
+            one_hour_ago = (datetime.now(UTC) - timedelta(hours=1)).isoformat()
+            try:
+                new_events = self.get_new_events_since(resort_id, one_hour_ago)
+            except Exception as e:
+                logger.error(f"Error getting new events for {resort_id}: {e}")
+                new_events = []
+
+        return ResortSnapshot(
+            resort_id=resort_id,
+            resort_name=self.get_resort_name(resort_id),
+            conditions=self.get_latest_conditions(resort_id),
+            new_events=new_events,
+        )
+
+    @staticmethod
+    def build_subscriber_index(
+        users: list[UserPreferences],
+    ) -> dict[str, list[UserPreferences]]:
+        """Invert users' favorites into resort_id -> subscribed users.
+
+        Users with notifications disabled are left out, so resorts only they
+        follow are never looked up.
+
+        Args:
+            users: Preferences of every user in the run
+
+        Returns:
+            Subscribers per resort, in first-seen order
+        """
+        index: dict[str, list[UserPreferences]] = {}
+        for prefs in users:
+            if not prefs.get_notification_settings().notifications_enabled:
+                continue
+            for resort_id in dict.fromkeys(prefs.favorite_resorts):
+                index.setdefault(resort_id, []).append(prefs)
+        return index
+
+    def load_resort_snapshots(
+        self, index: dict[str, list[UserPreferences]]
+    ) -> dict[str, ResortSnapshot]:
+        """Fetch each indexed resort's data once for all of its subscribers.
+
+        Events are only queried for resorts where at least one subscriber has
+        event alerts enabled.
+
+        Args:
+            index: Output of build_subscriber_index
+
+        Returns:
+            Dict of resort_id -> ResortSnapshot
+        """
+        return {
+            resort_id: self.load_resort_snapshot(
+                resort_id,
+                include_events=any(
+                    _event_alerts_enabled(prefs.get_notification_settings(), resort_id)
+                    for prefs in subscribers
+                ),
+            )
+            for resort_id, subscribers in index.items()
+        }
+
+    def get_resort_subscribers(self, resort_id: str) -> list[UserPreferences]:
+        """Load the preferences of users following a resort via the index.
+
+        Index entries can lag behind preference edits, so users who no longer
+        favorite the resort or have notifications disabled are dropped.
+
+        Args:
+            resort_id: Resort ID
+
+        Returns:
+            Preferences of the resort's current subscribers
+        """
+        user_ids = []
+        query_kwargs = {
+            "KeyConditionExpression": "resort_id = :rid",
+            "ExpressionAttributeValues": {":rid": resort_id},
+            "ProjectionExpression": "user_id",
+        }
+        while True:
+            response = self.resort_subscribers_table.query(**query_kwargs)
+            user_ids.extend(item["user_id"] for item in response.get("Items", []))
+            if "LastEvaluatedKey" not in response:
+                break
+            query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+        table_name = self.user_preferences_table.name
+        client = self.user_preferences_table.meta.client
+        subscribers = []
+        # BatchGetItem reads at most 100 keys per request
+        for i in range(0, len(user_ids), 100):
+            request = {
+                table_name: {
+                    "Keys": [{"user_id": uid} for uid in user_ids[i : i + 100]]
+                }
+            }
+            while request:
+                response = client.batch_get_item(RequestItems=request)
+                for item in response.get("Responses", {}).get(table_name, []):
+                    try:
+                        prefs = UserPreferences(**parse_from_dynamodb(item))
+                    except Exception as e:
+                        logger.error(f"Error parsing user {item.get('user_id')}: {e}")
+                        continue
+                    if (
+                        resort_id in prefs.favorite_resorts
+                        and prefs.get_notification_settings().notifications_enabled
+                    ):
+                        subscribers.append(prefs)
+                request = response.get("UnprocessedKeys") or None
+        return subscribers
+
+    def process_resort_change(self, resort_id: str) -> dict:
+        """Evaluate alerts for one resort right after its conditions changed.
+
+        Triggered by the weather worker's "resort changed" event instead of
+        the hourly scan: only the resort's subscribers are loaded and only
+        that resort is checked, with the same thresholds and grace periods as
+        the hourly run (so an alert sent here is not repeated there).
+
+        Args:
+            resort_id: Resort whose conditions were just written
+
+        Returns:
+            Summary of notifications processed
+        """
+        summary = {
+            "users_processed": 0,
+            "notifications_sent": 0,
+            "errors": 0,
+        }
+        if self.resort_subscribers_table is None:
+            logger.warning("No resort subscribers table configured, skipping")
+            return summary
+
+        deliveries: list[tuple[str, NotificationPayload]] = []
+        self._begin_run()
+
+        try:
+            subscribers = self.get_resort_subscribers(resort_id)
+            if not subscribers:
+                return summary
+
+            # New events are picked up by the hourly run
+            snapshots = {
+                resort_id: self.load_resort_snapshot(resort_id, include_events=False)
+            }
+            for prefs in subscribers:
+                try:
+                    notifications = self.process_user_notifications(
+                        prefs.user_id, prefs, snapshots, resort_ids={resort_id}
+                    )
+                    deliveries.extend(
+                        (prefs.user_id, notification) for notification in notifications
+                    )
+                    summary["users_processed"] += 1
+                except Exception as e:
+                    logger.error(
+                        f"Error processing user {prefs.user_id}: {e}", exc_info=True
+                    )
+                    summary["errors"] += 1
+
+            delivery = self.deliver_notifications(deliveries)
+            summary["notifications_sent"] = delivery["sent"]
+            summary["pruned_devices"] = delivery["pruned_devices"]
+
+        except Exception as e:
+            logger.error(f"Error in process_resort_change for {resort_id}: {e}")
+            summary["errors"] += 1
+        finally:
+            self._end_run()
+
+        logger.info(f"Resort change processing complete for {resort_id}: {summary}")
+        return summary
+
     def process_user_notifications(
-        self, user_id: str, prefs: UserPreferences
+        self,
+        user_id: str,
+        prefs: UserPreferences,
+        snapshots: dict[str, ResortSnapshot] | None = None,
+        resort_ids: set[str] | None = None,
     ) -> list[NotificationPayload]:
         """Process notifications for a single user.
 
@@ -677,12 +1252,17 @@ class NotificationService:
         Args:
             user_id: User ID
             prefs: User preferences
+            snapshots: Resort data prefetched for the whole run (see
+                load_resort_snapshots). Resorts missing from it are fetched.
+            resort_ids: Only check these favorites (default: all of them)
 
         Returns:
             List of notifications to send
         """
         notifications = []
         notification_settings = prefs.get_notification_settings()
+        stored_settings = prefs.notification_settings is not None
+        state_before = _notification_state(notification_settings)
         fresh_snow_resorts: set[str] = set()  # Track resorts that got fresh_snow alert
 
         # Skip if notifications are disabled
@@ -691,6 +1271,9 @@ class NotificationService:
 
         # Process each favorite resort
         for resort_id in prefs.favorite_resorts:
+            if resort_ids is not None and resort_id not in resort_ids:
+                continue
+
             # Get resort-specific settings or use defaults
             resort_settings = notification_settings.resort_settings.get(resort_id)
             snow_threshold = (
@@ -703,19 +1286,20 @@ class NotificationService:
                 if resort_settings
                 else notification_settings.fresh_snow_alerts
             )
-            events_enabled = (
-                resort_settings.event_notifications_enabled
-                if resort_settings
-                else notification_settings.event_alerts
-            )
+            events_enabled = _event_alerts_enabled(notification_settings, resort_id)
 
-            resort_name = self.get_resort_name(resort_id)
+            snapshot = (snapshots or {}).get(resort_id)
+            if snapshot is None:
+                snapshot = self.load_resort_snapshot(
+                    resort_id, include_events=events_enabled
+                )
+            resort_name = snapshot.resort_name
 
             # Check for fresh snow (uses snowfall_24h_cm, not cumulative fresh_snow_cm)
             # Each notification type has its own 24h grace period
             # Smart re-notification: if 10cm+ more snow fell, notify again
             if fresh_snow_enabled:
-                fresh_snow = self.get_fresh_snow_cm(resort_id)
+                fresh_snow = snapshot.fresh_snow_cm
                 if (
                     fresh_snow >= snow_threshold
                     and notification_settings.can_notify_for_resort(
@@ -746,11 +1330,8 @@ class NotificationService:
             if events_enabled and notification_settings.can_notify_for_resort(
                 resort_id, NotificationType.RESORT_EVENT.value
             ):
-                # Get events created in the last hour
-                one_hour_ago = (datetime.now(UTC) - timedelta(hours=1)).isoformat()
-                new_events = self.get_new_events_since(resort_id, one_hour_ago)
-
-                for event in new_events:
+                # Events created in the last hour
+                for event in snapshot.new_events or []:
                     notifications.append(
                         NotificationPayload(
                             notification_type=NotificationType.RESORT_EVENT,
@@ -772,7 +1353,7 @@ class NotificationService:
             # Check for thaw/freeze cycles
             # Thaw/freeze uses its own grace period per type
             if notification_settings.thaw_freeze_alerts:
-                current_temp = self.get_current_temperature(resort_id)
+                current_temp = snapshot.current_temperature
                 if current_temp is not None:
                     thaw_freeze_notification = self.check_thaw_freeze_cycle(
                         resort_id=resort_id,
@@ -803,7 +1384,7 @@ class NotificationService:
                     and resort_settings.powder_threshold_cm is not None
                     else notification_settings.powder_snow_threshold_cm
                 )
-                conditions = self.get_powder_conditions(resort_id)
+                conditions = snapshot.powder_conditions
                 if conditions:
                     snowfall = conditions.get("snowfall_24h_cm", 0.0)
                     if notification_settings.can_notify_for_resort(
@@ -832,7 +1413,7 @@ class NotificationService:
                     resort_id, NotificationType.FORECAST_SNOW.value
                 )
             ):
-                forecast = self.get_resort_forecast_next_3_days(resort_id)
+                forecast = snapshot.forecast
                 if forecast:
                     forecast_threshold = (
                         notification_settings.forecast_snow_threshold_cm
@@ -849,10 +1430,17 @@ class NotificationService:
                             resort_id, NotificationType.FORECAST_SNOW.value
                         )
 
-        # Save updated notification settings (with last_notified times and temp state)
-        # Always save to persist temperature state tracking
+        # Persist only the bookkeeping that changed (last_notified times and
+        # temperature state), at the end of the run when inside one
         prefs.notification_settings = notification_settings
-        self._save_user_preferences(prefs)
+        update = NotificationStateUpdate.diff(
+            user_id, state_before, notification_settings, stored_settings
+        )
+        if update is not None:
+            if self._pending_state is not None:
+                self._pending_state.append(update)
+            else:
+                self.save_notification_state(update)
 
         return notifications
 
@@ -925,29 +1513,51 @@ class NotificationService:
                 Limit=3,  # Get all 3 elevation levels
             )
 
-            items = response.get("Items", [])
-            if not items:
-                return {}
-
             # Take max across elevations for each forecast period
-            return {
-                "predicted_snow_24h_cm": max(
-                    float(item.get("predicted_snow_24h_cm", 0.0)) for item in items
-                ),
-                "predicted_snow_48h_cm": max(
-                    float(item.get("predicted_snow_48h_cm", 0.0)) for item in items
-                ),
-                "predicted_snow_72h_cm": max(
-                    float(item.get("predicted_snow_72h_cm", 0.0)) for item in items
-                ),
-            }
+            return _forecast_from_items(response.get("Items", []))
 
         except Exception as e:
             logger.error(f"Error getting forecast for {resort_id}: {e}")
             return {}
 
+    def load_weekly_rollup(self, resort_id: str) -> ResortWeeklyRollup | None:
+        """Fetch and roll up a resort's last 7 days and 3-day forecast.
+
+        Args:
+            resort_id: Resort ID
+
+        Returns:
+            ResortWeeklyRollup, or None if the resort has no recent conditions
+        """
+        resort_name = self.get_resort_name(resort_id)
+        conditions = self.get_resort_conditions_last_7_days(resort_id)
+        if not conditions:
+            return None
+
+        # Keep the maximum 24h snowfall reading for each day
+        daily_snowfall: dict[str, float] = {}
+        for condition in conditions:
+            timestamp_str = condition.get("timestamp", "")
+            date_str = timestamp_str[:10] if len(timestamp_str) >= 10 else ""
+            snowfall_24h = float(condition.get("snowfall_24h_cm", 0.0))
+            if date_str and snowfall_24h > daily_snowfall.get(date_str, -1.0):
+                daily_snowfall[date_str] = snowfall_24h
+
+        # predicted_snow_72h_cm is cumulative (includes 24h and 48h)
+        forecast = self.get_resort_forecast_next_3_days(resort_id)
+
+        return ResortWeeklyRollup(
+            resort_id=resort_id,
+            resort_name=resort_name,
+            daily_snowfall_cm=daily_snowfall,
+            upcoming_snow_cm=float(forecast.get("predicted_snow_72h_cm", 0.0)),
+        )
+
     def generate_weekly_digest(
-        self, user_id: str, prefs: "UserPreferences"
+        self,
+        user_id: str,
+        prefs: "UserPreferences",
+        rollups: dict[str, ResortWeeklyRollup | None] | None = None,
     ) -> NotificationPayload | None:
         """Generate a weekly snow digest for a user.
 
@@ -961,6 +1571,9 @@ class NotificationService:
         Args:
             user_id: User ID
             prefs: User preferences with favorite resorts
+            rollups: Per-resort rollups shared across the digest run; missing
+                resorts are loaded and added to it, so each resort is queried
+                once per run however many users follow it
 
         Returns:
             NotificationPayload with digest, or None if no data available
@@ -970,61 +1583,17 @@ class NotificationService:
 
         notification_settings = prefs.get_notification_settings()
         powder_threshold = notification_settings.powder_snow_threshold_cm
+        if rollups is None:
+            rollups = {}
 
         resort_summaries = []
 
         for resort_id in prefs.favorite_resorts:
-            resort_name = self.get_resort_name(resort_id)
-            conditions = self.get_resort_conditions_last_7_days(resort_id)
-
-            if not conditions:
-                continue
-
-            # Aggregate snowfall and find powder days
-            total_snowfall = 0.0
-            powder_days = 0
-            best_day_snow = 0.0
-            best_day_date = None
-
-            # Track daily snowfall by grouping conditions by date
-            daily_snowfall: dict[str, float] = {}
-            for condition in conditions:
-                timestamp_str = condition.get("timestamp", "")
-                date_str = timestamp_str[:10] if len(timestamp_str) >= 10 else ""
-                snowfall_24h = float(condition.get("snowfall_24h_cm", 0.0))
-
-                if date_str:
-                    # Keep the maximum 24h snowfall reading for each day
-                    if (
-                        date_str not in daily_snowfall
-                        or snowfall_24h > daily_snowfall[date_str]
-                    ):
-                        daily_snowfall[date_str] = snowfall_24h
-
-            for date_str, snow in daily_snowfall.items():
-                total_snowfall += snow
-                if snow >= powder_threshold:
-                    powder_days += 1
-                if snow > best_day_snow:
-                    best_day_snow = snow
-                    best_day_date = date_str
-
-            # Get forecast for upcoming storm potential
-            # predicted_snow_72h_cm is cumulative (includes 24h and 48h)
-            forecast = self.get_resort_forecast_next_3_days(resort_id)
-            upcoming_snow = forecast.get("predicted_snow_72h_cm", 0.0)
-
-            resort_summaries.append(
-                {
-                    "resort_id": resort_id,
-                    "resort_name": resort_name,
-                    "total_snowfall_cm": round(total_snowfall, 1),
-                    "powder_days": powder_days,
-                    "best_day_snow_cm": round(best_day_snow, 1),
-                    "best_day_date": best_day_date,
-                    "upcoming_snow_cm": round(upcoming_snow, 1),
-                }
-            )
+            if resort_id not in rollups:
+                rollups[resort_id] = self.load_weekly_rollup(resort_id)
+            rollup = rollups[resort_id]
+            if rollup is not None:
+                resort_summaries.append(rollup.summarize(powder_threshold))
 
         if not resort_summaries:
             return None
@@ -1090,11 +1659,56 @@ class NotificationService:
             },
         )
 
-    def process_weekly_digest(self) -> dict:
+    def scan_user_preferences(
+        self, segment: int | None = None, total_segments: int | None = None
+    ) -> list[dict]:
+        """Scan user preferences, optionally one segment of a parallel scan.
+
+        Args:
+            segment: Zero-based DynamoDB parallel-scan segment to read
+            total_segments: Number of segments the table is split into
+
+        Returns:
+            All user preference items (in the segment, if given)
+        """
+        scan_kwargs = {}
+        if total_segments is not None and total_segments > 1:
+            scan_kwargs = {"Segment": segment, "TotalSegments": total_segments}
+
+        response = self.user_preferences_table.scan(**scan_kwargs)
+        users = response.get("Items", [])
+
+        # Handle pagination
+        while "LastEvaluatedKey" in response:
+            response = self.user_preferences_table.scan(
+                ExclusiveStartKey=response["LastEvaluatedKey"], **scan_kwargs
+            )
+            users.extend(response.get("Items", []))
+
+        return users
+
+    @staticmethod
+    def merge_summaries(summaries: list[dict]) -> dict:
+        """Combine per-segment processing summaries by summing their counters."""
+        merged: dict = {}
+        for summary in summaries:
+            for key, value in summary.items():
+                if isinstance(value, int | float) and not isinstance(value, bool):
+                    merged[key] = merged.get(key, 0) + value
+        return merged
+
+    def process_weekly_digest(
+        self, segment: int | None = None, total_segments: int | None = None
+    ) -> dict:
         """Process weekly digest for all users who have opted in.
 
         Scans all users where weekly_summary=True, generates digest per user,
-        and sends via push notification.
+        and sends via push notification. Each followed resort is rolled up
+        once per run (see load_weekly_rollup) and shared by its followers.
+
+        Args:
+            segment: Only process this parallel-scan segment of the users table
+            total_segments: Number of segments the users table is split into
 
         Returns:
             Summary of weekly digest processing
@@ -1104,18 +1718,13 @@ class NotificationService:
             "digests_sent": 0,
             "errors": 0,
         }
+        deliveries: list[tuple[str, NotificationPayload]] = []
+        # Resort rollups shared by every user in this run
+        rollups: dict[str, ResortWeeklyRollup | None] = {}
+        self._begin_run()
 
         try:
-            # Scan all user preferences
-            response = self.user_preferences_table.scan()
-            users = response.get("Items", [])
-
-            # Handle pagination
-            while "LastEvaluatedKey" in response:
-                response = self.user_preferences_table.scan(
-                    ExclusiveStartKey=response["LastEvaluatedKey"]
-                )
-                users.extend(response.get("Items", []))
+            users = self.scan_user_preferences(segment, total_segments)
 
             logger.info(f"Processing weekly digest for {len(users)} total users")
 
@@ -1137,16 +1746,12 @@ class NotificationService:
                     if not prefs.favorite_resorts:
                         continue
 
-                    # Generate digest
-                    digest = self.generate_weekly_digest(user_id, prefs)
-
+                    # Generate digest (pushed in one batch below); users with
+                    # no data for a digest still count as processed
+                    digest = self.generate_weekly_digest(user_id, prefs, rollups)
                     if digest:
-                        sent = self.send_notification_to_user(user_id, digest)
-                        summary["digests_sent"] += sent
-                        summary["users_processed"] += 1
-                    else:
-                        # No data for digest, still count as processed
-                        summary["users_processed"] += 1
+                        deliveries.append((user_id, digest))
+                    summary["users_processed"] += 1
 
                 except Exception as e:
                     logger.error(
@@ -1155,25 +1760,115 @@ class NotificationService:
                     )
                     summary["errors"] += 1
 
+            delivery = self.deliver_notifications(deliveries)
+            summary["digests_sent"] = delivery["sent"]
+            summary["pruned_devices"] = delivery["pruned_devices"]
+
         except Exception as e:
             logger.error(f"Error in process_weekly_digest: {e}")
             summary["errors"] += 1
+        finally:
+            self._end_run()
 
         logger.info(f"Weekly digest processing complete: {summary}")
         return summary
 
-    def _save_user_preferences(self, prefs: UserPreferences) -> None:
-        """Save user preferences to DynamoDB."""
+    def save_notification_state(self, update: NotificationStateUpdate) -> None:
+        """Write a user's changed notification bookkeeping in place.
+
+        Each changed map entry is SET (or REMOVEd) by path, leaving the rest
+        of the preferences item untouched. Stored settings that predate one of
+        the bookkeeping maps get the touched maps set whole instead. Users
+        deleted during the run are skipped rather than recreated.
+        """
         try:
-            item = prepare_for_dynamodb(prefs.model_dump())
-            self.user_preferences_table.put_item(Item=item)
+            if not update.stored:
+                self._update_notification_settings(
+                    "SET #ns = :settings",
+                    {"#ns": "notification_settings"},
+                    {":settings": update.settings.model_dump()},
+                    update.user_id,
+                )
+                return
+
+            names = {"#ns": "notification_settings"}
+            values = {}
+            set_parts = []
+            remove_parts = []
+            for field, entries in update.changed.items():
+                names[f"#{field}"] = field
+                for entry_key, value in entries.items():
+                    i = len(names)
+                    names[f"#k{i}"] = entry_key
+                    values[f":v{i}"] = value
+                    set_parts.append(f"#ns.#{field}.#k{i} = :v{i}")
+            for field, entry_keys in update.removed.items():
+                names[f"#{field}"] = field
+                for entry_key in entry_keys:
+                    i = len(names)
+                    names[f"#k{i}"] = entry_key
+                    remove_parts.append(f"#ns.#{field}.#k{i}")
+
+            expression = " ".join(
+                f"{action} {', '.join(parts)}"
+                for action, parts in (("SET", set_parts), ("REMOVE", remove_parts))
+                if parts
+            )
+            try:
+                self._update_notification_settings(
+                    expression, names, values, update.user_id
+                )
+            except ClientError as e:
+                if e.response["Error"]["Code"] != "ValidationException":
+                    raise
+                # A bookkeeping map is missing from the stored settings
+                fields = list(dict.fromkeys([*update.changed, *update.removed]))
+                self._update_notification_settings(
+                    "SET " + ", ".join(f"#ns.#{f} = :{f}" for f in fields),
+                    {"#ns": "notification_settings", **{f"#{f}": f for f in fields}},
+                    {f":{f}": getattr(update.settings, f) for f in fields},
+                    update.user_id,
+                )
+
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                logger.info(f"User {update.user_id} no longer exists, state dropped")
+                return
+            logger.error(f"Error saving notification state for {update.user_id}: {e}")
         except Exception as e:
-            logger.error(f"Error saving user preferences: {e}", exc_info=True)
+            logger.error(
+                f"Error saving notification state for {update.user_id}: {e}",
+                exc_info=True,
+            )
+
+    def _update_notification_settings(
+        self, expression: str, names: dict, values: dict, user_id: str
+    ) -> None:
+        """UpdateItem on an existing user's preferences."""
+        kwargs = {}
+        if values:
+            kwargs["ExpressionAttributeValues"] = prepare_for_dynamodb(values)
+        self.user_preferences_table.update_item(
+            Key={"user_id": user_id},
+            UpdateExpression=expression,
+            ConditionExpression="attribute_exists(user_id)",
+            ExpressionAttributeNames=names,
+            **kwargs,
+        )
 
-    def process_all_notifications(self) -> dict:
+    def process_all_notifications(
+        self, segment: int | None = None, total_segments: int | None = None
+    ) -> dict:
         """Process notifications for all users.
 
-        This is the main entry point for the hourly Lambda.
+        This is the main entry point for the hourly Lambda. Users' favorites
+        are inverted into a resort -> subscribers index so each resort's
+        conditions and events are fetched once, then every subscriber's
+        alerts are evaluated in memory against that shared snapshot.
+
+        Args:
+            segment: Only process this parallel-scan segment of the users table
+            total_segments: Number of segments the users table is split into
 
         Returns:
             Summary of notifications processed
@@ -1183,50 +1878,67 @@ class NotificationService:
             "notifications_sent": 0,
             "errors": 0,
         }
+        deliveries: list[tuple[str, NotificationPayload]] = []
+        self._begin_run()
 
         try:
-            # Scan all user preferences
-            response = self.user_preferences_table.scan()
-            users = response.get("Items", [])
-
-            # Handle pagination
-            while "LastEvaluatedKey" in response:
-                response = self.user_preferences_table.scan(
-                    ExclusiveStartKey=response["LastEvaluatedKey"]
-                )
-                users.extend(response.get("Items", []))
+            users = self.scan_user_preferences(segment, total_segments)
 
             logger.info(f"Processing notifications for {len(users)} users")
 
+            subscribers = []
             for user_data in users:
                 try:
                     prefs = UserPreferences(**user_data)
-                    user_id = prefs.user_id
+                except Exception as e:
+                    logger.error(
+                        f"Error processing user {user_data.get('user_id')}: {e}",
+                        exc_info=True,
+                    )
+                    summary["errors"] += 1
+                    continue
+                # Skip users with no favorites
+                if prefs.favorite_resorts:
+                    subscribers.append(prefs)
 
-                    # Skip users with no favorites
-                    if not prefs.favorite_resorts:
-                        continue
+            index = self.build_subscriber_index(subscribers)
+            snapshots = self.load_resort_snapshots(index)
+            logger.info(
+                f"Loaded conditions for {len(snapshots)} resorts "
+                f"followed by {len(subscribers)} users"
+            )
 
-                    # Get notifications for this user
-                    notifications = self.process_user_notifications(user_id, prefs)
+            for prefs in subscribers:
+                try:
+                    user_id = prefs.user_id
 
-                    # Send notifications
-                    for notification in notifications:
-                        sent = self.send_notification_to_user(user_id, notification)
-                        summary["notifications_sent"] += sent
+                    # Get notifications for this user
+                    notifications = self.process_user_notifications(
+                        user_id, prefs, snapshots
+                    )
 
+                    # Queue for the concurrent delivery stage below
+                    deliveries.extend(
+                        (user_id, notification) for notification in notifications
+                    )
                     summary["users_processed"] += 1
 
                 except Exception as e:
                     logger.error(
-                        f"Error processing user {user_data.get('user_id')}: {e}",
+                        f"Error processing user {prefs.user_id}: {e}",
                         exc_info=True,
                     )
                     summary["errors"] += 1
 
+            delivery = self.deliver_notifications(deliveries)
+            summary["notifications_sent"] = delivery["sent"]
+            summary["pruned_devices"] = delivery["pruned_devices"]
+
         except Exception as e:
             logger.error(f"Error in process_all_notifications: {e}")
             summary["errors"] += 1
+        finally:
+            self._end_run()
 
         logger.info(f"Notification processing complete: {summary}")
         return summary
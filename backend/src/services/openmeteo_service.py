@@ -1,5 +1,6 @@
 """Open-Meteo weather data service for accurate elevation-aware weather data."""
 
+import bisect
 import logging
 import time
 from datetime import UTC, datetime, timedelta
@@ -78,6 +79,88 @@ def _request_with_retry(
     raise last_exception
 
 
+# Thaw-freeze thresholds: (temp_celsius, required_hours). An ice formation
+# event occurs when ANY threshold is met; snow that fell before it is assumed
+# to have refrozen.
+ICE_THRESHOLDS = [
+    (3.0, 3),  # 3 hours at +3°C (hard ice fast)
+    (2.0, 6),  # 6 hours at +2°C
+    (1.0, 8),  # 8 hours at +1°C
+    (0.0, 4),  # 4 hours above 0°C (surface crust formation)
+]
+
+
+def _new_freeze_state() -> dict[str, Any]:
+    """Empty freeze-thaw tracking state (see _advance_freeze_state)."""
+    return {
+        "through": None,
+        "runs": [0] * len(ICE_THRESHOLDS),
+        "last_ice_event": None,
+        "snow_since_ice_cm": 0.0,
+        "last_snow_hour": None,
+    }
+
+
+def _advance_freeze_state(
+    state: dict[str, Any],
+    hourly_times: list[str],
+    hourly_temps: list[float | None],
+    hourly_snowfall: list[float | None],
+    start: int,
+    end: int,
+) -> dict[str, Any]:
+    """Fold hours [start, end) into a freeze-thaw tracking state.
+
+    The state is small and JSON-safe so it can be persisted in the snow
+    summary and resumed next hour, processing only hours that arrived since:
+        through           last hour folded in (Open-Meteo time string)
+        runs              consecutive hours at/above each ICE_THRESHOLDS temp
+                          ending at `through` (None temps break a run)
+        last_ice_event    hour the latest ice event completed
+        snow_since_ice_cm snowfall after last_ice_event through `through`
+        last_snow_hour    latest hour with > 0.1cm snowfall
+    """
+    runs = [int(r) for r in state["runs"]]
+    last_ice_event = state["last_ice_event"]
+    snow_since_ice = float(state["snow_since_ice_cm"])
+    last_snow_hour = state["last_snow_hour"]
+
+    for i in range(start, end):
+        temp = hourly_temps[i] if i < len(hourly_temps) else None
+        ice_event = False
+        for k, (threshold_temp, required_hours) in enumerate(ICE_THRESHOLDS):
+            if temp is not None and temp >= threshold_temp:
+                runs[k] += 1
+                ice_event = ice_event or runs[k] >= required_hours
+            else:
+                runs[k] = 0
+
+        snow_cm = hourly_snowfall[i] if i < len(hourly_snowfall) else None
+        if ice_event:
+            last_ice_event = hourly_times[i]
+            snow_since_ice = 0.0
+        elif snow_cm is not None:
+            snow_since_ice += snow_cm
+        if snow_cm is not None and snow_cm > 0.1:
+            last_snow_hour = hourly_times[i]
+
+    return {
+        "through": hourly_times[end - 1] if end > start else state["through"],
+        "runs": runs,
+        "last_ice_event": last_ice_event,
+        "snow_since_ice_cm": snow_since_ice,
+        "last_snow_hour": last_snow_hour,
+    }
+
+
+def _hour_index(hourly_times: list[str], hour: str | None) -> int | None:
+    """Index of an exact Open-Meteo time string in the sorted hourly times."""
+    if not hour:
+        return None
+    i = bisect.bisect_left(hourly_times, hour)
+    return i if i < len(hourly_times) and hourly_times[i] == hour else None
+
+
 # Temperature-aware melt rates (cm/day), matching ML scorer logic.
 # Sub-zero: only sublimation (~3cm/day). Above-zero: active melt (~15cm/day).
 _MELT_RATE_SUBZERO_PER_DAY = 3.0  # cm/day
@@ -384,6 +467,7 @@ class OpenMeteoService:
         longitude: float,
         elevation_meters: int,
         last_known_freeze_date: str | None = None,
+        freeze_state: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """
         Fetch current weather data for a specific location and elevation.
@@ -395,6 +479,9 @@ class OpenMeteoService:
             last_known_freeze_date: Optional ISO timestamp of last known freeze event
                 from the snow summary table. If provided and older than 14 days,
                 we use it instead of searching Open-Meteo history.
+            freeze_state: Optional freeze-thaw tracking state from the snow
+                summary table, so only hours since the last run are scanned.
+                The updated state is returned under "freeze_state".
 
         Returns a dictionary suitable for creating a WeatherCondition object.
         """
@@ -426,7 +513,7 @@ class OpenMeteoService:
 
             # Calculate snowfall from daily data
             snowfall_data = self._process_snowfall(
-                daily, hourly, last_known_freeze_date
+                daily, hourly, last_known_freeze_date, freeze_state
             )
 
             # Calculate ice hours from hourly temperatures
@@ -512,6 +599,8 @@ class OpenMeteoService:
                     "last_freeze_thaw_hours_ago"
                 ),
                 "currently_warming": snowfall_data.get("currently_warming", False),
+                # Incremental freeze-thaw state to persist in the snow summary
+                "freeze_state": snowfall_data.get("freeze_state"),
                 # Weather conditions
                 "humidity_percent": current.get("relative_humidity_2m", 0.0),
                 "wind_speed_kmh": current.get("wind_speed_10m", 0.0),
@@ -813,7 +902,11 @@ class OpenMeteoService:
             raise Exception(f"Error processing timeline data: {str(e)}")
 
     def _process_snowfall(
-        self, daily: dict, hourly: dict, last_known_freeze_date: str | None = None
+        self,
+        daily: dict,
+        hourly: dict,
+        last_known_freeze_date: str | None = None,
+        freeze_state: dict[str, Any] | None = None,
     ) -> dict[str, float]:
         """Process snowfall data using hourly data for accurate rolling windows.
 
@@ -828,9 +921,13 @@ class OpenMeteoService:
             daily: Daily weather data from Open-Meteo
             hourly: Hourly weather data from Open-Meteo
             last_known_freeze_date: Optional ISO timestamp of last known freeze from snow summary
+            freeze_state: Freeze-thaw tracking state persisted from the previous
+                run (see _advance_freeze_state). When it lines up with these
+                hourly times only the newly arrived hours are scanned.
 
         Returns:
-            dict containing snowfall metrics and freeze_event_detected flag
+            dict containing snowfall metrics, freeze_event_detected flag and the
+            updated freeze_state to persist
         """
         # Maximum hours to look back for freeze-thaw detection (14 days)
         MAX_HISTORICAL_HOURS = 336
@@ -919,62 +1016,50 @@ class OpenMeteoService:
                     result["predicted_72h"] += snow_cm
 
             # Calculate snowfall-after-freeze (key fresh powder metric)
-            # Ice formation occurs with multiple temperature/duration thresholds:
-            # - 3h at +3°C or higher (warmest = fastest ice)
-            # - 6h at +2°C or higher
-            # - 8h at +1°C or higher
-            # This is the "reset" point - any snow before this is assumed icy
-
-            # Thaw-freeze thresholds: (temp_celsius, required_hours)
-            ICE_THRESHOLDS = [
-                (3.0, 3),  # 3 hours at +3°C (hard ice fast)
-                (2.0, 6),  # 6 hours at +2°C
-                (1.0, 8),  # 8 hours at +1°C
-                (0.0, 4),  # 4 hours above 0°C (surface crust formation)
-            ]
+            # Ice formation occurs with multiple temperature/duration thresholds
+            # (ICE_THRESHOLDS). This is the "reset" point - any snow before this
+            # is assumed icy.
+            #
+            # Only COMPLETED hours (up to current_index - 1) are folded in.
+            # Counting the current hour would detect "ongoing" warming as a
+            # freeze event, resetting snowfall_after_freeze to 0 during any warm
+            # period and corrupting the persistent snow summary in DynamoDB.
+            #
+            # Resume from the persisted state when its last hour is still in
+            # this response's 14-day window; otherwise rebuild it from the
+            # window start.
+            state = None
+            resume_from = start_historical
+            if freeze_state and freeze_state.get("through"):
+                through_index = _hour_index(hourly_times, freeze_state["through"])
+                if (
+                    through_index is not None
+                    and start_historical - 1 <= through_index < current_index
+                ):
+                    state = freeze_state
+                    resume_from = through_index + 1
+            if state is None:
+                state = _new_freeze_state()
+            state = _advance_freeze_state(
+                state,
+                hourly_times,
+                hourly_temps,
+                hourly_snowfall,
+                resume_from,
+                current_index,
+            )
+            result["freeze_state"] = state
 
-            # Find the last "ice formation event" using multi-threshold detection
-            # An ice event occurs when ANY threshold is met
-            # Search up to 14 days back for accurate freeze-thaw tracking
-            last_ice_event_end_index = None
-
-            # Start from current_index - 1 to only detect COMPLETED ice events.
-            # Starting at current_index would detect "ongoing" warming as a freeze
-            # event, resetting snowfall_after_freeze to 0 during any warm period
-            # and corrupting the persistent snow summary in DynamoDB.
-            search_start = max(current_index - 1, start_historical)
-
-            # Track consecutive hours at each threshold level
-            for i in range(search_start, start_historical - 1, -1):
-                if i >= len(hourly_temps) or hourly_temps[i] is None:
-                    continue
-
-                temp = hourly_temps[i]
-
-                # Check each threshold - look backwards for consecutive hours
-                for threshold_temp, required_hours in ICE_THRESHOLDS:
-                    if temp >= threshold_temp:
-                        # Count consecutive hours at or above this threshold
-                        consecutive = 0
-                        for j in range(
-                            i, max(start_historical - 1, i - required_hours - 1), -1
-                        ):
-                            if (
-                                j < len(hourly_temps)
-                                and hourly_temps[j] is not None
-                                and hourly_temps[j] >= threshold_temp
-                            ):
-                                consecutive += 1
-                            else:
-                                break
-
-                        if consecutive >= required_hours:
-                            # Found an ice formation event!
-                            last_ice_event_end_index = i
-                            break
-
-                if last_ice_event_end_index is not None:
-                    break
+            # Events older than the 14-day window are handled via the known
+            # freeze date below, exactly as when scanning the window
+            last_ice_event_end_index = _hour_index(
+                hourly_times, state["last_ice_event"]
+            )
+            if (
+                last_ice_event_end_index is not None
+                and last_ice_event_end_index < start_historical
+            ):
+                last_ice_event_end_index = None
 
             if last_ice_event_end_index is not None:
                 # Found a freeze event in Open-Meteo data (within 14 days)
@@ -1002,10 +1087,14 @@ class OpenMeteoService:
                         else f"New freeze event detected {detected_freeze_hours_ago:.0f}h ago (no prior known)"
                     )
 
-                # Sum snowfall AFTER the ice formation event (this is non-refrozen snow!)
-                for i in range(last_ice_event_end_index + 1, current_index + 1):
-                    if i < len(hourly_snowfall) and hourly_snowfall[i] is not None:
-                        result["snowfall_after_freeze_cm"] += hourly_snowfall[i]
+                # Snowfall AFTER the ice formation event (this is non-refrozen
+                # snow!): tracked through the last completed hour, plus this hour
+                result["snowfall_after_freeze_cm"] = state["snow_since_ice_cm"]
+                if (
+                    current_index < len(hourly_snowfall)
+                    and hourly_snowfall[current_index] is not None
+                ):
+                    result["snowfall_after_freeze_cm"] += hourly_snowfall[current_index]
             else:
                 # No ice formation event found in Open-Meteo data (last 14 days)
                 # Check if we have a known freeze date from snow summary
@@ -1061,14 +1150,18 @@ class OpenMeteoService:
 
             # Find hours since last significant snowfall (>0.1cm, same threshold
             # as ml_scorer._extract_features_at_hour to avoid counting sensor noise)
-            for i in range(current_index, start_historical - 1, -1):
-                if (
-                    i < len(hourly_snowfall)
-                    and hourly_snowfall[i] is not None
-                    and hourly_snowfall[i] > 0.1
-                ):
-                    result["hours_since_last_snowfall"] = float(current_index - i)
-                    break
+            if (
+                current_index < len(hourly_snowfall)
+                and hourly_snowfall[current_index] is not None
+                and hourly_snowfall[current_index] > 0.1
+            ):
+                result["hours_since_last_snowfall"] = 0.0
+            else:
+                last_snow_index = _hour_index(hourly_times, state["last_snow_hour"])
+                if last_snow_index is not None and last_snow_index >= start_historical:
+                    result["hours_since_last_snowfall"] = float(
+                        current_index - last_snow_index
+                    )
 
             # Get min/max temp from last 24 hours
             temps_24h = [
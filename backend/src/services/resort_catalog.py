@@ -0,0 +1,159 @@
+"""In-memory resort catalog for chat tools.
+
+Loads the static resorts.json and snow-quality.json published to the website
+bucket once per process and answers name searches, id lookups and radius
+queries from memory. The catalog is shared by every request in a warm Lambda
+and refreshed in place every CATALOG_TTL_SECONDS; a failed refresh keeps
+serving the previous copy.
+"""
+
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+
+import boto3
+
+from utils.geo_utils import haversine_distance
+
+logger = logging.getLogger(__name__)
+
+CATALOG_TTL_SECONDS = 300  # static JSON is regenerated after each weather run
+KM_PER_DEGREE_LAT = 111.0
+
+_s3_client = None
+_catalog_cache = {"catalog": None, "expires": 0.0}
+_catalog_lock = threading.Lock()
+
+
+class ResortCatalog:
+    """Resort metadata and latest snow quality, indexed for chat tool lookups."""
+
+    def __init__(self, resorts: list[dict], conditions: dict[str, dict] | None = None):
+        self._resorts = resorts
+        self._by_id = {r["resort_id"]: r for r in resorts}
+        self._conditions = conditions or {}
+        self._search_keys = [
+            (
+                r,
+                (r.get("name") or "").lower(),
+                (r.get("region") or "").lower(),
+                (r.get("country") or "").lower(),
+            )
+            for r in resorts
+        ]
+
+        # Resorts sorted by latitude so a radius query only measures the band
+        # of resorts that can be within reach
+        located = []
+        for r in resorts:
+            eps = r.get("elevation_points") or []
+            if not eps:
+                continue
+            lat, lon = eps[0].get("latitude"), eps[0].get("longitude")
+            if lat is None or lon is None:
+                continue
+            located.append((float(lat), float(lon), r))
+        located.sort(key=lambda x: x[0])
+        self._located = located
+        self._latitudes = [lat for lat, _, _ in located]
+
+    def __len__(self) -> int:
+        return len(self._resorts)
+
+    @property
+    def resorts(self) -> list[dict]:
+        """All resorts, in published order."""
+        return self._resorts
+
+    def get(self, resort_id: str) -> dict | None:
+        """Resort metadata by id."""
+        return self._by_id.get(resort_id)
+
+    def conditions(self, resort_id: str) -> dict | None:
+        """Latest snow quality summary for a resort, if published."""
+        return self._conditions.get(resort_id)
+
+    def search(self, query: str) -> list[dict]:
+        """Resorts whose name, region or country contains query."""
+        query = query.lower()
+        return [
+            r
+            for r, name, region, country in self._search_keys
+            if query in name or query in region or query in country
+        ]
+
+    def nearby(
+        self, latitude: float, longitude: float, radius_km: float
+    ) -> list[tuple[float, dict]]:
+        """(distance_km, resort) pairs within radius_km, nearest first."""
+        delta = radius_km / KM_PER_DEGREE_LAT
+        lo = bisect.bisect_left(self._latitudes, latitude - delta)
+        hi = bisect.bisect_right(self._latitudes, latitude + delta)
+        results = []
+        for lat, lon, r in self._located[lo:hi]:
+            dist = haversine_distance(latitude, longitude, lat, lon)
+            if dist <= radius_km:
+                results.append((dist, r))
+        results.sort(key=lambda x: x[0])
+        return results
+
+
+def _get_s3_client():
+    """Get or create S3 client (lazy init for SnapStart)."""
+    global _s3_client
+    if _s3_client is None:
+        region = os.environ.get("AWS_DEFAULT_REGION", "us-west-2")
+        _s3_client = boto3.client("s3", region_name=region)
+    return _s3_client
+
+
+def _read_static_json(bucket: str, key: str) -> dict:
+    response = _get_s3_client().get_object(Bucket=bucket, Key=key)
+    return json.loads(response["Body"].read())
+
+
+def _load_catalog(bucket: str) -> ResortCatalog:
+    resorts = _read_static_json(bucket, "data/resorts.json").get("resorts", [])
+    try:
+        conditions = _read_static_json(bucket, "data/snow-quality.json").get(
+            "results", {}
+        )
+    except Exception as e:
+        logger.warning("Snow quality snapshot unavailable for catalog: %s", e)
+        conditions = {}
+    logger.info(
+        "Loaded resort catalog: %d resorts, %d with conditions",
+        len(resorts),
+        len(conditions),
+    )
+    return ResortCatalog(resorts, conditions)
+
+
+def get_resort_catalog() -> ResortCatalog | None:
+    """Return the process-wide catalog, loading or refreshing it if stale.
+
+    Returns None when no static JSON is available (no WEBSITE_BUCKET, or the
+    first load failed); callers fall back to DynamoDB.
+    """
+    now = time.time()
+    if _catalog_cache["catalog"] is not None and now < _catalog_cache["expires"]:
+        return _catalog_cache["catalog"]
+
+    bucket = os.environ.get("WEBSITE_BUCKET")
+    if not bucket:
+        return None
+
+    with _catalog_lock:
+        # Another thread may have refreshed while we waited
+        if _catalog_cache["catalog"] is not None and now < _catalog_cache["expires"]:
+            return _catalog_cache["catalog"]
+        try:
+            _catalog_cache["catalog"] = _load_catalog(bucket)
+        except Exception as e:
+            logger.warning("Error loading resort catalog from S3: %s", e)
+        # Back off for a full TTL either way, serving the previous copy if any
+        _catalog_cache["expires"] = now + CATALOG_TTL_SECONDS
+        return _catalog_cache["catalog"]
@@ -37,14 +37,15 @@ class SnowQualityService:
         # so it's only reliable when we can extract the same exact features.
         # Without raw_data, fall through to the heuristic algorithm.
         try:
-            from services.ml_scorer import (
-                extract_features_from_raw_data,
-                predict_quality,
-            )
-
-            raw_features = extract_features_from_raw_data(weather, elevation_m)
-            if raw_features is not None:
-                ml_quality, ml_score = predict_quality(weather, elevation_m)
+            from services.ml_scorer import build_scoring_context, predict_quality
+
+            # One feature extraction pass, shared with predict_quality. Only
+            # exact features are used, so don't approximate without raw_data
+            context = build_scoring_context(weather, elevation_m, exact_only=True)
+            if context.exact:
+                ml_quality, ml_score = predict_quality(
+                    weather, elevation_m, context=context
+                )
                 if ml_quality != SnowQuality.UNKNOWN:
                     # Post-ML adjustments for features the model doesn't see.
                     snow_depth = getattr(weather, "snow_depth_cm", None)
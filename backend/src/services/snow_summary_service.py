@@ -19,6 +19,8 @@ from typing import Any
 import boto3
 from botocore.exceptions import ClientError
 
+from utils.dynamodb_utils import prepare_for_dynamodb
+
 logger = logging.getLogger(__name__)
 
 
@@ -78,6 +80,7 @@ class SnowSummaryService:
         last_updated: str,
         season_start_date: str | None = None,
         last_snowfall_24h_cm: float | None = None,
+        freeze_state: dict[str, Any] | None = None,
     ) -> bool:
         """Update the snow summary with latest data.
 
@@ -90,6 +93,8 @@ class SnowSummaryService:
             last_updated: ISO timestamp of this update
             season_start_date: When tracking started (YYYY-MM-DD format)
             last_snowfall_24h_cm: Last known 24h snowfall value (for delta tracking)
+            freeze_state: Incremental freeze-thaw state from Open-Meteo processing,
+                resumed on the next run so only new hours are scanned
 
         Returns:
             True if update successful, False otherwise
@@ -118,6 +123,9 @@ class SnowSummaryService:
                     str(round(last_snowfall_24h_cm, 2))
                 )
 
+            if freeze_state:
+                item["freeze_state"] = prepare_for_dynamodb(freeze_state)
+
             self.table.put_item(Item=item)
             logger.debug(
                 f"Updated snow summary for {resort_id}/{elevation_level}: "
@@ -289,6 +297,8 @@ class SnowSummaryService:
                 result[key] = float(value)
             elif isinstance(value, dict):
                 result[key] = self._convert_decimals(value)
+            elif isinstance(value, list):
+                result[key] = [float(v) if isinstance(v, Decimal) else v for v in value]
             else:
                 result[key] = value
         return result
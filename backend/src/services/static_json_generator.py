@@ -6,11 +6,18 @@ These files are uploaded to S3 and served via CloudFront for optimal performance
 Files generated:
 - /data/resorts.json - All resort metadata
 - /data/snow-quality.json - All resort snow quality summaries
+- /data/manifest.json, /data/shards/, /data/deltas/ - versioned region and
+  resort shards plus deltas between versions (see services.static_shards)
+
+The files are built either from a full DynamoDB pass (generate_all) or from
+the per-chunk summaries weather workers upload under static-chunks/{run_id}/
+(generate_from_chunks), which needs no DynamoDB reads at all.
 """
 
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 from typing import Any
 
@@ -19,7 +26,7 @@ from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 
 from models.resort import Resort
-from models.weather import SnowQuality
+from models.weather import SnowQuality, WeatherCondition
 from services.ml_scorer import raw_score_to_quality
 from services.quality_explanation_service import (
     generate_overall_explanation,
@@ -27,6 +34,19 @@ from services.quality_explanation_service import (
 )
 from services.resort_service import ResortService
 from services.snow_quality_service import SnowQualityService
+from services.static_shards import (
+    HASHES_KEY,
+    MANIFEST_KEY,
+    REGION_SHARD_PREFIX,
+    RESORT_SHARD_PREFIX,
+    build_delta,
+    build_region_shards,
+    build_resort_shard,
+    changed_resorts,
+    content_hash,
+    delta_key,
+    resort_hashes,
+)
 from services.weather_service import WeatherService
 from utils.constants import DEFAULT_ELEVATION_WEIGHT, ELEVATION_WEIGHTS
 
@@ -42,6 +62,113 @@ _boto_config = BotoConfig(max_pool_connections=25, retries={"max_attempts": 3})
 s3_client = boto3.client("s3", region_name=AWS_REGION, config=_boto_config)
 dynamodb = boto3.resource("dynamodb", region_name=AWS_REGION, config=_boto_config)
 
+DEFAULT_CACHE_CONTROL = "public, max-age=3600"  # 1 hour cache
+# Shards are overwritten in place; the manifest must be fresh for readers
+# to notice a new version at all
+SHARD_CACHE_CONTROL = "public, max-age=300"
+MANIFEST_CACHE_CONTROL = "public, max-age=60"
+# A delta's key names both versions, so its content never changes
+DELTA_CACHE_CONTROL = "public, max-age=31536000, immutable"
+SHARD_UPLOAD_WORKERS = 16  # Stays under the client's 25 pooled connections
+
+# Per-run summaries written by weather workers: static-chunks/{run_id}/{chunk}.json
+CHUNK_PREFIX = "static-chunks/"
+CHUNK_FETCH_WORKERS = 16
+PUBLISHED_MARKER = "_published"
+
+
+def chunk_key(run_id: str, chunk: str) -> str:
+    """S3 key of one worker's chunk summary for a run."""
+    return f"{CHUNK_PREFIX}{run_id}/{chunk}.json"
+
+
+def build_snow_quality_summary(
+    resort_id: str, conditions: list[WeatherCondition]
+) -> dict:
+    """Snow quality summary for one resort from its latest conditions.
+
+    This mirrors the API's _get_snow_quality_for_resort function logic.
+    Weather workers call it on the conditions they just computed, so
+    summaries from chunks match the ones built from DynamoDB.
+
+    Args:
+        resort_id: Resort ID
+        conditions: Latest condition per elevation
+    """
+    if not conditions:
+        return {
+            "resort_id": resort_id,
+            "overall_quality": SnowQuality.UNKNOWN.value,
+            "last_updated": None,
+            "temperature_c": None,
+            "snowfall_fresh_cm": None,
+            "snowfall_24h_cm": None,
+            "snow_depth_cm": None,
+            "wind_speed_kmh": None,
+            "predicted_snow_48h_cm": None,
+        }
+
+    # Get representative condition (prefer mid > top > base).
+    # Mid elevation best represents typical skiing conditions.
+    # We use this single elevation's score for overall quality so that
+    # the score matches the timeline view and explanation text.
+    representative = None
+    for pref_level in ["mid", "top", "base"]:
+        for c in conditions:
+            if c.elevation_level == pref_level:
+                representative = c
+                break
+        if representative:
+            break
+    if not representative and conditions:
+        representative = conditions[0]
+
+    # Use weighted average across all elevations for overall quality
+    # Weights: top 50%, mid 35%, base 15% (matches recommendation service)
+    weighted_raw = 0.0
+    total_w = 0.0
+    for c in conditions:
+        if c.quality_score is not None:
+            w = ELEVATION_WEIGHTS.get(c.elevation_level, DEFAULT_ELEVATION_WEIGHT)
+            weighted_raw += c.quality_score * w
+            total_w += w
+
+    if total_w > 0:
+        overall_raw = weighted_raw / total_w
+        snow_score = score_to_100(overall_raw)
+        overall_quality = raw_score_to_quality(overall_raw)
+    else:
+        overall_quality = SnowQualityService.calculate_overall_quality(conditions)
+        snow_score = None
+
+    # Generate overall explanation using same representative condition
+    # to ensure temperature in explanation matches temperature_c field
+    explanation = generate_overall_explanation(
+        conditions, overall_quality, representative=representative
+    )
+
+    return {
+        "resort_id": resort_id,
+        "overall_quality": (
+            overall_quality.value
+            if hasattr(overall_quality, "value")
+            else overall_quality
+        ),
+        "snow_score": snow_score,
+        "explanation": explanation,
+        "last_updated": max(c.timestamp for c in conditions) if conditions else None,
+        "temperature_c": (
+            representative.current_temp_celsius if representative else None
+        ),
+        "snowfall_fresh_cm": (representative.fresh_snow_cm if representative else None),
+        "snowfall_24h_cm": (representative.snowfall_24h_cm if representative else None),
+        "snow_depth_cm": (representative.snow_depth_cm if representative else None),
+        "wind_speed_kmh": (representative.wind_speed_kmh if representative else None),
+        "predicted_snow_48h_cm": (
+            representative.predicted_snow_48h_cm if representative else None
+        ),
+    }
+
 
 class StaticJsonGenerator:
     """Generates and uploads static JSON files to S3."""
@@ -74,6 +201,9 @@ class StaticJsonGenerator:
             api_key="",  # Not needed for reading from DynamoDB
             conditions_table=self.weather_table,
         )
+        # Output of the last _generate_* calls, reused for the shards
+        self._resorts_data: list[dict] | None = None
+        self._quality_summaries: dict[str, dict] | None = None
 
     def generate_all(self) -> dict[str, Any]:
         """Generate and upload all static JSON files.
@@ -89,9 +219,11 @@ class StaticJsonGenerator:
             "errors": [],
         }
 
+        resorts = None
         try:
-            # Generate resorts.json
-            resorts_result = self._generate_resorts_json()
+            # Generate resorts.json (one scan, shared with snow-quality.json)
+            resorts = self.resort_service.get_all_resorts()
+            resorts_result = self._generate_resorts_json(resorts)
             results["files"].append(resorts_result)
         except Exception as e:
             logger.error(f"Failed to generate resorts.json: {e}")
@@ -99,12 +231,150 @@ class StaticJsonGenerator:
 
         try:
             # Generate snow-quality.json
-            quality_result = self._generate_snow_quality_json()
+            quality_result = self._generate_snow_quality_json(resorts)
             results["files"].append(quality_result)
         except Exception as e:
             logger.error(f"Failed to generate snow-quality.json: {e}")
             results["errors"].append({"file": "snow-quality.json", "error": str(e)})
 
+        return self._finish(results, start_time)
+
+    def generate_from_chunks(
+        self, run_id: str, chunk_count: int | None = None
+    ) -> dict[str, Any]:
+        """Generate all static JSON files from a run's worker chunk summaries.
+
+        Each weather worker uploads the metadata and snow quality summaries
+        of the resorts it just processed, so the files can be published as
+        soon as the last worker finishes, without another DynamoDB pass.
+        Chunks are merged as they download and both files upload in
+        parallel. Falls back to generate_all() if a chunk or resort is
+        missing.
+
+        Args:
+            run_id: Weather processing run the chunks belong to
+            chunk_count: Number of chunks the run dispatched, if known
+
+        Returns:
+            Dict with generation statistics and results
+        """
+        logger.info(f"Starting static JSON generation from run {run_id} chunks")
+        start_time = datetime.now(UTC)
+        prefix = f"{CHUNK_PREFIX}{run_id}/"
+        keys = self._list_keys(prefix)
+
+        # Two workers finishing together can both trigger generation
+        if prefix + PUBLISHED_MARKER in keys:
+            logger.info(f"Static JSON for run {run_id} already published")
+            return {
+                "generated_at": start_time.isoformat(),
+                "files": [],
+                "errors": [],
+                "run_id": run_id,
+                "skipped": True,
+                "duration_seconds": 0.0,
+                "success": True,
+            }
+
+        chunk_keys = sorted(key for key in keys if key.endswith(".json"))
+        if not chunk_keys or (chunk_count and len(chunk_keys) < chunk_count):
+            logger.warning(
+                f"Run {run_id} has {len(chunk_keys)}/{chunk_count} chunks, "
+                "falling back to a full generation"
+            )
+            return self.generate_all()
+        try:
+            resorts_data, quality_summaries = self._merge_chunks(chunk_keys)
+        except Exception as e:
+            logger.warning(
+                f"Failed to merge chunks for run {run_id}, "
+                f"falling back to a full generation: {e}"
+            )
+            return self.generate_all()
+
+        results = {
+            "generated_at": start_time.isoformat(),
+            "files": [],
+            "errors": [],
+            "run_id": run_id,
+            "chunks": len(chunk_keys),
+        }
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            uploads = {
+                "resorts.json": pool.submit(self._write_resorts_json, resorts_data),
+                "snow-quality.json": pool.submit(
+                    self._write_snow_quality_json, quality_summaries
+                ),
+            }
+        for file_name, future in uploads.items():
+            try:
+                results["files"].append(future.result())
+            except Exception as e:
+                logger.error(f"Failed to generate {file_name}: {e}")
+                results["errors"].append({"file": file_name, "error": str(e)})
+
+        results = self._finish(results, start_time)
+        if results["success"]:
+            try:
+                self._upload_to_s3(
+                    prefix + PUBLISHED_MARKER, "{}", cache_control="no-cache"
+                )
+            except ClientError:
+                pass  # Already logged; at worst a duplicate trigger republishes
+        return results
+
+    def _merge_chunks(
+        self, chunk_keys: list[str]
+    ) -> tuple[list[dict], dict[str, dict]]:
+        """Download chunks in parallel, folding each in as it arrives.
+
+        Resorts a worker couldn't summarize get their summary from DynamoDB.
+
+        Returns:
+            (resort dicts sorted by name, snow quality summaries by resort ID)
+
+        Raises:
+            ValueError: If a resort a worker was assigned is missing
+        """
+        resorts_by_id: dict[str, dict] = {}
+        quality_summaries: dict[str, dict] = {}
+        expected: set[str] = set()
+        with ThreadPoolExecutor(max_workers=CHUNK_FETCH_WORKERS) as pool:
+            futures = [pool.submit(self._read_json, key) for key in chunk_keys]
+            for future in as_completed(futures):
+                chunk = future.result()
+                expected.update(chunk.get("resort_ids", []))
+                for resort in chunk.get("resorts", []):
+                    resorts_by_id[resort["resort_id"]] = resort
+                quality_summaries.update(chunk.get("snow_quality", {}))
+
+        missing = expected - set(resorts_by_id)
+        if missing:
+            raise ValueError(f"{len(missing)} resorts missing from chunks")
+
+        for resort_id, resort in resorts_by_id.items():
+            if resort_id not in quality_summaries:
+                quality_summaries[resort_id] = self._get_snow_quality_for_resort(
+                    Resort.model_validate(resort)
+                )
+
+        # Same order as ResortService.get_all_resorts()
+        resorts_data = sorted(resorts_by_id.values(), key=lambda r: r["name"])
+        return resorts_data, quality_summaries
+
+    def _finish(self, results: dict[str, Any], start_time: datetime) -> dict[str, Any]:
+        """Publish shards for complete files and record timing."""
+        # Shards and the manifest describe both files, so only publish a new
+        # version when both are complete
+        if not results["errors"]:
+            try:
+                results["shards"] = self._publish_shards(
+                    self._resorts_data, self._quality_summaries
+                )
+            except Exception as e:
+                logger.error(f"Failed to publish static JSON shards: {e}")
+                results["errors"].append({"file": MANIFEST_KEY, "error": str(e)})
+
         end_time = datetime.now(UTC)
         results["duration_seconds"] = (end_time - start_time).total_seconds()
         results["success"] = len(results["errors"]) == 0
@@ -116,16 +386,22 @@ class StaticJsonGenerator:
 
         return results
 
-    def _generate_resorts_json(self) -> dict[str, Any]:
+    def _generate_resorts_json(
+        self, resorts: list[Resort] | None = None
+    ) -> dict[str, Any]:
         """Generate resorts.json with all resort metadata.
 
+        Args:
+            resorts: Pre-fetched resorts. If None, scans the resorts table.
+
         Returns:
             Dict with file generation stats
         """
         logger.info("Generating resorts.json")
 
         # Get all resorts
-        resorts = self.resort_service.get_all_resorts()
+        if resorts is None:
+            resorts = self.resort_service.get_all_resorts()
         logger.info(f"Found {len(resorts)} resorts")
 
         # Convert to JSON-serializable format
@@ -134,6 +410,14 @@ class StaticJsonGenerator:
             resort_dict = resort.model_dump()
             resorts_data.append(resort_dict)
 
+        return self._write_resorts_json(resorts_data)
+
+    def _write_resorts_json(self, resorts_data: list[dict]) -> dict[str, Any]:
+        """Upload resorts.json built from resort dicts.
+
+        Returns:
+            Dict with file generation stats
+        """
         # Build the JSON structure
         output = {
             "generated_at": datetime.now(UTC).isoformat(),
@@ -146,6 +430,7 @@ class StaticJsonGenerator:
         s3_key = "data/resorts.json"
 
         self._upload_to_s3(s3_key, json_content)
+        self._resorts_data = resorts_data
 
         return {
             "file": s3_key,
@@ -153,16 +438,22 @@ class StaticJsonGenerator:
             "size_bytes": len(json_content),
         }
 
-    def _generate_snow_quality_json(self) -> dict[str, Any]:
+    def _generate_snow_quality_json(
+        self, resorts: list[Resort] | None = None
+    ) -> dict[str, Any]:
         """Generate snow-quality.json with all resort snow quality summaries.
 
+        Args:
+            resorts: Pre-fetched resorts. If None, scans the resorts table.
+
         Returns:
             Dict with file generation stats
         """
         logger.info("Generating snow-quality.json")
 
         # Get all resorts
-        resorts = self.resort_service.get_all_resorts()
+        if resorts is None:
+            resorts = self.resort_service.get_all_resorts()
 
         # Bulk-fetch conditions for ALL resorts in 3 GSI queries (one per elevation)
         # instead of 1019 individual queries. Uses ProjectionExpression to exclude
@@ -195,6 +486,18 @@ class StaticJsonGenerator:
 
         logger.info(f"Generated snow quality for {processed} resorts, {errors} errors")
 
+        result = self._write_snow_quality_json(quality_summaries)
+        result["errors"] = errors
+        return result
+
+    def _write_snow_quality_json(
+        self, quality_summaries: dict[str, dict]
+    ) -> dict[str, Any]:
+        """Upload snow-quality.json built from per-resort summaries.
+
+        Returns:
+            Dict with file generation stats
+        """
         # Build the JSON structure
         output = {
             "generated_at": datetime.now(UTC).isoformat(),
@@ -207,12 +510,12 @@ class StaticJsonGenerator:
         s3_key = "data/snow-quality.json"
 
         self._upload_to_s3(s3_key, json_content)
+        self._quality_summaries = quality_summaries
 
         return {
             "file": s3_key,
             "resort_count": len(quality_summaries),
             "size_bytes": len(json_content),
-            "errors": errors,
         }
 
     def _get_snow_quality_for_resort(
@@ -220,8 +523,6 @@ class StaticJsonGenerator:
     ) -> dict | None:
         """Get snow quality summary for a single resort.
 
-        This mirrors the API's _get_snow_quality_for_resort function logic.
-
         Args:
             resort: Resort object
             conditions: Pre-fetched conditions list. If None, queries DynamoDB per-resort.
@@ -230,91 +531,183 @@ class StaticJsonGenerator:
             conditions = self.weather_service.get_latest_conditions_all_elevations(
                 resort.resort_id
             )
+        return build_snow_quality_summary(resort.resort_id, conditions)
 
-        if not conditions:
-            return {
-                "resort_id": resort.resort_id,
-                "overall_quality": SnowQuality.UNKNOWN.value,
-                "last_updated": None,
-                "temperature_c": None,
-                "snowfall_fresh_cm": None,
-                "snowfall_24h_cm": None,
-                "snow_depth_cm": None,
-                "predicted_snow_48h_cm": None,
-            }
+    def _publish_shards(
+        self, resorts_data: list[dict], quality: dict[str, dict]
+    ) -> dict[str, Any]:
+        """Publish changed shards, a delta from the previous version and the manifest.
 
-        # Get representative condition (prefer mid > top > base).
-        # Mid elevation best represents typical skiing conditions.
-        # We use this single elevation's score for overall quality so that
-        # the score matches the timeline view and explanation text.
-        representative = None
-        for pref_level in ["mid", "top", "base"]:
-            for c in conditions:
-                if c.elevation_level == pref_level:
-                    representative = c
-                    break
-            if representative:
-                break
-        if not representative and conditions:
-            representative = conditions[0]
+        The version is a hash of every resort's metadata and snow quality
+        hashes, so a run that changed nothing publishes nothing. The manifest
+        is uploaded last: readers that see a new version can rely on its
+        shards and delta already being in place.
 
-        # Use weighted average across all elevations for overall quality
-        # Weights: top 50%, mid 35%, base 15% (matches recommendation service)
-        weighted_raw = 0.0
-        total_w = 0.0
-        for c in conditions:
-            if c.quality_score is not None:
-                w = ELEVATION_WEIGHTS.get(c.elevation_level, DEFAULT_ELEVATION_WEIGHT)
-                weighted_raw += c.quality_score * w
-                total_w += w
-
-        if total_w > 0:
-            overall_raw = weighted_raw / total_w
-            snow_score = score_to_100(overall_raw)
-            overall_quality = raw_score_to_quality(overall_raw)
-        else:
-            overall_quality = SnowQualityService.calculate_overall_quality(conditions)
-            snow_score = None
-
-        # Generate overall explanation using same representative condition
-        # to ensure temperature in explanation matches temperature_c field
-        explanation = generate_overall_explanation(
-            conditions, overall_quality, representative=representative
+        Args:
+            resorts_data: Resort dicts as written to resorts.json
+            quality: Snow quality summaries as written to snow-quality.json
+
+        Returns:
+            Dict with the version and upload stats
+        """
+        generated_at = datetime.now(UTC).isoformat()
+        previous = self._read_previous_hashes()
+        previous_version = previous.get("version")
+
+        hashes = resort_hashes(resorts_data, quality)
+        version = content_hash(hashes)
+        if version == previous_version:
+            logger.info(f"Static JSON unchanged at version {version}")
+            return {"version": version, "changed": False, "uploaded": 0}
+
+        metadata_changed, quality_changed, removed = changed_resorts(
+            previous.get("resorts", {}), hashes
+        )
+        region_shards = build_region_shards(resorts_data, quality)
+        region_hashes = {
+            slug: content_hash(shard) for slug, shard in region_shards.items()
+        }
+
+        uploads: list[tuple[str, dict, str]] = []
+        for resort in resorts_data:
+            resort_id = resort["resort_id"]
+            if resort_id in metadata_changed or resort_id in quality_changed:
+                uploads.append(
+                    (
+                        f"{RESORT_SHARD_PREFIX}{resort_id}.json",
+                        build_resort_shard(resort, quality),
+                        SHARD_CACHE_CONTROL,
+                    )
+                )
+        previous_regions = previous.get("regions", {})
+        for slug, shard in region_shards.items():
+            if previous_regions.get(slug) != region_hashes[slug]:
+                uploads.append(
+                    (f"{REGION_SHARD_PREFIX}{slug}.json", shard, SHARD_CACHE_CONTROL)
+                )
+
+        delta_entry = None
+        if previous_version:
+            key = delta_key(previous_version, version)
+            delta = build_delta(
+                previous_version,
+                version,
+                generated_at,
+                resorts_data,
+                quality,
+                metadata_changed,
+                quality_changed,
+                removed,
+            )
+            uploads.append((key, delta, DELTA_CACHE_CONTROL))
+            delta_entry = {"from_version": previous_version, "key": key}
+
+        with ThreadPoolExecutor(max_workers=SHARD_UPLOAD_WORKERS) as pool:
+            sizes = list(pool.map(lambda upload: self._upload_json(*upload), uploads))
+        stale_keys = [
+            f"{RESORT_SHARD_PREFIX}{resort_id}.json" for resort_id in sorted(removed)
+        ] + [
+            f"{REGION_SHARD_PREFIX}{slug}.json"
+            for slug in sorted(set(previous_regions) - set(region_shards))
+        ]
+        if stale_keys:
+            self._delete_from_s3(stale_keys)
+
+        self._upload_json(
+            HASHES_KEY,
+            {"version": version, "resorts": hashes, "regions": region_hashes},
+            "no-cache",
         )
+        manifest = {
+            "version": version,
+            "generated_at": generated_at,
+            "resort_count": len(resorts_data),
+            "files": {
+                "resorts": {
+                    "key": "data/resorts.json",
+                    "hash": content_hash([h[0] for h in hashes.values()]),
+                },
+                "snow_quality": {
+                    "key": "data/snow-quality.json",
+                    "hash": content_hash([h[1] for h in hashes.values()]),
+                },
+            },
+            "regions": {
+                slug: {
+                    "key": f"{REGION_SHARD_PREFIX}{slug}.json",
+                    "hash": region_hashes[slug],
+                    "count": len(shard["resorts"]),
+                }
+                for slug, shard in sorted(region_shards.items())
+            },
+            "resort_shard_prefix": RESORT_SHARD_PREFIX,
+            "delta": delta_entry,
+        }
+        self._upload_json(MANIFEST_KEY, manifest, MANIFEST_CACHE_CONTROL)
 
+        logger.info(
+            f"Published static JSON version {version}: {len(uploads)} shards/deltas "
+            f"({sum(sizes)} bytes), {len(metadata_changed)} resorts and "
+            f"{len(quality_changed)} summaries changed, {len(removed)} removed"
+        )
         return {
-            "resort_id": resort.resort_id,
-            "overall_quality": (
-                overall_quality.value
-                if hasattr(overall_quality, "value")
-                else overall_quality
-            ),
-            "snow_score": snow_score,
-            "explanation": explanation,
-            "last_updated": max(c.timestamp for c in conditions)
-            if conditions
-            else None,
-            "temperature_c": (
-                representative.current_temp_celsius if representative else None
-            ),
-            "snowfall_fresh_cm": (
-                representative.fresh_snow_cm if representative else None
-            ),
-            "snowfall_24h_cm": (
-                representative.snowfall_24h_cm if representative else None
-            ),
-            "snow_depth_cm": (representative.snow_depth_cm if representative else None),
-            "predicted_snow_48h_cm": (
-                representative.predicted_snow_48h_cm if representative else None
-            ),
+            "version": version,
+            "previous_version": previous_version,
+            "changed": True,
+            "uploaded": len(uploads),
+            "size_bytes": sum(sizes),
+            "resorts_changed": len(metadata_changed),
+            "snow_quality_changed": len(quality_changed),
+            "removed": len(removed),
         }
 
-    def _upload_to_s3(self, key: str, content: str) -> None:
+    def _read_previous_hashes(self) -> dict:
+        """Hashes published by the previous run, or {} to republish everything."""
+        try:
+            previous = self._read_json(HASHES_KEY)
+            return previous if isinstance(previous, dict) else {}
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "NoSuchKey":
+                logger.warning(f"Failed to read {HASHES_KEY}: {e}")
+            return {}
+        except Exception as e:
+            logger.warning(f"Failed to read {HASHES_KEY}: {e}")
+            return {}
+
+    def _read_json(self, key: str) -> Any:
+        response = s3_client.get_object(Bucket=self.website_bucket, Key=key)
+        return json.loads(response["Body"].read().decode("utf-8"))
+
+    def _list_keys(self, prefix: str) -> list[str]:
+        keys = []
+        paginator = s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.website_bucket, Prefix=prefix):
+            keys.extend(obj["Key"] for obj in page.get("Contents", []))
+        return keys
+
+    def _upload_json(self, key: str, data: Any, cache_control: str) -> int:
+        """Serialize and upload a JSON object, returning its size in bytes."""
+        content = json.dumps(data, indent=None, separators=(",", ":"))
+        self._upload_to_s3(key, content, cache_control=cache_control)
+        return len(content)
+
+    def _delete_from_s3(self, keys: list[str]) -> None:
+        """Delete objects, 1000 per request (the DeleteObjects limit)."""
+        for i in range(0, len(keys), 1000):
+            s3_client.delete_objects(
+                Bucket=self.website_bucket,
+                Delete={"Objects": [{"Key": key} for key in keys[i : i + 1000]]},
+            )
+
+    def _upload_to_s3(
+        self, key: str, content: str, cache_control: str = DEFAULT_CACHE_CONTROL
+    ) -> None:
         """Upload content to S3 with appropriate headers.
 
         Args:
             key: S3 object key
             content: JSON content to upload
+            cache_control: Cache-Control header for CloudFront and browsers
         """
         try:
             s3_client.put_object(
@@ -322,7 +715,7 @@ class StaticJsonGenerator:
                 Key=key,
                 Body=content.encode("utf-8"),
                 ContentType="application/json",
-                CacheControl="public, max-age=3600",  # 1 hour cache
+                CacheControl=cache_control,
             )
             logger.info(f"Uploaded {key} to s3://{self.website_bucket}/{key}")
         except ClientError as e:
@@ -341,3 +734,21 @@ def generate_static_json_api() -> dict[str, Any]:
     """
     generator = StaticJsonGenerator()
     return generator.generate_all()
+
+
+def generate_static_json_from_chunks(
+    run_id: str, chunk_count: int | None = None
+) -> dict[str, Any]:
+    """Generate all static JSON files from a weather run's worker chunks.
+
+    This is the entry point invoked by the last weather worker of a run.
+
+    Args:
+        run_id: Weather processing run ID
+        chunk_count: Number of chunks (workers) the run dispatched
+
+    Returns:
+        Dict with generation results
+    """
+    generator = StaticJsonGenerator()
+    return generator.generate_from_chunks(run_id, chunk_count)
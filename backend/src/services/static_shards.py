@@ -0,0 +1,163 @@
+"""Sharded, versioned layout for the static JSON API.
+
+The monolithic data/resorts.json and data/snow-quality.json grow with the
+resort count and are re-downloaded whole whenever they change. Alongside
+them the generator publishes:
+
+- data/shards/regions/{region}.json - resorts and snow quality for one region
+- data/shards/resorts/{resort_id}.json - one resort and its snow quality
+- data/deltas/{from}-{to}.json - resorts and summaries changed, removed or
+  dropped between versions
+- data/manifest.json - current version, file hashes and the latest delta
+
+Every piece is identified by a content hash, so a reader holding version N
+can tell from the small manifest what changed and fetch only the delta (or
+the affected shards) instead of the full files. Shards whose content did not
+change are not re-uploaded.
+
+The per-resort hashes the next run diffs against live in
+data/shards/hashes.json.
+"""
+
+import hashlib
+import json
+import re
+from typing import Any
+
+MANIFEST_KEY = "data/manifest.json"
+HASHES_KEY = "data/shards/hashes.json"
+REGION_SHARD_PREFIX = "data/shards/regions/"
+RESORT_SHARD_PREFIX = "data/shards/resorts/"
+DELTA_PREFIX = "data/deltas/"
+UNKNOWN_REGION = "other"
+
+
+def content_hash(obj: Any) -> str:
+    """Short stable hash of a JSON-serializable object."""
+    canonical = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def region_slug(region: str | None) -> str:
+    """File-name-safe region identifier."""
+    slug = re.sub(r"[^a-z0-9]+", "-", (region or "").lower()).strip("-")
+    return slug or UNKNOWN_REGION
+
+
+def resort_hashes(
+    resorts_data: list[dict], quality: dict[str, dict]
+) -> dict[str, list[str | None]]:
+    """[metadata hash, snow quality hash] per resort ID."""
+    hashes = {}
+    for resort in resorts_data:
+        resort_id = resort["resort_id"]
+        summary = quality.get(resort_id)
+        hashes[resort_id] = [
+            content_hash(resort),
+            content_hash(summary) if summary is not None else None,
+        ]
+    return hashes
+
+
+def build_region_shards(
+    resorts_data: list[dict], quality: dict[str, dict]
+) -> dict[str, dict]:
+    """Region shards keyed by region slug."""
+    shards: dict[str, dict] = {}
+    for resort in resorts_data:
+        slug = region_slug(resort.get("region"))
+        shard = shards.setdefault(
+            slug, {"region": slug, "resorts": [], "snow_quality": {}}
+        )
+        shard["resorts"].append(resort)
+        summary = quality.get(resort["resort_id"])
+        if summary is not None:
+            shard["snow_quality"][resort["resort_id"]] = summary
+    return shards
+
+
+def build_resort_shard(resort: dict, quality: dict[str, dict]) -> dict:
+    """Shard for a single resort."""
+    return {"resort": resort, "snow_quality": quality.get(resort["resort_id"])}
+
+
+def changed_resorts(
+    previous: dict[str, list], current: dict[str, list]
+) -> tuple[set[str], set[str], set[str]]:
+    """Diff two resort hash maps.
+
+    Returns:
+        (IDs with changed metadata, IDs whose snow quality changed or was
+        dropped, removed IDs)
+    """
+    metadata_changed = set()
+    quality_changed = set()
+    for resort_id, (meta_hash, quality_hash) in current.items():
+        old = previous.get(resort_id) or [None, None]
+        if old[0] != meta_hash:
+            metadata_changed.add(resort_id)
+        if old[1] != quality_hash:
+            quality_changed.add(resort_id)
+    removed = set(previous) - set(current)
+    return metadata_changed, quality_changed, removed
+
+
+def build_delta(
+    from_version: str,
+    version: str,
+    generated_at: str,
+    resorts_data: list[dict],
+    quality: dict[str, dict],
+    metadata_changed: set[str],
+    quality_changed: set[str],
+    removed: set[str],
+) -> dict:
+    """Delta that turns the files at from_version into the files at version.
+
+    Resorts that still exist but no longer have a summary are listed in
+    snow_quality_removed.
+    """
+    return {
+        "from_version": from_version,
+        "version": version,
+        "generated_at": generated_at,
+        "resorts": [r for r in resorts_data if r["resort_id"] in metadata_changed],
+        "snow_quality": {
+            resort_id: quality[resort_id]
+            for resort_id in sorted(quality_changed)
+            if resort_id in quality
+        },
+        "snow_quality_removed": sorted(
+            resort_id for resort_id in quality_changed if resort_id not in quality
+        ),
+        "removed": sorted(removed),
+    }
+
+
+def delta_key(from_version: str, version: str) -> str:
+    return f"{DELTA_PREFIX}{from_version}-{version}.json"
+
+
+def apply_resorts_delta(resorts: list[dict], delta: dict) -> list[dict]:
+    """New resorts list with a delta's changed and removed resorts applied."""
+    removed = set(delta.get("removed", []))
+    changed = {r["resort_id"]: r for r in delta.get("resorts", [])}
+    updated = []
+    for resort in resorts:
+        resort_id = resort.get("resort_id")
+        if resort_id in removed:
+            continue
+        updated.append(changed.pop(resort_id, resort))
+    updated.extend(changed.values())
+    return updated
+
+
+def apply_snow_quality_delta(results: dict[str, dict], delta: dict) -> dict[str, dict]:
+    """New snow quality map with a delta's changed and removed summaries applied."""
+    updated = {**results, **delta.get("snow_quality", {})}
+    for resort_id in [
+        *delta.get("removed", []),
+        *delta.get("snow_quality_removed", []),
+    ]:
+        updated.pop(resort_id, None)
+    return updated
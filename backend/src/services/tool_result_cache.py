@@ -0,0 +1,128 @@
+"""Chat tool results cached per weather data version.
+
+Conditions, forecasts and history only change when the weather worker runs,
+so identical tool calls between runs return the same result. Results are
+keyed by tool name, normalized input and the current data version: the ETag
+of the static snow-quality.json, which the worker regenerates at the end of
+every run. A new version clears the cache.
+
+Without a WEBSITE_BUCKET there is no data version and nothing is cached.
+"""
+
+import copy
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+
+import boto3
+from cachetools import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Tools whose results depend only on their input and the weather data
+CACHEABLE_TOOLS = frozenset(
+    {
+        "get_resort_conditions",
+        "get_resort_forecast",
+        "get_best_conditions",
+        "get_snow_history",
+        "compare_resorts",
+    }
+)
+TOOL_CACHE_MAX_ENTRIES = 2000
+DATA_VERSION_CHECK_SECONDS = 60
+DATA_VERSION_KEY = "data/snow-quality.json"
+
+_s3_client = None
+
+
+def _get_s3_client():
+    """Get or create S3 client (lazy init for SnapStart)."""
+    global _s3_client
+    if _s3_client is None:
+        region = os.environ.get("AWS_DEFAULT_REGION", "us-west-2")
+        _s3_client = boto3.client("s3", region_name=region)
+    return _s3_client
+
+
+def _normalize_input(tool_input: dict) -> str:
+    return json.dumps(tool_input, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class ToolResultCache:
+    """Process-wide tool result cache, cleared when the data version changes."""
+
+    def __init__(self, max_entries: int = TOOL_CACHE_MAX_ENTRIES):
+        self._results: LRUCache = LRUCache(maxsize=max_entries)
+        self._lock = threading.Lock()
+        self._version: str | None = None
+        self._version_checked = 0.0
+
+    def data_version(self) -> str | None:
+        """Current weather data version, re-checked every minute."""
+        now = time.monotonic()
+        if self._version is not None and (
+            now - self._version_checked < DATA_VERSION_CHECK_SECONDS
+        ):
+            return self._version
+
+        bucket = os.environ.get("WEBSITE_BUCKET")
+        if not bucket:
+            return None
+        try:
+            head = _get_s3_client().head_object(Bucket=bucket, Key=DATA_VERSION_KEY)
+            version = head["ETag"]
+        except Exception as e:
+            logger.warning("Error checking tool cache data version: %s", e)
+            # Keep serving the last known version until the next check
+            version = self._version
+
+        with self._lock:
+            if version != self._version:
+                if self._version is not None:
+                    logger.info(
+                        "Weather data changed, dropping %d cached tool results",
+                        len(self._results),
+                    )
+                self._results.clear()
+                self._version = version
+            self._version_checked = now
+        return version
+
+    def get_or_run(
+        self, tool_name: str, tool_input: dict, run: Callable[[], dict]
+    ) -> dict:
+        """Return the cached result for this call, running the tool on a miss.
+
+        Error results are not cached.
+        """
+        if tool_name not in CACHEABLE_TOOLS:
+            return run()
+        version = self.data_version()
+        if version is None:
+            return run()
+
+        key = (tool_name, _normalize_input(tool_input), version)
+        with self._lock:
+            cached = self._results.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        result = run()
+        if isinstance(result, dict) and "error" not in result:
+            with self._lock:
+                if self._version == version:
+                    self._results[key] = copy.deepcopy(result)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+            self._version = None
+            self._version_checked = 0.0
+
+
+tool_result_cache = ToolResultCache()
@@ -25,6 +25,9 @@ class TripService:
     # Auto-delete completed/cancelled trips after 1 year
     COMPLETED_TRIP_TTL_DAYS = 365
 
+    # GSI (hash: status, range: start_date) for upcoming-trip queries
+    STATUS_START_DATE_INDEX = "StatusStartDateIndex"
+
     def __init__(self, table, resort_service=None, weather_service=None):
         """Initialize the trip service.
 
@@ -256,16 +259,7 @@ class TripService:
         if not trip:
             raise ValueError(f"Trip {trip_id} not found")
 
-        alert = TripAlert(
-            alert_id=str(uuid.uuid4()),
-            alert_type=alert_type,
-            message=message,
-            created_at=datetime.now(UTC).isoformat(),
-            is_read=False,
-            data=data or {},
-        )
-
-        trip.alerts.append(alert)
+        alert = self._append_alert(trip, alert_type, message, data)
         trip.updated_at = datetime.now(UTC).isoformat()
 
         # Save
@@ -329,7 +323,7 @@ class TripService:
                 trip.latest_conditions = new_conditions
                 trip.updated_at = datetime.now(UTC).isoformat()
 
-                # Check for significant changes and add alerts
+                # Check for significant changes and add alerts (saved below)
                 self._check_condition_changes(trip, old_conditions, new_conditions)
 
                 # Save
@@ -342,40 +336,160 @@ class TripService:
     def get_upcoming_trips_for_alerts(self, days_ahead: int = 7) -> list[Trip]:
         """Get all trips starting within the specified days for alert processing.
 
+        Queries the status/start_date index for planned trips, following
+        pagination.
+
         Args:
             days_ahead: Number of days to look ahead
 
         Returns:
-            List of upcoming trips
+            List of upcoming trips, soonest first
         """
-        # This would require a GSI on start_date for efficient querying
-        # For now, scan and filter (not ideal for large datasets)
         try:
             today = datetime.now(UTC).strftime("%Y-%m-%d")
             future = (datetime.now(UTC) + timedelta(days=days_ahead)).strftime(
                 "%Y-%m-%d"
             )
 
-            response = self.table.scan(
-                FilterExpression="start_date >= :today AND start_date <= :future AND #s = :planned",
-                ExpressionAttributeNames={"#s": "status"},
-                ExpressionAttributeValues={
+            query_kwargs = {
+                "IndexName": self.STATUS_START_DATE_INDEX,
+                "KeyConditionExpression": "#s = :planned AND start_date BETWEEN :today AND :future",
+                "ExpressionAttributeNames": {"#s": "status"},
+                "ExpressionAttributeValues": {
                     ":today": today,
                     ":future": future,
                     ":planned": TripStatus.PLANNED.value,
                 },
-            )
+            }
 
             trips = []
-            for item in response.get("Items", []):
-                parsed = parse_from_dynamodb(item)
-                trips.append(Trip(**parsed))
+            while True:
+                response = self.table.query(**query_kwargs)
+                for item in response.get("Items", []):
+                    parsed = parse_from_dynamodb(item)
+                    trips.append(Trip(**parsed))
+                if "LastEvaluatedKey" not in response:
+                    break
+                query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
 
             return trips
 
         except ClientError as e:
             raise Exception(f"Failed to get upcoming trips: {str(e)}")
 
+    def refresh_upcoming_trip_conditions(self, days_ahead: int = 7) -> dict[str, int]:
+        """Refresh condition snapshots and alerts for all upcoming trips.
+
+        Trips are grouped by resort so each resort's conditions are fetched
+        once, however many trips are planned there. A trip is written only
+        when its snapshot changed (ignoring the timestamp) or an alert was
+        raised, and then only latest_conditions, the new alerts and
+        updated_at are set. The trips come from an eventually consistent
+        index, so the write is conditioned on the trip still being planned
+        with the updated_at that was read; a trip the user edited since is
+        left alone until the next run.
+
+        Args:
+            days_ahead: Number of days to look ahead
+
+        Returns:
+            Counts of trips, resorts, updated, unchanged and conflicting
+            (edited since read) trips, and alerts added
+        """
+        stats = {
+            "trips": 0,
+            "resorts": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "conflicts": 0,
+            "alerts": 0,
+        }
+        if not self.weather_service:
+            return stats
+
+        trips_by_resort: dict[str, list[Trip]] = {}
+        for trip in self.get_upcoming_trips_for_alerts(days_ahead):
+            trips_by_resort.setdefault(trip.resort_id, []).append(trip)
+            stats["trips"] += 1
+        stats["resorts"] = len(trips_by_resort)
+
+        now = datetime.now(UTC).isoformat()
+        for resort_id, trips in trips_by_resort.items():
+            new_conditions = self._create_conditions_snapshot(resort_id)
+            if not new_conditions:
+                continue
+
+            for trip in trips:
+                alert_count = len(trip.alerts)
+                self._check_condition_changes(
+                    trip, trip.latest_conditions, new_conditions
+                )
+                new_alerts = trip.alerts[alert_count:]
+                if not new_alerts and self._same_conditions(
+                    trip.latest_conditions, new_conditions
+                ):
+                    stats["unchanged"] += 1
+                    continue
+
+                if self._save_refreshed_conditions(
+                    trip, new_conditions, new_alerts, now
+                ):
+                    stats["updated"] += 1
+                    stats["alerts"] += len(new_alerts)
+                else:
+                    stats["conflicts"] += 1
+
+        return stats
+
+    @staticmethod
+    def _same_conditions(
+        old: TripConditionSnapshot | None, new: TripConditionSnapshot
+    ) -> bool:
+        """Whether two snapshots match apart from when they were taken."""
+        if old is None:
+            return False
+        return old.model_dump(exclude={"timestamp"}) == new.model_dump(
+            exclude={"timestamp"}
+        )
+
+    def _save_refreshed_conditions(
+        self,
+        trip: Trip,
+        conditions: TripConditionSnapshot,
+        new_alerts: list[TripAlert],
+        now: str,
+    ) -> bool:
+        """Write a refreshed snapshot and new alerts onto a trip as read.
+
+        Returns:
+            False if the trip changed since it was read (nothing is written)
+        """
+        update = "SET latest_conditions = :conditions, updated_at = :now"
+        values = {
+            ":conditions": conditions.model_dump(),
+            ":now": now,
+            ":read_updated_at": trip.updated_at,
+            ":planned": TripStatus.PLANNED.value,
+        }
+        if new_alerts:
+            update += ", alerts = list_append(if_not_exists(alerts, :empty), :alerts)"
+            values[":alerts"] = [alert.model_dump() for alert in new_alerts]
+            values[":empty"] = []
+
+        try:
+            self.table.update_item(
+                Key={"trip_id": trip.trip_id, "user_id": trip.user_id},
+                UpdateExpression=update,
+                ConditionExpression="updated_at = :read_updated_at AND #s = :planned",
+                ExpressionAttributeNames={"#s": "status"},
+                ExpressionAttributeValues=prepare_for_dynamodb(values),
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            raise Exception(f"Failed to refresh trip conditions: {str(e)}")
+        return True
+
     def _create_conditions_snapshot(
         self, resort_id: str
     ) -> TripConditionSnapshot | None:
@@ -435,7 +549,10 @@ class TripService:
         old: TripConditionSnapshot | None,
         new: TripConditionSnapshot | None,
     ) -> None:
-        """Check for significant condition changes and add alerts."""
+        """Check for significant condition changes and add alerts.
+
+        Alerts are appended to the trip in memory; the caller saves it.
+        """
         if not old or not new:
             return
 
@@ -446,17 +563,15 @@ class TripService:
         if prefs.get("powder_alerts", True):
             snow_increase = new.fresh_snow_cm - old.fresh_snow_cm
             if snow_increase >= 10:
-                self.add_alert(
-                    trip.trip_id,
-                    trip.user_id,
+                self._append_alert(
+                    trip,
                     TripAlertType.POWDER_ALERT,
                     f"Fresh powder alert! {snow_increase:.0f}cm of new snow at {trip.resort_name}",
                     {"snow_increase_cm": snow_increase},
                 )
             elif new.predicted_snow_cm >= 20 and old.predicted_snow_cm < 20:
-                self.add_alert(
-                    trip.trip_id,
-                    trip.user_id,
+                self._append_alert(
+                    trip,
                     TripAlertType.POWDER_ALERT,
                     f"Big storm coming! {new.predicted_snow_cm:.0f}cm predicted before your trip",
                     {"predicted_cm": new.predicted_snow_cm},
@@ -470,9 +585,8 @@ class TripService:
                 and new.temperature_celsius >= 3
                 and old.temperature_celsius < 3
             ):
-                self.add_alert(
-                    trip.trip_id,
-                    trip.user_id,
+                self._append_alert(
+                    trip,
                     TripAlertType.WARM_SPELL,
                     f"Warm spell warning: {new.temperature_celsius:.0f}°C at {trip.resort_name}. Conditions may become icy.",
                     {"temperature_celsius": new.temperature_celsius},
@@ -497,18 +611,35 @@ class TripService:
             new_rank = quality_ranks.get(new.snow_quality, 0)
 
             if new_rank - old_rank >= 2:  # Significant improvement
-                self.add_alert(
-                    trip.trip_id,
-                    trip.user_id,
+                self._append_alert(
+                    trip,
                     TripAlertType.CONDITIONS_IMPROVED,
                     f"Conditions improved at {trip.resort_name}! Now rated {new.snow_quality}",
                     {"old_quality": old.snow_quality, "new_quality": new.snow_quality},
                 )
             elif old_rank - new_rank >= 2:  # Significant degradation
-                self.add_alert(
-                    trip.trip_id,
-                    trip.user_id,
+                self._append_alert(
+                    trip,
                     TripAlertType.CONDITIONS_DEGRADED,
                     f"Conditions changed at {trip.resort_name}: now rated {new.snow_quality}",
                     {"old_quality": old.snow_quality, "new_quality": new.snow_quality},
                 )
+
+    @staticmethod
+    def _append_alert(
+        trip: Trip,
+        alert_type: TripAlertType,
+        message: str,
+        data: dict[str, Any] | None = None,
+    ) -> TripAlert:
+        """Add a new unread alert to a trip in memory."""
+        alert = TripAlert(
+            alert_id=str(uuid.uuid4()),
+            alert_type=alert_type,
+            message=message,
+            created_at=datetime.now(UTC).isoformat(),
+            is_read=False,
+            data=data or {},
+        )
+        trip.alerts.append(alert)
+        return alert
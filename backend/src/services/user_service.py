@@ -1,5 +1,6 @@
 """User management service."""
 
+import logging
 from datetime import UTC, datetime, timezone
 from typing import Optional
 
@@ -9,13 +10,43 @@ from botocore.exceptions import ClientError
 from models.user import User, UserPreferences
 from utils.dynamodb_utils import parse_from_dynamodb, prepare_for_dynamodb
 
+logger = logging.getLogger(__name__)
+
 
 class UserService:
     """Service for managing user data and preferences."""
 
-    def __init__(self, table):
-        """Initialize the service with a DynamoDB table."""
+    def __init__(self, table, resort_subscribers_table=None):
+        """Initialize the service with a DynamoDB table.
+
+        Args:
+            table: User preferences table
+            resort_subscribers_table: Optional resort_id -> user_id index of
+                favorite resorts, kept in sync on every preferences write so
+                notifications can look up a resort's subscribers directly
+        """
         self.table = table
+        self.resort_subscribers_table = resort_subscribers_table
+
+    def _sync_resort_subscribers(
+        self, user_id: str, old_favorites: list[str], new_favorites: list[str]
+    ) -> None:
+        """Point the resort subscriber index at the user's current favorites.
+
+        Current favorites are always (re)written, so users saved before the
+        index existed are picked up on their next save. Failures are logged,
+        not raised: the hourly notification scan does not use the index.
+        """
+        if self.resort_subscribers_table is None:
+            return
+        try:
+            with self.resort_subscribers_table.batch_writer() as batch:
+                for resort_id in set(old_favorites) - set(new_favorites):
+                    batch.delete_item(Key={"resort_id": resort_id, "user_id": user_id})
+                for resort_id in set(new_favorites):
+                    batch.put_item(Item={"resort_id": resort_id, "user_id": user_id})
+        except Exception as e:
+            logger.warning("Failed to update resort subscribers for %s: %s", user_id, e)
 
     def get_user_preferences(self, user_id: str) -> UserPreferences | None:
         """Get user preferences by user ID."""
@@ -52,7 +83,15 @@ class UserService:
             # Convert Python types to DynamoDB Decimal types
             item = prepare_for_dynamodb(item)
 
-            self.table.put_item(Item=item)
+            if self.resort_subscribers_table is None:
+                self.table.put_item(Item=item)
+            else:
+                response = self.table.put_item(Item=item, ReturnValues="ALL_OLD")
+                self._sync_resort_subscribers(
+                    preferences.user_id,
+                    response.get("Attributes", {}).get("favorite_resorts", []),
+                    preferences.favorite_resorts,
+                )
 
             # Parse back for return value
             return UserPreferences(**parse_from_dynamodb(item))
@@ -140,14 +179,21 @@ class UserService:
 
         Returns dict with counts of deleted items per table.
         """
-        import logging
-
-        logger = logging.getLogger(__name__)
         results = {}
 
-        # 1. Delete user preferences (primary table)
+        # 1. Delete user preferences (primary table) and their index entries
         try:
-            self.table.delete_item(Key={"user_id": user_id})
+            if self.resort_subscribers_table is None:
+                self.table.delete_item(Key={"user_id": user_id})
+            else:
+                response = self.table.delete_item(
+                    Key={"user_id": user_id}, ReturnValues="ALL_OLD"
+                )
+                self._sync_resort_subscribers(
+                    user_id,
+                    response.get("Attributes", {}).get("favorite_resorts", []),
+                    [],
+                )
             results["user_preferences"] = 1
         except ClientError as e:
             logger.error("Failed to delete user preferences for %s: %s", user_id, e)
@@ -169,11 +215,12 @@ class UserService:
                 logger.error("Failed to delete device tokens for %s: %s", user_id, e)
                 results["device_tokens"] = 0
 
-        # 3. Delete trips (hash: user_id, sort: trip_id)
+        # 3. Delete trips (GSI: UserIdIndex, key: trip_id + user_id)
         if trips_table:
             try:
                 response = trips_table.query(
-                    KeyConditionExpression=Key("user_id").eq(user_id)
+                    IndexName="UserIdIndex",
+                    KeyConditionExpression=Key("user_id").eq(user_id),
                 )
                 items = response.get("Items", [])
                 for item in items:
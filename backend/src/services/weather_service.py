@@ -10,7 +10,7 @@ import requests
 from boto3.dynamodb.conditions import Key
 
 from models.weather import ConfidenceLevel, WeatherCondition
-from utils.dynamodb_utils import parse_from_dynamodb
+from utils.dynamodb_utils import deserialize_item, parse_from_dynamodb, project_record
 
 
 class WeatherService:
@@ -21,6 +21,18 @@ class WeatherService:
         self.api_key = api_key
         self.base_url = "https://api.weatherapi.com/v1"
         self.conditions_table = conditions_table
+        self._client = None
+
+    def _get_client(self):
+        """Low-level client for wire-format reads of the conditions table.
+
+        The table resource converts every number to Decimal; bulk reads use
+        this client instead and decode items with deserialize_item.
+        """
+        if self._client is None:
+            region = self.conditions_table.meta.client.meta.region_name
+            self._client = boto3.client("dynamodb", region_name=region)
+        return self._client
 
     def get_current_weather(
         self, latitude: float, longitude: float, elevation_meters: int
@@ -388,6 +400,8 @@ class WeatherService:
                 "data_source, source_confidence, #ttl"
             )
             expression_names = {"#ts": "timestamp", "#ttl": "ttl"}
+            client = self._get_client()
+            table_name = self.conditions_table.name
 
             def query_elevation(elevation_level: str):
                 """Query conditions for a specific elevation level with pagination.
@@ -400,18 +414,22 @@ class WeatherService:
                 try:
                     items = []
                     query_params = {
+                        "TableName": table_name,
                         "IndexName": "ElevationIndex",
-                        "KeyConditionExpression": Key("elevation_level").eq(
-                            elevation_level
-                        )
-                        & Key("timestamp").gte(cutoff_str),
+                        "KeyConditionExpression": (
+                            "elevation_level = :level AND #ts >= :cutoff"
+                        ),
+                        "ExpressionAttributeValues": {
+                            ":level": {"S": elevation_level},
+                            ":cutoff": {"S": cutoff_str},
+                        },
                         "ScanIndexForward": False,
                         "ProjectionExpression": projection_attrs,
                         "ExpressionAttributeNames": expression_names,
                     }
 
                     while True:
-                        response = self.conditions_table.query(**query_params)
+                        response = client.query(**query_params)
                         items.extend(response.get("Items", []))
 
                         # Check for more pages
@@ -440,13 +458,15 @@ class WeatherService:
                         level = futures[future]
                         logger.warning("Error querying elevation %s: %s", level, e)
 
-            # Parse and group by resort, keeping only latest per elevation
+            # Parse and group by resort, keeping only latest per elevation.
+            # Items are in wire format; only the ones kept are decoded, and
+            # they are built without validation (the worker validated them
+            # before writing).
             seen_keys: set[str] = set()  # "resort_id:elevation" dedup keys
             for item in all_items:
                 try:
-                    parsed_item = parse_from_dynamodb(item)
-                    resort_id = parsed_item.get("resort_id")
-                    elevation = parsed_item.get("elevation_level", "")
+                    resort_id = item.get("resort_id", {}).get("S")
+                    elevation = item.get("elevation_level", {}).get("S", "")
                     if not resort_id:
                         continue
                     # Keep only the first (latest, since sorted desc) per resort+elevation
@@ -454,7 +474,10 @@ class WeatherService:
                     if dedup_key in seen_keys:
                         continue
                     seen_keys.add(dedup_key)
-                    condition = WeatherCondition(**parsed_item)
+                    condition = project_record(WeatherCondition, deserialize_item(item))
+                    if condition is None:
+                        logger.debug(f"Skipping incomplete item for {resort_id}")
+                        continue
                     conditions_by_resort[resort_id].append(condition)
                 except Exception as parse_error:
                     logger.debug(f"Skipping item due to parse error: {parse_error}")
@@ -3,9 +3,12 @@
 # Import dynamodb_utils first as it has no dependencies on services
 from .dynamodb_utils import (
     decimal_to_python,
+    deserialize_item,
+    deserialize_items,
     parse_from_dynamodb,
     parse_items_from_dynamodb,
     prepare_for_dynamodb,
+    project_record,
     python_to_decimal,
 )
 
@@ -18,6 +21,9 @@ __all__ = [
     "prepare_for_dynamodb",
     "parse_from_dynamodb",
     "parse_items_from_dynamodb",
+    "deserialize_item",
+    "deserialize_items",
+    "project_record",
 ]
 
 
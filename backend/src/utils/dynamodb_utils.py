@@ -2,10 +2,20 @@
 
 DynamoDB stores numbers as Decimal types, but Python/Pydantic models use float/int.
 This module provides utilities for converting between the two formats.
+
+Bulk reads can skip the Decimal round-trip entirely: deserialize_item decodes
+items in the low-level client's wire format ({"N": "1.5"}, {"S": "..."}) straight
+to int/float/str, and project_record builds a model from the result without
+running pydantic validation.
 """
 
 from decimal import Decimal
-from typing import Any, Dict, List, Union
+from functools import cache
+from typing import Any, Dict, List, TypeVar, Union
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
 def decimal_to_python(obj: Any) -> Any:
@@ -109,3 +119,124 @@ def parse_items_from_dynamodb(items: list[dict[str, Any]]) -> list[dict[str, Any
         List of dictionaries with all Decimal values converted
     """
     return [parse_from_dynamodb(item) for item in items]
+
+
+def deserialize_number(value: str) -> int | float:
+    """
+    Convert a wire-format DynamoDB number string to int or float.
+
+    Whole numbers become int, like decimal_to_python. Other values are parsed
+    as doubles, without going through Decimal.
+
+    Args:
+        value: The string from an {"N": ...} attribute
+
+    Returns:
+        The number as int or float
+    """
+    if "." in value or "e" in value or "E" in value:
+        number = float(value)
+        return int(number) if number.is_integer() else number
+    return int(value)
+
+
+def _deserialize_map(value: dict[str, Any]) -> dict[str, Any]:
+    return {key: deserialize_attribute(item) for key, item in value.items()}
+
+
+def _deserialize_list(value: list[Any]) -> list[Any]:
+    return [deserialize_attribute(item) for item in value]
+
+
+_WIRE_DECODERS = {
+    "S": lambda value: value,
+    "N": deserialize_number,
+    "BOOL": lambda value: value,
+    "NULL": lambda value: None,
+    "M": _deserialize_map,
+    "L": _deserialize_list,
+    "B": lambda value: value,
+    "SS": set,
+    "NS": lambda value: {deserialize_number(item) for item in value},
+    "BS": set,
+}
+
+
+def deserialize_attribute(value: dict[str, Any]) -> Any:
+    """
+    Convert a single wire-format attribute value to a Python value.
+
+    Args:
+        value: Attribute value with a single type key, e.g. {"N": "1.5"}
+
+    Returns:
+        The Python value (str, int, float, bool, None, dict, list, set or bytes)
+    """
+    ((type_key, raw),) = value.items()
+    return _WIRE_DECODERS[type_key](raw)
+
+
+def deserialize_item(
+    item: dict[str, Any], attributes: set[str] | None = None
+) -> dict[str, Any]:
+    """
+    Parse an item returned by the low-level DynamoDB client.
+
+    Args:
+        item: Item in wire format, from client.query/scan/get_item
+        attributes: Only decode these attributes (all when None)
+
+    Returns:
+        Dictionary of Python-native values
+    """
+    if attributes is None:
+        return {key: deserialize_attribute(value) for key, value in item.items()}
+    return {
+        key: deserialize_attribute(value)
+        for key, value in item.items()
+        if key in attributes
+    }
+
+
+def deserialize_items(
+    items: list[dict[str, Any]], attributes: set[str] | None = None
+) -> list[dict[str, Any]]:
+    """
+    Parse a list of wire-format items from the low-level DynamoDB client.
+
+    Args:
+        items: Items in wire format
+        attributes: Only decode these attributes (all when None)
+
+    Returns:
+        List of dictionaries of Python-native values
+    """
+    return [deserialize_item(item, attributes) for item in items]
+
+
+@cache
+def _required_fields(model_cls: type[BaseModel]) -> tuple[str, ...]:
+    return tuple(
+        name for name, field in model_cls.model_fields.items() if field.is_required()
+    )
+
+
+def project_record(model_cls: type[ModelT], data: dict[str, Any]) -> ModelT | None:
+    """
+    Build a model from trusted stored data without pydantic validation.
+
+    Only the presence of required fields is checked; values are used as-is and
+    unset fields take their defaults. Use it for bulk reads of items this
+    service wrote itself (already validated once on the way in).
+
+    Args:
+        model_cls: Pydantic model class
+        data: Parsed item, e.g. from deserialize_item
+
+    Returns:
+        The model, or None when a required field is missing
+    """
+    for name in _required_fields(model_cls):
+        if data.get(name) is None:
+            return None
+    return model_cls.model_construct(**data)
@@ -1,7 +1,20 @@
-"""Load resort data from JSON file."""
+"""Load resort data from JSON file.
 
+The file is parsed once per loader and indexed by resort ID, country and
+region, and each transformed Resort is built once and reused, so lookups
+don't re-walk or re-validate the ~1MB file.
+
+A pickled snapshot of the parsed data and transformed resorts (built with
+scripts/build_resort_snapshot.py) skips the JSON parse and pydantic
+validation altogether. It records the SHA-256 of the resorts.json it was
+built from and is ignored once that file changes.
+"""
+
+import hashlib
 import json
 import logging
+import pickle
+from collections import defaultdict
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -12,14 +25,31 @@ logger = logging.getLogger(__name__)
 
 # Path to resort data JSON
 DATA_FILE = Path(__file__).parent.parent.parent / "data" / "resorts.json"
+# Build artifact; only ever load snapshots this repo's build wrote
+SNAPSHOT_FILE = DATA_FILE.with_name("resorts.snapshot.pickle")
+SNAPSHOT_FORMAT = 1
 
 
 class ResortLoader:
-    """Load and transform resort data from JSON file."""
+    """Load and transform resort data from JSON file.
+
+    Resort objects are shared between calls; treat them as read-only.
+    """
 
-    def __init__(self, data_file: Path = DATA_FILE):
+    def __init__(
+        self, data_file: Path = DATA_FILE, snapshot_file: Path | None = SNAPSHOT_FILE
+    ):
         self.data_file = data_file
+        self.snapshot_file = snapshot_file
         self._data: dict[str, Any] | None = None
+        # Positions in data["resorts"], built on load
+        self._by_id: dict[str, int] = {}
+        self._by_country: dict[str, list[int]] = {}
+        self._by_region: dict[str, list[int]] = {}
+        # Transformed resorts by position, and untimestamped ones from a snapshot
+        self._resorts: dict[int, Resort] = {}
+        self._snapshot_resorts: dict[int, Resort] = {}
+        self._loaded_at = ""
 
     def load(self) -> dict[str, Any]:
         """Load data from JSON file."""
@@ -27,8 +57,15 @@ class ResortLoader:
             if not self.data_file.exists():
                 raise FileNotFoundError(f"Resort data file not found: {self.data_file}")
 
-            with open(self.data_file, encoding="utf-8") as f:
-                self._data = json.load(f)
+            content = self.data_file.read_bytes()
+            snapshot = self._read_snapshot(hashlib.sha256(content).hexdigest())
+            if snapshot is not None:
+                data = snapshot["data"]
+                self._snapshot_resorts = snapshot["resorts"]
+            else:
+                data = json.loads(content.decode("utf-8"))
+            self._build_indexes(data)
+            self._data = data
 
             logger.info(
                 f"Loaded {len(self._data.get('resorts', []))} resorts from {self.data_file}"
@@ -36,6 +73,84 @@ class ResortLoader:
 
         return self._data
 
+    def _read_snapshot(self, source_sha256: str) -> dict[str, Any] | None:
+        """Snapshot for this exact resorts.json, or None."""
+        if not self.snapshot_file or not self.snapshot_file.exists():
+            return None
+        try:
+            with open(self.snapshot_file, "rb") as f:
+                snapshot = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable snapshot {self.snapshot_file}: {e}")
+            return None
+        if (
+            snapshot.get("format") != SNAPSHOT_FORMAT
+            or snapshot.get("source_sha256") != source_sha256
+        ):
+            logger.info(f"Ignoring stale snapshot {self.snapshot_file}")
+            return None
+        return snapshot
+
+    def write_snapshot(self, snapshot_file: Path | None = None) -> Path:
+        """Write a snapshot of the parsed data and all transformable resorts.
+
+        Returns:
+            Path of the snapshot file
+        """
+        path = snapshot_file or self.snapshot_file or SNAPSHOT_FILE
+        content = self.data_file.read_bytes()
+        data = json.loads(content.decode("utf-8"))
+        resorts = {}
+        for index, raw in enumerate(data.get("resorts", [])):
+            try:
+                # Timestamps are set when a snapshot resort is first used
+                resorts[index] = self._transform_resort(raw, "")
+            except Exception as e:
+                logger.warning(
+                    f"Failed to transform resort {raw.get('resort_id', 'unknown')}: {e}"
+                )
+        snapshot = {
+            "format": SNAPSHOT_FORMAT,
+            "source_sha256": hashlib.sha256(content).hexdigest(),
+            "data": data,
+            "resorts": resorts,
+        }
+        with open(path, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        logger.info(f"Wrote snapshot of {len(resorts)} resorts to {path}")
+        return path
+
+    def _build_indexes(self, data: dict[str, Any]) -> None:
+        by_country: dict[str, list[int]] = defaultdict(list)
+        by_region: dict[str, list[int]] = defaultdict(list)
+        for index, raw in enumerate(data.get("resorts", [])):
+            # First occurrence wins, like a linear scan
+            if raw.get("resort_id") is not None:
+                self._by_id.setdefault(raw["resort_id"], index)
+            by_country[raw.get("country")].append(index)
+            by_region[raw.get("region", "unknown")].append(index)
+        self._by_country = dict(by_country)
+        self._by_region = dict(by_region)
+        self._loaded_at = datetime.now(UTC).isoformat()
+
+    def _resort_at(self, index: int) -> Resort:
+        """Transformed resort at a position in data["resorts"], built once."""
+        resort = self._resorts.get(index)
+        if resort is None:
+            snapshot_resort = self._snapshot_resorts.get(index)
+            if snapshot_resort is not None:
+                resort = snapshot_resort.model_copy(
+                    update={
+                        "created_at": self._loaded_at,
+                        "updated_at": self._loaded_at,
+                    }
+                )
+            else:
+                raw = self.load()["resorts"][index]
+                resort = self._transform_resort(raw, self._loaded_at)
+            self._resorts[index] = resort
+        return resort
+
     def get_regions(self) -> dict[str, dict[str, Any]]:
         """Get all region definitions."""
         data = self.load()
@@ -45,13 +160,11 @@ class ResortLoader:
         """Get list of regions with counts."""
         data = self.load()
         regions = data.get("regions", {})
-        resorts = data.get("resorts", [])
 
         # Count resorts per region
-        region_counts = {}
-        for resort in resorts:
-            region = resort.get("region", "unknown")
-            region_counts[region] = region_counts.get(region, 0) + 1
+        region_counts = {
+            region: len(indexes) for region, indexes in self._by_region.items()
+        }
 
         result = []
         for region_id, region_info in regions.items():
@@ -81,18 +194,18 @@ class ResortLoader:
         raw_resorts = data.get("resorts", [])
 
         if region:
-            raw_resorts = [r for r in raw_resorts if r.get("region") == region]
+            indexes = self._by_region.get(region, [])
+        else:
+            indexes = range(len(raw_resorts))
 
-        now = datetime.now(UTC).isoformat()
         resorts = []
-
-        for raw in raw_resorts:
+        for index in indexes:
             try:
-                resort = self._transform_resort(raw, now)
-                resorts.append(resort)
+                resorts.append(self._resort_at(index))
             except Exception as e:
                 logger.warning(
-                    f"Failed to transform resort {raw.get('resort_id', 'unknown')}: {e}"
+                    f"Failed to transform resort "
+                    f"{raw_resorts[index].get('resort_id', 'unknown')}: {e}"
                 )
 
         return resorts
@@ -191,26 +304,19 @@ class ResortLoader:
 
     def get_resort_by_id(self, resort_id: str) -> Resort | None:
         """Get a single resort by ID."""
-        data = self.load()
-        raw_resorts = data.get("resorts", [])
-
-        for raw in raw_resorts:
-            if raw.get("resort_id") == resort_id:
-                now = datetime.now(UTC).isoformat()
-                return self._transform_resort(raw, now)
-
-        return None
+        self.load()
+        index = self._by_id.get(resort_id)
+        if index is None:
+            return None
+        return self._resort_at(index)
 
     def get_resorts_by_country(self, country_code: str) -> list[Resort]:
         """Get all resorts in a specific country."""
-        data = self.load()
-        raw_resorts = [
-            r for r in data.get("resorts", []) if r.get("country") == country_code
+        self.load()
+        return [
+            self._resort_at(index) for index in self._by_country.get(country_code, [])
         ]
 
-        now = datetime.now(UTC).isoformat()
-        return [self._transform_resort(raw, now) for raw in raw_resorts]
-
 
 # Convenience function
 def load_resorts(region: str | None = None) -> list[Resort]:
@@ -0,0 +1,118 @@
+"""Resort mention detection for chat messages.
+
+All resort aliases and names are compiled into a single Aho-Corasick
+automaton, so finding every mention in a message is one pass over the
+message no matter how many resorts the catalog holds.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+
+# Pattern kinds. Aliases win: names are only consulted when no alias matched.
+ALIAS = 0
+NAME = 1
+
+# Name matching thresholds (short names cause false positives)
+MIN_NAME_LENGTH = 4
+MIN_FIRST_WORD_LENGTH = 5
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+def _at_boundary(text: str, i: int) -> bool:
+    """Regex \\b semantics: a word/non-word transition at position i."""
+    before = i > 0 and _is_word_char(text[i - 1])
+    after = i < len(text) and _is_word_char(text[i])
+    return before != after
+
+
+class ResortMentionDetector:
+    """Finds resort aliases and names mentioned in free text.
+
+    Matching mirrors the original per-pattern regexes: aliases and the first
+    word of resort names must sit on word boundaries, while full resort
+    names match anywhere in the message.
+    """
+
+    def __init__(
+        self,
+        aliases: dict[str, str],
+        resorts: Iterable[tuple[str, str]] = (),
+    ):
+        """Build the automaton.
+
+        Args:
+            aliases: Lowercase alias -> resort_id
+            resorts: (resort_id, display name) pairs
+        """
+        # Trie as parallel arrays: goto transitions, failure links and the
+        # (length, resort_id, kind, whole_word) patterns ending at each state
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[tuple[int, str, int, bool]]] = [[]]
+
+        for alias, resort_id in aliases.items():
+            self._add(alias.lower(), (resort_id, ALIAS, True))
+        for resort_id, name in resorts:
+            name_lower = name.lower()
+            if len(name_lower) < MIN_NAME_LENGTH:
+                continue
+            self._add(name_lower, (resort_id, NAME, False))
+            # First word of multi-word names (e.g. "Revelstoke" from
+            # "Revelstoke Mountain Resort")
+            first_word = name_lower.split()[0]
+            if len(first_word) >= MIN_FIRST_WORD_LENGTH:
+                self._add(first_word, (resort_id, NAME, True))
+        self._build_failure_links()
+
+    def _add(self, pattern: str, target: tuple[str, int, bool]) -> None:
+        if not pattern:
+            return
+        state = 0
+        for c in pattern:
+            nxt = self._goto[state].get(c)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][c] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append((len(pattern), *target))
+
+    def _build_failure_links(self) -> None:
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for c, nxt in self._goto[state].items():
+                pending.append(nxt)
+                fallback = self._fail[state]
+                while fallback and c not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(c, 0)
+                self._fail[nxt] = link if link != nxt else 0
+                # Patterns ending at the suffix state also end here
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, message: str) -> list[str]:
+        """Resort ids mentioned in message, in order of first mention.
+
+        Returns alias matches when there are any, otherwise name matches.
+        """
+        text = message.lower()
+        found: tuple[dict[str, None], dict[str, None]] = ({}, {})
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for end, c in enumerate(text, 1):
+            while state and c not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(c, 0)
+            for length, resort_id, kind, whole_word in out[state]:
+                if whole_word and not (
+                    _at_boundary(text, end - length) and _at_boundary(text, end)
+                ):
+                    continue
+                found[kind].setdefault(resort_id, None)
+        return list(found[ALIAS] or found[NAME])
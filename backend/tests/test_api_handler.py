@@ -2276,3 +2276,148 @@ class TestAppConfig:
         data = client.get("/api/v1/app-config").json()
         assert data["minimum_ios_version"] == "2.1.0"
         assert data["force_update"] is False
+
+
+class TestStaticJsonCache:
+    """Tests for manifest- and delta-aware refresh of the static JSON caches."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_static_caches(self):
+        import handlers.api_handler as api
+
+        for cache in (api._static_resorts_cache, api._static_snow_quality_cache):
+            cache.update({"data": None, "expires": 0, "version": None})
+        yield
+        for cache in (api._static_resorts_cache, api._static_snow_quality_cache):
+            cache.update({"data": None, "expires": 0, "version": None})
+
+    @pytest.fixture
+    def s3_objects(self):
+        """Fake bucket contents served by get_object."""
+        import json
+
+        from botocore.exceptions import ClientError
+
+        objects = {}
+        s3 = MagicMock()
+
+        def get_object(Bucket, Key):
+            if Key not in objects:
+                raise ClientError(
+                    {"Error": {"Code": "NoSuchKey", "Message": ""}}, "GetObject"
+                )
+            body = MagicMock()
+            body.read.return_value = json.dumps(objects[Key]).encode("utf-8")
+            return {"Body": body}
+
+        s3.get_object.side_effect = get_object
+        with (
+            patch("handlers.api_handler.get_s3_client", return_value=s3),
+            patch.dict("os.environ", {"WEBSITE_BUCKET": "test-bucket"}),
+        ):
+            yield objects, s3
+
+    @staticmethod
+    def _fetched_keys(s3):
+        return [c.kwargs["Key"] for c in s3.get_object.call_args_list]
+
+    @staticmethod
+    def _expire():
+        import handlers.api_handler as api
+
+        api._static_resorts_cache["expires"] = 0
+        api._static_snow_quality_cache["expires"] = 0
+
+    def test_full_fetch_records_manifest_version(self, s3_objects):
+        from handlers.api_handler import (
+            _get_static_resorts_from_s3,
+            _static_resorts_cache,
+        )
+
+        objects, s3 = s3_objects
+        objects["data/manifest.json"] = {"version": "v1", "delta": None}
+        objects["data/resorts.json"] = {"resorts": [{"resort_id": "a"}]}
+
+        assert _get_static_resorts_from_s3() == [{"resort_id": "a"}]
+        assert _static_resorts_cache["version"] == "v1"
+
+    def test_unchanged_version_skips_download(self, s3_objects):
+        from handlers.api_handler import _get_static_snow_quality_from_s3
+
+        objects, s3 = s3_objects
+        objects["data/manifest.json"] = {"version": "v1", "delta": None}
+        objects["data/snow-quality.json"] = {"results": {"a": {"q": "good"}}}
+        _get_static_snow_quality_from_s3()
+        self._expire()
+        s3.get_object.reset_mock()
+
+        assert _get_static_snow_quality_from_s3() == {"a": {"q": "good"}}
+        assert self._fetched_keys(s3) == ["data/manifest.json"]
+
+    def test_applies_delta_from_cached_version(self, s3_objects):
+        from handlers.api_handler import (
+            _get_static_resorts_from_s3,
+            _get_static_snow_quality_from_s3,
+            _static_resorts_cache,
+        )
+
+        objects, s3 = s3_objects
+        objects["data/manifest.json"] = {"version": "v1", "delta": None}
+        objects["data/resorts.json"] = {
+            "resorts": [{"resort_id": "a"}, {"resort_id": "b"}]
+        }
+        objects["data/snow-quality.json"] = {
+            "results": {"a": {"q": "good"}, "b": {"q": "good"}}
+        }
+        _get_static_resorts_from_s3()
+        _get_static_snow_quality_from_s3()
+        self._expire()
+        s3.get_object.reset_mock()
+
+        objects["data/manifest.json"] = {
+            "version": "v2",
+            "delta": {"from_version": "v1", "key": "data/deltas/v1-v2.json"},
+        }
+        objects["data/deltas/v1-v2.json"] = {
+            "resorts": [{"resort_id": "c"}],
+            "snow_quality": {"a": {"q": "poor"}, "c": {"q": "fair"}},
+            "removed": ["b"],
+        }
+
+        assert _get_static_resorts_from_s3() == [{"resort_id": "a"}, {"resort_id": "c"}]
+        assert _get_static_snow_quality_from_s3() == {
+            "a": {"q": "poor"},
+            "c": {"q": "fair"},
+        }
+        assert _static_resorts_cache["version"] == "v2"
+        assert "data/resorts.json" not in self._fetched_keys(s3)
+        assert "data/snow-quality.json" not in self._fetched_keys(s3)
+
+    def test_delta_from_other_version_falls_back_to_full_fetch(self, s3_objects):
+        from handlers.api_handler import _get_static_resorts_from_s3
+
+        objects, s3 = s3_objects
+        objects["data/manifest.json"] = {"version": "v1", "delta": None}
+        objects["data/resorts.json"] = {"resorts": [{"resort_id": "a"}]}
+        _get_static_resorts_from_s3()
+        self._expire()
+
+        objects["data/manifest.json"] = {
+            "version": "v3",
+            "delta": {"from_version": "v2", "key": "data/deltas/v2-v3.json"},
+        }
+        objects["data/resorts.json"] = {"resorts": [{"resort_id": "z"}]}
+
+        assert _get_static_resorts_from_s3() == [{"resort_id": "z"}]
+        assert "data/deltas/v2-v3.json" not in self._fetched_keys(s3)
+
+    def test_no_manifest_uses_full_files(self, s3_objects):
+        from handlers.api_handler import _get_static_resorts_from_s3
+
+        objects, s3 = s3_objects
+        objects["data/resorts.json"] = {"resorts": [{"resort_id": "a"}]}
+
+        assert _get_static_resorts_from_s3() == [{"resort_id": "a"}]
+        self._expire()
+        objects["data/resorts.json"] = {"resorts": [{"resort_id": "b"}]}
+        assert _get_static_resorts_from_s3() == [{"resort_id": "b"}]
@@ -1,11 +1,16 @@
 """Tests for AuthService."""
 
+import time
 from datetime import UTC, datetime, timedelta
 from unittest.mock import Mock, patch
 
 import pytest
 from botocore.exceptions import ClientError
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk as jose_jwk
 from jose import jwt
+from jose.exceptions import ExpiredSignatureError
 
 from services.auth_service import (
     AuthenticatedUser,
@@ -15,6 +20,23 @@ from services.auth_service import (
 )
 
 
+def _rsa_key_pair(kid: str) -> tuple[bytes, dict]:
+    """(private PEM, public JWK) for signing provider-style identity tokens."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    public_jwk = jose_jwk.construct(public_pem, algorithm="RS256").to_dict()
+    public_jwk["kid"] = kid
+    return private_pem, public_jwk
+
+
 class TestAuthService:
     """Test cases for AuthService."""
 
@@ -133,6 +155,45 @@ class TestAuthService:
         with pytest.raises(AuthenticationError):
             auth_service.verify_access_token(wrong_secret_token)
 
+    def test_verify_access_token_cached(self, auth_service):
+        """Repeat verifications of a token skip JWT decoding."""
+        tokens = auth_service.create_session_tokens("test-user-123")
+        auth_service.verify_access_token(tokens["access_token"])
+
+        with patch("services.auth_service.jwt.decode") as mock_decode:
+            user_id = auth_service.verify_access_token(tokens["access_token"])
+
+        assert user_id == "test-user-123"
+        mock_decode.assert_not_called()
+
+    def test_verify_access_token_cache_honors_exp(self, auth_service):
+        """A cached token is fully verified again once past its exp."""
+        tokens = auth_service.create_session_tokens("test-user-123")
+        auth_service.verify_access_token(tokens["access_token"])
+
+        expired = time.time() + auth_service.JWT_EXPIRATION_HOURS * 3600 + 60
+        with (
+            patch("services.auth_service.time.time", return_value=expired),
+            patch(
+                "services.auth_service.jwt.decode",
+                side_effect=ExpiredSignatureError("Signature has expired."),
+            ) as mock_decode,
+        ):
+            with pytest.raises(AuthenticationError, match="expired"):
+                auth_service.verify_access_token(tokens["access_token"])
+
+        mock_decode.assert_called_once()
+        assert len(auth_service._verified_tokens) == 0
+
+    def test_verify_access_token_rejections_not_cached(self, auth_service):
+        """Invalid tokens are rejected every time."""
+        tokens = auth_service.create_session_tokens("test-user-123")
+
+        for _ in range(2):
+            with pytest.raises(AuthenticationError, match="Invalid token type"):
+                auth_service.verify_access_token(tokens["refresh_token"])
+        assert len(auth_service._verified_tokens) == 0
+
     def test_refresh_tokens_success(
         self, auth_service, mock_user_table, sample_user_data
     ):
@@ -708,6 +769,53 @@ class TestAuthService:
         with pytest.raises(AuthenticationError, match="Failed to fetch"):
             auth_service._get_apple_public_keys()
 
+    @patch("services.auth_service.requests.get")
+    def test_apple_keys_parsed_once_per_fetch(self, mock_get, auth_service):
+        """JWKS entries become key objects once, not on every sign-in."""
+        private_pem, public_jwk = _rsa_key_pair("apple-kid")
+        mock_get.return_value = Mock(json=Mock(return_value={"keys": [public_jwk]}))
+        now = datetime.now(UTC)
+        token = jwt.encode(
+            {
+                "sub": "apple-user",
+                "aud": "com.test.app",
+                "iss": "https://appleid.apple.com",
+                "iat": now,
+                "exp": now + timedelta(minutes=5),
+            },
+            private_pem,
+            algorithm="RS256",
+            headers={"kid": "apple-kid"},
+        )
+
+        with patch(
+            "services.auth_service.jwk.construct", wraps=jose_jwk.construct
+        ) as mock_construct:
+            claims1 = auth_service._decode_apple_token(token)
+            claims2 = auth_service._decode_apple_token(token)
+
+        assert claims1["sub"] == claims2["sub"] == "apple-user"
+        assert mock_get.call_count == 1
+        assert mock_construct.call_count == 1
+
+    @patch("services.auth_service.threading.Thread")
+    def test_public_keys_refreshed_in_background_before_expiry(
+        self, mock_thread, auth_service
+    ):
+        """Keys close to expiry are served from cache while a refresh runs."""
+        cached = {"keys": [{"kid": "old-key"}]}
+        auth_service._google_keys_cache = cached
+        auth_service._google_keys_cache_time = (
+            time.time() - auth_service.GOOGLE_KEYS_CACHE_DURATION + 60
+        )
+
+        assert auth_service._get_google_public_keys() is cached
+        assert auth_service._get_google_public_keys() is cached
+
+        # One refresh in flight at a time
+        mock_thread.assert_called_once()
+        mock_thread.return_value.start.assert_called_once()
+
     # ============================================
     # Integration-style Tests
     # ============================================
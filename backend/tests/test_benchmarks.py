@@ -0,0 +1,68 @@
+"""Tests for the scoring hot-path benchmark suite (benchmarks/bench_scoring.py)."""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+
+from bench_scoring import (  # noqa: E402
+    BASELINE_FILE,
+    build_cases,
+    compare,
+    load_contexts,
+)
+
+
+@pytest.fixture(scope="module")
+def contexts():
+    return load_contexts()
+
+
+class TestFixtures:
+    def test_fixtures_replay_through_ingest_path(self, contexts):
+        assert len(contexts) >= 3
+        for ctx in contexts:
+            assert ctx.raw_features is not None
+            assert ctx.condition.quality_score is not None
+            assert ctx.condition.raw_data["api_response"]["hourly"]["time"]
+
+    def test_every_case_runs(self, contexts):
+        for fn in build_cases(contexts).values():
+            fn()
+
+    def test_baseline_covers_every_case(self, contexts):
+        with open(BASELINE_FILE) as f:
+            baseline = json.load(f)["results"]
+        assert set(build_cases(contexts)) <= set(baseline)
+
+
+class TestCompare:
+    BASELINE = {"f": {"ops_per_sec": 1000.0, "alloc_kib": 10.0}}
+
+    def test_within_tolerance(self):
+        results = {"f": {"ops_per_sec": 800.0, "alloc_kib": 12.0}}
+        assert compare(results, self.BASELINE, tolerance=0.25) == []
+
+    def test_slowdown_flagged(self):
+        results = {"f": {"ops_per_sec": 700.0, "alloc_kib": 10.0}}
+        regressions = compare(results, self.BASELINE, tolerance=0.25)
+        assert len(regressions) == 1
+        assert "ops/s" in regressions[0]
+
+    def test_allocation_growth_flagged(self):
+        results = {"f": {"ops_per_sec": 1000.0, "alloc_kib": 20.0}}
+        regressions = compare(results, self.BASELINE, tolerance=0.25)
+        assert len(regressions) == 1
+        assert "KiB" in regressions[0]
+
+    def test_small_allocation_noise_ignored(self):
+        baseline = {"f": {"ops_per_sec": 1000.0, "alloc_kib": 0.4}}
+        results = {"f": {"ops_per_sec": 1000.0, "alloc_kib": 0.9}}
+        assert compare(results, baseline) == []
+
+    def test_new_benchmark_without_baseline_ignored(self):
+        results = {"g": {"ops_per_sec": 1.0, "alloc_kib": 1000.0}}
+        assert compare(results, self.BASELINE) == []
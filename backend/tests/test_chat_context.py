@@ -0,0 +1,189 @@
+"""Tests for token-budgeted chat context building."""
+
+from services.chat_context import (
+    CACHE_POINT,
+    build_messages,
+    cached_tool_config,
+    dedupe_tool_results,
+    estimate_tokens,
+    summarize_turns,
+    system_blocks,
+)
+
+
+def _history(*turns):
+    return [{"role": role, "content": content} for role, content in turns]
+
+
+def _result(tool_use_id, value):
+    return {"toolResult": {"toolUseId": tool_use_id, "content": [{"json": value}]}}
+
+
+BIG_RESULT = {"resort_id": "whistler-blackcomb", "notes": "fresh powder " * 30}
+
+
+class TestBuildMessages:
+    def test_short_history_sent_verbatim(self):
+        history = _history(("user", "How's Vail?"), ("assistant", "Great."))
+
+        messages = build_messages(history, "And Aspen?")
+
+        assert messages == [
+            {"role": "user", "content": [{"text": "How's Vail?"}]},
+            {"role": "assistant", "content": [{"text": "Great."}]},
+            {"role": "user", "content": [{"text": "And Aspen?"}]},
+        ]
+
+    def test_skips_empty_and_non_chat_roles(self):
+        history = [
+            {"role": "user", "content": ""},
+            {"role": "system", "content": "ignored"},
+            {"role": "user", "content": "Hi"},
+            {"role": "assistant", "content": "Hello!"},
+        ]
+
+        messages = build_messages(history, "Snow?")
+
+        assert [m["role"] for m in messages] == ["user", "assistant", "user"]
+
+    def test_older_turns_summarized_over_budget(self):
+        long_reply = "Whistler has a deep base and cold temps. " * 40
+        history = _history(
+            ("user", "Tell me about Whistler"),
+            ("assistant", long_reply),
+            ("user", "What about Vail?"),
+            ("assistant", "Vail is icy today."),
+        )
+
+        messages = build_messages(history, "Which is better?", budget=50)
+
+        # Only the turns that fit are verbatim; the rest open the context
+        # as a summary inside the first user turn
+        assert [m["role"] for m in messages] == ["user", "assistant", "user"]
+        summary = messages[0]["content"][0]["text"]
+        assert summary.startswith("[Summary of earlier messages")
+        assert "- User: Tell me about Whistler" in summary
+        assert "- Assistant: Whistler has a deep base" in summary
+        assert long_reply not in summary
+        assert messages[0]["content"][1] == {"text": "What about Vail?"}
+        assert messages[-1]["content"] == [{"text": "Which is better?"}]
+
+    def test_context_size_bounded_for_long_conversations(self):
+        turns = []
+        for i in range(200):
+            turns.append(("user", f"Question {i} " + "about snow " * 20))
+            turns.append(("assistant", f"Answer {i} " + "lots of detail " * 50))
+        messages = build_messages(_history(*turns), "Latest?", budget=1000)
+
+        total = sum(
+            estimate_tokens(block["text"]) for m in messages for block in m["content"]
+        )
+        # Verbatim budget plus the summary budget, whatever the history length
+        assert total < 1000 + 400
+        assert messages[-1]["content"][-1] == {"text": "Latest?"}
+
+    def test_opens_with_user_turn(self):
+        history = _history(
+            ("user", "x" * 4000),
+            ("assistant", "Short answer."),
+            ("user", "Thanks"),
+            ("assistant", "Anytime."),
+        )
+
+        messages = build_messages(history, "One more", budget=20)
+
+        assert messages[0]["role"] == "user"
+        roles = [m["role"] for m in messages]
+        assert all(a != b for a, b in zip(roles, roles[1:], strict=False))
+
+    def test_consecutive_same_role_merged(self):
+        # The assistant reply for "First" was never saved
+        history = _history(("user", "First"))
+
+        messages = build_messages(history, "Second")
+
+        assert messages == [
+            {"role": "user", "content": [{"text": "First"}, {"text": "Second"}]}
+        ]
+
+
+class TestSummarizeTurns:
+    def test_keeps_newest_within_budget(self):
+        turns = [("user", f"message {i} " + "word " * 30) for i in range(20)]
+
+        summary = summarize_turns(turns, budget=100)
+
+        assert "message 19" in summary
+        assert "message 0 " not in summary
+        assert "older message(s) omitted" in summary
+
+    def test_nothing_to_summarize(self):
+        assert summarize_turns([]) is None
+
+
+class TestPromptCaching:
+    def test_system_blocks_static_prefix_cached(self):
+        assert system_blocks("static") == [{"text": "static"}, CACHE_POINT]
+        assert system_blocks("static", "dynamic") == [
+            {"text": "static"},
+            CACHE_POINT,
+            {"text": "dynamic"},
+        ]
+
+    def test_tool_config_ends_with_cache_point(self):
+        tools = [{"toolSpec": {"name": "a"}}]
+
+        config = cached_tool_config(tools)
+
+        assert config == {"tools": [{"toolSpec": {"name": "a"}}, CACHE_POINT]}
+        assert tools == [{"toolSpec": {"name": "a"}}]
+
+
+class TestDedupeToolResults:
+    def test_repeat_of_earlier_result_replaced(self):
+        messages = [
+            {"role": "user", "content": [{"text": "Compare"}]},
+            {"role": "user", "content": [_result("t1", BIG_RESULT)]},
+        ]
+
+        deduped = dedupe_tool_results([_result("t2", dict(BIG_RESULT))], messages)
+
+        assert deduped == [
+            {
+                "toolResult": {
+                    "toolUseId": "t2",
+                    "content": [{"text": "Same result as tool call t1 above."}],
+                }
+            }
+        ]
+
+    def test_repeat_within_one_turn_replaced(self):
+        deduped = dedupe_tool_results(
+            [_result("t1", BIG_RESULT), _result("t2", BIG_RESULT)], []
+        )
+
+        assert deduped[0] == _result("t1", BIG_RESULT)
+        assert "t1" in deduped[1]["toolResult"]["content"][0]["text"]
+
+    def test_result_already_in_prefetched_data_replaced(self):
+        import json
+
+        context_data = f"Resort: Whistler\nConditions: {json.dumps(BIG_RESULT)}\n"
+
+        deduped = dedupe_tool_results([_result("t1", BIG_RESULT)], [], context_data)
+
+        assert "PRE-FETCHED" in deduped[0]["toolResult"]["content"][0]["text"]
+
+    def test_new_small_and_error_results_kept(self):
+        error = {
+            "toolResult": {
+                "toolUseId": "t3",
+                "content": [{"text": "Error: boom"}],
+                "status": "error",
+            }
+        }
+        small = _result("t2", {"ok": True})
+        messages = [{"role": "user", "content": [_result("t0", {"ok": True})]}]
+        results = [_result("t1", BIG_RESULT), small, error]
+
+        assert dedupe_tool_results(results, messages) == results
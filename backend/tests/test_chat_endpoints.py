@@ -8,6 +8,7 @@ from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+from botocore.exceptions import ClientError
 from fastapi.testclient import TestClient
 
 from models.chat import ChatMessage, ChatResponse, ConversationSummary
@@ -127,16 +128,14 @@ class TestSendChatMessage:
         assert resp.status_code == 422  # Validation error
 
     @patch("handlers.api_handler._check_anonymous_chat_limit")
-    @patch("handlers.api_handler._get_remaining_anonymous_messages")
     @patch("handlers.api_handler.get_chat_service")
     def test_send_message_no_auth_anonymous(
-        self, mock_chat_svc, mock_remaining, mock_limit, mock_auth, client
+        self, mock_chat_svc, mock_limit, mock_auth, client
     ):
         """Should allow anonymous chat without auth header."""
         # Auth returns None for anonymous
         mock_auth.return_value = MagicMock()
-        mock_limit.return_value = True
-        mock_remaining.return_value = 4
+        mock_limit.return_value = (True, 4)
 
         svc = MagicMock()
         svc.chat.return_value = ChatResponse(
@@ -159,7 +158,7 @@ class TestSendChatMessage:
     def test_send_message_anonymous_rate_limited(self, mock_limit, mock_auth, client):
         """Should return 429 when anonymous rate limit exceeded."""
         mock_auth.return_value = MagicMock()
-        mock_limit.return_value = False
+        mock_limit.return_value = (False, 0)
 
         resp = client.post("/api/v1/chat", json={"message": "Hello"})
         assert resp.status_code == 429
@@ -420,15 +419,13 @@ class TestAnonymousChatRateLimit:
 
     @patch("handlers.api_handler.get_auth_service")
     @patch("handlers.api_handler._check_anonymous_chat_limit")
-    @patch("handlers.api_handler._get_remaining_anonymous_messages")
     @patch("handlers.api_handler.get_chat_service")
     def test_anonymous_chat_includes_remaining_messages(
-        self, mock_chat_svc, mock_remaining, mock_limit, mock_auth, client
+        self, mock_chat_svc, mock_limit, mock_auth, client
     ):
         """Anonymous response should include remaining_messages field."""
         mock_auth.return_value = MagicMock()
-        mock_limit.return_value = True
-        mock_remaining.return_value = 3
+        mock_limit.return_value = (True, 3)
 
         svc = MagicMock()
         svc.chat.return_value = ChatResponse(
@@ -477,7 +474,7 @@ class TestAnonymousChatRateLimit:
     def test_anonymous_rate_limit_returns_429(self, mock_limit, mock_auth, client):
         """Should return 429 with helpful message when limit reached."""
         mock_auth.return_value = MagicMock()
-        mock_limit.return_value = False
+        mock_limit.return_value = (False, 0)
 
         resp = client.post("/api/v1/chat", json={"message": "Hello"})
         assert resp.status_code == 429
@@ -491,6 +488,24 @@ class TestAnonymousChatRateLimit:
 # ---------------------------------------------------------------------------
 
 
+def _rate_limit_table(mock_boto3, count=None, error=None):
+    """Rate limit table whose counter update returns count or raises error."""
+    table = MagicMock()
+    if error is not None:
+        table.update_item.side_effect = error
+    else:
+        table.update_item.return_value = {"Attributes": {"message_count": count}}
+    mock_boto3.resource.return_value.Table.return_value = table
+    return table
+
+
+def _condition_failed():
+    return ClientError(
+        {"Error": {"Code": "ConditionalCheckFailedException", "Message": ""}},
+        "UpdateItem",
+    )
+
+
 class TestCheckAnonymousChatLimit:
     """Tests for the _check_anonymous_chat_limit helper.
 
@@ -514,7 +529,7 @@ class TestCheckAnonymousChatLimit:
         """Should allow request when table not configured."""
         from handlers.api_handler import _check_anonymous_chat_limit
 
-        assert _check_anonymous_chat_limit("1.2.3.4") is True
+        assert _check_anonymous_chat_limit("1.2.3.4") == (True, 5)
 
     @patch("handlers.api_handler.boto3")
     @patch.dict(
@@ -523,18 +538,23 @@ class TestCheckAnonymousChatLimit:
         clear=False,
     )
     def test_first_message_allowed(self, mock_boto3):
-        """Should allow first message from a new IP."""
+        """Should allow first message from a new IP with one atomic update."""
+        import time
+
         from handlers.api_handler import _check_anonymous_chat_limit
 
-        table = MagicMock()
-        table.get_item.return_value = {}  # No existing item
-        mock_boto3.resource.return_value.Table.return_value = table
+        table = _rate_limit_table(mock_boto3, count=1)
 
-        assert _check_anonymous_chat_limit("1.2.3.4") is True
-        table.put_item.assert_called_once()
-        item = table.put_item.call_args[1]["Item"]
-        assert item["ip_address"] == "1.2.3.4"
-        assert item["message_count"] == 1
+        assert _check_anonymous_chat_limit("1.2.3.4") == (True, 4)
+        table.update_item.assert_called_once()
+        table.get_item.assert_not_called()
+        table.put_item.assert_not_called()
+        kwargs = table.update_item.call_args[1]
+        window = int(time.time()) // (6 * 3600)
+        assert kwargs["Key"] == {"ip_address": f"1.2.3.4#{window}"}
+        assert kwargs["ExpressionAttributeValues"][":limit"] == 5
+        assert kwargs["ExpressionAttributeValues"][":exp"] == (window + 1) * 6 * 3600
+        assert "message_count < :limit" in kwargs["ConditionExpression"]
 
     @patch("handlers.api_handler.boto3")
     @patch.dict(
@@ -544,22 +564,11 @@ class TestCheckAnonymousChatLimit:
     )
     def test_under_limit_allowed(self, mock_boto3):
         """Should allow when under the limit."""
-        import time
-
         from handlers.api_handler import _check_anonymous_chat_limit
 
-        now = int(time.time())
-        table = MagicMock()
-        table.get_item.return_value = {
-            "Item": {
-                "ip_address": "1.2.3.4",
-                "timestamps": [now - 100, now - 50],
-                "message_count": 2,
-            }
-        }
-        mock_boto3.resource.return_value.Table.return_value = table
+        _rate_limit_table(mock_boto3, count=3)
 
-        assert _check_anonymous_chat_limit("1.2.3.4") is True
+        assert _check_anonymous_chat_limit("1.2.3.4") == (True, 2)
 
     @patch("handlers.api_handler.boto3")
     @patch.dict(
@@ -568,49 +577,12 @@ class TestCheckAnonymousChatLimit:
         clear=False,
     )
     def test_at_limit_rejected(self, mock_boto3):
-        """Should reject when at the limit."""
-        import time
-
-        from handlers.api_handler import _check_anonymous_chat_limit
-
-        now = int(time.time())
-        table = MagicMock()
-        table.get_item.return_value = {
-            "Item": {
-                "ip_address": "1.2.3.4",
-                "timestamps": [now - 500, now - 400, now - 300, now - 200, now - 100],
-                "message_count": 5,
-            }
-        }
-        mock_boto3.resource.return_value.Table.return_value = table
-
-        assert _check_anonymous_chat_limit("1.2.3.4") is False
-
-    @patch("handlers.api_handler.boto3")
-    @patch.dict(
-        "os.environ",
-        {"CHAT_RATE_LIMIT_TABLE_NAME": "test-rate-limit"},
-        clear=False,
-    )
-    def test_expired_timestamps_not_counted(self, mock_boto3):
-        """Should not count timestamps outside the window."""
-        import time
-
+        """Should reject when the window's counter is already at the limit."""
         from handlers.api_handler import _check_anonymous_chat_limit
 
-        now = int(time.time())
-        old = now - (7 * 3600)  # 7 hours ago (outside 6h window)
-        table = MagicMock()
-        table.get_item.return_value = {
-            "Item": {
-                "ip_address": "1.2.3.4",
-                "timestamps": [old, old, old, old, old],  # All expired
-                "message_count": 5,
-            }
-        }
-        mock_boto3.resource.return_value.Table.return_value = table
+        _rate_limit_table(mock_boto3, error=_condition_failed())
 
-        assert _check_anonymous_chat_limit("1.2.3.4") is True
+        assert _check_anonymous_chat_limit("1.2.3.4") == (False, 0)
 
     @patch("handlers.api_handler.boto3")
     @patch.dict(
@@ -622,11 +594,9 @@ class TestCheckAnonymousChatLimit:
         """Should allow request if DynamoDB errors (fail open)."""
         from handlers.api_handler import _check_anonymous_chat_limit
 
-        table = MagicMock()
-        table.get_item.side_effect = Exception("DynamoDB timeout")
-        mock_boto3.resource.return_value.Table.return_value = table
+        _rate_limit_table(mock_boto3, error=Exception("DynamoDB timeout"))
 
-        assert _check_anonymous_chat_limit("1.2.3.4") is True
+        assert _check_anonymous_chat_limit("1.2.3.4") == (True, 5)
 
 
 # ---------------------------------------------------------------------------
@@ -665,17 +635,14 @@ class TestCheckAuthenticatedChatLimit:
         """Should allow first message from a new user."""
         from handlers.api_handler import _check_authenticated_chat_limit
 
-        table = MagicMock()
-        table.get_item.return_value = {}  # No existing item
-        mock_boto3.resource.return_value.Table.return_value = table
+        table = _rate_limit_table(mock_boto3, count=1)
 
         allowed, remaining = _check_authenticated_chat_limit("user-123")
         assert allowed is True
         assert remaining == 99
-        table.put_item.assert_called_once()
-        item = table.put_item.call_args[1]["Item"]
-        assert item["ip_address"] == "user_user-123"
-        assert item["message_count"] == 1
+        table.update_item.assert_called_once()
+        values = table.update_item.call_args[1]["ExpressionAttributeValues"]
+        assert values[":limit"] == 100
 
     @patch("handlers.api_handler.boto3")
     @patch.dict(
@@ -685,20 +652,9 @@ class TestCheckAuthenticatedChatLimit:
     )
     def test_under_limit_allowed(self, mock_boto3):
         """Should allow when under the 100/day limit."""
-        import time
-
         from handlers.api_handler import _check_authenticated_chat_limit
 
-        now = int(time.time())
-        table = MagicMock()
-        table.get_item.return_value = {
-            "Item": {
-                "ip_address": "user_user-456",
-                "timestamps": [now - 100, now - 50],
-                "message_count": 2,
-            }
-        }
-        mock_boto3.resource.return_value.Table.return_value = table
+        _rate_limit_table(mock_boto3, count=3)
 
         allowed, remaining = _check_authenticated_chat_limit("user-456")
         assert allowed is True
@@ -712,54 +668,14 @@ class TestCheckAuthenticatedChatLimit:
     )
     def test_at_limit_rejected(self, mock_boto3):
         """Should reject when at the 100/day limit."""
-        import time
-
         from handlers.api_handler import _check_authenticated_chat_limit
 
-        now = int(time.time())
-        timestamps = [now - i * 60 for i in range(100)]
-        table = MagicMock()
-        table.get_item.return_value = {
-            "Item": {
-                "ip_address": "user_user-789",
-                "timestamps": timestamps,
-                "message_count": 100,
-            }
-        }
-        mock_boto3.resource.return_value.Table.return_value = table
+        _rate_limit_table(mock_boto3, error=_condition_failed())
 
         allowed, remaining = _check_authenticated_chat_limit("user-789")
         assert allowed is False
         assert remaining == 0
 
-    @patch("handlers.api_handler.boto3")
-    @patch.dict(
-        "os.environ",
-        {"CHAT_RATE_LIMIT_TABLE_NAME": "test-rate-limit"},
-        clear=False,
-    )
-    def test_expired_timestamps_not_counted(self, mock_boto3):
-        """Should not count timestamps outside the 24h window."""
-        import time
-
-        from handlers.api_handler import _check_authenticated_chat_limit
-
-        now = int(time.time())
-        old = now - (25 * 3600)  # 25 hours ago (outside 24h window)
-        table = MagicMock()
-        table.get_item.return_value = {
-            "Item": {
-                "ip_address": "user_user-expired",
-                "timestamps": [old] * 100,
-                "message_count": 100,
-            }
-        }
-        mock_boto3.resource.return_value.Table.return_value = table
-
-        allowed, remaining = _check_authenticated_chat_limit("user-expired")
-        assert allowed is True
-        assert remaining == 99  # All old timestamps expired, only 1 new
-
     @patch("handlers.api_handler.boto3")
     @patch.dict(
         "os.environ",
@@ -770,9 +686,7 @@ class TestCheckAuthenticatedChatLimit:
         """Should allow request if DynamoDB errors (fail open)."""
         from handlers.api_handler import _check_authenticated_chat_limit
 
-        table = MagicMock()
-        table.get_item.side_effect = Exception("DynamoDB timeout")
-        mock_boto3.resource.return_value.Table.return_value = table
+        _rate_limit_table(mock_boto3, error=Exception("DynamoDB timeout"))
 
         allowed, remaining = _check_authenticated_chat_limit("user-error")
         assert allowed is True
@@ -784,16 +698,19 @@ class TestCheckAuthenticatedChatLimit:
         {"CHAT_RATE_LIMIT_TABLE_NAME": "test-rate-limit"},
         clear=False,
     )
-    def test_uses_user_prefixed_key(self, mock_boto3):
-        """Should use 'user_' prefix for DynamoDB key to avoid IP collision."""
+    def test_uses_user_prefixed_daily_key(self, mock_boto3):
+        """Should use 'user_' prefix and a daily window to avoid IP collision."""
+        import time
+
         from handlers.api_handler import _check_authenticated_chat_limit
 
-        table = MagicMock()
-        table.get_item.return_value = {}
-        mock_boto3.resource.return_value.Table.return_value = table
+        table = _rate_limit_table(mock_boto3, count=1)
 
         _check_authenticated_chat_limit("abc-123")
-        table.get_item.assert_called_once_with(Key={"ip_address": "user_abc-123"})
+        day = int(time.time()) // 86400
+        assert table.update_item.call_args[1]["Key"] == {
+            "ip_address": f"user_abc-123#{day}"
+        }
 
 
 # ---------------------------------------------------------------------------
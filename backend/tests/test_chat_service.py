@@ -9,6 +9,7 @@ import pytest
 from models.chat import ChatResponse, ConversationSummary
 from models.resort import ElevationLevel, ElevationPoint, Resort
 from models.weather import ConfidenceLevel, SnowQuality, WeatherCondition
+from services.chat_context import CACHE_POINT
 from services.chat_service import (
     BEDROCK_MAX_RETRIES,
     MAX_TOOL_ITERATIONS,
@@ -17,6 +18,8 @@ from services.chat_service import (
     SYSTEM_PROMPT,
     TOOL_DEFINITIONS,
     ChatService,
+    WriteBehind,
+    run_tool_calls,
 )
 
 # ---------------------------------------------------------------------------
@@ -234,12 +237,32 @@ class TestChat:
         assert "title" in user_item
         assert user_item["title"] == "What are conditions at Whistler?"
 
-    def test_save_message_failure_propagates(self, chat_service, mock_chat_table):
-        """DynamoDB save failure should propagate as exception."""
+    def test_save_message_failure_does_not_fail_reply(
+        self, chat_service, mock_chat_table
+    ):
+        """Message writes are write-behind: a failed save is logged, not raised."""
         mock_chat_table.put_item.side_effect = Exception("DynamoDB write failed")
 
-        with pytest.raises(Exception, match="DynamoDB write failed"):
-            chat_service.chat("Hello", None, "user_123")
+        result = chat_service.chat("Hello", None, "user_123")
+
+        assert result.response
+        assert mock_chat_table.put_item.call_count == 2
+
+    def test_user_message_saved_when_model_call_fails(
+        self, chat_service, mock_chat_table
+    ):
+        """The pending user message write is flushed even if Bedrock raises."""
+        with patch.object(
+            chat_service,
+            "_call_bedrock_with_tools",
+            side_effect=Exception("Bedrock unavailable"),
+        ):
+            with pytest.raises(Exception, match="Bedrock unavailable"):
+                chat_service.chat("Hello", None, "user_123")
+
+        assert mock_chat_table.put_item.call_count == 1
+        user_item = mock_chat_table.put_item.call_args[1]["Item"]
+        assert user_item["role"] == "user"
 
     def test_subsequent_message_no_title(self, chat_service, mock_chat_table):
         """Subsequent messages should not have a title."""
@@ -268,8 +291,9 @@ class TestChat:
         mock_bedrock_client.converse.assert_called_once()
         call_kwargs = mock_bedrock_client.converse.call_args[1]
         assert call_kwargs["modelId"] == "us.anthropic.claude-sonnet-4-6"
-        assert call_kwargs["system"] == [{"text": SYSTEM_PROMPT}]
-        assert call_kwargs["toolConfig"]["tools"] == TOOL_DEFINITIONS
+        # Static prompt and tools end in cache points for prompt caching
+        assert call_kwargs["system"] == [{"text": SYSTEM_PROMPT}, CACHE_POINT]
+        assert call_kwargs["toolConfig"]["tools"] == [*TOOL_DEFINITIONS, CACHE_POINT]
         assert call_kwargs["inferenceConfig"]["maxTokens"] == 2048
         assert call_kwargs["inferenceConfig"]["temperature"] == 0.5
 
@@ -640,6 +664,143 @@ class TestToolExecution:
 # ---------------------------------------------------------------------------
 
 
+def _tool_use(i, name="get_resort_conditions", **tool_input):
+    return {"toolUse": {"toolUseId": f"t{i}", "name": name, "input": tool_input}}
+
+
+class TestToolResultCaching:
+    """Tool results are shared across calls within one weather run."""
+
+    def test_repeated_conditions_call_uses_cache(
+        self, chat_service, mock_weather_service, monkeypatch
+    ):
+        from services import tool_result_cache as cache_module
+
+        monkeypatch.setenv("WEBSITE_BUCKET", "site")
+        s3 = MagicMock()
+        s3.head_object.return_value = {"ETag": '"run-1"'}
+        cache = cache_module.ToolResultCache()
+        with (
+            patch.object(cache_module, "_get_s3_client", return_value=s3),
+            patch("services.chat_service.tool_result_cache", cache),
+        ):
+            first = chat_service._execute_tool(
+                "get_resort_conditions", {"resort_id": "big-white"}
+            )
+            second = chat_service._execute_tool(
+                "get_resort_conditions", {"resort_id": "big-white"}
+            )
+
+        assert first == second
+        assert mock_weather_service.get_conditions_for_resort.call_count == 1
+
+
+class TestRunToolCalls:
+    """Concurrent execution of one turn's tool calls."""
+
+    def test_runs_concurrently_and_keeps_request_order(self):
+        delays = [0.2, 0.05, 0.1]
+        blocks = [_tool_use(i, delay=d) for i, d in enumerate(delays)]
+        finished = []
+
+        def execute(name, tool_input):
+            time.sleep(tool_input["delay"])
+            return {"delay": tool_input["delay"]}
+
+        start = time.monotonic()
+        results, calls = run_tool_calls(
+            blocks, execute, on_done=lambda call: finished.append(call["input"])
+        )
+        elapsed = time.monotonic() - start
+
+        assert elapsed < sum(delays)
+        assert [r["toolResult"]["toolUseId"] for r in results] == ["t0", "t1", "t2"]
+        assert [r["toolResult"]["content"][0]["json"]["delay"] for r in results] == (
+            delays
+        )
+        assert all(c["success"] for c in calls)
+        # Completion callbacks fire as each tool finishes
+        assert [f["delay"] for f in finished] == [0.05, 0.1, 0.2]
+
+    def test_failed_tool_reports_error(self):
+        def execute(name, tool_input):
+            if tool_input.get("fail"):
+                raise ValueError("boom")
+            return {"ok": True}
+
+        results, calls = run_tool_calls(
+            [_tool_use(0), _tool_use(1, fail=True)], execute
+        )
+
+        assert results[0]["toolResult"]["content"] == [{"json": {"ok": True}}]
+        assert results[1]["toolResult"]["status"] == "error"
+        assert results[1]["toolResult"]["content"] == [{"text": "Error: boom"}]
+        assert calls[1]["success"] is False
+        assert calls[1]["error"] == "boom"
+
+    def test_slow_tool_times_out_without_blocking_turn(self):
+        def execute(name, tool_input):
+            time.sleep(tool_input.get("delay", 0))
+            return {}
+
+        started = []
+        with patch("services.chat_service.TOOL_TIMEOUT_SECONDS", 0.1):
+            start = time.monotonic()
+            results, calls = run_tool_calls(
+                [_tool_use(0, delay=1.0), _tool_use(1)],
+                execute,
+                on_start=lambda name, tool_input: started.append(name),
+            )
+            elapsed = time.monotonic() - start
+
+        assert elapsed < 0.5
+        assert len(started) == 2
+        assert results[0]["toolResult"]["status"] == "error"
+        assert "timed out" in calls[0]["error"]
+        assert calls[1]["success"] is True
+
+    def test_queued_tools_fail_when_every_worker_is_hung(self):
+        def execute(name, tool_input):
+            time.sleep(tool_input.get("delay", 0))
+            return {}
+
+        with (
+            patch("services.chat_service.TOOL_TIMEOUT_SECONDS", 0.1),
+            patch("services.chat_service.MAX_PARALLEL_TOOLS", 1),
+        ):
+            results, calls = run_tool_calls(
+                [_tool_use(0, delay=0.5), _tool_use(1)], execute
+            )
+
+        assert [c["success"] for c in calls] == [False, False]
+        assert calls[1]["error"] == "timed out waiting for a worker"
+
+
+class TestWriteBehind:
+    """Background message writes flushed once the reply is ready."""
+
+    def test_writes_run_before_flush(self):
+        writes = WriteBehind()
+        done = []
+        writes.submit(lambda: (time.sleep(0.05), done.append(1)))
+        writes.submit(done.append, 2)
+
+        writes.flush()
+
+        assert sorted(done) == [1, 2]
+
+    def test_failed_write_is_logged_not_raised(self, caplog):
+        writes = WriteBehind()
+        writes.submit(Mock(side_effect=Exception("throttled")))
+        ok = Mock()
+        writes.submit(ok, "x")
+
+        writes.flush()
+
+        ok.assert_called_once_with("x")
+        assert "Background write failed: throttled" in caplog.text
+
+
 class TestTitleGeneration:
     """Test cases for conversation title generation."""
 
@@ -972,6 +1133,22 @@ class TestAutoDetectResorts:
         # "prevailed" contains "vail" but shouldn't match at word boundary
         assert result is None or "vail" not in (result or "")
 
+    def test_detects_resort_name_without_alias(self, chat_service, mock_resort_service):
+        """Resort names from the database are matched when no alias is."""
+        mock_resort_service.get_all_resorts.return_value = [
+            mock_resort_service.get_resort.return_value
+        ]
+        result = chat_service._auto_detect_resorts("Thinking about Big White Ski")
+        assert result is not None
+        assert "big-white" in result
+
+    def test_detector_built_once(self, chat_service, mock_resort_service):
+        """All resorts are loaded once, not on every message."""
+        mock_resort_service.get_all_resorts.return_value = []
+        chat_service._auto_detect_resorts("How's Whistler?")
+        chat_service._auto_detect_resorts("Anything good in Utah?")
+        assert mock_resort_service.get_all_resorts.call_count == 1
+
     def test_context_includes_conditions(self, chat_service, mock_weather_service):
         """Pre-fetched context should include conditions data."""
         result = chat_service._auto_detect_resorts("How's Whistler?")
@@ -989,9 +1166,11 @@ class TestAutoDetectResorts:
         chat_service.chat("How's Whistler?", None, "user_123")
 
         call_kwargs = mock_bedrock_client.converse.call_args[1]
-        system_text = call_kwargs["system"][0]["text"]
-        assert "PRE-FETCHED DATA" in system_text
-        assert "whistler-blackcomb" in system_text.lower()
+        static, cache_point, extra = call_kwargs["system"]
+        assert static == {"text": SYSTEM_PROMPT}
+        assert cache_point == CACHE_POINT
+        assert "PRE-FETCHED DATA" in extra["text"]
+        assert "whistler-blackcomb" in extra["text"].lower()
 
     def test_no_injection_for_generic_message(self, chat_service, mock_bedrock_client):
         """Generic messages should not add context to system prompt."""
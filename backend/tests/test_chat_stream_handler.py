@@ -275,3 +275,217 @@ class TestGetResortForecast:
             dynamodb,
         )
         assert len(result["days"]) == 7
+
+
+# ---------------------------------------------------------------------------
+# Tests for catalog-backed tools
+# ---------------------------------------------------------------------------
+
+
+def _catalog():
+    from services.resort_catalog import ResortCatalog
+
+    return ResortCatalog(
+        [
+            {**SAMPLE_RESORT, "epic_pass": "unlimited"},
+            {
+                "resort_id": "mt-baker",
+                "name": "Mt. Baker",
+                "country": "US",
+                "region": "na_west",
+                "elevation_points": [
+                    {"level": "base", "latitude": 48.86, "longitude": -121.66}
+                ],
+            },
+        ],
+        {
+            "whistler-blackcomb": {
+                "overall_quality": "excellent",
+                "snow_score": 88,
+                "snowfall_24h_cm": 12.0,
+                "wind_speed_kmh": 18.0,
+            }
+        },
+    )
+
+
+class TestCatalogBackedTools:
+    """Tools answer from the in-memory catalog instead of DynamoDB."""
+
+    @patch.dict("os.environ", {"ENVIRONMENT": "prod"})
+    def test_search_resorts_uses_catalog(self):
+        from handlers.chat_stream_handler import _execute_tool
+
+        dynamodb = _mock_dynamodb_with_resort()
+        with patch(
+            "handlers.chat_stream_handler.get_resort_catalog", return_value=_catalog()
+        ):
+            result = _execute_tool("search_resorts", {"query": "baker"}, dynamodb)
+
+        assert result["count"] == 1
+        assert result["results"][0]["resort_id"] == "mt-baker"
+        dynamodb.Table("snow-tracker-resorts-prod").scan.assert_not_called()
+
+    @patch.dict("os.environ", {"ENVIRONMENT": "prod"})
+    def test_nearby_resorts_uses_catalog_and_snapshot(self):
+        from handlers.chat_stream_handler import _execute_tool
+
+        dynamodb = _mock_dynamodb_with_resort()
+        with patch(
+            "handlers.chat_stream_handler.get_resort_catalog", return_value=_catalog()
+        ):
+            result = _execute_tool(
+                "get_nearby_resorts",
+                {"latitude": 49.28, "longitude": -123.12, "radius_km": 150},
+                dynamodb,
+            )
+
+        assert [r["resort_id"] for r in result["results"]] == [
+            "whistler-blackcomb",
+            "mt-baker",
+        ]
+        whistler = result["results"][0]
+        assert whistler["snow_quality"] == "excellent"
+        assert whistler["snow_score"] == 88.0
+        assert whistler["pass_affiliations"] == ["Epic (unlimited)"]
+        assert "snow_quality" not in result["results"][1]
+        dynamodb.Table("snow-tracker-weather-conditions-prod").query.assert_not_called()
+
+    @patch.dict("os.environ", {"ENVIRONMENT": "prod"})
+    def test_details_batch_uses_snapshot_with_wind(self):
+        from handlers.chat_stream_handler import _execute_tool
+
+        dynamodb = _mock_dynamodb_with_resort()
+        with patch(
+            "handlers.chat_stream_handler.get_resort_catalog", return_value=_catalog()
+        ):
+            result = _execute_tool(
+                "get_resort_details_batch",
+                {"resort_ids": ["whistler-blackcomb"]},
+                dynamodb,
+            )
+
+        whistler = result["resorts"][0]
+        assert whistler["snow_score"] == 88.0
+        assert whistler["wind_speed_kmh"] == 18.0
+        dynamodb.Table("snow-tracker-weather-conditions-prod").query.assert_not_called()
+
+    @patch.dict("os.environ", {"ENVIRONMENT": "prod"})
+    def test_search_resorts_without_catalog_scans_every_page(self):
+        from handlers.chat_stream_handler import _execute_tool
+
+        dynamodb = _mock_dynamodb_with_resort()
+        table = dynamodb.Table("snow-tracker-resorts-prod")
+        table.scan.side_effect = [
+            {"Items": [{"resort_id": "a", "name": "Baker A"}], "LastEvaluatedKey": 1},
+            {"Items": [{"resort_id": "b", "name": "Baker B"}]},
+        ]
+        with patch(
+            "handlers.chat_stream_handler.get_resort_catalog", return_value=None
+        ):
+            result = _execute_tool("search_resorts", {"query": "baker"}, dynamodb)
+
+        assert result["count"] == 2
+        assert table.scan.call_count == 2
+
+
+class TestAutoDetectResortsFast:
+    """Pre-fetch detection in the streaming handler."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_detector(self):
+        from handlers import chat_stream_handler
+
+        with patch.dict(
+            chat_stream_handler._mention_detector,
+            {
+                "catalog": None,
+                "detector": chat_stream_handler._mention_detector["detector"],
+            },
+        ):
+            yield
+
+    @patch.dict("os.environ", {"ENVIRONMENT": "prod"})
+    def test_detects_catalog_resort_names(self):
+        from handlers.chat_stream_handler import _auto_detect_resorts_fast
+
+        dynamodb = _mock_dynamodb_with_resort()
+        dynamodb.Table("snow-tracker-weather-conditions-prod").query.return_value = {
+            "Items": [{"elevation_level": "mid", "snowfall_24h_cm": Decimal("4")}]
+        }
+        with patch(
+            "handlers.chat_stream_handler.get_resort_catalog", return_value=_catalog()
+        ):
+            context = _auto_detect_resorts_fast("Is mt. baker open?", dynamodb)
+
+        assert "Resort: Mt. Baker (mt-baker)" in context
+
+    @patch.dict("os.environ", {"ENVIRONMENT": "prod"})
+    def test_aliases_without_catalog(self):
+        from handlers.chat_stream_handler import _auto_detect_resorts_fast
+
+        dynamodb = _mock_dynamodb_with_resort(resort_item=SAMPLE_RESORT)
+        dynamodb.Table("snow-tracker-weather-conditions-prod").query.return_value = {
+            "Items": [{"elevation_level": "mid", "snowfall_24h_cm": Decimal("4")}]
+        }
+        with patch(
+            "handlers.chat_stream_handler.get_resort_catalog", return_value=None
+        ):
+            context = _auto_detect_resorts_fast("How's whistler?", dynamodb)
+            assert _auto_detect_resorts_fast("Is mt. baker open?", dynamodb) is None
+
+        assert "Resort: Whistler Blackcomb (whistler-blackcomb)" in context
+
+
+class TestToolLoopDedupe:
+    """Tool results repeated from the pre-fetched context are replaced."""
+
+    def test_result_in_prefetched_data_replaced(self):
+        import json
+        import queue
+
+        from handlers.chat_stream_handler import _call_bedrock_with_tools_stream
+
+        conditions = {"resort_id": "whistler-blackcomb", "notes": "x" * 300}
+        context_data = f"Resort: Whistler\nConditions: {json.dumps(conditions)}\n"
+        bedrock = MagicMock()
+        bedrock.converse.side_effect = [
+            {
+                "stopReason": "tool_use",
+                "output": {
+                    "message": {
+                        "content": [
+                            {
+                                "toolUse": {
+                                    "toolUseId": "t1",
+                                    "name": "get_resort_conditions",
+                                    "input": {"resort_id": "whistler-blackcomb"},
+                                }
+                            }
+                        ]
+                    }
+                },
+            },
+            {
+                "stopReason": "end_turn",
+                "output": {"message": {"content": [{"text": "Fresh snow."}]}},
+            },
+        ]
+        bedrock.converse_stream.side_effect = Exception("no stream")
+        messages = [{"role": "user", "content": [{"text": "How's whistler?"}]}]
+
+        with patch(
+            "handlers.chat_stream_handler._execute_tool", return_value=conditions
+        ):
+            text, _ = _call_bedrock_with_tools_stream(
+                bedrock,
+                [],
+                messages,
+                queue.Queue(),
+                MagicMock(),
+                context_data=context_data,
+            )
+
+        assert text == "Fresh snow."
+        result = messages[2]["content"][0]["toolResult"]
+        assert "PRE-FETCHED" in result["content"][0]["text"]
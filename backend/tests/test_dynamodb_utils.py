@@ -4,11 +4,16 @@ from decimal import Decimal
 
 import pytest
 
+from models.weather import WeatherCondition
 from utils.dynamodb_utils import (
     decimal_to_python,
+    deserialize_item,
+    deserialize_items,
+    deserialize_number,
     parse_from_dynamodb,
     parse_items_from_dynamodb,
     prepare_for_dynamodb,
+    project_record,
     python_to_decimal,
 )
 
@@ -339,3 +344,100 @@ class TestRoundTrip:
         # Check that booleans and None are preserved
         assert recovered["active"] is True
         assert recovered["notes"] is None
+
+
+class TestDeserializeItem:
+    """Tests for the wire-format fast path."""
+
+    def test_numbers_become_int_or_float(self):
+        """N values decode straight to int/float like decimal_to_python."""
+        assert deserialize_number("42") == 42
+        assert isinstance(deserialize_number("42"), int)
+        assert deserialize_number("-5.5") == -5.5
+        assert isinstance(deserialize_number("1.0"), int)
+        assert deserialize_number("1E+3") == 1000
+        assert deserialize_number("2.5e-1") == 0.25
+
+    def test_all_types(self):
+        """Every wire type decodes to its Python equivalent."""
+        item = {
+            "resort_id": {"S": "whistler"},
+            "temp": {"N": "-5.5"},
+            "active": {"BOOL": True},
+            "notes": {"NULL": True},
+            "weather": {"M": {"depth": {"N": "120"}, "tags": {"L": [{"S": "a"}]}}},
+            "names": {"SS": ["a", "b"]},
+            "scores": {"NS": ["1", "2.5"]},
+            "blob": {"B": b"x"},
+            "blobs": {"BS": [b"x"]},
+        }
+
+        assert deserialize_item(item) == {
+            "resort_id": "whistler",
+            "temp": -5.5,
+            "active": True,
+            "notes": None,
+            "weather": {"depth": 120, "tags": ["a"]},
+            "names": {"a", "b"},
+            "scores": {1, 2.5},
+            "blob": b"x",
+            "blobs": {b"x"},
+        }
+
+    def test_matches_resource_layer_parsing(self):
+        """Same result as parsing the resource layer's Decimal items."""
+        from boto3.dynamodb.types import TypeDeserializer
+
+        item = {
+            "resort_id": {"S": "whistler"},
+            "snowfall_24h_cm": {"N": "12.5"},
+            "ttl": {"N": "1700000000"},
+            "points": {"L": [{"M": {"elevation_meters": {"N": "1500"}}}]},
+        }
+        deserializer = TypeDeserializer()
+        via_decimal = parse_from_dynamodb(
+            {key: deserializer.deserialize(value) for key, value in item.items()}
+        )
+
+        assert deserialize_item(item) == via_decimal
+
+    def test_attributes_limit_decoding(self):
+        """Only the requested attributes are decoded."""
+        items = [{"a": {"N": "1"}, "raw_data": {"M": {"big": {"S": "x"}}}}]
+
+        assert deserialize_items(items, attributes={"a"}) == [{"a": 1}]
+
+
+class TestProjectRecord:
+    """Tests for building models without validation."""
+
+    def _data(self, **overrides):
+        data = {
+            "resort_id": "whistler",
+            "elevation_level": "top",
+            "timestamp": "2026-01-01T00:00:00+00:00",
+            "current_temp_celsius": -5,
+            "min_temp_celsius": -8.5,
+            "max_temp_celsius": 0,
+            "snow_quality": "good",
+            "data_source": "open-meteo.com",
+            "source_confidence": "high",
+        }
+        data.update(overrides)
+        return data
+
+    def test_same_dump_as_validated_model(self):
+        """The record dumps the same as a validated model."""
+        record = project_record(WeatherCondition, self._data())
+
+        assert isinstance(record, WeatherCondition)
+        assert record.model_dump() == WeatherCondition(**self._data()).model_dump()
+        assert record.fresh_snow_cm == 0.0
+
+    def test_missing_required_field(self):
+        """Items missing a required field are rejected."""
+        data = self._data()
+        del data["timestamp"]
+
+        assert project_record(WeatherCondition, data) is None
+        assert project_record(WeatherCondition, self._data(resort_id=None)) is None
@@ -2,7 +2,7 @@
 
 import math
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -15,8 +15,10 @@ from services.ml_scorer import (
     _forward_single,
     _override_snowfall_from_condition,
     _relu,
+    _run_inference,
     _sigmoid,
     _transpose_weights,
+    build_scoring_context,
     engineer_features,
     extract_features_from_condition,
     predict_quality,
@@ -194,6 +196,53 @@ class TestForwardSingle:
         assert abs(result - 3.5) < 0.01
 
 
+class TestRunInference:
+    """Inference path selection between ensemble and distilled student."""
+
+    @staticmethod
+    def _constant_net(b2: float) -> dict:
+        # Zero hidden layer, so output is sigmoid(b2) * 5 + 1
+        return {"W1_T": [[0.0, 0.0]], "b1": [0.0], "W2": [[0.0]], "b2": [b2]}
+
+    def _model(self, with_student: bool = True) -> dict:
+        model = {
+            "weights": self._constant_net(0.0),
+            "ensemble": [self._constant_net(-1.0), self._constant_net(1.0)],
+        }
+        if with_student:
+            model["student"] = self._constant_net(2.0)
+        return model
+
+    def test_ensemble_mode_averages_members(self):
+        import services.ml_scorer as ml_mod
+
+        with patch.object(ml_mod, "SCORER_MODE", "ensemble"):
+            result = _run_inference([1.0, 2.0], self._model())
+        expected = (_sigmoid(-1.0) + _sigmoid(1.0)) / 2 * 5.0 + 1.0
+        assert abs(result - expected) < 1e-9
+
+    def test_student_mode_uses_student(self):
+        import services.ml_scorer as ml_mod
+
+        with patch.object(ml_mod, "SCORER_MODE", "student"):
+            result = _run_inference([1.0, 2.0], self._model())
+        assert abs(result - (_sigmoid(2.0) * 5.0 + 1.0)) < 1e-9
+
+    def test_student_mode_falls_back_to_ensemble(self):
+        import services.ml_scorer as ml_mod
+
+        model = self._model(with_student=False)
+        with patch.object(ml_mod, "SCORER_MODE", "student"):
+            student_result = _run_inference([1.0, 2.0], model)
+        with patch.object(ml_mod, "SCORER_MODE", "ensemble"):
+            ensemble_result = _run_inference([1.0, 2.0], model)
+        assert student_result == ensemble_result
+
+    def test_single_network_without_ensemble(self):
+        model = {"weights": self._constant_net(0.0)}
+        assert abs(_run_inference([1.0, 2.0], model) - 3.5) < 1e-9
+
+
 # ── Feature engineering ──────────────────────────────────────────────────────
 
 
@@ -715,6 +764,110 @@ class TestPredictQuality:
         assert 1.0 <= score <= 6.0
 
 
+# ── Scoring context ──────────────────────────────────────────────────────────
+
+
+def _hourly_raw_data(n: int = 120) -> dict:
+    return {
+        "hourly": {
+            "temperature_2m": [-8.0 + (i % 24 - 12) * 0.3 for i in range(n)],
+            "snowfall": [0.5 if i % 4 == 0 else 0.0 for i in range(n)],
+            "wind_speed_10m": [12.0] * n,
+            "snow_depth": [0.8] * n,
+            "time": [f"2026-02-{18 + i // 24:02d}T{i % 24:02d}:00" for i in range(n)],
+        }
+    }
+
+
+class TestFindCurrentIndex:
+    TIMES = [f"2026-02-18T{h:02d}:00" for h in range(24)]
+
+    def _at(self, iso: str) -> int:
+        from datetime import datetime
+
+        import services.ml_scorer as ml_mod
+
+        fake_now = datetime.fromisoformat(iso)
+        with patch.object(ml_mod, "datetime") as mock_dt:
+            mock_dt.now.return_value = fake_now
+            return ml_mod._find_current_index(self.TIMES)
+
+    def test_exact_hour(self):
+        assert self._at("2026-02-18T07:00:00+00:00") == 7
+
+    def test_mid_hour_matches_hour_slot(self):
+        assert self._at("2026-02-18T07:45:00+00:00") == 7
+
+    def test_before_range_is_first_slot(self):
+        assert self._at("2026-02-17T23:00:00+00:00") == 0
+
+    def test_after_range_is_last_slot(self):
+        assert self._at("2026-02-19T05:00:00+00:00") == 23
+
+
+class TestScoringContext:
+    def test_exact_context_from_raw_data(self):
+        ctx = build_scoring_context(
+            _make_condition(raw_data=_hourly_raw_data()), 2500.0
+        )
+        assert ctx.exact
+        assert ctx.current_index == 119  # times are in the past
+        assert len(ctx.features) == len(engineer_features(ctx.raw_features))
+
+    def test_approximated_context_without_raw_data(self):
+        ctx = build_scoring_context(_make_condition(), 2000.0)
+        assert not ctx.exact
+        assert ctx.current_index is None
+        assert ctx.raw_features is not None
+
+    def test_exact_only_skips_approximation(self):
+        import services.ml_scorer as ml_mod
+
+        with patch.object(ml_mod, "extract_features_from_condition") as approximate:
+            ctx = build_scoring_context(_make_condition(), 2000.0, exact_only=True)
+        approximate.assert_not_called()
+        assert not ctx.exact
+        assert ctx.raw_features is None
+        assert ctx.features is None
+
+    def test_merged_snowfall_override_applied(self):
+        condition = _make_condition(raw_data=_hourly_raw_data(), snowfall_24h_cm=40.0)
+        ctx = build_scoring_context(condition, 2500.0)
+        assert ctx.raw_features["snowfall_24h_cm"] == 40.0
+
+    def test_predict_quality_fills_context(self):
+        condition = _make_condition(raw_data=_hourly_raw_data())
+        ctx = build_scoring_context(condition, 2500.0)
+        quality, score = predict_quality(condition, 2500.0, context=ctx)
+        assert ctx.score == score
+        assert ctx.quality == quality
+        assert 1.0 <= ctx.model_score <= 6.0
+        assert (quality, score) == predict_quality(condition, 2500.0)
+
+    def test_predict_quality_reuses_context_features(self):
+        import services.ml_scorer as ml_mod
+
+        condition = _make_condition(raw_data=_hourly_raw_data())
+        ctx = build_scoring_context(condition, 2500.0)
+        with patch.object(ml_mod, "_extract_features_at_hour") as extract:
+            predict_quality(condition, 2500.0, context=ctx)
+        extract.assert_not_called()
+
+    def test_no_snowfall_cap_flag(self):
+        raw = _hourly_raw_data()
+        raw["hourly"]["snowfall"] = [0.0] * 120
+        condition = _make_condition(
+            raw_data=raw,
+            snowfall_24h_cm=0.0,
+            snowfall_72h_cm=0.0,
+            snowfall_after_freeze_cm=0.0,
+        )
+        ctx = build_scoring_context(condition, 2500.0)
+        predict_quality(condition, 2500.0, context=ctx)
+        assert ctx.score <= 3.5
+        assert ctx.no_snowfall_capped == (ctx.model_score > 3.5)
+
+
 # ── Integration: predict_quality_at_hour ─────────────────────────────────────
 
 
@@ -749,6 +902,112 @@ class TestPredictQualityAtHour:
         assert score == 3.5
 
 
+# ── Model registry and shadow scoring ───────────────────────────────────────
+
+
+class TestModelRegistry:
+    @pytest.fixture
+    def registry(self):
+        """Point ml_scorer at a fake S3 registry; restore module state after."""
+        import copy
+        import json
+
+        import services.ml_scorer as ml_mod
+
+        with open(ml_mod.MODEL_PATH) as f:
+            weights = json.load(f)
+        objects = {
+            "ml-models/manifest.json": {
+                "primary": {"version": "v2-a", "key": "ml-models/v2-a.json"},
+                "shadow": None,
+            },
+            "ml-models/v2-a.json": weights,
+            "ml-models/v2-b.json": copy.deepcopy(weights),
+        }
+        fetch = Mock(side_effect=lambda key: copy.deepcopy(objects[key]))
+        saved = (ml_mod._model, ml_mod._shadow_model, dict(ml_mod._registry_versions))
+        ml_mod._model = None
+        ml_mod._shadow_model = None
+        ml_mod._registry_versions.update(primary=None, shadow=None)
+        ml_mod._registry_checked_at = None
+        ml_mod._shadow_samples.clear()
+        try:
+            with (
+                patch.object(ml_mod, "MODEL_BUCKET", "registry-bucket"),
+                patch.object(ml_mod, "_fetch_registry_json", fetch),
+            ):
+                yield ml_mod, objects, fetch
+        finally:
+            ml_mod._model, ml_mod._shadow_model = saved[:2]
+            ml_mod._registry_versions.update(saved[2])
+            ml_mod._registry_checked_at = None
+            ml_mod._shadow_samples.clear()
+
+    def test_loads_primary_from_manifest(self, registry):
+        ml_mod, _, _ = registry
+        model = ml_mod._load_model()
+        assert model["version"] == "v2-a"
+        assert "W1_T" in model["ensemble"][0]
+
+    def test_manifest_reads_are_throttled(self, registry):
+        ml_mod, _, fetch = registry
+        ml_mod._load_model()
+        ml_mod._load_model()
+        manifest_reads = [c for c in fetch.call_args_list if "manifest" in c.args[0]]
+        assert len(manifest_reads) == 1
+
+    def test_swaps_primary_on_version_change(self, registry):
+        ml_mod, objects, fetch = registry
+        first = ml_mod._load_model()
+        objects["ml-models/manifest.json"]["primary"] = {
+            "version": "v2-b",
+            "key": "ml-models/v2-b.json",
+        }
+        ml_mod._registry_checked_at = None  # refresh interval elapsed
+        second = ml_mod._load_model()
+        assert second is not first
+        assert second["version"] == "v2-b"
+
+    def test_registry_error_keeps_current_model(self, registry):
+        ml_mod, _, fetch = registry
+        first = ml_mod._load_model()
+        fetch.side_effect = RuntimeError("S3 unavailable")
+        ml_mod._registry_checked_at = None
+        assert ml_mod._load_model() is first
+
+    def test_falls_back_to_bundled_model(self, registry):
+        ml_mod, _, fetch = registry
+        fetch.side_effect = RuntimeError("S3 unavailable")
+        model = ml_mod._load_model()
+        assert model is not None
+        assert model["version"] == "v2"
+
+    def test_shadow_divergence_stats(self, registry):
+        ml_mod, objects, _ = registry
+        objects["ml-models/manifest.json"]["shadow"] = {
+            "version": "v2-b",
+            "key": "ml-models/v2-b.json",
+        }
+        with patch.object(ml_mod, "SHADOW_SCORING", True):
+            for temp in (-10.0, -3.0, 2.0):
+                predict_quality(_make_condition(current_temp_celsius=temp), 2000.0)
+            stats = ml_mod.flush_shadow_stats()
+        # Identical weights: no divergence
+        assert stats["n"] == 3
+        assert stats["primary_version"] == "v2-a"
+        assert stats["shadow_version"] == "v2-b"
+        assert stats["max_abs_diff"] == 0.0
+        assert stats["quality_agreement"] == 1.0
+        assert ml_mod.flush_shadow_stats() is None
+
+    def test_no_shadow_queues_nothing(self, registry):
+        ml_mod, _, _ = registry
+        with patch.object(ml_mod, "SHADOW_SCORING", True):
+            predict_quality(_make_condition(), 2000.0)
+        assert ml_mod._shadow_samples == []
+        assert ml_mod.flush_shadow_stats() is None
+
+
 # ── Fresh-snow floor ────────────────────────────────────────────────────────
 
 
@@ -1,5 +1,6 @@
 """Tests for NotificationService."""
 
+import io
 import json
 import os
 from datetime import UTC, datetime, timedelta
@@ -21,7 +22,22 @@ from models.notification import (
     UserNotificationPreferences,
 )
 from models.user import UserPreferences
-from services.notification_service import NotificationService
+from services.notification_service import (
+    NotificationService,
+    NotificationStateUpdate,
+    _notification_state,
+)
+
+
+def _updated_entries(call) -> dict[str, set[str]]:
+    """Bookkeeping map entries touched by a narrow update_item call."""
+    names = call.kwargs["ExpressionAttributeNames"]
+    entries = {}
+    for part in call.kwargs["UpdateExpression"].replace(",", " ").split():
+        if part.startswith("#ns.#"):
+            _, field, key = part.split(".")
+            entries.setdefault(names[field], set()).add(names[key])
+    return entries
 
 
 class TestNotificationServiceInit:
@@ -432,6 +448,145 @@ class TestSendNotificationToUser:
         assert result == 1
 
 
+class TestDeliverNotifications:
+    """Tests for the concurrent push delivery stage."""
+
+    @pytest.fixture
+    def service(self):
+        svc = NotificationService(
+            device_tokens_table=MagicMock(),
+            user_preferences_table=MagicMock(),
+            resort_events_table=MagicMock(),
+            weather_conditions_table=MagicMock(),
+            resorts_table=MagicMock(),
+            sns_client=MagicMock(),
+            apns_platform_arn="arn:aws:sns:us-west-2:123:app/APNS/snow",
+            notification_history_service=MagicMock(),
+        )
+        now = datetime.now(UTC).isoformat()
+        svc.device_tokens_table.query.side_effect = lambda **kw: {
+            "Items": [
+                {
+                    "user_id": kw["ExpressionAttributeValues"][":uid"],
+                    "device_id": f"dev-{token}",
+                    "token": token,
+                    "platform": "ios",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for token in ("good", "stale", "bogus")
+            ]
+        }
+
+        def create_endpoint(PlatformApplicationArn, Token):
+            if Token == "bogus":
+                raise ClientError(
+                    {
+                        "Error": {
+                            "Code": "InvalidParameter",
+                            "Message": "Invalid parameter: Token Reason: "
+                            "iOS device tokens must be no more than 400 "
+                            "hexadecimal characters",
+                        }
+                    },
+                    "CreatePlatformEndpoint",
+                )
+            return {"EndpointArn": f"arn:endpoint/{Token}"}
+
+        svc.sns.create_platform_endpoint.side_effect = create_endpoint
+        svc.sns.get_endpoint_attributes.side_effect = lambda EndpointArn: {
+            "Attributes": {"Enabled": "false" if "stale" in EndpointArn else "true"}
+        }
+        return svc
+
+    def _payload(self, title="Fresh Snow!"):
+        return NotificationPayload(
+            notification_type=NotificationType.FRESH_SNOW,
+            title=title,
+            body="10cm of fresh snow.",
+            resort_id="whistler-blackcomb",
+        )
+
+    def test_prunes_disabled_and_invalid_endpoints(self, service):
+        result = service.deliver_notifications(
+            [("user1", self._payload()), ("user2", self._payload())]
+        )
+
+        assert result["sent"] == 2
+        assert result["per_delivery"] == [1, 1]
+        assert result["pruned_devices"] == 4
+        pruned = {
+            (c.kwargs["Key"]["user_id"], c.kwargs["Key"]["device_id"])
+            for c in service.device_tokens_table.delete_item.call_args_list
+        }
+        assert pruned == {
+            ("user1", "dev-stale"),
+            ("user1", "dev-bogus"),
+            ("user2", "dev-stale"),
+            ("user2", "dev-bogus"),
+        }
+        assert service.notification_history_service.store_notification.call_count == 2
+
+    def test_bad_platform_arn_prunes_nothing(self, service):
+        service.sns.create_platform_endpoint.side_effect = ClientError(
+            {
+                "Error": {
+                    "Code": "InvalidParameter",
+                    "Message": "Invalid parameter: PlatformApplicationArn "
+                    "Reason: No endpoint found for the target arn specified",
+                }
+            },
+            "CreatePlatformEndpoint",
+        )
+
+        result = service.deliver_notifications([("user1", self._payload())])
+
+        assert result["sent"] == 0
+        assert result["pruned_devices"] == 0
+        service.device_tokens_table.delete_item.assert_not_called()
+
+    def test_run_caches_tokens_and_endpoints(self, service):
+        service._begin_run()
+        try:
+            service.deliver_notifications([("user1", self._payload("A"))])
+            service.sns.create_platform_endpoint.reset_mock()
+            result = service.deliver_notifications(
+                [("user1", self._payload("B")), ("user1", self._payload("C"))]
+            )
+        finally:
+            service._end_run()
+
+        # One token lookup for the whole run, endpoints reused, and devices
+        # pruned in the first batch are not retried
+        assert service.device_tokens_table.query.call_count == 1
+        service.sns.create_platform_endpoint.assert_not_called()
+        assert result["per_delivery"] == [1, 1]
+        assert result["pruned_devices"] == 0
+
+    @patch("services.notification_service.time.sleep")
+    def test_throttled_publish_is_retried(self, mock_sleep, service):
+        service.sns.publish.side_effect = [
+            ClientError({"Error": {"Code": "Throttling"}}, "Publish"),
+            {"MessageId": "m1"},
+        ]
+
+        assert service.send_push_notification("good", self._payload()) is True
+        assert service.sns.publish.call_count == 2
+        mock_sleep.assert_called()
+
+    @patch("services.notification_service.time.sleep")
+    @patch("services.notification_service.time.monotonic", return_value=100.0)
+    def test_rate_limiter_spaces_calls(self, mock_monotonic, mock_sleep):
+        from services.notification_service import _RateLimiter
+
+        limiter = _RateLimiter(10)
+        for _ in range(3):
+            limiter.wait()
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == pytest.approx([0.1, 0.2])
+
+
 class TestCreateResortEvent:
     """Tests for create_resort_event."""
 
@@ -1082,8 +1237,8 @@ class TestProcessUserNotifications:
         result = service.process_user_notifications("user1", prefs)
         assert len(result) == 0  # Not enough snow for per-resort threshold
 
-    def test_saves_user_preferences_after_processing(self, service):
-        """Test that user preferences are saved after processing."""
+    def test_unchanged_state_is_not_written(self, service):
+        """Test that a run with no notifications leaves the item untouched."""
         settings = UserNotificationPreferences(
             notifications_enabled=True,
             fresh_snow_alerts=False,
@@ -1097,7 +1252,36 @@ class TestProcessUserNotifications:
 
         service.process_user_notifications("user1", prefs)
 
-        service.user_preferences_table.put_item.assert_called_once()
+        service.user_preferences_table.put_item.assert_not_called()
+        service.user_preferences_table.update_item.assert_not_called()
+
+    def test_changed_state_is_written_by_path(self, service):
+        """Test that only the changed bookkeeping entries are updated."""
+        settings = UserNotificationPreferences(
+            notifications_enabled=True,
+            fresh_snow_alerts=True,
+            event_alerts=False,
+            thaw_freeze_alerts=False,
+            default_snow_threshold_cm=5.0,
+        )
+        prefs = self._make_prefs(
+            favorite_resorts=["whistler-blackcomb"],
+            notification_settings=settings,
+        )
+        service.weather_conditions_table.query.return_value = {
+            "Items": [{"snowfall_24h_cm": 10.0}]
+        }
+
+        service.process_user_notifications("user1", prefs)
+
+        service.user_preferences_table.put_item.assert_not_called()
+        call = service.user_preferences_table.update_item.call_args
+        assert call.kwargs["Key"] == {"user_id": "user1"}
+        assert call.kwargs["ConditionExpression"] == "attribute_exists(user_id)"
+        assert _updated_entries(call) == {
+            "last_notified": {"whistler-blackcomb:fresh_snow"},
+            "last_notified_amount": {"whistler-blackcomb:fresh_snow"},
+        }
 
     def test_thaw_freeze_alert_in_processing(self, service):
         """Test that thaw/freeze alerts are generated during user notification processing."""
@@ -1151,8 +1335,8 @@ class TestProcessUserNotifications:
         assert len(result) == 0
 
 
-class TestSaveUserPreferences:
-    """Tests for _save_user_preferences."""
+class TestSaveNotificationState:
+    """Tests for save_notification_state."""
 
     @pytest.fixture
     def service(self):
@@ -1166,28 +1350,88 @@ class TestSaveUserPreferences:
             apns_platform_arn="arn:test",
         )
 
-    def test_save_user_preferences_success(self, service):
-        """Test saving user preferences calls put_item."""
-        now = datetime.now(UTC).isoformat()
-        prefs = UserPreferences(
-            user_id="user1",
-            created_at=now,
-            updated_at=now,
+    def _update(self, before=None, stored=True, **state):
+        snapshot = _notification_state(UserNotificationPreferences())
+        snapshot.update(before or {})
+        settings = UserNotificationPreferences(**state)
+        return NotificationStateUpdate.diff("user1", snapshot, settings, stored=stored)
+
+    def _client_error(self, code):
+        return ClientError({"Error": {"Code": code, "Message": code}}, "UpdateItem")
+
+    def test_diff_without_changes_is_none(self):
+        settings = UserNotificationPreferences(last_notified={"a:fresh_snow": "t1"})
+        assert (
+            NotificationStateUpdate.diff(
+                "user1", _notification_state(settings), settings
+            )
+            is None
         )
-        service._save_user_preferences(prefs)
-        service.user_preferences_table.put_item.assert_called_once()
 
-    def test_save_user_preferences_error_handled(self, service):
-        """Test that errors during save are handled gracefully."""
-        service.user_preferences_table.put_item.side_effect = Exception("DB error")
-        now = datetime.now(UTC).isoformat()
-        prefs = UserPreferences(
-            user_id="user1",
-            created_at=now,
-            updated_at=now,
+    def test_sets_and_removes_changed_entries(self, service):
+        update = self._update(
+            before={"temperature_state": {"a": "thawing", "b": "frozen"}},
+            last_notified={"a:thaw_alert": "t1"},
+            temperature_state={"a": "frozen"},
+        )
+
+        service.save_notification_state(update)
+
+        call = service.user_preferences_table.update_item.call_args
+        expression = call.kwargs["UpdateExpression"]
+        assert expression.startswith("SET ")
+        assert " REMOVE " in expression
+        assert _updated_entries(call) == {
+            "last_notified": {"a:thaw_alert"},
+            "temperature_state": {"a", "b"},
+        }
+        assert "attribute_exists(user_id)" == call.kwargs["ConditionExpression"]
+
+    def test_unstored_settings_are_set_whole(self, service):
+        update = self._update(stored=False, last_notified={"a:fresh_snow": "t1"})
+
+        service.save_notification_state(update)
+
+        call = service.user_preferences_table.update_item.call_args
+        assert call.kwargs["UpdateExpression"] == "SET #ns = :settings"
+        saved = call.kwargs["ExpressionAttributeValues"][":settings"]
+        assert saved["last_notified"] == {"a:fresh_snow": "t1"}
+
+    def test_missing_map_falls_back_to_whole_map(self, service):
+        table = service.user_preferences_table
+        table.update_item.side_effect = [
+            self._client_error("ValidationException"),
+            None,
+        ]
+        update = self._update(thaw_started_at={"a": "t1"})
+
+        service.save_notification_state(update)
+
+        assert table.update_item.call_count == 2
+        retry = table.update_item.call_args
+        assert retry.kwargs["UpdateExpression"] == (
+            "SET #ns.#thaw_started_at = :thaw_started_at"
+        )
+        assert retry.kwargs["ExpressionAttributeValues"] == {
+            ":thaw_started_at": {"a": "t1"}
+        }
+
+    def test_deleted_user_is_skipped(self, service):
+        table = service.user_preferences_table
+        table.update_item.side_effect = self._client_error(
+            "ConditionalCheckFailedException"
         )
+
+        # Should not raise
+        service.save_notification_state(self._update(last_notified={"a": "t1"}))
+
+        assert table.update_item.call_count == 1
+
+    def test_error_handled(self, service):
+        service.user_preferences_table.update_item.side_effect = Exception("DB error")
+
         # Should not raise
-        service._save_user_preferences(prefs)
+        service.save_notification_state(self._update(last_notified={"a": "t1"}))
 
 
 class TestProcessAllNotifications:
@@ -1361,6 +1605,70 @@ class TestProcessAllNotifications:
         assert service.user_preferences_table.scan.call_count == 2
         assert summary["errors"] == 0
 
+    def _user(self, user_id, favorites, **settings):
+        now = datetime.now(UTC).isoformat()
+        return {
+            "user_id": user_id,
+            "favorite_resorts": favorites,
+            "notification_settings": {
+                "notifications_enabled": True,
+                "fresh_snow_alerts": True,
+                "event_alerts": False,
+                "thaw_freeze_alerts": False,
+                "default_snow_threshold_cm": 5.0,
+                **settings,
+            },
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    def test_build_subscriber_index(self, service):
+        """Favorites are inverted per resort; disabled users are left out."""
+        users = [
+            UserPreferences(**self._user("u1", ["whistler", "revelstoke"])),
+            UserPreferences(**self._user("u2", ["whistler"])),
+            UserPreferences(
+                **self._user("u3", ["zermatt"], notifications_enabled=False)
+            ),
+        ]
+
+        index = service.build_subscriber_index(users)
+
+        assert list(index) == ["whistler", "revelstoke"]
+        assert [p.user_id for p in index["whistler"]] == ["u1", "u2"]
+
+    def test_process_all_fetches_each_resort_once(self, service):
+        """Shared resorts are queried once per run, not once per follower."""
+        service.user_preferences_table.scan.return_value = {
+            "Items": [
+                self._user("u1", ["whistler"], default_snow_threshold_cm=20.0),
+                self._user("u2", ["whistler", "revelstoke"]),
+                self._user("u3", ["whistler"], event_alerts=True),
+            ]
+        }
+        service.resorts_table.get_item.return_value = {"Item": {"name": "Resort"}}
+        service.weather_conditions_table.query.return_value = {
+            "Items": [{"snowfall_24h_cm": 10.0}]
+        }
+        service.resort_events_table.query.return_value = {"Items": []}
+        service.device_tokens_table.query.return_value = {"Items": []}
+
+        summary = service.process_all_notifications()
+
+        assert summary["users_processed"] == 3
+        assert service.weather_conditions_table.query.call_count == 2
+        assert service.resorts_table.get_item.call_count == 2
+        # Only whistler has a subscriber with event alerts
+        assert service.resort_events_table.query.call_count == 1
+        # Thresholds are still evaluated per subscriber: u1 wants 20cm
+        saved = {
+            c.kwargs["Key"]["user_id"]: _updated_entries(c)["last_notified"]
+            for c in service.user_preferences_table.update_item.call_args_list
+        }
+        assert "u1" not in saved
+        assert saved["u2"] == {"whistler:fresh_snow", "revelstoke:fresh_snow"}
+        assert saved["u3"] == {"whistler:fresh_snow"}
+
 
 class TestGetPowderConditions:
     """Tests for get_powder_conditions."""
@@ -2789,6 +3097,53 @@ class TestProcessWeeklyDigest:
         # User should be processed (weekly_summary=True from legacy prefs)
         assert summary["users_processed"] == 1
 
+    def test_rolls_up_each_resort_once_per_run(self, service):
+        """Shared favorites are queried once; powder days stay per user."""
+        now = datetime.now(UTC)
+
+        def user(user_id, powder_threshold):
+            return {
+                "user_id": user_id,
+                "favorite_resorts": ["whistler-blackcomb"],
+                "notification_settings": {
+                    "notifications_enabled": True,
+                    "weekly_summary": True,
+                    "powder_snow_threshold_cm": powder_threshold,
+                },
+                "created_at": now.isoformat(),
+                "updated_at": now.isoformat(),
+            }
+
+        service.user_preferences_table.scan.return_value = {
+            "Items": [user("user1", 15.0), user("user2", 5.0)]
+        }
+        service.resorts_table.get_item.return_value = {
+            "Item": {"resort_id": "whistler-blackcomb", "name": "Whistler Blackcomb"}
+        }
+        service.weather_conditions_table.query.side_effect = [
+            {
+                "Items": [
+                    {
+                        "timestamp": (now - timedelta(days=i)).isoformat(),
+                        "snowfall_24h_cm": 20.0 if i == 0 else 8.0,
+                    }
+                    for i in range(3)
+                ]
+            },
+            {"Items": [{"predicted_snow_72h_cm": 4.0}]},
+        ]
+
+        with patch.object(service, "deliver_notifications") as mock_deliver:
+            mock_deliver.return_value = {"sent": 2, "pruned_devices": 0}
+            summary = service.process_weekly_digest()
+
+        assert summary["users_processed"] == 2
+        assert service.weather_conditions_table.query.call_count == 2
+        assert service.resorts_table.get_item.call_count == 1
+        digests = dict(mock_deliver.call_args.args[0])
+        assert digests["user1"].data["total_powder_days"] == 1
+        assert digests["user2"].data["total_powder_days"] == 3
+
 
 class TestWeeklyDigestHandler:
     """Tests for the notification_processor handler with weekly digest events."""
@@ -2837,8 +3192,11 @@ class TestWeeklyDigestHandler:
         mock_service.process_weekly_digest.assert_called_once()
         mock_service.process_all_notifications.assert_not_called()
 
+    @patch("handlers.notification_processor.refresh_trip_conditions")
     @patch("handlers.notification_processor.get_notification_service")
-    def test_notification_handler_routes_regular_event(self, mock_get_service):
+    def test_notification_handler_routes_regular_event(
+        self, mock_get_service, mock_refresh_trips
+    ):
         """Test that notification_handler routes regular events correctly."""
         from handlers.notification_processor import notification_handler
 
@@ -2856,6 +3214,32 @@ class TestWeeklyDigestHandler:
         assert "Notification processing complete" in result["body"]["message"]
         mock_service.process_all_notifications.assert_called_once()
         mock_service.process_weekly_digest.assert_not_called()
+        mock_refresh_trips.assert_called_once()
+
+    @patch("handlers.notification_processor.refresh_trip_conditions")
+    @patch("handlers.notification_processor.get_notification_service")
+    def test_weekly_digest_skips_trip_refresh(
+        self, mock_get_service, mock_refresh_trips
+    ):
+        """The weekly digest does not refresh trips."""
+        from handlers.notification_processor import notification_handler
+
+        mock_get_service.return_value.process_weekly_digest.return_value = {}
+
+        notification_handler({"weekly_digest": True}, None)
+
+        mock_refresh_trips.assert_not_called()
+
+    @patch("handlers.notification_processor.get_trip_service")
+    def test_trip_refresh_failure_is_reported(self, mock_get_trip_service):
+        """A failing trip refresh is logged and summarized, not raised."""
+        from handlers.notification_processor import refresh_trip_conditions
+
+        mock_get_trip_service.return_value.refresh_upcoming_trip_conditions.side_effect = Exception(
+            "Boom"
+        )
+
+        assert refresh_trip_conditions() == {"error": "Boom"}
 
     @patch("handlers.notification_processor.get_notification_service")
     def test_weekly_digest_handler_standalone(self, mock_get_service):
@@ -2891,6 +3275,229 @@ class TestWeeklyDigestHandler:
         assert "Error" in result["body"]["message"]
 
 
+class TestSegmentedFanOut:
+    """Tests for parallel-scan segment fan-out of notification runs."""
+
+    def test_scan_user_preferences_segment_on_every_page(self):
+        """Segment/TotalSegments are passed on the first and paginated scans."""
+        table = MagicMock()
+        table.scan.side_effect = [
+            {"Items": [{"user_id": "u1"}], "LastEvaluatedKey": {"user_id": "u1"}},
+            {"Items": [{"user_id": "u2"}]},
+        ]
+        service = NotificationService(
+            device_tokens_table=MagicMock(),
+            user_preferences_table=table,
+            resort_events_table=MagicMock(),
+            weather_conditions_table=MagicMock(),
+            resorts_table=MagicMock(),
+            sns_client=MagicMock(),
+        )
+
+        users = service.scan_user_preferences(segment=2, total_segments=4)
+
+        assert [u["user_id"] for u in users] == ["u1", "u2"]
+        assert table.scan.call_args_list[0].kwargs == {
+            "Segment": 2,
+            "TotalSegments": 4,
+        }
+        assert table.scan.call_args_list[1].kwargs == {
+            "ExclusiveStartKey": {"user_id": "u1"},
+            "Segment": 2,
+            "TotalSegments": 4,
+        }
+
+    def test_merge_summaries_sums_counters(self):
+        merged = NotificationService.merge_summaries(
+            [
+                {"users_processed": 3, "notifications_sent": 2, "errors": 0},
+                {"users_processed": 4, "notifications_sent": 0, "errors": 1},
+            ]
+        )
+        assert merged == {"users_processed": 7, "notifications_sent": 2, "errors": 1}
+
+    @patch("handlers.notification_processor._build_notification_service")
+    def test_local_fan_out_runs_every_segment(self, mock_build):
+        from handlers.notification_processor import fan_out_segments
+
+        services = [MagicMock() for _ in range(3)]
+        for service in services:
+            service.process_all_notifications.return_value = {
+                "users_processed": 2,
+                "notifications_sent": 1,
+                "errors": 0,
+            }
+        mock_build.side_effect = services
+
+        summary = fan_out_segments({}, 3, "local")
+
+        segments = sorted(s.process_all_notifications.call_args.args for s in services)
+        assert segments == [(0, 3), (1, 3), (2, 3)]
+        assert summary["users_processed"] == 6
+        assert summary["notifications_sent"] == 3
+        assert summary["segments"] == 3
+        assert summary["failed_segments"] == 0
+
+    @patch("handlers.notification_processor._get_lambda_client")
+    def test_lambda_fan_out_counts_failed_segments(self, mock_client):
+        from handlers.notification_processor import fan_out_segments
+
+        def invoke(FunctionName, InvocationType, Payload):
+            event = json.loads(Payload)
+            assert event["weekly_digest"] is True
+            if event["segment"] == 1:
+                body = {"statusCode": 500, "body": {"message": "boom"}}
+            else:
+                summary = {"users_processed": 5, "digests_sent": 4, "errors": 0}
+                body = {"statusCode": 200, "body": {"summary": summary}}
+            return {"Payload": io.BytesIO(json.dumps(body).encode())}
+
+        mock_client.return_value.invoke.side_effect = invoke
+
+        summary = fan_out_segments({"weekly_digest": True}, 2, "lambda")
+
+        assert summary["users_processed"] == 5
+        assert summary["digests_sent"] == 4
+        assert summary["errors"] == 1
+        assert summary["failed_segments"] == 1
+
+    @patch("handlers.notification_processor.NOTIFICATION_SEGMENTS", 4)
+    @patch("handlers.notification_processor.refresh_trip_conditions")
+    @patch("handlers.notification_processor.fan_out_segments")
+    @patch("handlers.notification_processor.get_notification_service")
+    def test_worker_event_is_not_fanned_out_again(
+        self, mock_get_service, mock_fan, mock_refresh_trips
+    ):
+        from handlers.notification_processor import notification_handler
+
+        mock_get_service.return_value.process_all_notifications.return_value = {
+            "users_processed": 1,
+            "notifications_sent": 0,
+            "errors": 0,
+        }
+
+        notification_handler({"segment": 1, "total_segments": 4}, None)
+        mock_fan.assert_not_called()
+        mock_refresh_trips.assert_not_called()
+        mock_get_service.return_value.process_all_notifications.assert_called_once_with(
+            1, 4
+        )
+
+        mock_fan.return_value = {"users_processed": 0}
+        notification_handler({"source": "aws.events"}, None)
+        mock_fan.assert_called_once_with({"source": "aws.events"}, 4, "lambda")
+        # Trips are refreshed once by the coordinator, not by each segment
+        mock_refresh_trips.assert_called_once()
+
+
+class TestResortChangeAlerts:
+    """Tests for event-driven alerts on a single changed resort."""
+
+    @pytest.fixture
+    def service(self):
+        prefs_table = MagicMock()
+        prefs_table.name = "prefs"
+        return NotificationService(
+            device_tokens_table=MagicMock(),
+            user_preferences_table=prefs_table,
+            resort_events_table=MagicMock(),
+            weather_conditions_table=MagicMock(),
+            resorts_table=MagicMock(),
+            sns_client=MagicMock(),
+            resort_subscribers_table=MagicMock(),
+        )
+
+    def _user(self, user_id, favorites):
+        now = datetime.now(UTC).isoformat()
+        return {
+            "user_id": user_id,
+            "favorite_resorts": favorites,
+            "notification_settings": {
+                "notifications_enabled": True,
+                "fresh_snow_alerts": True,
+                "thaw_freeze_alerts": False,
+                "default_snow_threshold_cm": 5.0,
+            },
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    def _index(self, service, users):
+        service.resort_subscribers_table.query.return_value = {
+            "Items": [{"user_id": u["user_id"]} for u in users]
+        }
+        service.user_preferences_table.meta.client.batch_get_item.return_value = {
+            "Responses": {"prefs": users}
+        }
+
+    def test_get_resort_subscribers_drops_stale_entries(self, service):
+        """Index entries for users who unfavorited the resort are ignored."""
+        self._index(
+            service,
+            [self._user("u1", ["whistler"]), self._user("u2", ["revelstoke"])],
+        )
+
+        subscribers = service.get_resort_subscribers("whistler")
+
+        assert [p.user_id for p in subscribers] == ["u1"]
+        request = service.user_preferences_table.meta.client.batch_get_item.call_args
+        assert request.kwargs["RequestItems"]["prefs"]["Keys"] == [
+            {"user_id": "u1"},
+            {"user_id": "u2"},
+        ]
+
+    def test_process_resort_change_checks_only_that_resort(self, service):
+        """Only the changed resort is queried and evaluated."""
+        self._index(service, [self._user("u1", ["whistler", "revelstoke"])])
+        service.resorts_table.get_item.return_value = {"Item": {"name": "Whistler"}}
+        service.weather_conditions_table.query.return_value = {
+            "Items": [{"snowfall_24h_cm": 10.0}]
+        }
+        service.device_tokens_table.query.return_value = {"Items": []}
+
+        summary = service.process_resort_change("whistler")
+
+        assert summary["users_processed"] == 1
+        assert service.weather_conditions_table.query.call_count == 1
+        service.resort_events_table.query.assert_not_called()
+        call = service.user_preferences_table.update_item.call_args
+        assert _updated_entries(call)["last_notified"] == {"whistler:fresh_snow"}
+
+    def test_process_resort_change_without_index_is_a_no_op(self):
+        service = NotificationService(
+            device_tokens_table=MagicMock(),
+            user_preferences_table=MagicMock(),
+            resort_events_table=MagicMock(),
+            weather_conditions_table=MagicMock(),
+            resorts_table=MagicMock(),
+            sns_client=MagicMock(),
+        )
+
+        summary = service.process_resort_change("whistler")
+
+        assert summary["users_processed"] == 0
+        service.user_preferences_table.scan.assert_not_called()
+
+    @patch("handlers.notification_processor.NOTIFICATION_SEGMENTS", 4)
+    @patch("handlers.notification_processor.fan_out_segments")
+    @patch("handlers.notification_processor.get_notification_service")
+    def test_change_event_skips_scan(self, mock_get_service, mock_fan):
+        from handlers.notification_processor import notification_handler
+
+        service = mock_get_service.return_value
+        service.process_resort_change.return_value = {"users_processed": 2}
+
+        result = notification_handler(
+            {"resort_changed": {"resort_id": "whistler", "snowfall_24h_cm": 12.0}},
+            None,
+        )
+
+        assert result["statusCode"] == 200
+        service.process_resort_change.assert_called_once_with("whistler")
+        service.process_all_notifications.assert_not_called()
+        mock_fan.assert_not_called()
+
+
 class TestCheckForecastAlert:
     """Tests for check_forecast_alert."""
 
@@ -10,6 +10,7 @@ from services.openmeteo_service import (
     MAX_RETRIES,
     RETRYABLE_STATUS_CODES,
     OpenMeteoService,
+    _advance_freeze_state,
     _is_retryable_error,
     _request_with_retry,
 )
@@ -597,6 +598,80 @@ class TestProcessSnowfallFreezeThaw(unittest.TestCase):
         self.assertTrue(result["freeze_event_detected"])
 
 
+class TestProcessSnowfallFreezeState(unittest.TestCase):
+    """Resuming from a persisted freeze-thaw state matches a full rescan."""
+
+    LAG_HOURS = 5
+
+    def setUp(self):
+        self.service = OpenMeteoService()
+        # One timeline long enough to cover the current response and one
+        # fetched LAG_HOURS earlier; each response is a slice of it
+        self.timeline, self.ci = _build_hourly(
+            past_hours=336 + self.LAG_HOURS, default_temp=-5.0
+        )
+        temps = self.timeline["temperature_2m"]
+        snow = self.timeline["snowfall"]
+        # Freeze events (3h at +4C) 200h and 30h ago, snow before and after
+        for end in (200, 30):
+            for offset in (end + 2, end + 1, end):
+                temps[self.ci - offset] = 4.0
+        for offset, cm in ((250, 6.0), (100, 3.0), (20, 2.5), (4, 1.5), (2, 0.05)):
+            snow[self.ci - offset] = cm
+
+    def _response(self, hours_ago):
+        """Hourly block as Open-Meteo returned it `hours_ago` hours before now."""
+        end = self.ci - hours_ago
+        lo, hi = end - 336, end + 73
+        return {k: v[lo:hi] for k, v in self.timeline.items()}
+
+    def _process(self, hours_ago, freeze_state=None):
+        with patch("services.openmeteo_service.datetime") as mock_dt:
+            mock_dt.now.return_value = FIXED_NOW - timedelta(hours=hours_ago)
+            mock_dt.side_effect = lambda *a, **kw: datetime(*a, **kw)
+            return self.service._process_snowfall(
+                {}, self._response(hours_ago), freeze_state=freeze_state
+            )
+
+    def test_resumed_result_matches_full_scan(self):
+        earlier = self._process(self.LAG_HOURS)
+        resumed = self._process(0, freeze_state=earlier["freeze_state"])
+        full = self._process(0)
+
+        for key in (
+            "snowfall_after_freeze_cm",
+            "last_freeze_thaw_hours_ago",
+            "detected_freeze_date",
+            "hours_since_last_snowfall",
+        ):
+            self.assertEqual(resumed[key], full[key], key)
+        self.assertEqual(resumed["freeze_state"], full["freeze_state"])
+        self.assertAlmostEqual(full["snowfall_after_freeze_cm"], 4.05)
+        self.assertEqual(full["last_freeze_thaw_hours_ago"], 30.0)
+        self.assertEqual(full["hours_since_last_snowfall"], 4.0)
+
+    def test_resume_only_scans_new_hours(self):
+        earlier = self._process(self.LAG_HOURS)
+        with patch(
+            "services.openmeteo_service._advance_freeze_state",
+            wraps=_advance_freeze_state,
+        ) as advance:
+            self._process(0, freeze_state=earlier["freeze_state"])
+        start, end = advance.call_args[0][4:6]
+        self.assertEqual(end - start, self.LAG_HOURS)
+
+    def test_state_outside_window_falls_back_to_full_scan(self):
+        stale = dict(self._process(0)["freeze_state"], through="2025-12-01T00:00")
+        with patch(
+            "services.openmeteo_service._advance_freeze_state",
+            wraps=_advance_freeze_state,
+        ) as advance:
+            result = self._process(0, freeze_state=stale)
+        start, end = advance.call_args[0][4:6]
+        self.assertEqual(end - start, 336)
+        self.assertEqual(result["last_freeze_thaw_hours_ago"], 30.0)
+
+
 # ============================================================================
 # 9. _process_snowfall - currently_warming
 # ============================================================================
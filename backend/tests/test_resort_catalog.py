@@ -0,0 +1,135 @@
+"""Tests for the in-memory resort catalog."""
+
+import io
+import json
+import random
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services import resort_catalog
+from services.resort_catalog import ResortCatalog, get_resort_catalog
+from utils.geo_utils import haversine_distance
+
+
+def _resort(resort_id, name, lat=None, lon=None, **extra):
+    eps = []
+    if lat is not None:
+        eps.append({"level": "base", "latitude": lat, "longitude": lon})
+    return {
+        "resort_id": resort_id,
+        "name": name,
+        "country": extra.pop("country", "CA"),
+        "region": extra.pop("region", "na_west"),
+        "elevation_points": eps,
+        **extra,
+    }
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    resort_catalog._catalog_cache.update(catalog=None, expires=0.0)
+    yield
+    resort_catalog._catalog_cache.update(catalog=None, expires=0.0)
+
+
+class TestResortCatalog:
+    def test_get_and_conditions(self):
+        catalog = ResortCatalog(
+            [_resort("whistler", "Whistler")], {"whistler": {"snow_score": 80}}
+        )
+        assert len(catalog) == 1
+        assert catalog.get("whistler")["name"] == "Whistler"
+        assert catalog.get("missing") is None
+        assert catalog.conditions("whistler") == {"snow_score": 80}
+        assert catalog.conditions("missing") is None
+
+    def test_search_matches_name_region_and_country(self):
+        catalog = ResortCatalog(
+            [
+                _resort("whistler", "Whistler Blackcomb"),
+                _resort("zermatt", "Zermatt", country="CH", region="alps"),
+                _resort("niseko", "Niseko", country="JP", region="japan"),
+            ]
+        )
+        assert [r["resort_id"] for r in catalog.search("BLACK")] == ["whistler"]
+        assert [r["resort_id"] for r in catalog.search("alps")] == ["zermatt"]
+        assert [r["resort_id"] for r in catalog.search("jp")] == ["niseko"]
+        assert catalog.search("nothing") == []
+
+    def test_nearby_matches_brute_force(self):
+        rng = random.Random(7)
+        resorts = [
+            _resort(f"r{i}", f"R{i}", rng.uniform(-60, 70), rng.uniform(-180, 180))
+            for i in range(500)
+        ]
+        resorts.append(_resort("no-coords", "No Coords"))
+        catalog = ResortCatalog(resorts)
+
+        for lat, lon, radius in [(47.0, 10.0, 800), (60.0, -179.5, 1500), (0, 0, 50)]:
+            expected = sorted(
+                (haversine_distance(lat, lon, ep["latitude"], ep["longitude"]), r)
+                for r in resorts
+                for ep in r["elevation_points"][:1]
+                if haversine_distance(lat, lon, ep["latitude"], ep["longitude"])
+                <= radius
+            )
+            got = catalog.nearby(lat, lon, radius)
+            assert [r["resort_id"] for _, r in got] == [
+                r["resort_id"] for _, r in expected
+            ]
+
+
+class TestGetResortCatalog:
+    def _s3(self, resorts, quality=None):
+        files = {
+            "data/resorts.json": {"resorts": resorts},
+            "data/snow-quality.json": {"results": quality or {}},
+        }
+        s3 = MagicMock()
+        s3.get_object.side_effect = lambda Bucket, Key: {
+            "Body": io.BytesIO(json.dumps(files[Key]).encode())
+        }
+        return s3
+
+    def test_without_bucket_returns_none(self, monkeypatch):
+        monkeypatch.delenv("WEBSITE_BUCKET", raising=False)
+        assert get_resort_catalog() is None
+
+    def test_loads_once_per_ttl(self, monkeypatch):
+        monkeypatch.setenv("WEBSITE_BUCKET", "site")
+        s3 = self._s3([_resort("whistler", "Whistler")], {"whistler": {}})
+        with patch.object(resort_catalog, "_get_s3_client", return_value=s3):
+            first = get_resort_catalog()
+            second = get_resort_catalog()
+
+        assert first is second
+        assert first.get("whistler") is not None
+        assert first.conditions("whistler") == {}
+        assert s3.get_object.call_count == 2
+
+    def test_failed_refresh_keeps_previous_catalog(self, monkeypatch):
+        monkeypatch.setenv("WEBSITE_BUCKET", "site")
+        s3 = self._s3([_resort("whistler", "Whistler")])
+        with patch.object(resort_catalog, "_get_s3_client", return_value=s3):
+            first = get_resort_catalog()
+            resort_catalog._catalog_cache["expires"] = 0.0
+            s3.get_object.side_effect = Exception("S3 down")
+            assert get_resort_catalog() is first
+
+    def test_missing_snapshot_still_serves_resorts(self, monkeypatch):
+        monkeypatch.setenv("WEBSITE_BUCKET", "site")
+        s3 = self._s3([_resort("whistler", "Whistler")])
+        resorts_body = s3.get_object.side_effect
+
+        def get_object(Bucket, Key):
+            if Key == "data/snow-quality.json":
+                raise Exception("NoSuchKey")
+            return resorts_body(Bucket, Key)
+
+        s3.get_object.side_effect = get_object
+        with patch.object(resort_catalog, "_get_s3_client", return_value=s3):
+            catalog = get_resort_catalog()
+
+        assert catalog.get("whistler") is not None
+        assert catalog.conditions("whistler") is None
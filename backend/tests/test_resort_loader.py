@@ -504,6 +504,77 @@ class TestLoadResortsConvenience:
         assert resorts == []
 
 
+# ---------------------------------------------------------------------------
+# Tests – indexes, memoization and snapshots
+# ---------------------------------------------------------------------------
+
+
+class TestIndexesAndSnapshot:
+    """Indexed lookups, reused Resort objects and the pickled snapshot."""
+
+    def test_resorts_transformed_once(self, loader: ResortLoader):
+        """Repeated lookups reuse the same Resort objects."""
+        with patch.object(
+            loader, "_transform_resort", wraps=loader._transform_resort
+        ) as transform:
+            first = loader.get_resort_by_id("zermatt")
+            assert loader.get_resort_by_id("zermatt") is first
+            assert loader.get_resorts(region="alps")[1] is first
+            assert loader.get_resorts_by_country("CH") == [first]
+        assert transform.call_count == 2
+
+    def test_duplicate_id_returns_first(self, tmp_path: Path):
+        """get_resort_by_id returns the first entry with a given ID."""
+        data = {**SAMPLE_DATA, "resorts": [*SAMPLE_DATA["resorts"]]}
+        data["resorts"].append({**SAMPLE_DATA["resorts"][0], "name": "Duplicate"})
+        file = tmp_path / "resorts.json"
+        file.write_text(json.dumps(data), encoding="utf-8")
+
+        resort = ResortLoader(data_file=file).get_resort_by_id("chamonix")
+
+        assert resort.name == "Chamonix Mont-Blanc"
+
+    def test_snapshot_round_trip(self, tmp_json: Path, tmp_path: Path):
+        """A loader with a matching snapshot skips parsing and transforming."""
+        snapshot = tmp_path / "resorts.snapshot.pickle"
+        ResortLoader(data_file=tmp_json).write_snapshot(snapshot)
+
+        loader = ResortLoader(data_file=tmp_json, snapshot_file=snapshot)
+        with (
+            patch("utils.resort_loader.json.loads") as loads,
+            patch.object(loader, "_transform_resort") as transform,
+        ):
+            resorts = loader.get_resorts()
+        loads.assert_not_called()
+        transform.assert_not_called()
+
+        expected = ResortLoader(data_file=tmp_json, snapshot_file=None).get_resorts()
+        assert [r.resort_id for r in resorts] == [r.resort_id for r in expected]
+        assert resorts[0].elevation_points == expected[0].elevation_points
+        assert resorts[0].created_at
+        assert resorts[0].created_at == resorts[0].updated_at
+
+    def test_stale_snapshot_ignored(self, tmp_json: Path, tmp_path: Path):
+        """A snapshot of an older resorts.json is not used."""
+        snapshot = tmp_path / "resorts.snapshot.pickle"
+        ResortLoader(data_file=tmp_json).write_snapshot(snapshot)
+        data = {**SAMPLE_DATA, "resorts": SAMPLE_DATA["resorts"][:1]}
+        tmp_json.write_text(json.dumps(data), encoding="utf-8")
+
+        loader = ResortLoader(data_file=tmp_json, snapshot_file=snapshot)
+
+        assert [r.resort_id for r in loader.get_resorts()] == ["chamonix"]
+
+    def test_unreadable_snapshot_ignored(self, tmp_json: Path, tmp_path: Path):
+        """A corrupt snapshot falls back to the JSON file."""
+        snapshot = tmp_path / "resorts.snapshot.pickle"
+        snapshot.write_bytes(b"not a pickle")
+
+        loader = ResortLoader(data_file=tmp_json, snapshot_file=snapshot)
+
+        assert len(loader.get_resorts()) == 3
+
+
 # ---------------------------------------------------------------------------
 # Tests – real data file (integration-style)
 # ---------------------------------------------------------------------------
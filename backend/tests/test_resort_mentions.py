@@ -0,0 +1,77 @@
+"""Tests for the resort mention detector."""
+
+import random
+import re
+
+from services.chat_service import RESORT_ALIASES
+from utils.resort_mentions import ResortMentionDetector
+
+RESORTS = [
+    ("revelstoke", "Revelstoke Mountain Resort"),
+    ("big-white", "Big White Ski Resort"),
+    ("mt-baker", "Mt. Baker"),
+    ("alta", "Alta"),
+    ("sun-peaks", "Sun Peaks"),
+]
+
+
+def _reference(message: str, aliases: dict, resorts: list) -> set[str]:
+    """The per-pattern regex matching the detector replaced."""
+    message_lower = message.lower()
+    detected = set()
+    for alias, resort_id in aliases.items():
+        if re.search(r"\b" + re.escape(alias) + r"\b", message_lower):
+            detected.add(resort_id)
+    if detected:
+        return detected
+    for resort_id, name in resorts:
+        name_lower = name.lower()
+        if len(name_lower) >= 4:
+            if name_lower in message_lower:
+                detected.add(resort_id)
+                continue
+            first_word = name_lower.split()[0]
+            if len(first_word) >= 5 and re.search(
+                r"\b" + re.escape(first_word) + r"\b", message_lower
+            ):
+                detected.add(resort_id)
+    return detected
+
+
+class TestResortMentionDetector:
+    def test_alias_word_boundaries(self):
+        detector = ResortMentionDetector(RESORT_ALIASES)
+        assert detector.find("WHISTLER or Vail?") == ["whistler-blackcomb", "vail"]
+        assert detector.find("I was prevailed upon to ski") == []
+
+    def test_overlapping_aliases_all_reported(self):
+        detector = ResortMentionDetector(
+            {"squaw": "palisades-tahoe", "squaw valley": "sv", "valley": "v"}
+        )
+        assert detector.find("squaw valley") == ["palisades-tahoe", "sv", "v"]
+
+    def test_names_only_when_no_alias_matches(self):
+        detector = ResortMentionDetector({"whistler": "whistler-blackcomb"}, RESORTS)
+        assert detector.find("Revelstoke or Whistler?") == ["whistler-blackcomb"]
+        assert detector.find("Revelstoke or Mt. Baker?") == ["revelstoke", "mt-baker"]
+
+    def test_name_rules(self):
+        detector = ResortMentionDetector({}, RESORTS)
+        # Full names match anywhere; short names (< 4 chars) are skipped
+        assert detector.find("the sun peaks area") == ["sun-peaks"]
+        assert detector.find("basaltaa") == ["alta"]
+        # First words need 5+ characters and word boundaries
+        assert detector.find("big day") == []
+        assert detector.find("revelstokes") == []
+
+    def test_matches_reference_on_random_messages(self):
+        rng = random.Random(3)
+        vocab = [*RESORT_ALIASES, *(n.lower() for _, n in RESORTS)]
+        vocab += ["the", "snow", "at", "x", "prevail", "-", ".", "ski", "ed"]
+        detector = ResortMentionDetector(RESORT_ALIASES, RESORTS)
+        for _ in range(300):
+            words = rng.choices(vocab, k=rng.randint(1, 8))
+            message = rng.choice(["", " "]).join(words)
+            assert set(detector.find(message)) == _reference(
+                message, RESORT_ALIASES, RESORTS
+            ), message
@@ -1,7 +1,7 @@
 """Tests for service layer functionality."""
 
 from datetime import UTC, datetime, timedelta, timezone
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from botocore.exceptions import ClientError
@@ -757,6 +757,112 @@ class TestGetConditionsForResort:
         assert result[0].elevation_level == "mid"
 
 
+class TestGetAllLatestConditions:
+    """Tests for WeatherService.get_all_latest_conditions wire-format reads."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        from utils.cache import clear_all_caches
+
+        clear_all_caches()
+        yield
+        clear_all_caches()
+
+    @pytest.fixture
+    def client(self):
+        client = Mock()
+        client.query.return_value = {"Items": []}
+        return client
+
+    @pytest.fixture
+    def service(self, client):
+        table = Mock()
+        table.name = "conditions"
+        svc = WeatherService(api_key="test", conditions_table=table)
+        svc._client = client
+        return svc
+
+    def _make_item(self, resort_id, elevation, timestamp, temp="-5.5"):
+        return {
+            "resort_id": {"S": resort_id},
+            "elevation_level": {"S": elevation},
+            "timestamp": {"S": timestamp},
+            "current_temp_celsius": {"N": temp},
+            "min_temp_celsius": {"N": "-8"},
+            "max_temp_celsius": {"N": "0"},
+            "snowfall_24h_cm": {"N": "12.5"},
+            "snow_quality": {"S": "good"},
+            "currently_warming": {"BOOL": False},
+            "data_source": {"S": "open-meteo.com"},
+            "source_confidence": {"S": "high"},
+        }
+
+    def test_decodes_latest_per_resort_and_elevation(self, service, client):
+        """Wire-format items are decoded, keeping the newest per elevation."""
+        items = {
+            "top": [
+                self._make_item("whistler", "top", "2026-01-01T02:00", "-6.5"),
+                self._make_item("whistler", "top", "2026-01-01T01:00", "-1"),
+                self._make_item("vail", "top", "2026-01-01T02:00"),
+            ],
+            "mid": [self._make_item("whistler", "mid", "2026-01-01T02:00")],
+            "base": [],
+        }
+        client.query.side_effect = lambda **kw: {
+            "Items": items[kw["ExpressionAttributeValues"][":level"]["S"]]
+        }
+
+        result = service.get_all_latest_conditions()
+
+        assert set(result) == {"whistler", "vail"}
+        top = next(c for c in result["whistler"] if c.elevation_level == "top")
+        assert top.current_temp_celsius == -6.5
+        assert top.snowfall_24h_cm == 12.5
+        assert top.snow_quality == "good"
+        assert len(result["whistler"]) == 2
+
+    def test_queries_gsi_with_wire_format_values(self, service, client):
+        """Queries go to the ElevationIndex GSI with typed attribute values."""
+        service.get_all_latest_conditions()
+
+        assert client.query.call_count == 3
+        kwargs = client.query.call_args.kwargs
+        assert kwargs["TableName"] == "conditions"
+        assert kwargs["IndexName"] == "ElevationIndex"
+        assert set(kwargs["ExpressionAttributeValues"][":cutoff"]) == {"S"}
+        assert "raw_data" not in kwargs["ProjectionExpression"]
+
+    def test_follows_pagination(self, service, client):
+        """LastEvaluatedKey is passed back as ExclusiveStartKey."""
+        last_key = {"resort_id": {"S": "a"}}
+        client.query.side_effect = [
+            {"Items": [], "LastEvaluatedKey": last_key},
+            {"Items": []},
+            {"Items": []},
+            {"Items": []},
+        ]
+
+        service.get_all_latest_conditions()
+
+        assert client.query.call_count == 4
+        assert any(
+            c.kwargs.get("ExclusiveStartKey") == last_key
+            for c in client.query.call_args_list
+        )
+
+    def test_incomplete_items_skipped(self, service, client):
+        """Items missing required fields are dropped."""
+        item = self._make_item("whistler", "top", "2026-01-01T02:00")
+        del item["data_source"]
+        client.query.side_effect = lambda **kw: {
+            "Items": [item]
+            if kw["ExpressionAttributeValues"][":level"]["S"] == "top"
+            else []
+        }
+
+        assert service.get_all_latest_conditions() == {}
+
+
 class TestUserService:
     """Test cases for UserService."""
 
@@ -845,6 +951,52 @@ class TestUserService:
         with pytest.raises(Exception, match="Failed to save user preferences"):
             user_service.save_user_preferences(sample_user_preferences)
 
+    def test_save_user_preferences_syncs_resort_subscribers(
+        self, mock_table, sample_user_preferences
+    ):
+        """Favorites are indexed and removed favorites are dropped."""
+        index_table = MagicMock()
+        batch = index_table.batch_writer.return_value.__enter__.return_value
+        mock_table.put_item.return_value = {
+            "Attributes": {"favorite_resorts": ["big-white", "whistler"]}
+        }
+        service = UserService(mock_table, resort_subscribers_table=index_table)
+
+        service.save_user_preferences(sample_user_preferences)
+
+        assert mock_table.put_item.call_args.kwargs["ReturnValues"] == "ALL_OLD"
+        batch.delete_item.assert_called_once_with(
+            Key={"resort_id": "whistler", "user_id": "apple_user_123"}
+        )
+        put = sorted(c.kwargs["Item"]["resort_id"] for c in batch.put_item.mock_calls)
+        assert put == ["big-white", "lake-louise"]
+
+    def test_save_user_preferences_survives_index_failure(
+        self, mock_table, sample_user_preferences
+    ):
+        """The preferences save succeeds even if the index write fails."""
+        index_table = MagicMock()
+        index_table.batch_writer.side_effect = Exception("index down")
+        service = UserService(mock_table, resort_subscribers_table=index_table)
+
+        saved = service.save_user_preferences(sample_user_preferences)
+
+        assert saved.user_id == "apple_user_123"
+
+    def test_delete_user_data_removes_resort_subscribers(self, mock_table):
+        index_table = MagicMock()
+        batch = index_table.batch_writer.return_value.__enter__.return_value
+        mock_table.delete_item.return_value = {
+            "Attributes": {"favorite_resorts": ["big-white"]}
+        }
+        service = UserService(mock_table, resort_subscribers_table=index_table)
+
+        service.delete_user_data("test_user_123")
+
+        batch.delete_item.assert_called_once_with(
+            Key={"resort_id": "big-white", "user_id": "test_user_123"}
+        )
+
     def test_delete_user_data_success(self, user_service, mock_table):
         """Test successful deletion of user data (preferences table only)."""
         result = user_service.delete_user_data("test_user_123")
@@ -168,6 +168,30 @@ class TestSnowSummaryService:
         assert "last_snowfall_24h_cm" in item
         assert item["last_snowfall_24h_cm"] == Decimal("0.0")
 
+    def test_update_summary_stores_freeze_state(self, service, mock_table):
+        """Freeze-thaw state is stored as Decimals and read back as floats."""
+        freeze_state = {
+            "through": "2026-02-01T09:00",
+            "runs": [0, 2, 2, 2],
+            "last_ice_event": "2026-01-30T14:00",
+            "snow_since_ice_cm": 7.25,
+            "last_snow_hour": "2026-02-01T03:00",
+        }
+        service.update_summary(
+            resort_id="big-white",
+            elevation_level="mid",
+            last_freeze_date=None,
+            snowfall_since_freeze_cm=7.25,
+            total_season_snowfall_cm=100.0,
+            last_updated="2026-02-01T10:00:00+00:00",
+            freeze_state=freeze_state,
+        )
+
+        item = mock_table.put_item.call_args[1]["Item"]
+        assert item["freeze_state"]["runs"] == [Decimal(n) for n in (0, 2, 2, 2)]
+        assert item["freeze_state"]["snow_since_ice_cm"] == Decimal("7.25")
+        assert service._convert_decimals(item)["freeze_state"] == freeze_state
+
     def test_update_summary_dynamo_error(self, service, mock_table):
         """Test update_summary returns False on DynamoDB ClientError."""
         mock_table.put_item.side_effect = ClientError(
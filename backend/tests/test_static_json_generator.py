@@ -6,6 +6,7 @@ from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 import pytest
+from boto3.dynamodb.types import TypeSerializer
 
 from models.resort import ElevationLevel, ElevationPoint, Resort
 from models.weather import ConfidenceLevel, SnowQuality, WeatherCondition
@@ -13,6 +14,19 @@ from services.static_json_generator import StaticJsonGenerator
 from utils.cache import clear_all_caches
 
 
+def _wire_client(query):
+    """Low-level client mock serving a table mock's query in wire format."""
+    serializer = TypeSerializer()
+    client = MagicMock()
+    client.query = lambda **kwargs: {
+        "Items": [
+            {key: serializer.serialize(value) for key, value in item.items()}
+            for item in query(**kwargs)["Items"]
+        ]
+    }
+    return client
+
+
 class TestStaticJsonGenerator:
     """Tests for the StaticJsonGenerator class."""
 
@@ -170,6 +184,7 @@ class TestStaticJsonGenerator:
             "snow_quality": "excellent",
             "source_confidence": "high",
             "snowfall_after_freeze_cm": Decimal("25.0"),
+            "wind_speed_kmh": Decimal("15.0"),
             "data_source": "open-meteo",
         }
 
@@ -198,7 +213,11 @@ class TestStaticJsonGenerator:
             website_bucket="test-bucket",
         )
 
-        generator._generate_snow_quality_json()
+        with patch(
+            "services.weather_service.boto3.client",
+            return_value=_wire_client(mock_query),
+        ):
+            generator._generate_snow_quality_json()
 
         # Verify S3 upload was called
         assert mock_s3.put_object.called
@@ -211,6 +230,7 @@ class TestStaticJsonGenerator:
         assert "results" in data
         assert "whistler-blackcomb" in data["results"]
         assert data["results"]["whistler-blackcomb"]["overall_quality"] == "excellent"
+        assert data["results"]["whistler-blackcomb"]["wind_speed_kmh"] == 15.0
 
     def test_snow_quality_horrible_makes_resort_not_skiable(
         self, mock_dynamodb, mock_s3
@@ -302,7 +322,11 @@ class TestStaticJsonGenerator:
             website_bucket="test-bucket",
         )
 
-        generator._generate_snow_quality_json()
+        with patch(
+            "services.weather_service.boto3.client",
+            return_value=_wire_client(mock_query),
+        ):
+            generator._generate_snow_quality_json()
 
         # Check the uploaded JSON content
         call_args = mock_s3.put_object.call_args
@@ -353,3 +377,314 @@ class TestStaticJsonGenerator:
         call_args = mock_s3.put_object.call_args
         assert call_args.kwargs["ContentType"] == "application/json"
         assert call_args.kwargs["CacheControl"] == "public, max-age=3600"
+
+    def test_generate_all_scans_resorts_once(self, mock_dynamodb, mock_s3):
+        """Both files are built from a single resorts scan."""
+        generator = StaticJsonGenerator(
+            resorts_table_name="test-resorts",
+            weather_conditions_table_name="test-conditions",
+            website_bucket="test-bucket",
+        )
+        generator.resort_service = MagicMock()
+        generator.resort_service.get_all_resorts.return_value = []
+        generator.weather_service = MagicMock()
+        generator.weather_service.get_all_latest_conditions.return_value = {}
+
+        result = generator.generate_all()
+
+        generator.resort_service.get_all_resorts.assert_called_once()
+        assert result["success"] is True
+        assert "shards" in result
+
+
+class TestPublishShards:
+    """Tests for sharded, delta-published static JSON."""
+
+    @pytest.fixture
+    def mock_s3(self):
+        with patch("services.static_json_generator.s3_client") as mock_s3:
+            yield mock_s3
+
+    @pytest.fixture
+    def generator(self, mock_s3):
+        with patch("services.static_json_generator.dynamodb"):
+            return StaticJsonGenerator(
+                resorts_table_name="test-resorts",
+                weather_conditions_table_name="test-conditions",
+                website_bucket="test-bucket",
+            )
+
+    RESORTS = [
+        {"resort_id": "zermatt", "region": "alps", "name": "Zermatt"},
+        {"resort_id": "verbier", "region": "alps", "name": "Verbier"},
+        {"resort_id": "niseko", "region": "japan", "name": "Niseko"},
+    ]
+
+    @staticmethod
+    def _quality(**overrides):
+        quality = {
+            r["resort_id"]: {"resort_id": r["resort_id"], "overall_quality": "good"}
+            for r in TestPublishShards.RESORTS
+        }
+        for resort_id, value in overrides.items():
+            quality[resort_id] = {"resort_id": resort_id, "overall_quality": value}
+        return quality
+
+    @staticmethod
+    def _uploads(mock_s3):
+        return {
+            c.kwargs["Key"]: (json.loads(c.kwargs["Body"]), c.kwargs["CacheControl"])
+            for c in mock_s3.put_object.call_args_list
+        }
+
+    @staticmethod
+    def _no_previous_state(mock_s3):
+        from botocore.exceptions import ClientError
+
+        mock_s3.get_object.side_effect = ClientError(
+            {"Error": {"Code": "NoSuchKey", "Message": ""}}, "GetObject"
+        )
+
+    @staticmethod
+    def _previous_state(mock_s3, uploads):
+        body = MagicMock()
+        body.read.return_value = json.dumps(
+            uploads["data/shards/hashes.json"][0]
+        ).encode("utf-8")
+        mock_s3.get_object.return_value = {"Body": body}
+        mock_s3.get_object.side_effect = None
+        mock_s3.put_object.reset_mock()
+
+    def test_first_run_publishes_all_shards_and_manifest(self, generator, mock_s3):
+        self._no_previous_state(mock_s3)
+
+        result = generator._publish_shards(self.RESORTS, self._quality())
+
+        uploads = self._uploads(mock_s3)
+        assert set(uploads) == {
+            "data/shards/resorts/zermatt.json",
+            "data/shards/resorts/verbier.json",
+            "data/shards/resorts/niseko.json",
+            "data/shards/regions/alps.json",
+            "data/shards/regions/japan.json",
+            "data/shards/hashes.json",
+            "data/manifest.json",
+        }
+        # Manifest goes last so readers never see a version before its files
+        assert mock_s3.put_object.call_args.kwargs["Key"] == "data/manifest.json"
+        manifest, cache_control = uploads["data/manifest.json"]
+        assert cache_control == "public, max-age=60"
+        assert manifest["version"] == result["version"]
+        assert manifest["delta"] is None
+        assert manifest["regions"]["alps"]["count"] == 2
+        assert uploads["data/shards/resorts/niseko.json"][0] == {
+            "resort": self.RESORTS[2],
+            "snow_quality": self._quality()["niseko"],
+        }
+
+    def test_unchanged_run_uploads_nothing(self, generator, mock_s3):
+        self._no_previous_state(mock_s3)
+        first = generator._publish_shards(self.RESORTS, self._quality())
+        self._previous_state(mock_s3, self._uploads(mock_s3))
+
+        result = generator._publish_shards(self.RESORTS, self._quality())
+
+        assert result == {
+            "version": first["version"],
+            "changed": False,
+            "uploaded": 0,
+        }
+        mock_s3.put_object.assert_not_called()
+
+    def test_changed_run_uploads_only_affected_shards_and_delta(
+        self, generator, mock_s3
+    ):
+        self._no_previous_state(mock_s3)
+        first = generator._publish_shards(self.RESORTS, self._quality())
+        self._previous_state(mock_s3, self._uploads(mock_s3))
+
+        result = generator._publish_shards(self.RESORTS, self._quality(niseko="poor"))
+
+        uploads = self._uploads(mock_s3)
+        delta_key = f"data/deltas/{first['version']}-{result['version']}.json"
+        assert set(uploads) == {
+            "data/shards/resorts/niseko.json",
+            "data/shards/regions/japan.json",
+            delta_key,
+            "data/shards/hashes.json",
+            "data/manifest.json",
+        }
+        delta, cache_control = uploads[delta_key]
+        assert "immutable" in cache_control
+        assert delta["resorts"] == []
+        assert delta["snow_quality"] == {
+            "niseko": {"resort_id": "niseko", "overall_quality": "poor"}
+        }
+        manifest = uploads["data/manifest.json"][0]
+        assert manifest["delta"] == {"from_version": first["version"], "key": delta_key}
+        assert result["snow_quality_changed"] == 1
+
+    def test_removed_resort_and_region_shards_deleted(self, generator, mock_s3):
+        self._no_previous_state(mock_s3)
+        generator._publish_shards(self.RESORTS, self._quality())
+        self._previous_state(mock_s3, self._uploads(mock_s3))
+
+        generator._publish_shards(self.RESORTS[:2], self._quality())
+
+        mock_s3.delete_objects.assert_called_once_with(
+            Bucket="test-bucket",
+            Delete={
+                "Objects": [
+                    {"Key": "data/shards/resorts/niseko.json"},
+                    {"Key": "data/shards/regions/japan.json"},
+                ]
+            },
+        )
+
+    def test_unreadable_previous_state_republishes(self, generator, mock_s3):
+        mock_s3.get_object.side_effect = Exception("timeout")
+
+        result = generator._publish_shards(self.RESORTS, self._quality())
+
+        assert result["changed"] is True
+        assert result["previous_version"] is None
+        assert result["uploaded"] == 5
+
+
+class TestGenerateFromChunks:
+    """Tests for building static JSON from weather worker chunk summaries."""
+
+    RUN = "20260101T000000Z"
+
+    @pytest.fixture
+    def bucket(self):
+        """Fake bucket: key -> JSON object, served through the mocked client."""
+        objects = {}
+        with (
+            patch("services.static_json_generator.s3_client") as mock_s3,
+            patch("services.static_json_generator.dynamodb"),
+        ):
+
+            def get_object(Bucket, Key):
+                body = MagicMock()
+                body.read.return_value = json.dumps(objects[Key]).encode("utf-8")
+                return {"Body": body}
+
+            def put_object(Bucket, Key, Body, **kwargs):
+                objects[Key] = json.loads(Body)
+
+            mock_s3.get_object.side_effect = get_object
+            mock_s3.put_object.side_effect = put_object
+            mock_s3.get_paginator.return_value.paginate.side_effect = (
+                lambda Bucket, Prefix: [
+                    {"Contents": [{"Key": k} for k in objects if k.startswith(Prefix)]}
+                ]
+            )
+            yield objects, mock_s3
+
+    @pytest.fixture
+    def generator(self, bucket):
+        generator = StaticJsonGenerator(
+            resorts_table_name="test-resorts",
+            weather_conditions_table_name="test-conditions",
+            website_bucket="test-bucket",
+        )
+        generator.resort_service = MagicMock()
+        generator.weather_service = MagicMock()
+        return generator
+
+    @staticmethod
+    def _resort(resort_id, name):
+        return {
+            "resort_id": resort_id,
+            "name": name,
+            "country": "CH",
+            "region": "alps",
+            "timezone": "Europe/Zurich",
+            "elevation_points": [],
+        }
+
+    def _add_chunk(self, objects, chunk, resorts, quality, resort_ids=None):
+        objects[f"static-chunks/{self.RUN}/{chunk}.json"] = {
+            "run_id": self.RUN,
+            "chunk": chunk,
+            "resort_ids": resort_ids or [r["resort_id"] for r in resorts],
+            "resorts": resorts,
+            "snow_quality": quality,
+        }
+
+    def test_merges_chunks_without_dynamodb(self, generator, bucket):
+        objects, _ = bucket
+        self._add_chunk(
+            objects,
+            "alps_chunk0",
+            [self._resort("zermatt", "Zermatt")],
+            {"zermatt": {"resort_id": "zermatt", "overall_quality": "good"}},
+        )
+        self._add_chunk(
+            objects,
+            "alps_chunk1",
+            [self._resort("verbier", "Verbier")],
+            {"verbier": {"resort_id": "verbier", "overall_quality": "fair"}},
+        )
+
+        result = generator.generate_from_chunks(self.RUN, chunk_count=2)
+
+        assert result["success"] is True
+        assert result["chunks"] == 2
+        generator.resort_service.get_all_resorts.assert_not_called()
+        generator.weather_service.get_all_latest_conditions.assert_not_called()
+        resorts = objects["data/resorts.json"]["resorts"]
+        assert [r["resort_id"] for r in resorts] == ["verbier", "zermatt"]
+        assert set(objects["data/snow-quality.json"]["results"]) == {
+            "verbier",
+            "zermatt",
+        }
+        assert "data/manifest.json" in objects
+        assert f"static-chunks/{self.RUN}/_published" in objects
+
+    def test_missing_summary_backfilled_from_dynamodb(self, generator, bucket):
+        objects, _ = bucket
+        self._add_chunk(objects, "alps", [self._resort("zermatt", "Zermatt")], {})
+        generator.weather_service.get_latest_conditions_all_elevations.return_value = []
+
+        result = generator.generate_from_chunks(self.RUN, chunk_count=1)
+
+        assert result["success"] is True
+        generator.weather_service.get_latest_conditions_all_elevations.assert_called_once_with(
+            "zermatt"
+        )
+        quality = objects["data/snow-quality.json"]["results"]["zermatt"]
+        assert quality["overall_quality"] == "unknown"
+
+    def test_missing_chunk_falls_back_to_full_generation(self, generator, bucket):
+        objects, _ = bucket
+        self._add_chunk(objects, "alps", [self._resort("zermatt", "Zermatt")], {})
+
+        with patch.object(generator, "generate_all", return_value={"ok": 1}) as full:
+            assert generator.generate_from_chunks(self.RUN, chunk_count=2) == {"ok": 1}
+        full.assert_called_once()
+
+    def test_missing_resort_falls_back_to_full_generation(self, generator, bucket):
+        objects, _ = bucket
+        self._add_chunk(
+            objects,
+            "alps",
+            [self._resort("zermatt", "Zermatt")],
+            {},
+            resort_ids=["zermatt", "verbier"],
+        )
+
+        with patch.object(generator, "generate_all", return_value={"ok": 1}) as full:
+            assert generator.generate_from_chunks(self.RUN, chunk_count=1) == {"ok": 1}
+        full.assert_called_once()
+
+    def test_already_published_run_skipped(self, generator, bucket):
+        objects, mock_s3 = bucket
+        self._add_chunk(objects, "alps", [self._resort("zermatt", "Zermatt")], {})
+        objects[f"static-chunks/{self.RUN}/_published"] = {}
+
+        result = generator.generate_from_chunks(self.RUN, chunk_count=1)
+
+        assert result["skipped"] is True
+        mock_s3.put_object.assert_not_called()
@@ -0,0 +1,151 @@
+"""Tests for the sharded, versioned static JSON layout."""
+
+from services.static_shards import (
+    apply_resorts_delta,
+    apply_snow_quality_delta,
+    build_delta,
+    build_region_shards,
+    changed_resorts,
+    content_hash,
+    delta_key,
+    region_slug,
+    resort_hashes,
+)
+
+
+def _resort(resort_id, region="alps", name=None):
+    return {"resort_id": resort_id, "region": region, "name": name or resort_id}
+
+
+def _summary(resort_id, quality="good"):
+    return {"resort_id": resort_id, "overall_quality": quality}
+
+
+class TestContentHash:
+    def test_independent_of_key_order(self):
+        assert content_hash({"a": 1, "b": 2}) == content_hash({"b": 2, "a": 1})
+
+    def test_changes_with_content(self):
+        assert content_hash({"a": 1}) != content_hash({"a": 2})
+        assert len(content_hash({"a": 1})) == 16
+
+
+class TestRegionSlug:
+    def test_slugifies(self):
+        assert region_slug("British Columbia") == "british-columbia"
+        assert region_slug("na_west") == "na-west"
+
+    def test_missing_region(self):
+        assert region_slug(None) == "other"
+        assert region_slug("  ") == "other"
+
+
+class TestBuildRegionShards:
+    def test_groups_resorts_and_quality_by_region(self):
+        resorts = [_resort("a"), _resort("b", "japan"), _resort("c")]
+        quality = {"a": _summary("a"), "b": _summary("b")}
+
+        shards = build_region_shards(resorts, quality)
+
+        assert set(shards) == {"alps", "japan"}
+        assert [r["resort_id"] for r in shards["alps"]["resorts"]] == ["a", "c"]
+        assert shards["alps"]["snow_quality"] == {"a": _summary("a")}
+        assert shards["japan"]["snow_quality"] == {"b": _summary("b")}
+
+
+class TestChangedResorts:
+    def test_detects_metadata_quality_and_removal(self):
+        resorts = [_resort("a"), _resort("b")]
+        previous = resort_hashes(
+            [*resorts, _resort("gone")], {"a": _summary("a"), "b": _summary("b")}
+        )
+        current = resort_hashes(
+            [_resort("a", name="Renamed"), _resort("b"), _resort("new")],
+            {"a": _summary("a"), "b": _summary("b", "poor"), "new": _summary("new")},
+        )
+
+        metadata, quality, removed = changed_resorts(previous, current)
+
+        assert metadata == {"a", "new"}
+        assert quality == {"b", "new"}
+        assert removed == {"gone"}
+
+    def test_dropped_summary_is_a_quality_change(self):
+        resorts = [_resort("a"), _resort("b")]
+        previous = resort_hashes(resorts, {"a": _summary("a"), "b": _summary("b")})
+        current = resort_hashes(resorts, {"a": _summary("a")})
+
+        assert changed_resorts(previous, current) == (set(), {"b"}, set())
+
+    def test_resort_without_summary_unchanged(self):
+        hashes = resort_hashes([_resort("a")], {})
+
+        assert changed_resorts(hashes, hashes) == (set(), set(), set())
+
+    def test_no_previous_state_everything_changed(self):
+        current = resort_hashes([_resort("a")], {"a": _summary("a")})
+
+        assert changed_resorts({}, current) == ({"a"}, {"a"}, set())
+
+
+class TestDeltas:
+    def test_delta_round_trip(self):
+        old_resorts = [_resort("a"), _resort("b"), _resort("gone")]
+        old_quality = {r["resort_id"]: _summary(r["resort_id"]) for r in old_resorts}
+        new_resorts = [_resort("a", name="Renamed"), _resort("b"), _resort("new")]
+        new_quality = {
+            "a": _summary("a"),
+            "b": _summary("b", "poor"),
+            "new": _summary("new"),
+        }
+        metadata, quality, removed = changed_resorts(
+            resort_hashes(old_resorts, old_quality),
+            resort_hashes(new_resorts, new_quality),
+        )
+
+        delta = build_delta(
+            "v1", "v2", "now", new_resorts, new_quality, metadata, quality, removed
+        )
+
+        assert delta["from_version"] == "v1"
+        assert [r["resort_id"] for r in delta["resorts"]] == ["a", "new"]
+        assert set(delta["snow_quality"]) == {"b", "new"}
+        assert delta["removed"] == ["gone"]
+        assert apply_resorts_delta(old_resorts, delta) == new_resorts
+        assert apply_snow_quality_delta(old_quality, delta) == new_quality
+
+    def test_dropped_summary_round_trip(self):
+        resorts = [_resort("a"), _resort("b")]
+        old_quality = {"a": _summary("a"), "b": _summary("b")}
+        new_quality = {"a": _summary("a")}
+        metadata, quality, removed = changed_resorts(
+            resort_hashes(resorts, old_quality), resort_hashes(resorts, new_quality)
+        )
+
+        delta = build_delta(
+            "v1", "v2", "now", resorts, new_quality, metadata, quality, removed
+        )
+
+        assert delta["snow_quality"] == {}
+        assert delta["snow_quality_removed"] == ["b"]
+        assert delta["removed"] == []
+        assert apply_snow_quality_delta(old_quality, delta) == new_quality
+        assert apply_resorts_delta(resorts, delta) == resorts
+
+    def test_apply_does_not_mutate_input(self):
+        resorts = [_resort("a")]
+        quality = {"a": _summary("a")}
+        delta = {
+            "resorts": [_resort("a", name="X")],
+            "snow_quality": {"a": _summary("a", "poor")},
+            "removed": [],
+        }
+
+        apply_resorts_delta(resorts, delta)
+        apply_snow_quality_delta(quality, delta)
+
+        assert resorts == [_resort("a")]
+        assert quality == {"a": _summary("a")}
+
+    def test_delta_key_names_both_versions(self):
+        assert delta_key("v1", "v2") == "data/deltas/v1-v2.json"
@@ -0,0 +1,92 @@
+"""Tests for the data-versioned chat tool result cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services import tool_result_cache as cache_module
+from services.tool_result_cache import ToolResultCache
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    monkeypatch.setenv("WEBSITE_BUCKET", "site")
+    client = MagicMock()
+    client.head_object.return_value = {"ETag": '"v1"'}
+    with patch.object(cache_module, "_get_s3_client", return_value=client):
+        yield client
+
+
+@pytest.fixture
+def cache():
+    return ToolResultCache()
+
+
+def _counting_tool(result=None):
+    run = MagicMock(return_value=result if result is not None else {"ok": True})
+    return run
+
+
+class TestToolResultCache:
+    def test_no_bucket_means_no_caching(self, cache, monkeypatch):
+        monkeypatch.delenv("WEBSITE_BUCKET", raising=False)
+        run = _counting_tool()
+        cache.get_or_run("get_resort_conditions", {"resort_id": "a"}, run)
+        cache.get_or_run("get_resort_conditions", {"resort_id": "a"}, run)
+        assert run.call_count == 2
+
+    def test_repeated_call_is_served_from_cache(self, cache, s3):
+        run = _counting_tool()
+        first = cache.get_or_run("get_snow_history", {"resort_id": "a", "days": 7}, run)
+        second = cache.get_or_run(
+            "get_snow_history", {"days": 7, "resort_id": "a"}, run
+        )
+        assert run.call_count == 1
+        assert first == second == {"ok": True}
+        # Callers get their own copy
+        second["ok"] = False
+        assert cache.get_or_run("get_snow_history", {"resort_id": "a", "days": 7}, run)[
+            "ok"
+        ]
+
+    def test_different_inputs_are_separate_entries(self, cache, s3):
+        run = _counting_tool()
+        cache.get_or_run("get_resort_conditions", {"resort_id": "a"}, run)
+        cache.get_or_run("get_resort_conditions", {"resort_id": "b"}, run)
+        assert run.call_count == 2
+
+    def test_new_data_version_evicts(self, cache, s3):
+        run = _counting_tool()
+        cache.get_or_run("get_best_conditions", {}, run)
+        s3.head_object.return_value = {"ETag": '"v2"'}
+        with patch.object(cache_module, "DATA_VERSION_CHECK_SECONDS", 0):
+            cache.get_or_run("get_best_conditions", {}, run)
+            cache.get_or_run("get_best_conditions", {}, run)
+        assert run.call_count == 2
+
+    def test_version_checked_at_most_once_a_minute(self, cache, s3):
+        run = _counting_tool()
+        for _ in range(5):
+            cache.get_or_run("get_best_conditions", {}, run)
+        assert s3.head_object.call_count == 1
+
+    def test_failed_version_check_keeps_last_version(self, cache, s3):
+        run = _counting_tool()
+        cache.get_or_run("get_best_conditions", {}, run)
+        s3.head_object.side_effect = Exception("S3 down")
+        with patch.object(cache_module, "DATA_VERSION_CHECK_SECONDS", 0):
+            cache.get_or_run("get_best_conditions", {}, run)
+        assert run.call_count == 1
+
+    def test_errors_are_not_cached(self, cache, s3):
+        run = _counting_tool({"error": "No conditions for 'a'"})
+        cache.get_or_run("get_resort_conditions", {"resort_id": "a"}, run)
+        cache.get_or_run("get_resort_conditions", {"resort_id": "a"}, run)
+        assert run.call_count == 2
+
+    def test_non_data_tools_are_not_cached(self, cache, s3):
+        run = _counting_tool()
+        cache.get_or_run("get_condition_reports", {"resort_id": "a"}, run)
+        cache.get_or_run("get_condition_reports", {"resort_id": "a"}, run)
+        assert run.call_count == 2
+        s3.head_object.assert_not_called()
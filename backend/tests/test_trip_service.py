@@ -1,7 +1,7 @@
 """Tests for TripService."""
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from botocore.exceptions import ClientError
@@ -493,9 +493,105 @@ class TestTripService:
         self, trip_service, mock_table, sample_trip_data
     ):
         """Test retrieving trips for alert processing."""
-        mock_table.scan.return_value = {"Items": [sample_trip_data]}
+        mock_table.query.side_effect = [
+            {"Items": [sample_trip_data], "LastEvaluatedKey": {"trip_id": "t1"}},
+            {"Items": [{**sample_trip_data, "trip_id": "test-trip-789"}]},
+        ]
 
         trips = trip_service.get_upcoming_trips_for_alerts(days_ahead=14)
 
-        assert len(trips) == 1
-        mock_table.scan.assert_called_once()
+        assert [t.trip_id for t in trips] == ["test-trip-123", "test-trip-789"]
+        mock_table.scan.assert_not_called()
+        first, second = mock_table.query.call_args_list
+        assert first.kwargs["IndexName"] == "StatusStartDateIndex"
+        assert first.kwargs["ExpressionAttributeValues"][":planned"] == "planned"
+        assert second.kwargs["ExclusiveStartKey"] == {"trip_id": "t1"}
+
+    def test_refresh_upcoming_trip_conditions_fetches_each_resort_once(
+        self, trip_service, mock_table, mock_weather_service, sample_trip_data
+    ):
+        """Trips at the same resort share one conditions fetch."""
+        warm = {**sample_trip_data["latest_conditions"], "temperature_celsius": 5.0}
+        mock_table.query.return_value = {
+            "Items": [
+                sample_trip_data,
+                {**sample_trip_data, "trip_id": "trip-2", "latest_conditions": warm},
+                {**sample_trip_data, "trip_id": "trip-3", "resort_id": "whistler"},
+            ]
+        }
+
+        stats = trip_service.refresh_upcoming_trip_conditions()
+
+        assert stats["trips"] == 3
+        assert stats["resorts"] == 2
+        assert mock_weather_service.get_conditions_for_resort.call_count == 2
+        mock_table.put_item.assert_not_called()
+
+    def test_refresh_writes_only_changed_fields_conditionally(
+        self, trip_service, mock_table, mock_weather_service, sample_trip_data
+    ):
+        """A refresh sets the snapshot, new alerts and updated_at, nothing else."""
+        sample_trip_data["latest_conditions"]["fresh_snow_cm"] = 0.0
+        mock_table.query.return_value = {"Items": [sample_trip_data]}
+
+        stats = trip_service.refresh_upcoming_trip_conditions()
+
+        assert stats["updated"] == 1
+        assert stats["alerts"] == 1
+        kwargs = mock_table.update_item.call_args.kwargs
+        assert kwargs["Key"] == {"trip_id": "test-trip-123", "user_id": "test-user-456"}
+        assert "notes" not in kwargs["UpdateExpression"]
+        assert "list_append" in kwargs["UpdateExpression"]
+        values = kwargs["ExpressionAttributeValues"]
+        assert values[":read_updated_at"] == "2026-01-20T08:00:00Z"
+        assert values[":planned"] == "planned"
+        assert [a["alert_type"] for a in values[":alerts"]] == ["powder_alert"]
+        assert "updated_at = :read_updated_at" in kwargs["ConditionExpression"]
+
+    def test_refresh_skips_unchanged_snapshot(
+        self, trip_service, mock_table, mock_weather_service, sample_trip_data
+    ):
+        """No write when only the snapshot timestamp would change."""
+        new = trip_service._create_conditions_snapshot("big-white")
+        sample_trip_data["latest_conditions"] = {
+            **new.model_dump(),
+            "timestamp": "2026-01-01T00:00:00Z",
+        }
+        mock_table.query.return_value = {"Items": [sample_trip_data]}
+
+        stats = trip_service.refresh_upcoming_trip_conditions()
+
+        assert stats["unchanged"] == 1
+        assert stats["updated"] == 0
+        mock_table.update_item.assert_not_called()
+
+    def test_refresh_leaves_trip_edited_since_read(
+        self, trip_service, mock_table, mock_weather_service, sample_trip_data
+    ):
+        """A trip edited after the index read is not overwritten."""
+        sample_trip_data["latest_conditions"]["fresh_snow_cm"] = 0.0
+        mock_table.query.return_value = {"Items": [sample_trip_data]}
+        mock_table.update_item.side_effect = ClientError(
+            {"Error": {"Code": "ConditionalCheckFailedException", "Message": ""}},
+            "UpdateItem",
+        )
+
+        stats = trip_service.refresh_upcoming_trip_conditions()
+
+        assert stats["conflicts"] == 1
+        assert stats["updated"] == 0
+        assert stats["alerts"] == 0
+        mock_table.put_item.assert_not_called()
+
+    def test_update_trip_conditions_saves_alerts_with_snapshot(
+        self, trip_service, mock_table, mock_weather_service, sample_trip_data
+    ):
+        """Alerts raised by a refresh are part of the single saved item."""
+        sample_trip_data["latest_conditions"]["fresh_snow_cm"] = 0.0
+        mock_table.get_item.return_value = {"Item": sample_trip_data}
+
+        trip_service.update_trip_conditions("test-trip-123", "test-user-456")
+
+        mock_table.put_item.assert_called_once()
+        saved = mock_table.put_item.call_args.kwargs["Item"]
+        assert [a["alert_type"] for a in saved["alerts"]] == ["powder_alert"]
@@ -991,6 +991,32 @@ class TestOrchestrateParallelProcessing:
         assert body["workers_failed"] == 0
         assert body["total_resorts"] == 1
 
+    def test_payload_carries_static_json_run(self):
+        """Workers get the run ID and chunk count for static JSON chunks."""
+        from handlers.weather_processor import orchestrate_parallel_processing
+
+        resorts = [
+            _make_resort(resort_id="whistler", region="na_west"),
+            _make_resort(resort_id="chamonix", region="alps"),
+        ]
+
+        with (
+            patch(f"{self.MODULE}.dynamodb"),
+            patch(f"{self.MODULE}.ResortService") as mock_rs_cls,
+            patch(f"{self.MODULE}.lambda_client") as mock_lc,
+            patch(f"{self.MODULE}.ENABLE_STATIC_JSON", True),
+        ):
+            mock_rs_cls.return_value.get_all_resorts.return_value = resorts
+            mock_lc.invoke.return_value = {"StatusCode": 202}
+
+            orchestrate_parallel_processing(_make_lambda_context(300000))
+
+        payloads = [
+            json.loads(c.kwargs["Payload"]) for c in mock_lc.invoke.call_args_list
+        ]
+        assert {p["chunk_count"] for p in payloads} == {2}
+        assert len({p["run_id"] for p in payloads}) == 1
+
     def test_success_multiple_regions(self):
         from handlers.weather_processor import orchestrate_parallel_processing
 
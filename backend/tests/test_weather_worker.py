@@ -927,8 +927,38 @@ class TestProcessElevationPoint:
             longitude=-118.9,
             elevation_meters=1800,
             last_known_freeze_date="2026-02-15",
+            freeze_state=None,
         )
 
+    def test_freeze_state_resumed_and_persisted(self):
+        """Freeze-thaw state round-trips from the summary through Open-Meteo."""
+        from handlers.weather_worker import process_elevation_point
+
+        previous_state = {"through": "2026-02-15T10:00", "runs": [0, 0, 0, 0]}
+        new_state = {"through": "2026-02-15T11:00", "runs": [0, 0, 0, 0]}
+        weather_data = _make_weather_data()
+        weather_data["freeze_state"] = new_state
+        summary = _default_summary()
+        summary["freeze_state"] = previous_state
+        ws, sqs, table, sss = _setup_services(
+            weather_data=weather_data, existing_summary=summary
+        )
+
+        process_elevation_point(
+            elevation_point=_make_elevation_point_dict("mid"),
+            resort_id="big-white",
+            weather_service=ws,
+            snow_quality_service=sqs,
+            weather_conditions_table=table,
+            scraper=None,
+            scraped_data=None,
+            snow_summary_service=sss,
+        )
+
+        kwargs = ws.get_current_weather.call_args[1]
+        assert kwargs["freeze_state"] == previous_state
+        assert sss.update_summary.call_args[1]["freeze_state"] == new_state
+
     def test_elevation_passed_to_quality_service(self):
         """Snow quality service should receive elevation_m for ML model."""
         from handlers.weather_worker import process_elevation_point
@@ -1769,6 +1799,78 @@ class TestWeatherWorkerHandler:
         body = json.loads(result["body"])
         assert "Processed 1 resorts" in body["message"]
 
+    def test_emits_change_event_when_snowfall_rises(self):
+        """Resorts whose 24h snowfall rose trigger an async notification event."""
+        from handlers.weather_worker import weather_worker_handler
+
+        fresh = _make_resort_data(
+            "big-white", elevation_points=[_make_elevation_point_dict("mid")]
+        )
+        quiet = _make_resort_data(
+            "quiet", elevation_points=[_make_elevation_point_dict("mid")]
+        )
+
+        def process(point, resort_id, *args):
+            snow = 12.0 if resort_id == "big-white" else 3.0
+            return {
+                "success": True,
+                "error": None,
+                "level": "mid",
+                "snowfall_24h_cm": snow,
+                "previous_snowfall_24h_cm": 3.0,
+            }
+
+        with (
+            patch(f"{MODULE}.dynamodb") as mock_ddb,
+            patch(f"{MODULE}.OpenMeteoService"),
+            patch(f"{MODULE}.SnowQualityService"),
+            patch(f"{MODULE}.SnowSummaryService"),
+            patch(f"{MODULE}.OnTheSnowScraper"),
+            patch(f"{MODULE}.ENABLE_SCRAPING", False),
+            patch(f"{MODULE}.INTER_RESORT_DELAY", 0.0),
+            patch(f"{MODULE}.RESORTS_TABLE", TABLE_NAME),
+            patch(f"{MODULE}.NOTIFICATION_PROCESSOR_LAMBDA", "notifier"),
+            patch(f"{MODULE}.process_elevation_point", side_effect=process),
+            patch(f"{MODULE}._get_lambda_client") as mock_client,
+        ):
+            mock_ddb.meta.client.batch_get_item.return_value = {
+                "Responses": {TABLE_NAME: [fresh, quiet]}
+            }
+            mock_client.return_value.invoke.return_value = {"StatusCode": 202}
+
+            event = {"resort_ids": ["big-white", "quiet"], "region": "na_west"}
+            result = weather_worker_handler(event, _make_lambda_context())
+
+        invoke = mock_client.return_value.invoke
+        invoke.assert_called_once()
+        assert invoke.call_args.kwargs["InvocationType"] == "Event"
+        assert json.loads(invoke.call_args.kwargs["Payload"]) == {
+            "resort_changed": {
+                "resort_id": "big-white",
+                "snowfall_24h_cm": 12.0,
+                "previous_snowfall_24h_cm": 3.0,
+            }
+        }
+        assert json.loads(result["body"])["stats"]["change_events"] == 1
+
+    def test_build_resort_change_uses_highest_elevation_values(self):
+        from handlers.weather_worker import build_resort_change
+
+        results = [
+            {"success": True, "snowfall_24h_cm": 8.0, "previous_snowfall_24h_cm": 2.0},
+            {"success": True, "snowfall_24h_cm": 4.0},
+            {"success": False, "error": "timeout"},
+        ]
+
+        change = build_resort_change("big-white", results)
+
+        assert change == {
+            "resort_id": "big-white",
+            "snowfall_24h_cm": 8.0,
+            "previous_snowfall_24h_cm": 2.0,
+        }
+        assert build_resort_change("big-white", results[2:]) is None
+
 
 # ---------------------------------------------------------------------------
 # Tests for _archive_raw_data_to_s3
@@ -2061,3 +2163,146 @@ class TestWorkerRawDataCollection:
 
             # Handler should still return 200
             assert result["statusCode"] == 200
+
+
+# ---------------------------------------------------------------------------
+# Tests for static JSON chunk publishing
+# ---------------------------------------------------------------------------
+
+
+class TestStaticJsonChunk:
+    """Workers upload per-chunk summaries; the last one triggers generation."""
+
+    def _listing(self, count):
+        return {
+            "Contents": [
+                {"Key": f"static-chunks/run-1/chunk{i}.json"} for i in range(count)
+            ]
+        }
+
+    def test_last_chunk_triggers_generation(self):
+        from handlers.weather_worker import publish_static_chunk
+
+        with (
+            patch(f"{MODULE}.s3_client") as mock_s3,
+            patch(f"{MODULE}.WEBSITE_BUCKET", "test-bucket"),
+            patch(f"{MODULE}.STATIC_JSON_LAMBDA", "static-json"),
+            patch(f"{MODULE}._get_lambda_client") as mock_client,
+        ):
+            mock_s3.list_objects_v2.return_value = self._listing(2)
+
+            triggered = publish_static_chunk(
+                "run-1", "alps", ["a"], [{"resort_id": "a"}], {"a": {}}, 2
+            )
+
+        assert triggered is True
+        put = mock_s3.put_object.call_args.kwargs
+        assert put["Key"] == "static-chunks/run-1/alps.json"
+        assert json.loads(put["Body"]) == {
+            "run_id": "run-1",
+            "chunk": "alps",
+            "resort_ids": ["a"],
+            "resorts": [{"resort_id": "a"}],
+            "snow_quality": {"a": {}},
+        }
+        invoke = mock_client.return_value.invoke.call_args.kwargs
+        assert invoke["FunctionName"] == "static-json"
+        assert invoke["InvocationType"] == "Event"
+        assert json.loads(invoke["Payload"]) == {"run_id": "run-1", "chunk_count": 2}
+
+    def test_earlier_chunk_does_not_trigger(self):
+        from handlers.weather_worker import publish_static_chunk
+
+        with (
+            patch(f"{MODULE}.s3_client") as mock_s3,
+            patch(f"{MODULE}.WEBSITE_BUCKET", "test-bucket"),
+            patch(f"{MODULE}.STATIC_JSON_LAMBDA", "static-json"),
+            patch(f"{MODULE}._get_lambda_client") as mock_client,
+        ):
+            mock_s3.list_objects_v2.return_value = self._listing(1)
+
+            assert publish_static_chunk("run-1", "alps", [], [], {}, 2) is False
+
+        mock_s3.put_object.assert_called_once()
+        mock_client.return_value.invoke.assert_not_called()
+
+    def test_handler_uploads_chunk_with_summaries(self):
+        from handlers.weather_worker import weather_worker_handler
+
+        mid = _make_elevation_point_dict("mid")
+        mid["elevation_feet"] = 5906
+        resort = _make_resort_data("big-white", elevation_points=[mid])
+        resort.update(
+            {"country": "CA", "region": "na_west", "timezone": "America/Vancouver"}
+        )
+        condition = _make_condition()
+        condition.quality_score = 4.5
+
+        with (
+            patch(f"{MODULE}.dynamodb") as mock_ddb,
+            patch(f"{MODULE}.OpenMeteoService"),
+            patch(f"{MODULE}.SnowQualityService"),
+            patch(f"{MODULE}.SnowSummaryService"),
+            patch(f"{MODULE}.OnTheSnowScraper"),
+            patch(f"{MODULE}.ENABLE_SCRAPING", False),
+            patch(f"{MODULE}.INTER_RESORT_DELAY", 0.0),
+            patch(f"{MODULE}.RESORTS_TABLE", TABLE_NAME),
+            patch(f"{MODULE}.WEBSITE_BUCKET", "test-bucket"),
+            patch(f"{MODULE}.process_elevation_point") as mock_pep,
+            patch(f"{MODULE}.publish_static_chunk", return_value=True) as mock_pub,
+        ):
+            mock_ddb.meta.client.batch_get_item.return_value = {
+                "Responses": {TABLE_NAME: [resort]}
+            }
+            mock_pep.return_value = {
+                "success": True,
+                "error": None,
+                "level": "mid",
+                "weather_condition": condition,
+            }
+
+            event = {
+                "resort_ids": ["big-white"],
+                "region": "na_west",
+                "run_id": "run-1",
+                "chunk_count": 3,
+            }
+            result = weather_worker_handler(event, _make_lambda_context())
+
+        run_id, chunk, resort_ids, resorts, quality, chunk_count = (
+            mock_pub.call_args.args
+        )
+        assert (run_id, chunk, resort_ids, chunk_count) == (
+            "run-1",
+            "na_west",
+            ["big-white"],
+            3,
+        )
+        assert [r["resort_id"] for r in resorts] == ["big-white"]
+        assert quality["big-white"]["resort_id"] == "big-white"
+        assert quality["big-white"]["snow_score"] is not None
+        assert json.loads(result["body"])["stats"]["static_json_triggered"] is True
+
+    def test_handler_without_run_id_skips_chunk(self):
+        from handlers.weather_worker import weather_worker_handler
+
+        with (
+            patch(f"{MODULE}.dynamodb") as mock_ddb,
+            patch(f"{MODULE}.OpenMeteoService"),
+            patch(f"{MODULE}.SnowQualityService"),
+            patch(f"{MODULE}.SnowSummaryService"),
+            patch(f"{MODULE}.OnTheSnowScraper"),
+            patch(f"{MODULE}.ENABLE_SCRAPING", False),
+            patch(f"{MODULE}.INTER_RESORT_DELAY", 0.0),
+            patch(f"{MODULE}.RESORTS_TABLE", TABLE_NAME),
+            patch(f"{MODULE}.WEBSITE_BUCKET", "test-bucket"),
+            patch(f"{MODULE}.publish_static_chunk") as mock_pub,
+        ):
+            mock_ddb.meta.client.batch_get_item.return_value = {"Responses": {}}
+
+            weather_worker_handler(
+                {"resort_ids": ["big-white"], "region": "na_west"},
+                _make_lambda_context(),
+            )
+
+        mock_pub.assert_not_called()
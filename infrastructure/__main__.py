@@ -353,6 +353,35 @@ notifications_table = aws.dynamodb.Table(
     tags=tags,
 )
 
+# Resort -> subscriber index of users' favorite resorts, maintained on every
+# preferences write; lets event-driven alerts find a resort's followers
+# without scanning the user preferences table
+resort_subscribers_table = aws.dynamodb.Table(
+    f"{app_name}-resort-subscribers-{environment}",
+    name=f"{app_name}-resort-subscribers-{environment}",
+    billing_mode="PAY_PER_REQUEST",
+    hash_key="resort_id",
+    range_key="user_id",
+    attributes=[
+        {"name": "resort_id", "type": "S"},
+        {"name": "user_id", "type": "S"},
+    ],
+    tags=tags,
+)
+
+# Trips table for ski trip planning. It predates this stack: every
+# environment's API has always used the manually created
+# snow-tracker-trips-dev table (the API's TRIPS_TABLE default), so it is
+# referenced by name rather than created here, which would fail in dev and
+# hand prod an empty table. backend/scripts/migrate_trips_table.py adds the
+# UserIdIndex and StatusStartDateIndex GSIs the API queries; run it before
+# deploying a backend that uses them.
+trips_table_name = config.get("tripsTableName") or f"{app_name}-trips-dev"
+trips_table_arn = (
+    f"arn:aws:dynamodb:{aws_region}:{caller_identity.account_id}"
+    f":table/{trips_table_name}"
+)
+
 # IAM Role for Lambda functions
 lambda_role = aws.iam.Role(
     f"{app_name}-lambda-role-{environment}",
@@ -392,6 +421,8 @@ lambda_policy = aws.iam.RolePolicy(
         chat_rate_limit_table.arn,
         chat_suggestions_table.arn,
         notifications_table.arn,
+        resort_subscribers_table.arn,
+        trips_table_arn,
     ).apply(
         lambda arns: f"""{{
         "Version": "2012-10-17",
@@ -431,6 +462,8 @@ lambda_policy = aws.iam.RolePolicy(
                     "{arns[10]}",
                     "{arns[11]}",
                     "{arns[12]}",
+                    "{arns[13]}",
+                    "{arns[14]}",
                     "{arns[0]}/index/*",
                     "{arns[1]}/index/*",
                     "{arns[2]}/index/*",
@@ -443,7 +476,9 @@ lambda_policy = aws.iam.RolePolicy(
                     "{arns[9]}/index/*",
                     "{arns[10]}/index/*",
                     "{arns[11]}/index/*",
-                    "{arns[12]}/index/*"
+                    "{arns[12]}/index/*",
+                    "{arns[13]}/index/*",
+                    "{arns[14]}/index/*"
                 ]
             }},
             {{
@@ -474,11 +509,18 @@ lambda_policy = aws.iam.RolePolicy(
                     "arn:aws:s3:::snow-tracker-pulumi-state-us-west-2",
                     "arn:aws:s3:::snow-tracker-pulumi-state-us-west-2/scraper-results/*",
                     "arn:aws:s3:::snow-tracker-pulumi-state-us-west-2/resort-versions/*",
+                    "arn:aws:s3:::snow-tracker-pulumi-state-us-west-2/ml-models/*",
                     "arn:aws:s3:::{website_bucket_name}",
                     "arn:aws:s3:::{website_bucket_name}/data/*",
-                    "arn:aws:s3:::{website_bucket_name}/raw-data/*"
+                    "arn:aws:s3:::{website_bucket_name}/raw-data/*",
+                    "arn:aws:s3:::{website_bucket_name}/static-chunks/*"
                 ]
             }},
+            {{
+                "Effect": "Allow",
+                "Action": "s3:DeleteObject",
+                "Resource": "arn:aws:s3:::{website_bucket_name}/data/shards/*"
+            }},
             {{
                 "Effect": "Allow",
                 "Action": [
@@ -628,6 +670,18 @@ weather_worker_lambda = aws.lambda_.Function(
             "WEATHERKIT_PRIVATE_KEY": config.get_secret("weatherKitPrivateKey")
             or config.get_secret("apnsPrivateKey")
             or "",
+            # ML model registry (s3://<bucket>/ml-models/manifest.json); empty
+            # uses the weights bundled in the package
+            "ML_MODEL_BUCKET": config.get("mlModelBucket") or "",
+            "ML_SHADOW_SCORING": config.get("mlShadowScoring") or "true",
+            # Event-driven alerts: invoke the notification processor when a
+            # resort's 24h snowfall rises (empty disables)
+            "NOTIFICATION_PROCESSOR_LAMBDA": f"{app_name}-notification-processor-{environment}"
+            if (config.get("eventDrivenAlerts") or "true") == "true"
+            else "",
+            # The last worker of a run builds static JSON from the workers'
+            # chunk summaries (empty leaves it to the scheduled run)
+            "STATIC_JSON_LAMBDA": f"{app_name}-static-json-{environment}",
         }
     ),
     tags=tags,
@@ -699,8 +753,9 @@ static_json_lambda = aws.lambda_.Function(
     opts=pulumi.ResourceOptions(depends_on=[lambda_role, static_json_log_group]),
 )
 
-# Schedule static JSON generation 15 minutes after weather processor
-# This gives enough time for all parallel workers to complete
+# Schedule static JSON generation 15 minutes after weather processor.
+# Parallel runs normally publish as soon as the last worker finishes; this
+# full regeneration is the backstop if a worker fails.
 static_json_schedule_rule = aws.cloudwatch.EventRule(
     f"{app_name}-static-json-schedule-{environment}",
     name=f"{app_name}-static-json-schedule-{environment}",
@@ -1104,7 +1159,14 @@ notification_processor_lambda = aws.lambda_.Function(
             "RESORT_EVENTS_TABLE": f"{app_name}-resort-events-{environment}",
             "RESORTS_TABLE": f"{app_name}-resorts-{environment}",
             "NOTIFICATIONS_TABLE": f"{app_name}-notifications-{environment}",
+            "RESORT_SUBSCRIBERS_TABLE": f"{app_name}-resort-subscribers-{environment}",
+            # The hourly run refreshes upcoming trips' conditions and alerts
+            "TRIPS_TABLE": trips_table_name,
             "AWS_REGION_NAME": aws_region,
+            # Parallel-scan segments; >1 makes the scheduled run a coordinator
+            # that invokes this function once per segment
+            "NOTIFICATION_SEGMENTS": config.get("notificationSegments") or "1",
+            "NOTIFICATION_WORKER_LAMBDA": f"{app_name}-notification-processor-{environment}",
             # APNs platform ARN is optional - notifications will be skipped if not configured
             "APNS_PLATFORM_APP_ARN": apns_platform_app_arn
             if apns_platform_app_arn
@@ -1368,6 +1430,8 @@ def get_conditions(resort_id, headers):
             "DAILY_HISTORY_TABLE": f"{app_name}-daily-history-{environment}",
             "CHAT_SUGGESTIONS_TABLE": f"{app_name}-chat-suggestions-{environment}",
             "NOTIFICATIONS_TABLE": f"{app_name}-notifications-{environment}",
+            "RESORT_SUBSCRIBERS_TABLE": f"{app_name}-resort-subscribers-{environment}",
+            "TRIPS_TABLE": trips_table_name,
             "APNS_PLATFORM_APP_ARN": apns_platform_app_arn
             if apns_platform_app_arn
             else "",
@@ -1416,6 +1480,7 @@ chat_stream_lambda = aws.lambda_.Function(
             "ENVIRONMENT": environment,
             "CHAT_TABLE_NAME": f"{app_name}-chat-{environment}",
             "RESULTS_BUCKET": "snow-tracker-pulumi-state-us-west-2",
+            "WEBSITE_BUCKET": website_bucket_name,
             "AWS_REGION_NAME": aws_region,
             "AWS_LAMBDA_EXEC_WRAPPER": "/opt/bootstrap",
             "AWS_LWA_INVOKE_MODE": "response_stream",
@@ -3443,6 +3508,35 @@ website_bucket_website = aws.s3.BucketWebsiteConfigurationV2(
     ),
 )
 
+# Static JSON deltas are only useful to readers one version behind, and
+# worker chunk summaries only until their run is published
+website_bucket_lifecycle = aws.s3.BucketLifecycleConfigurationV2(
+    f"{app_name}-website-lifecycle-{environment}",
+    bucket=website_bucket.id,
+    rules=[
+        aws.s3.BucketLifecycleConfigurationV2RuleArgs(
+            id="expire-static-json-chunks",
+            status="Enabled",
+            filter=aws.s3.BucketLifecycleConfigurationV2RuleFilterArgs(
+                prefix="static-chunks/",
+            ),
+            expiration=aws.s3.BucketLifecycleConfigurationV2RuleExpirationArgs(
+                days=1,
+            ),
+        ),
+        aws.s3.BucketLifecycleConfigurationV2RuleArgs(
+            id="expire-static-json-deltas",
+            status="Enabled",
+            filter=aws.s3.BucketLifecycleConfigurationV2RuleFilterArgs(
+                prefix="data/deltas/",
+            ),
+            expiration=aws.s3.BucketLifecycleConfigurationV2RuleExpirationArgs(
+                days=3,
+            ),
+        )
+    ],
+)
+
 # CloudFront Origin Access Control
 website_oac = aws.cloudfront.OriginAccessControl(
     f"{app_name}-website-oac-{environment}",
@@ -17,7 +17,7 @@ import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-import aiohttp
+from weather_cache import WeatherCache, fetch_many
 
 OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
 RESORTS_FILE = Path(__file__).parent.parent / "backend" / "data" / "resorts.json"
@@ -327,120 +327,102 @@ def compute_features_for_day(
     }
 
 
-async def fetch_resort_data(
-    session: aiohttp.ClientSession,
-    resort: dict,
-    semaphore: asyncio.Semaphore,
-) -> list[dict]:
-    """Fetch hourly data from Open-Meteo for a resort and compute features."""
-    async with semaphore:
-        resort_id = resort["resort_id"]
-        lat = resort["latitude"]
-        lon = resort["longitude"]
-        elev_top = resort["elevation_top_m"]
-
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "elevation": elev_top,
-            "hourly": "temperature_2m,snowfall,wind_speed_10m,wind_gusts_10m,snow_depth,weather_code,cloud_cover,visibility",
-            "past_days": 14,
-            "forecast_days": 1,
-            "timezone": "GMT",
-        }
-
-        data = None
-        for attempt in range(3):
-            try:
-                async with session.get(
-                    OPEN_METEO_URL,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=15),
-                ) as resp:
-                    if resp.status == 429:
-                        await asyncio.sleep(2**attempt)
-                        continue
-                    resp.raise_for_status()
-                    data = await resp.json()
-                    break
-            except Exception as e:
-                if attempt == 2:
-                    print(f"  FAILED {resort_id}: {e}")
-                    return []
-                await asyncio.sleep(1)
-
-        if data is None:
-            print(f"  RATE LIMITED {resort_id}")
-            return []
-
-        hourly = data.get("hourly", {})
-        temps = hourly.get("temperature_2m", [])
-        snowfall = hourly.get("snowfall", [])
-        times = hourly.get("time", [])
-        wind = hourly.get("wind_speed_10m", [])
-        snow_depth = hourly.get("snow_depth", [])
-        weather_code = hourly.get("weather_code", [])
-        cloud_cover = hourly.get("cloud_cover", [])
-        wind_gusts = hourly.get("wind_gusts_10m", [])
-        visibility = hourly.get("visibility", [])
-
-        if not temps:
-            print(f"  NO DATA {resort_id}")
-            return []
-
-        results = []
-        n_days = len(temps) // 24
-
-        # Compute features for each full day (skip first 2 days for lookback)
-        for day_idx in range(2, n_days):
-            features = compute_features_for_day(
-                temps,
-                snowfall,
-                times,
-                day_idx,
-                elev_top,
-                wind,
-                snow_depth,
-                weather_code,
-                cloud_cover,
-                wind_gusts,
-                visibility,
-            )
-            if features:
-                # Determine the date for this day
-                hour_idx = day_idx * 24
-                if hour_idx < len(times):
-                    date_str = times[hour_idx][:10]
-                else:
-                    date_str = f"day_{day_idx}"
-
-                features["resort_id"] = resort_id
-                features["resort_name"] = resort["name"]
-                features["date"] = date_str
-                features["country"] = resort["country"]
-                features["region"] = resort["region"]
-                results.append(features)
-
-        return results
-
-
-async def collect_all():
-    """Collect features for all resorts."""
+def build_params(resort: dict) -> dict:
+    """Open-Meteo forecast query for a resort's top elevation (14 past days)."""
+    return {
+        "latitude": resort["latitude"],
+        "longitude": resort["longitude"],
+        "elevation": resort["elevation_top_m"],
+        "hourly": "temperature_2m,snowfall,wind_speed_10m,wind_gusts_10m,snow_depth,weather_code,cloud_cover,visibility",
+        "past_days": 14,
+        "forecast_days": 1,
+        "timezone": "GMT",
+    }
+
+
+def features_from_response(resort: dict, data: dict | None) -> list[dict]:
+    """Compute per-day features for a resort from an Open-Meteo response."""
+    resort_id = resort["resort_id"]
+    if data is None:
+        print(f"  FAILED {resort_id}")
+        return []
+
+    hourly = data.get("hourly", {})
+    temps = hourly.get("temperature_2m", [])
+    snowfall = hourly.get("snowfall", [])
+    times = hourly.get("time", [])
+    wind = hourly.get("wind_speed_10m", [])
+    snow_depth = hourly.get("snow_depth", [])
+    weather_code = hourly.get("weather_code", [])
+    cloud_cover = hourly.get("cloud_cover", [])
+    wind_gusts = hourly.get("wind_gusts_10m", [])
+    visibility = hourly.get("visibility", [])
+
+    if not temps:
+        print(f"  NO DATA {resort_id}")
+        return []
+
+    results = []
+    n_days = len(temps) // 24
+
+    # Compute features for each full day (skip first 2 days for lookback)
+    for day_idx in range(2, n_days):
+        features = compute_features_for_day(
+            temps,
+            snowfall,
+            times,
+            day_idx,
+            resort["elevation_top_m"],
+            wind,
+            snow_depth,
+            weather_code,
+            cloud_cover,
+            wind_gusts,
+            visibility,
+        )
+        if features:
+            # Determine the date for this day
+            hour_idx = day_idx * 24
+            if hour_idx < len(times):
+                date_str = times[hour_idx][:10]
+            else:
+                date_str = f"day_{day_idx}"
+
+            features["resort_id"] = resort_id
+            features["resort_name"] = resort["name"]
+            features["date"] = date_str
+            features["country"] = resort["country"]
+            features["region"] = resort["region"]
+            results.append(features)
+
+    return results
+
+
+async def collect_all(refresh: bool = False):
+    """Collect features for all resorts.
+
+    Responses come from the on-disk weather cache when available (see
+    weather_cache.py); pass refresh=True to re-download everything.
+    """
     with open(RESORTS_FILE) as f:
         data = json.load(f)
 
     resorts = data["resorts"]
     print(f"Collecting data for {len(resorts)} resorts...")
 
-    semaphore = asyncio.Semaphore(CONCURRENT_REQUESTS)
-    all_features = []
-
-    async with aiohttp.ClientSession() as session:
-        tasks = [fetch_resort_data(session, r, semaphore) for r in resorts]
-        results = await asyncio.gather(*tasks)
+    jobs = [(r["resort_id"], OPEN_METEO_URL, build_params(r)) for r in resorts]
+    responses = await fetch_many(
+        jobs,
+        concurrency=CONCURRENT_REQUESTS,
+        timeout=15,
+        cache=WeatherCache(refresh=refresh),
+    )
 
-        for resort_features in results:
-            all_features.extend(resort_features)
+    all_features = []
+    for resort in resorts:
+        all_features.extend(
+            features_from_response(resort, responses.get(resort["resort_id"]))
+        )
 
     print(f"\nCollected {len(all_features)} data points across {len(resorts)} resorts")
 
@@ -460,4 +442,6 @@ async def collect_all():
 
 
 if __name__ == "__main__":
-    asyncio.run(collect_all())
+    import sys
+
+    asyncio.run(collect_all(refresh="--refresh" in sys.argv))
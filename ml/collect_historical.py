@@ -10,7 +10,7 @@ import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
-import aiohttp
+from weather_cache import WeatherCache, fetch_many
 
 # Open-Meteo Archive API (for historical data beyond 16 days)
 ARCHIVE_URL = "https://archive-api.open-meteo.com/v1/archive"
@@ -174,93 +174,107 @@ def compute_features_for_day(
     }
 
 
-async def fetch_resort_archive(
-    session: aiohttp.ClientSession,
-    resort: dict,
-    start_date: str,
-    end_date: str,
-    semaphore: asyncio.Semaphore,
-) -> list[dict]:
-    """Fetch historical hourly data from Open-Meteo archive API."""
-    async with semaphore:
-        resort_id = resort["resort_id"]
-        lat = resort["latitude"]
-        lon = resort["longitude"]
-        elev_top = resort["elevation_top_m"]
-
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "elevation": elev_top,
-            "hourly": "temperature_2m,snowfall,wind_speed_10m,snow_depth",
-            "start_date": start_date,
-            "end_date": end_date,
-            "timezone": "GMT",
-        }
-
-        for attempt in range(3):
-            try:
-                async with session.get(
-                    ARCHIVE_URL,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=30),
-                ) as resp:
-                    if resp.status == 429:
-                        await asyncio.sleep(2**attempt + 1)
-                        continue
-                    if resp.status != 200:
-                        text = await resp.text()
-                        print(f"  HTTP {resp.status} for {resort_id}: {text[:100]}")
-                        if attempt < 2:
-                            await asyncio.sleep(2)
-                            continue
-                        return []
-                    data = await resp.json()
-                    break
-            except Exception as e:
-                if attempt == 2:
-                    print(f"  FAILED {resort_id}: {e}")
-                    return []
-                await asyncio.sleep(1)
-
-        hourly = data.get("hourly", {})
-        temps = hourly.get("temperature_2m", [])
-        snowfall = hourly.get("snowfall", [])
-        times = hourly.get("time", [])
-        wind = hourly.get("wind_speed_10m", [])
-        snow_depth = hourly.get("snow_depth", [])
-
-        if not temps:
-            print(f"  NO DATA {resort_id}")
-            return []
-
-        results = []
-        n_days = len(temps) // 24
-
-        for day_idx in range(2, n_days):
-            features = compute_features_for_day(
-                temps, snowfall, times, day_idx, elev_top, wind, snow_depth
-            )
-            if features:
-                hour_idx = day_idx * 24
-                if hour_idx < len(times):
-                    date_str = times[hour_idx][:10]
-                else:
-                    date_str = f"day_{day_idx}"
-
-                features["resort_id"] = resort_id
-                features["resort_name"] = resort["name"]
-                features["date"] = date_str
-                features["country"] = resort["country"]
-                features["region"] = resort["region"]
-                features["source"] = "historical"
-                results.append(features)
-
-        return results
-
-
-async def collect_historical(start_date: str, end_date: str):
-    """Collect historical features for all resorts."""
+HOURLY_VARIABLES = "temperature_2m,snowfall,wind_speed_10m,snow_depth"
+
+
+def month_chunks(start_date: str, end_date: str) -> list[tuple[str, str]]:
+    """Split [start_date, end_date] into calendar-month sub-ranges.
+
+    Archive data for a past month never changes, so requesting per month lets
+    overlapping or extended collection ranges reuse cached months instead of
+    re-downloading the whole period. A chunk ending in the last few days is
+    cached for the day only (see weather_cache.RECENT_DAYS), since the
+    archive has not filled it in yet.
+    """
+    start = datetime.strptime(start_date, "%Y-%m-%d").date()
+    end = datetime.strptime(end_date, "%Y-%m-%d").date()
+    chunks = []
+    while start <= end:
+        next_month = (start.replace(day=1) + timedelta(days=32)).replace(day=1)
+        chunk_end = min(end, next_month - timedelta(days=1))
+        chunks.append((start.isoformat(), chunk_end.isoformat()))
+        start = next_month
+    return chunks
+
+
+def build_params(resort: dict, start_date: str, end_date: str) -> dict:
+    """Open-Meteo archive query for a resort's top elevation."""
+    return {
+        "latitude": resort["latitude"],
+        "longitude": resort["longitude"],
+        "elevation": resort["elevation_top_m"],
+        "hourly": HOURLY_VARIABLES,
+        "start_date": start_date,
+        "end_date": end_date,
+        "timezone": "GMT",
+    }
+
+
+def merge_hourly(responses: list[dict | None]) -> dict | None:
+    """Concatenate the hourly arrays of consecutive month responses.
+
+    Returns None if any chunk is missing, since a gap would corrupt the
+    lookback windows of every day after it.
+    """
+    if not responses or any(r is None for r in responses):
+        return None
+    merged: dict[str, list] = {}
+    for response in responses:
+        for key, values in response.get("hourly", {}).items():
+            merged.setdefault(key, []).extend(values)
+    return {"hourly": merged}
+
+
+def features_from_response(resort: dict, data: dict | None) -> list[dict]:
+    """Compute per-day features for a resort from (merged) archive data."""
+    resort_id = resort["resort_id"]
+    if data is None:
+        print(f"  FAILED {resort_id}")
+        return []
+
+    elev_top = resort["elevation_top_m"]
+    hourly = data.get("hourly", {})
+    temps = hourly.get("temperature_2m", [])
+    snowfall = hourly.get("snowfall", [])
+    times = hourly.get("time", [])
+    wind = hourly.get("wind_speed_10m", [])
+    snow_depth = hourly.get("snow_depth", [])
+
+    if not temps:
+        print(f"  NO DATA {resort_id}")
+        return []
+
+    results = []
+    n_days = len(temps) // 24
+
+    for day_idx in range(2, n_days):
+        features = compute_features_for_day(
+            temps, snowfall, times, day_idx, elev_top, wind, snow_depth
+        )
+        if features:
+            hour_idx = day_idx * 24
+            if hour_idx < len(times):
+                date_str = times[hour_idx][:10]
+            else:
+                date_str = f"day_{day_idx}"
+
+            features["resort_id"] = resort_id
+            features["resort_name"] = resort["name"]
+            features["date"] = date_str
+            features["country"] = resort["country"]
+            features["region"] = resort["region"]
+            features["source"] = "historical"
+            results.append(features)
+
+    return results
+
+
+async def collect_historical(start_date: str, end_date: str, refresh: bool = False):
+    """Collect historical features for all resorts.
+
+    Archive responses are cached on disk per resort and calendar month (see
+    weather_cache.py); pass refresh=True to re-download everything.
+    """
     with open(RESORTS_FILE) as f:
         data = json.load(f)
 
@@ -269,18 +283,29 @@ async def collect_historical(start_date: str, end_date: str):
         f"Collecting historical data ({start_date} to {end_date}) for {len(resorts)} resorts..."
     )
 
-    semaphore = asyncio.Semaphore(CONCURRENT_REQUESTS)
-    all_features = []
-
-    async with aiohttp.ClientSession() as session:
-        tasks = [
-            fetch_resort_archive(session, r, start_date, end_date, semaphore)
-            for r in resorts
-        ]
-        results = await asyncio.gather(*tasks)
+    chunks = month_chunks(start_date, end_date)
+    jobs = [
+        (
+            f"{r['resort_id']}:{chunk_start}",
+            ARCHIVE_URL,
+            build_params(r, chunk_start, chunk_end),
+        )
+        for r in resorts
+        for chunk_start, chunk_end in chunks
+    ]
+    responses = await fetch_many(
+        jobs,
+        concurrency=CONCURRENT_REQUESTS,
+        timeout=30,
+        cache=WeatherCache(refresh=refresh),
+    )
 
-        for resort_features in results:
-            all_features.extend(resort_features)
+    all_features = []
+    for resort in resorts:
+        merged = merge_hourly(
+            [responses.get(f"{resort['resort_id']}:{start}") for start, _ in chunks]
+        )
+        all_features.extend(features_from_response(resort, merged))
 
     print(f"\nCollected {len(all_features)} data points across {len(resorts)} resorts")
 
@@ -303,7 +328,8 @@ async def collect_historical(start_date: str, end_date: str):
 if __name__ == "__main__":
     import sys
 
-    # Default: collect January 2026 data
-    start = sys.argv[1] if len(sys.argv) > 1 else "2026-01-01"
-    end = sys.argv[2] if len(sys.argv) > 2 else "2026-01-31"
-    asyncio.run(collect_historical(start, end))
+    # Default: collect January 2026 data (--refresh bypasses the cache)
+    args = [a for a in sys.argv[1:] if a != "--refresh"]
+    start = args[0] if len(args) > 0 else "2026-01-01"
+    end = args[1] if len(args) > 1 else "2026-01-31"
+    asyncio.run(collect_historical(start, end, refresh="--refresh" in sys.argv))
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Publish model weights to the S3 model registry read by backend ml_scorer.
+
+The registry is a prefix holding immutable, versioned weights files plus a
+manifest naming the primary and (optional) shadow model:
+
+    s3://<bucket>/ml-models/manifest.json
+    s3://<bucket>/ml-models/<version>.json
+
+Running Lambdas re-read the manifest every ML_MODEL_REFRESH_SECONDS and swap
+models on a version change, so publishing needs no redeploy. A shadow model
+is scored by the weather worker on the same features as the primary and only
+logged (divergence stats), never served.
+
+Usage:
+    python3 ml/publish_model.py shadow ml/model_weights_v2.json --version v3-rc1
+    python3 ml/publish_model.py promote           # shadow -> primary
+    python3 ml/publish_model.py primary ml/model_weights_v2.json --version v3
+    python3 ml/publish_model.py clear-shadow
+    python3 ml/publish_model.py show
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime, timezone
+
+DEFAULT_BUCKET = "snow-tracker-pulumi-state-us-west-2"
+DEFAULT_PREFIX = "ml-models/"
+
+
+def _client():
+    import boto3
+
+    return boto3.client("s3")
+
+
+def read_manifest(s3, bucket: str, prefix: str) -> dict:
+    try:
+        response = s3.get_object(Bucket=bucket, Key=f"{prefix}manifest.json")
+    except s3.exceptions.NoSuchKey:
+        return {"primary": None, "shadow": None}
+    return json.loads(response["Body"].read())
+
+
+def write_manifest(s3, bucket: str, prefix: str, manifest: dict) -> None:
+    manifest["updated_at"] = datetime.now(timezone.utc).isoformat()
+    s3.put_object(
+        Bucket=bucket,
+        Key=f"{prefix}manifest.json",
+        Body=json.dumps(manifest, indent=2).encode(),
+        ContentType="application/json",
+    )
+
+
+def upload_weights(s3, bucket: str, prefix: str, path: str, version: str) -> dict:
+    """Upload a weights file under its version. Versions are immutable."""
+    with open(path) as f:
+        model = json.load(f)
+    if "normalization" not in model or not (
+        model.get("ensemble") or model.get("weights")
+    ):
+        raise ValueError(f"{path} is not a model weights file")
+
+    key = f"{prefix}{version}.json"
+    existing = s3.list_objects_v2(Bucket=bucket, Prefix=key).get("KeyCount", 0)
+    if existing:
+        raise ValueError(f"Version {version} already published (s3://{bucket}/{key})")
+
+    s3.put_object(
+        Bucket=bucket,
+        Key=key,
+        Body=json.dumps(model).encode(),
+        ContentType="application/json",
+    )
+    print(f"Uploaded {path} -> s3://{bucket}/{key}")
+    return {"version": version, "key": key}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ML model registry")
+    parser.add_argument(
+        "action", choices=["primary", "shadow", "promote", "clear-shadow", "show"]
+    )
+    parser.add_argument("weights", nargs="?", help="Weights file (primary/shadow)")
+    parser.add_argument("--version", help="Registry version name (primary/shadow)")
+    parser.add_argument("--bucket", default=DEFAULT_BUCKET)
+    parser.add_argument("--prefix", default=DEFAULT_PREFIX)
+    args = parser.parse_args()
+
+    s3 = _client()
+    manifest = read_manifest(s3, args.bucket, args.prefix)
+
+    if args.action in ("primary", "shadow"):
+        if not args.weights or not args.version:
+            parser.error(f"{args.action} needs a weights file and --version")
+        manifest[args.action] = upload_weights(
+            s3, args.bucket, args.prefix, args.weights, args.version
+        )
+    elif args.action == "promote":
+        if not manifest.get("shadow"):
+            sys.exit("No shadow model to promote")
+        manifest["primary"], manifest["shadow"] = manifest["shadow"], None
+    elif args.action == "clear-shadow":
+        manifest["shadow"] = None
+
+    if args.action != "show":
+        write_manifest(s3, args.bucket, args.prefix, manifest)
+    print(json.dumps(manifest, indent=2))
+
+
+if __name__ == "__main__":
+    main()
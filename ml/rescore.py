@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""Parallel re-scoring of feature datasets (training, historical, audit).
+
+Shards a dataset across CPU cores and scores each shard in one vectorized
+pass, so re-scoring ~12,000+ observations (or a full historical archive)
+after a model change takes seconds instead of a per-sample Python loop.
+
+Scorers:
+    model      ensemble from a weights file (numpy, whole shard per matmul)
+    student    distilled student from the same weights file (train_v2 --distill)
+    rules      deterministic labels from score_historical_batches.py
+    rules_v1   deterministic labels from score_historical.py
+
+Results stream to disk shard by shard. A checkpoint next to the output
+records finished shards (and the byte offset of the output), keyed by a
+fingerprint of the input, scorer and weights, so an interrupted run resumes
+where it stopped and a model change starts over. Outputs ending in .json are
+written as a scores_*.json-style list when the run completes; .jsonl outputs
+are kept as the streamed records.
+
+Usage:
+    python3 ml/rescore.py ml/historical_features.json ml/rescored.jsonl
+    python3 ml/rescore.py ml/training_features.json ml/scores/scores_x.json \\
+        --scorer rules --workers 8
+    python3 ml/rescore.py ml/training_features.json out.jsonl \\
+        --scorer model --weights ml/model_weights_v2.json
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+ML_DIR = Path(__file__).parent
+DEFAULT_WEIGHTS = ML_DIR / "model_weights_v2.json"
+SHARD_SIZE = 2000
+
+RULE_MODULES = {
+    "rules": "score_historical_batches",
+    "rules_v1": "score_historical",
+}
+
+# Per-process scorer, built once by the pool initializer
+_scorer = None
+
+
+class EnsembleScorer:
+    """Vectorized ensemble (or student) inference over a batch of records."""
+
+    def __init__(self, weights_path: str | Path, use_student: bool = False):
+        import numpy as np
+
+        from train_v2 import _state_to_model
+
+        with open(weights_path) as f:
+            data = json.load(f)
+        self.mean = np.array(data["normalization"]["mean"])
+        self.std = np.array(data["normalization"]["std"])
+        self.std[self.std < 1e-8] = 1.0
+
+        states = data["ensemble"]
+        if use_student:
+            if not data.get("student"):
+                raise ValueError(f"No distilled student in {weights_path}")
+            states = [data["student"]]
+        self.models = [_state_to_model(s, len(self.mean)) for s in states]
+
+    def __call__(self, records: list[dict]) -> list[float]:
+        import numpy as np
+
+        from train_v2 import engineer_features
+
+        X = np.array([engineer_features(r) for r in records], dtype=np.float64)
+        X_norm = (X - self.mean) / self.std
+        preds = np.zeros(len(records))
+        for model in self.models:
+            preds += model.predict(X_norm)
+        return (preds / len(self.models)).tolist()
+
+
+class RuleScorer:
+    """Deterministic rule-based labels (score_snow_quality per record)."""
+
+    def __init__(self, module_name: str):
+        self.score_fn = importlib.import_module(module_name).score_snow_quality
+
+    def __call__(self, records: list[dict]) -> list[float]:
+        return [self.score_fn(r) for r in records]
+
+
+def build_scorer(spec: tuple[str, str | None]):
+    """Build a scorer from a picklable (kind, weights_path) spec."""
+    kind, weights_path = spec
+    if kind in RULE_MODULES:
+        return RuleScorer(RULE_MODULES[kind])
+    if kind in ("model", "student"):
+        return EnsembleScorer(weights_path or DEFAULT_WEIGHTS, kind == "student")
+    raise ValueError(f"Unknown scorer: {kind}")
+
+
+def _init_worker(spec):
+    global _scorer
+    _scorer = build_scorer(spec)
+
+
+def _score_shard(shard_id: int, records: list[dict], source: str):
+    """Score one shard in the current process. Returns (shard_id, entries)."""
+    scores = _scorer(records)
+    return shard_id, [
+        {
+            "resort_id": r.get("resort_id"),
+            "date": r.get("date"),
+            "score": round(float(s), 2),
+            "source": source,
+        }
+        for r, s in zip(records, scores, strict=True)
+    ]
+
+
+def load_records(path: str | Path) -> list[dict]:
+    """Load feature records from a {"data": [...]} file or a plain list."""
+    with open(path) as f:
+        data = json.load(f)
+    return data["data"] if isinstance(data, dict) else data
+
+
+def _fingerprint(input_path, spec, shard_size) -> str:
+    """Identity of a scoring run; a mismatch invalidates the checkpoint."""
+    weights_path = None
+    if spec[0] in ("model", "student"):
+        weights_path = spec[1] or DEFAULT_WEIGHTS
+    h = hashlib.sha256()
+    for path in (input_path, weights_path):
+        if path is not None:
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    h.update(block)
+    h.update(json.dumps([spec[0], shard_size]).encode())
+    return h.hexdigest()
+
+
+def _load_checkpoint(path: Path, fingerprint: str) -> dict:
+    if path.exists():
+        with open(path) as f:
+            ckpt = json.load(f)
+        if ckpt.get("fingerprint") == fingerprint:
+            return ckpt
+    return {"fingerprint": fingerprint, "done": [], "offset": 0}
+
+
+def _save_checkpoint(path: Path, ckpt: dict) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump(ckpt, f)
+    os.replace(tmp, path)
+
+
+def score_dataset(
+    input_path: str | Path,
+    output_path: str | Path,
+    spec: tuple[str, str | None] = ("model", None),
+    workers: int | None = None,
+    shard_size: int = SHARD_SIZE,
+    source: str = "rescored",
+    verbose: bool = True,
+) -> dict:
+    """Score every record in input_path and stream results to output_path.
+
+    Args:
+        input_path: Feature file ({"data": [...]} or a list of records).
+        output_path: .jsonl (streamed records) or .json (scores list).
+        spec: (scorer kind, weights path) — see build_scorer().
+        workers: Process count (default: all cores). 1 scores in-process.
+        shard_size: Records per shard / vectorized batch.
+        source: Value of the "source" field on each output entry.
+        verbose: Print per-shard progress and throughput.
+
+    Returns:
+        Summary dict with n, scored, elapsed, throughput and (for .json
+        outputs) the scored entries.
+    """
+    output_path = Path(output_path)
+    stream_path = (
+        output_path
+        if output_path.suffix == ".jsonl"
+        else output_path.with_suffix(".partial.jsonl")
+    )
+    ckpt_path = stream_path.with_suffix(stream_path.suffix + ".ckpt")
+
+    # Fail fast on a bad spec (e.g. no student) before touching the output
+    scorer = build_scorer(spec)
+    records = load_records(input_path)
+    shards = [records[i : i + shard_size] for i in range(0, len(records), shard_size)]
+    ckpt = _load_checkpoint(ckpt_path, _fingerprint(input_path, spec, shard_size))
+    done = set(ckpt["done"])
+    todo = [i for i in range(len(shards)) if i not in done]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(todo) or 1))
+
+    # Drop anything written after the last checkpointed shard
+    stream_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(stream_path, "a+b") as f:
+        f.truncate(ckpt["offset"])
+
+    if verbose:
+        resumed = f", resuming ({len(done)} shards done)" if done else ""
+        print(
+            f"Scoring {len(records)} records in {len(shards)} shards "
+            f"with {spec[0]} on {workers} worker(s){resumed}"
+        )
+
+    start = time.monotonic()
+    scored_now = 0
+
+    def write_shard(shard_id, entries):
+        nonlocal scored_now
+        with open(stream_path, "a") as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+            ckpt["offset"] = f.tell()
+        ckpt["done"].append(shard_id)
+        _save_checkpoint(ckpt_path, ckpt)
+        scored_now += len(entries)
+        if verbose:
+            elapsed = time.monotonic() - start
+            rate = scored_now / elapsed if elapsed > 0 else 0.0
+            print(
+                f"  shard {len(ckpt['done'])}/{len(shards)}: "
+                f"{scored_now} records, {rate:,.0f} rec/s"
+            )
+
+    if workers == 1:
+        global _scorer
+        _scorer = scorer
+        for i in todo:
+            write_shard(*_score_shard(i, shards[i], source))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(spec,)
+        ) as pool:
+            futures = [pool.submit(_score_shard, i, shards[i], source) for i in todo]
+            # Shards finish out of order; hold them until every earlier one
+            # is written so the output keeps the input record order
+            pending = {}
+            next_pos = 0
+            for future in as_completed(futures):
+                shard_id, entries = future.result()
+                pending[shard_id] = entries
+                while next_pos < len(todo) and todo[next_pos] in pending:
+                    write_shard(todo[next_pos], pending.pop(todo[next_pos]))
+                    next_pos += 1
+
+    elapsed = time.monotonic() - start
+    summary = {
+        "n": len(records),
+        "scored": scored_now,
+        "elapsed": elapsed,
+        "throughput": scored_now / elapsed if elapsed > 0 else 0.0,
+        "output": str(output_path),
+    }
+
+    if stream_path != output_path:
+        with open(stream_path) as f:
+            entries = [json.loads(line) for line in f]
+        with open(output_path, "w") as f:
+            json.dump(entries, f, indent=2)
+        stream_path.unlink()
+        summary["entries"] = entries
+    ckpt_path.unlink(missing_ok=True)
+
+    if verbose:
+        print(
+            f"Done: {scored_now} records in {elapsed:.2f}s "
+            f"({summary['throughput']:,.0f} rec/s) -> {output_path}"
+        )
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel dataset re-scoring")
+    parser.add_argument("input", help="Feature file to score")
+    parser.add_argument("output", help=".jsonl (streamed) or .json (scores list)")
+    parser.add_argument(
+        "--scorer",
+        choices=["model", "student", *RULE_MODULES],
+        default="model",
+    )
+    parser.add_argument("--weights", default=None, help="Model weights JSON")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE)
+    parser.add_argument("--source", default="rescored")
+    args = parser.parse_args()
+
+    score_dataset(
+        args.input,
+        args.output,
+        (args.scorer, args.weights),
+        workers=args.workers,
+        shard_size=args.shard_size,
+        source=args.source,
+    )
+
+
+if __name__ == "__main__":
+    main()
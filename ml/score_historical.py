@@ -8,6 +8,8 @@ import json
 import os
 import sys
 
+from rescore import score_dataset
+
 
 def score_snow_quality(d: dict) -> float:
     """
@@ -349,25 +351,14 @@ def process_batch(batch_idx: int):
     )
     output_path = f"/Users/wouter/dev/snow/ml/scores/scores_historical_{batch_idx}.json"
 
-    with open(input_path) as f:
-        data = json.load(f)
-
-    scored = []
-    for item in data:
-        score = score_snow_quality(item)
-        scored.append(
-            {
-                "resort_id": item["resort_id"],
-                "date": item["date"],
-                "score": score,
-                "source": "historical_scored",
-            }
-        )
-
-    with open(output_path, "w") as f:
-        json.dump(scored, f, indent=2)
-
-    return len(scored)
+    summary = score_dataset(
+        input_path,
+        output_path,
+        ("rules_v1", None),
+        source="historical_scored",
+        verbose=False,
+    )
+    return summary["n"]
 
 
 def main():
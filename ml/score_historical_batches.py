@@ -15,6 +15,8 @@ Scoring scale: 1.0 to 6.0
 import json
 import os
 
+from rescore import score_dataset
+
 
 def score_snow_quality(d: dict) -> float:
     """Score a single data point based on weather conditions."""
@@ -312,23 +314,13 @@ def process_batch(batch_num: int):
     input_path = f"/Users/wouter/dev/snow/ml/historical_batches/batch_{batch_num}.json"
     output_path = f"/Users/wouter/dev/snow/ml/scores/scores_historical_{batch_num}.json"
 
-    with open(input_path, "r") as f:
-        data = json.load(f)
-
-    scored = []
-    for item in data:
-        score = score_snow_quality(item)
-        scored.append(
-            {
-                "resort_id": item["resort_id"],
-                "date": item["date"],
-                "score": score,
-                "source": "historical_scored",
-            }
-        )
-
-    with open(output_path, "w") as f:
-        json.dump(scored, f, indent=2)
+    scored = score_dataset(
+        input_path,
+        output_path,
+        ("rules", None),
+        source="historical_scored",
+        verbose=False,
+    )["entries"]
 
     # Print distribution summary
     from collections import Counter
@@ -815,6 +815,220 @@ def evaluate_by_source(y_true, y_pred, metadata):
     return results
 
 
+def load_transfer_features(include_historical=True):
+    """Load engineered features for every known sample, labeled or not.
+
+    Distillation doesn't need human/rule labels — the ensemble provides the
+    targets — so the student can learn from the full real, synthetic and
+    historical feature sets. Returns an (n_samples, n_features) array.
+    """
+    feature_files = [FEATURES_FILE, ML_DIR / "synthetic_features.json"]
+    if include_historical:
+        feature_files.append(ML_DIR / "historical_features.json")
+
+    features_by_key = {}
+    for path in feature_files:
+        if not path.exists():
+            continue
+        with open(path) as f:
+            data = json.load(f)
+        for item in data["data"]:
+            features_by_key[(item["resort_id"], item["date"])] = item
+        print(f"  + {len(data['data'])} transfer samples from {path.name}")
+
+    return np.array(
+        [engineer_features(item) for item in features_by_key.values()],
+        dtype=np.float64,
+    )
+
+
+def _state_to_model(m_state, n_input):
+    """Rebuild a SimpleNN from a saved state dict."""
+    model = SimpleNN(n_input, n_hidden=m_state["n_hidden"])
+    model.W1 = np.array(m_state["W1"])
+    model.b1 = np.array(m_state["b1"])
+    model.W2 = np.array(m_state["W2"])
+    model.b2 = np.array(m_state["b2"])
+    return model
+
+
+def predict_from_states(states, X):
+    """Average predictions of saved model states (ensemble members) on X."""
+    preds = np.zeros(len(X))
+    for m_state in states:
+        preds += _state_to_model(m_state, X.shape[1]).predict(X)
+    return preds / len(states)
+
+
+def distill_student(
+    X_transfer,
+    y_teacher,
+    X_val,
+    y_val_teacher,
+    n_hidden=16,
+    seed=7,
+    n_epochs=2000,
+    checkpoint_interval=50,
+    verbose=True,
+):
+    """Train a single small network to mimic the ensemble's outputs.
+
+    Targets are the ensemble's (soft) scores, so there is no class balancing:
+    the student should reproduce the teacher everywhere, including regions
+    that are rare in the labeled data. The checkpoint with the lowest MAE
+    against the teacher on the held-out set is kept.
+
+    Returns the best student state in the same format as ensemble members.
+    """
+    np.random.seed(seed)
+    model = SimpleNN(X_transfer.shape[1], n_hidden=n_hidden)
+    lr = 0.01
+    batch_size = 64
+    best_state = None
+
+    for epoch in range(n_epochs):
+        perm = np.random.permutation(len(X_transfer))
+        for start in range(0, len(X_transfer), batch_size):
+            batch_idx = perm[start : start + batch_size]
+            y_pred, cache = model.forward(X_transfer[batch_idx])
+            grads = model.backward(y_teacher[batch_idx], y_pred, cache)
+            model.update(grads, lr)
+
+        if epoch > 0 and epoch % 500 == 0:
+            lr *= 0.5
+
+        if epoch % checkpoint_interval == 0 or epoch == n_epochs - 1:
+            gap = np.mean(np.abs(y_val_teacher - model.predict(X_val)))
+            if verbose and epoch % 500 == 0:
+                print(f"  student h={n_hidden} ep={epoch}: teacher_mae={gap:.4f}")
+            if best_state is None or gap < best_state["teacher_mae"]:
+                best_state = {
+                    "n_hidden": n_hidden,
+                    "seed": seed,
+                    "epoch": epoch,
+                    "teacher_mae": gap,
+                    "W1": model.W1.copy(),
+                    "b1": model.b1.copy(),
+                    "W2": model.W2.copy(),
+                    "b2": model.b2.copy(),
+                }
+
+    if verbose:
+        print(
+            f"  -> Best student: h={n_hidden} ep={best_state['epoch']} "
+            f"teacher_mae={best_state['teacher_mae']:.4f}"
+        )
+    return best_state
+
+
+def distill(weights_file=WEIGHTS_FILE, n_hidden=16, include_historical=True):
+    """Distill the saved ensemble into one student network.
+
+    Loads the trained ensemble from `weights_file`, labels every available
+    feature row (real, synthetic and historical) with the ensemble's score,
+    trains a student on those targets and reports the accuracy gap against
+    the real labels (`evaluate`) and the physics suite
+    (`eval_physics_checks`). The student is written back into the weights
+    file under "student"; `ml_scorer` uses it when ML_SCORER_MODE=student.
+    """
+    from eval_physics_checks import (
+        build_constraints,
+        build_edge_cases,
+        run_physics_eval,
+    )
+
+    with open(weights_file) as f:
+        model_data = json.load(f)
+    mean = np.array(model_data["normalization"]["mean"])
+    std = np.array(model_data["normalization"]["std"])
+    std[std < 1e-8] = 1.0
+    teacher = model_data["ensemble"]
+
+    print(f"\n{'=' * 60}")
+    print(f"Distilling {len(teacher)}-model ensemble into h={n_hidden} student")
+    print(f"{'=' * 60}")
+
+    X_transfer = (load_transfer_features(include_historical) - mean) / std
+    y_teacher = predict_from_states(teacher, X_transfer)
+    print(f"Transfer set: {X_transfer.shape[0]} samples")
+
+    # Same seed and split as main() so the labeled validation rows are the
+    # ones the ensemble never trained on.
+    historical_weight = model_data.get("training_config", {}).get(
+        "historical_weight", 1.0
+    )
+    X_raw, y, metadata, _ = load_data(historical_weight=historical_weight)
+    np.random.seed(42)
+    val_idx = np.random.permutation(len(y))[int(0.8 * len(y)) :]
+    X_val = (X_raw[val_idx] - mean) / std
+    y_val = y[val_idx]
+    meta_val = [metadata[i] for i in val_idx]
+    ensemble_val_pred = predict_from_states(teacher, X_val)
+
+    student = distill_student(
+        X_transfer, y_teacher, X_val, ensemble_val_pred, n_hidden=n_hidden
+    )
+    student_val_pred = predict_from_states([student], X_val)
+
+    print("\n--- Validation Set (ensemble / teacher) ---")
+    teacher_metrics = evaluate(y_val, ensemble_val_pred, meta_val)
+    print("\n--- Validation Set (student) ---")
+    student_metrics = evaluate(y_val, student_val_pred, meta_val)
+    print("\n  By source (student):")
+    evaluate_by_source(y_val, student_val_pred, meta_val)
+
+    print("\n--- Physics checks ---")
+    edge_cases = build_edge_cases()
+    constraints = build_constraints()
+    teacher_models = [_state_to_model(s, len(mean)) for s in teacher]
+    teacher_physics = run_physics_eval(
+        teacher_models, mean, std, edge_cases, constraints, verbose=False
+    )
+    student_physics = run_physics_eval(
+        [_state_to_model(student, len(mean))],
+        mean,
+        std,
+        edge_cases,
+        constraints,
+        verbose=True,
+    )
+
+    print(f"\n{'=' * 60}")
+    print("Accuracy gap (student - ensemble)")
+    print(f"{'=' * 60}")
+    for key in ("mae", "rmse", "r2", "accuracy", "within_1"):
+        t, s = teacher_metrics[key], student_metrics[key]
+        print(f"  {key:<10s} ensemble={t:.3f} student={s:.3f} gap={s - t:+.3f}")
+    print(
+        f"  physics    ensemble={teacher_physics['pass_rate']:.1%} "
+        f"student={student_physics['pass_rate']:.1%} "
+        f"({student_physics['total_failed']} violations)"
+    )
+    print(f"  teacher agreement MAE: {student['teacher_mae']:.4f}")
+
+    model_data["student"] = {
+        "n_hidden": student["n_hidden"],
+        "seed": student["seed"],
+        "epoch": student["epoch"],
+        "teacher_mae": float(student["teacher_mae"]),
+        "n_transfer_samples": int(X_transfer.shape[0]),
+        "W1": student["W1"].tolist(),
+        "b1": student["b1"].tolist(),
+        "W2": student["W2"].tolist(),
+        "b2": student["b2"].tolist(),
+    }
+    model_data.setdefault("metrics", {})["student_validation"] = {
+        **{k: float(v) for k, v in student_metrics.items()},
+        "physics_pass_rate": float(student_physics["pass_rate"]),
+    }
+
+    with open(weights_file, "w") as f:
+        json.dump(model_data, f, indent=2)
+    print(f"\nStudent saved to {weights_file} (copy to backend/src/ml_model/)")
+
+    return student_physics["total_failed"] == 0
+
+
 def main(historical_weight=None):
     import sys
 
@@ -975,4 +1189,11 @@ def main(historical_weight=None):
 
 
 if __name__ == "__main__":
+    import sys
+
+    if "--distill" in sys.argv:
+        # python3 ml/train_v2.py --distill [weights_file]
+        args = [a for a in sys.argv[1:] if a != "--distill"]
+        ok = distill(Path(args[0]) if args else WEIGHTS_FILE)
+        sys.exit(0 if ok else 1)
     main()
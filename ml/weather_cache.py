@@ -0,0 +1,234 @@
+"""Persistent on-disk cache for Open-Meteo responses used by data collection.
+
+Responses are content-addressed: the key is a SHA-256 of the endpoint plus the
+canonicalized query (coordinates, elevation, variables and date range), and the
+body is stored gzip-compressed under CACHE_DIR/<key[:2]>/<key>.json.gz. Queries
+with a relative window (past_days/forecast_days instead of start/end dates) are
+additionally keyed by the UTC date they were made on, so a forecast pulled
+today is reused all day but never served as "current" tomorrow. Ranges whose
+end_date is within RECENT_DAYS of today are keyed the same way: the archive
+lags a few days behind, so their last days come back as nulls until it
+catches up and must not be cached for good.
+
+Shared by ml/collect_data.py, ml/collect_historical.py and
+backend/scripts/backfill_historical_data.py, so rebuilding the training set
+after a feature change only recomputes features instead of re-fetching months
+of weather.
+
+Usage:
+    cache = WeatherCache()
+    data = cache.get(url, params)          # None on miss
+    cache.put(url, params, data)
+
+    # Bounded-concurrency async fetch; cache hits never touch the network and
+    # every response is persisted as soon as it arrives, so an interrupted run
+    # resumes where it left off.
+    responses = asyncio.run(fetch_many(jobs, concurrency=10))
+
+Set OPEN_METEO_CACHE_DIR to relocate the cache, or pass refresh=True (the
+collectors' --refresh flag) to ignore existing entries and overwrite them.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+CACHE_DIR = Path(
+    os.environ.get(
+        "OPEN_METEO_CACHE_DIR", Path(__file__).parent / ".cache" / "open_meteo"
+    )
+)
+
+# Query params that make a request window relative to "now"
+RELATIVE_WINDOW_PARAMS = ("past_days", "forecast_days", "past_hours", "current")
+
+# The Open-Meteo archive lags ~5 days; ranges ending within this many days of
+# today may still be incomplete
+RECENT_DAYS = 7
+
+
+def _ends_recently(params: dict, today: date) -> bool:
+    """True if the request's end_date is within RECENT_DAYS of today."""
+    end_date = params.get("end_date")
+    if not end_date:
+        return False
+    try:
+        end = date.fromisoformat(str(end_date))
+    except ValueError:
+        return False
+    return end >= today - timedelta(days=RECENT_DAYS)
+
+
+def cache_key(url: str, params: dict) -> str:
+    """Content address for an Open-Meteo request.
+
+    Params are sorted and floats normalized so logically identical requests
+    (e.g. lat 49.1 vs 49.10) share an entry.
+    """
+    canonical = {
+        k: round(v, 4) if isinstance(v, float) else v for k, v in sorted(params.items())
+    }
+    today = datetime.now(timezone.utc).date()
+    if any(k in params for k in RELATIVE_WINDOW_PARAMS) or _ends_recently(
+        params, today
+    ):
+        canonical["_as_of"] = today.isoformat()
+    payload = json.dumps({"url": url, "params": canonical}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class WeatherCache:
+    """Gzip-compressed JSON response store keyed by cache_key()."""
+
+    def __init__(self, cache_dir: Path | str | None = None, refresh: bool = False):
+        self.cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json.gz"
+
+    def get(self, url: str, params: dict) -> dict | None:
+        """Return the cached response, or None on a miss (or in refresh mode)."""
+        path = self._path(cache_key(url, params))
+        if self.refresh or not path.exists():
+            self.misses += 1
+            return None
+        try:
+            with gzip.open(path, "rt") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            # Unreadable entry (disk corruption, manual edits) - treat as a miss
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, url: str, params: dict, data: dict) -> None:
+        """Store a response atomically (temp file + rename)."""
+        path = self._path(cache_key(url, params))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(json.dumps(data, separators=(",", ":")).encode())
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+def cached_get_json(
+    url: str, params: dict, cache: WeatherCache | None = None, timeout: int = 30
+) -> dict:
+    """Synchronous GET through the cache (for requests-based scripts)."""
+    import requests
+
+    cache = cache or WeatherCache()
+    data = cache.get(url, params)
+    if data is not None:
+        return data
+    response = requests.get(url, params=params, timeout=timeout)
+    response.raise_for_status()
+    data = response.json()
+    cache.put(url, params, data)
+    return data
+
+
+async def _fetch_one(session, url, params, timeout, retries):
+    """GET with retry/backoff on 429 and transient errors. Returns JSON or None."""
+    import aiohttp
+
+    for attempt in range(retries):
+        try:
+            async with session.get(
+                url, params=params, timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as resp:
+                if resp.status == 429:
+                    await asyncio.sleep(2**attempt + 1)
+                    continue
+                resp.raise_for_status()
+                return await resp.json()
+        except Exception as e:
+            if attempt == retries - 1:
+                print(
+                    f"  FAILED {params.get('latitude')},{params.get('longitude')}: {e}"
+                )
+                return None
+            await asyncio.sleep(1)
+    return None
+
+
+async def fetch_many(
+    jobs: list[tuple[str, str, dict]],
+    concurrency: int = 10,
+    timeout: int = 30,
+    retries: int = 3,
+    cache: WeatherCache | None = None,
+    progress_every: int = 25,
+) -> dict[str, dict | None]:
+    """Fetch many Open-Meteo requests with bounded concurrency.
+
+    Args:
+        jobs: (job_id, url, params) tuples; job_id is only used in the result.
+        concurrency: Max in-flight HTTP requests (cache hits don't count).
+        timeout: Per-request timeout in seconds.
+        retries: Attempts per request (429s back off exponentially).
+        cache: Response cache; a default WeatherCache() if omitted.
+        progress_every: Print a progress line every N completed jobs.
+
+    Returns:
+        {job_id: response JSON or None if the request ultimately failed}
+    """
+    cache = cache or WeatherCache()
+    results: dict[str, dict | None] = {}
+    pending = []
+    for job_id, url, params in jobs:
+        data = cache.get(url, params)
+        if data is not None:
+            results[job_id] = data
+        else:
+            pending.append((job_id, url, params))
+
+    total = len(jobs)
+    print(f"  cache: {total - len(pending)}/{total} hits, fetching {len(pending)}")
+    if not pending:
+        return results
+
+    import aiohttp
+
+    semaphore = asyncio.Semaphore(concurrency)
+    start = time.monotonic()
+    done = 0
+    failed = 0
+
+    async def run(session, job_id, url, params):
+        nonlocal done, failed
+        async with semaphore:
+            data = await _fetch_one(session, url, params, timeout, retries)
+        if data is not None:
+            cache.put(url, params, data)
+        else:
+            failed += 1
+        results[job_id] = data
+        done += 1
+        if done % progress_every == 0 or done == len(pending):
+            elapsed = time.monotonic() - start
+            rate = done / elapsed if elapsed > 0 else 0.0
+            eta = (len(pending) - done) / rate if rate > 0 else 0.0
+            print(
+                f"  fetched {done}/{len(pending)} ({failed} failed) "
+                f"{rate:.1f} req/s, ETA {eta:.0f}s"
+            )
+
+    async with aiohttp.ClientSession() as session:
+        await asyncio.gather(*(run(session, *job) for job in pending))
+
+    return results